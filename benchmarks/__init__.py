@@ -0,0 +1,2 @@
+"""Tools measuring the performance of the application without a real node."""
+from __future__ import annotations
@@ -0,0 +1,699 @@
+# pylint: disable=too-many-arguments,too-many-instance-attributes
+"""
+A local stand-in for the RGB Lightning Node HTTP API.
+
+This module provides a `MockNodeServer` that answers the endpoints of
+`src/utils/endpoints.py` from a deterministic, generated dataset, so that
+services and views can be benchmarked on a development machine without the
+regtest infrastructure of `e2e_tests/regtest.sh`. Responses are built from the
+application's own response models, so they always parse the way the real
+node's responses do.
+
+Key Features:
+- Configurable data volumes: assets, transfers per asset, payments, channels,
+  on-chain transactions and unspents.
+- Injectable latency, with optional jitter and per-endpoint overrides.
+- Injectable error rate, answering with the node's error body.
+- Seeded random generator, so the same options give the same data, latency
+  and failures on every run.
+- Mutating endpoints answer with success and leave the dataset unchanged.
+
+Usage:
+    python -m benchmarks.mock_node_server --assets 200 --transfers 50 --payments 500 \\
+        --channels 20 --latency-ms 30 --error-rate 0.01
+
+The application talks to `http://127.0.0.1:3001` by default, which is the
+default address of the server.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Any
+
+from pydantic import BaseModel
+
+from src.model.btc_model import AddressResponseModel
+from src.model.btc_model import BalanceResponseModel
+from src.model.btc_model import BalanceStatus
+from src.model.btc_model import ConfirmationTime
+from src.model.btc_model import EstimateFeeResponse
+from src.model.btc_model import RgbAllocation
+from src.model.btc_model import SendBtcResponseModel
+from src.model.btc_model import Transaction
+from src.model.btc_model import TransactionListResponse
+from src.model.btc_model import Unspent
+from src.model.btc_model import UnspentsListResponseModel
+from src.model.btc_model import Utxo
+from src.model.channels_model import Channel
+from src.model.channels_model import ChannelsListResponseModel
+from src.model.channels_model import OpenChannelResponseModel
+from src.model.common_operation_model import CheckIndexerUrlResponseModel
+from src.model.common_operation_model import InitResponseModel
+from src.model.common_operation_model import NetworkInfoResponseModel
+from src.model.common_operation_model import NodeInfoResponseModel
+from src.model.common_operation_model import SignMessageResponseModel
+from src.model.invoices_model import DecodeInvoiceResponseModel
+from src.model.invoices_model import InvoiceStatusResponseModel
+from src.model.invoices_model import LnInvoiceResponseModel
+from src.model.payments_model import KeysendResponseModel
+from src.model.payments_model import ListPaymentResponseModel
+from src.model.payments_model import Payment
+from src.model.peers_model import ListPeersResponseModel
+from src.model.peers_model import Peer
+from src.model.rgb_model import AssetBalanceResponseModel
+from src.model.rgb_model import AssetModel
+from src.model.rgb_model import DecodeRgbInvoiceResponseModel
+from src.model.rgb_model import GetAssetMediaModelResponseModel
+from src.model.rgb_model import GetAssetResponseModel
+from src.model.rgb_model import ListTransferAssetResponseModel
+from src.model.rgb_model import Media
+from src.model.rgb_model import PostAssetMediaModelResponseModel
+from src.model.rgb_model import RgbInvoiceDataResponseModel
+from src.model.rgb_model import SendAssetResponseModel
+from src.model.rgb_model import TransferAsset
+from src.utils import endpoints
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 3001
+DEFAULT_ASSETS = 10
+DEFAULT_TRANSFERS = 20
+DEFAULT_PAYMENTS = 50
+DEFAULT_CHANNELS = 5
+DEFAULT_TRANSACTIONS = 50
+DEFAULT_UNSPENTS = 20
+DEFAULT_ERROR_STATUS = 500
+ASSET_SCHEMAS = ('nia', 'cfa', 'uda')
+ASSET_IFACES = {'nia': 'RGB20', 'cfa': 'RGB25', 'uda': 'RGB21'}
+TRANSFER_KINDS = ('Issuance', 'ReceiveBlind', 'ReceiveWitness', 'Send')
+TRANSFER_STATUSES = (
+    'Settled', 'WaitingCounterparty', 'WaitingConfirmations', 'Failed',
+)
+PAYMENT_STATUSES = ('Succeeded', 'Pending', 'Failed')
+TRANSACTION_TYPES = ('User', 'RgbSend', 'CreateUtxos')
+BASE_TIMESTAMP = 1_700_000_000
+
+
+def _png_pixel() -> bytes:
+    """Return a valid 1x1 PNG image, served as the media of every asset."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack('>I', len(data)) + kind + data
+            + struct.pack('>I', zlib.crc32(kind + data))
+        )
+    return (
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', 1, 1, 8, 6, 0, 0, 0))
+        + chunk(b'IDAT', zlib.compress(b'\x00\xff\xff\xff\xff'))
+        + chunk(b'IEND', b'')
+    )
+
+
+class MockNodeData:
+    """A deterministic dataset shaped like the responses of the node."""
+
+    def __init__(
+        self,
+        assets: int = DEFAULT_ASSETS,
+        transfers: int = DEFAULT_TRANSFERS,
+        payments: int = DEFAULT_PAYMENTS,
+        channels: int = DEFAULT_CHANNELS,
+        transactions: int = DEFAULT_TRANSACTIONS,
+        unspents: int = DEFAULT_UNSPENTS,
+        seed: int = 0,
+    ):
+        """
+        Generate the dataset.
+
+        Args:
+            assets (int): Number of assets, spread over the NIA, CFA and UDA schemas.
+            transfers (int): Number of transfers of each asset.
+            payments (int): Number of lightning payments.
+            channels (int): Number of channels, one peer each.
+            transactions (int): Number of on-chain transactions.
+            unspents (int): Number of unspent outputs.
+            seed (int): Seed of the generator; equal seeds give equal datasets.
+        """
+        rng = random.Random(seed)
+        self.pubkey = self._hex(rng, 33)
+        self.assets: dict[str, list[AssetModel]] = {
+            schema: [] for schema in ASSET_SCHEMAS
+        }
+        self.transfers: dict[str, list[TransferAsset]] = {}
+        for index in range(assets):
+            schema = ASSET_SCHEMAS[index % len(ASSET_SCHEMAS)]
+            asset = self._asset(rng, index, schema)
+            self.assets[schema].append(asset)
+            self.transfers[asset.asset_id] = [
+                self._transfer(rng, idx) for idx in range(transfers)
+            ]
+        asset_ids = list(self.transfers)
+        self.payments = [
+            self._payment(rng, index, asset_ids) for index in range(payments)
+        ]
+        self.channels = [
+            self._channel(rng, index, asset_ids) for index in range(channels)
+        ]
+        self.transactions = [
+            self._transaction(rng, index) for index in range(transactions)
+        ]
+        self.unspents = [
+            self._unspent(rng, index, asset_ids) for index in range(unspents)
+        ]
+        self.media_hex = _png_pixel().hex()
+
+    @staticmethod
+    def _hex(rng: random.Random, size: int) -> str:
+        return rng.randbytes(size).hex()
+
+    def _asset(self, rng: random.Random, index: int, schema: str) -> AssetModel:
+        settled = rng.randint(1, 1_000_000)
+        media = None
+        if schema != 'nia':
+            media = Media(
+                file_path=f'/tmp/mock-node/media/{index}',
+                digest=self._hex(rng, 32), mime='image/png',
+            )
+        return AssetModel(
+            asset_id=f'rgb:{self._hex(rng, 16)}',
+            asset_iface=ASSET_IFACES[schema],
+            ticker=f'T{index:04d}' if schema == 'nia' else None,
+            name=f'Mock asset {index}',
+            details=None,
+            precision=0,
+            issued_supply=settled,
+            timestamp=BASE_TIMESTAMP + index,
+            added_at=BASE_TIMESTAMP + index,
+            balance=AssetBalanceResponseModel(
+                settled=settled, future=settled, spendable=settled,
+                offchain_outbound=0, offchain_inbound=0,
+            ),
+            media=media,
+        )
+
+    def _transfer(self, rng: random.Random, idx: int) -> TransferAsset:
+        kind = TRANSFER_KINDS[idx % len(TRANSFER_KINDS)]
+        return TransferAsset(
+            idx=idx,
+            created_at=BASE_TIMESTAMP + idx * 60,
+            updated_at=BASE_TIMESTAMP + idx * 60,
+            status=rng.choice(TRANSFER_STATUSES),
+            amount=rng.randint(1, 10_000),
+            kind=kind,
+            txid=self._hex(rng, 32),
+            recipient_id=self._hex(rng, 16) if kind != 'Issuance' else None,
+            transport_endpoints=[],
+        )
+
+    def _payment(self, rng: random.Random, index: int, asset_ids: list[str]) -> Payment:
+        return Payment(
+            created_at=BASE_TIMESTAMP + index * 60,
+            updated_at=BASE_TIMESTAMP + index * 60,
+            amt_msat=rng.randint(3_000, 3_000_000),
+            asset_amount=rng.randint(1, 100) if asset_ids else None,
+            asset_id=rng.choice(asset_ids) if asset_ids else None,
+            payment_hash=self._hex(rng, 32),
+            inbound=bool(index % 2),
+            status=rng.choice(PAYMENT_STATUSES),
+            payee_pubkey=self._hex(rng, 33),
+        )
+
+    def _channel(self, rng: random.Random, index: int, asset_ids: list[str]) -> Channel:
+        capacity = rng.randint(30_010, 1_000_000)
+        local_balance = rng.randint(0, capacity)
+        asset_id = asset_ids[index % len(asset_ids)] if asset_ids else None
+        return Channel(
+            channel_id=self._hex(rng, 32),
+            funding_txid=self._hex(rng, 32),
+            peer_pubkey=self._hex(rng, 33),
+            peer_alias=f'peer-{index}',
+            short_channel_id=rng.randint(1, 2**40),
+            status='Opened',
+            ready=True,
+            capacity_sat=capacity,
+            local_balance_sat=local_balance,
+            outbound_balance_msat=local_balance * 1000,
+            inbound_balance_msat=(capacity - local_balance) * 1000,
+            is_usable=True,
+            public=True,
+            asset_id=asset_id,
+            asset_local_amount=rng.randint(0, 1000) if asset_id else None,
+            asset_remote_amount=rng.randint(0, 1000) if asset_id else None,
+        )
+
+    def _transaction(self, rng: random.Random, index: int) -> Transaction:
+        received = rng.randint(0, 1_000_000)
+        return Transaction(
+            transaction_type=TRANSACTION_TYPES[index % len(TRANSACTION_TYPES)],
+            txid=self._hex(rng, 32),
+            received=received,
+            sent=rng.randint(0, received),
+            fee=rng.randint(100, 2000),
+            confirmation_time=ConfirmationTime(
+                height=100 + index, timestamp=BASE_TIMESTAMP + index * 600,
+            ) if index % 5 else None,
+        )
+
+    def _unspent(self, rng: random.Random, index: int, asset_ids: list[str]) -> Unspent:
+        colorable = bool(index % 2)
+        allocations = []
+        if colorable and asset_ids:
+            allocations.append(
+                RgbAllocation(
+                    asset_id=asset_ids[index % len(asset_ids)],
+                    amount=rng.randint(1, 1000), settled=True,
+                ),
+            )
+        return Unspent(
+            utxo=Utxo(
+                outpoint=f'{self._hex(rng, 32)}:{index % 4}',
+                btc_amount=rng.randint(1000, 100_000),
+                colorable=colorable,
+            ),
+            rgb_allocations=allocations,
+        )
+
+    def new_asset(self, schema: str) -> AssetModel:
+        """Return an asset of the schema which is not part of the dataset, as issuing does."""
+        index = sum(len(assets) for assets in self.assets.values())
+        return self._asset(random.Random(index), index, schema)
+
+    def find_asset(self, asset_id: str | None) -> AssetModel | None:
+        """Return the asset with the given id, if any."""
+        for assets in self.assets.values():
+            for asset in assets:
+                if asset.asset_id == asset_id:
+                    return asset
+        return None
+
+    def btc_balance(self) -> BalanceResponseModel:
+        """Return the on-chain balance, split between vanilla and colored unspents."""
+        vanilla = sum(
+            unspent.utxo.btc_amount for unspent in self.unspents
+            if not unspent.utxo.colorable
+        )
+        colored = sum(
+            unspent.utxo.btc_amount for unspent in self.unspents
+            if unspent.utxo.colorable
+        )
+        return BalanceResponseModel(
+            vanilla=BalanceStatus(
+                settled=vanilla, future=vanilla, spendable=vanilla,
+            ),
+            colored=BalanceStatus(
+                settled=colored, future=colored, spendable=colored,
+            ),
+        )
+
+
+class MockNodeServer(ThreadingHTTPServer):
+    """HTTP server answering the node endpoints from a `MockNodeData` dataset."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        data: MockNodeData,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        endpoint_latency_ms: dict[str, float] | None = None,
+        error_rate: float = 0,
+        error_status: int = DEFAULT_ERROR_STATUS,
+        seed: int = 0,
+    ):
+        """
+        Bind the server; call `serve_forever` or `start` to answer requests.
+
+        Args:
+            data (MockNodeData): The dataset the responses are built from.
+            host (str): The address to listen on.
+            port (int): The port to listen on; 0 picks a free port.
+            latency_ms (float): Delay added to every response.
+            jitter_ms (float): Maximum random delay added on top of the latency.
+            endpoint_latency_ms (dict[str, float] | None): Latency of specific endpoints,
+                replacing `latency_ms` for them.
+            error_rate (float): Probability, between 0 and 1, of answering with an error.
+            error_status (int): HTTP status of the injected errors.
+            seed (int): Seed of the jitter and error generator.
+        """
+        super().__init__((host, port), MockNodeRequestHandler)
+        self.data = data
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.endpoint_latency_ms = endpoint_latency_ms or {}
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.request_counts: dict[str, int] = {}
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """The base URL of the server."""
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> None:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, name='mock-node-server', daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving requests and close the socket."""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def plan_request(self, endpoint: str) -> tuple[float, bool]:
+        """
+        Count the request and draw its delay and whether it fails.
+
+        Args:
+            endpoint (str): The endpoint being requested.
+
+        Returns:
+            tuple[float, bool]: The delay in seconds and whether to answer with an error.
+        """
+        latency_ms = self.endpoint_latency_ms.get(endpoint, self.latency_ms)
+        with self._rng_lock:
+            self.request_counts[endpoint] = self.request_counts.get(
+                endpoint, 0,
+            ) + 1
+            jitter_ms = self._rng.uniform(
+                0, self.jitter_ms,
+            ) if self.jitter_ms else 0
+            fails = self._rng.random() < self.error_rate
+        return (latency_ms + jitter_ms) / 1000, fails
+
+
+class MockNodeRequestHandler(BaseHTTPRequestHandler):
+    """Answers one request to the mock node."""
+
+    server: MockNodeServer
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer a GET request."""
+        self._handle()
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Answer a POST request."""
+        self._handle()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Keep the benchmark output free of one line per request."""
+
+    def _read_body(self) -> dict[str, Any]:
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        raw = self.rfile.read(length)
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            return {}
+        return body if isinstance(body, dict) else {}
+
+    def _handle(self) -> None:
+        endpoint = self.path.split('?', 1)[0]
+        body = self._read_body()
+        delay, fails = self.server.plan_request(endpoint)
+        if delay:
+            time.sleep(delay)
+
+        route = ROUTES.get(endpoint)
+        if route is None:
+            self._send_json(
+                404, {'error': f'Unknown endpoint {endpoint}', 'code': 404},
+            )
+        elif fails:
+            status = self.server.error_status
+            self._send_json(
+                status, {'error': 'Injected failure', 'code': status},
+            )
+        else:
+            response = route(self.server.data, body)
+            if isinstance(response, BaseModel):
+                response = response.model_dump(mode='json')
+            self._send_json(200, response)
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        content = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def _list_assets(data: MockNodeData, body: dict[str, Any]) -> GetAssetResponseModel:
+    schemas = [
+        schema.lower() for schema in body.get('filter_asset_schemas') or ASSET_SCHEMAS
+    ]
+    return GetAssetResponseModel(
+        **{schema: data.assets[schema] for schema in ASSET_SCHEMAS if schema in schemas},
+    )
+
+
+def _asset_balance(data: MockNodeData, body: dict[str, Any]) -> AssetBalanceResponseModel:
+    asset = data.find_asset(body.get('asset_id'))
+    if asset is None:
+        return AssetBalanceResponseModel(
+            settled=0, future=0, spendable=0, offchain_outbound=0, offchain_inbound=0,
+        )
+    return asset.balance
+
+
+def _node_info(data: MockNodeData, _body: dict[str, Any]) -> NodeInfoResponseModel:
+    return NodeInfoResponseModel(
+        pubkey=data.pubkey,
+        num_channels=len(data.channels),
+        num_usable_channels=len(data.channels),
+        local_balance_sat=sum(
+            channel.local_balance_sat for channel in data.channels
+        ),
+        eventual_close_fees_sat=0,
+        pending_outbound_payments_sat=0,
+        num_peers=len(data.channels),
+        onchain_pubkey=data.pubkey,
+        max_media_upload_size_mb=5,
+        rgb_htlc_min_msat=3_000_000,
+        rgb_channel_capacity_min_sat=30_010,
+        channel_capacity_min_sat=5_506,
+        channel_capacity_max_sat=16_777_215,
+        channel_asset_min_amount=1,
+        channel_asset_max_amount=18_446_744_073_709_551_615,
+        network_nodes=len(data.channels) + 1,
+        network_channels=len(data.channels),
+    )
+
+
+def _status(_data: MockNodeData, _body: dict[str, Any]) -> dict[str, bool]:
+    return {'status': True}
+
+
+def _txid(data: MockNodeData, _body: dict[str, Any]) -> SendBtcResponseModel:
+    return SendBtcResponseModel(txid=data.transactions[0].txid if data.transactions else '00' * 32)
+
+
+def _keysend(data: MockNodeData, _body: dict[str, Any]) -> KeysendResponseModel:
+    return KeysendResponseModel(
+        payment_hash=data.pubkey[:64], payment_secret=data.pubkey[2:66], status='Pending',
+    )
+
+
+ROUTES: dict[str, Callable[[MockNodeData, dict[str, Any]], BaseModel | dict]] = {
+    # Reads
+    endpoints.LIST_ASSETS_ENDPOINT: _list_assets,
+    endpoints.ASSET_BALANCE_ENDPOINT: _asset_balance,
+    endpoints.LIST_TRANSFERS_ENDPOINT: lambda data, body: ListTransferAssetResponseModel(
+        transfers=data.transfers.get(body.get('asset_id'), []),
+    ),
+    endpoints.LIST_PAYMENTS_ENDPOINT: lambda data, body: ListPaymentResponseModel(
+        payments=data.payments,
+    ),
+    endpoints.LIST_CHANNELS_ENDPOINT: lambda data, body: ChannelsListResponseModel(
+        channels=data.channels,
+    ),
+    endpoints.LIST_PEERS_ENDPOINT: lambda data, body: ListPeersResponseModel(
+        peers=[Peer(pubkey=channel.peer_pubkey) for channel in data.channels],
+    ),
+    endpoints.LIST_TRANSACTIONS_ENDPOINT: lambda data, body: TransactionListResponse(
+        transactions=data.transactions,
+    ),
+    endpoints.LIST_UNSPENT_ENDPOINT: lambda data, body: UnspentsListResponseModel(
+        unspents=data.unspents,
+    ),
+    endpoints.BTC_BALANCE_ENDPOINT: lambda data, body: data.btc_balance(),
+    endpoints.NODE_INFO_ENDPOINT: _node_info,
+    endpoints.NETWORK_INFO_ENDPOINT: lambda data, body: NetworkInfoResponseModel(
+        network='Regtest', height=100 + len(data.transactions),
+    ),
+    endpoints.ESTIMATE_FEE_ENDPOINT: lambda data, body: EstimateFeeResponse(
+        fee_rate=max(1.0, 10.0 / max(1, body.get('blocks', 1))),
+    ),
+    endpoints.GET_ASSET_MEDIA: lambda data, body: GetAssetMediaModelResponseModel(
+        bytes_hex=data.media_hex,
+    ),
+    endpoints.ADDRESS_ENDPOINT: lambda data, body: AddressResponseModel(
+        address='bcrt1qmocknodeaddress000000000000000000000000',
+    ),
+    endpoints.DECODE_LN_INVOICE_ENDPOINT: lambda data, body: DecodeInvoiceResponseModel(
+        amt_msat=3_000_000, expiry_sec=420, timestamp=BASE_TIMESTAMP,
+        asset_id=None, asset_amount=None, payment_hash=data.pubkey[:64],
+        payment_secret=data.pubkey[2:66], payee_pubkey=data.pubkey, network='Regtest',
+    ),
+    endpoints.DECODE_RGB_INVOICE_ENDPOINT: lambda data, body: DecodeRgbInvoiceResponseModel(
+        recipient_id=data.pubkey[:32], network='Regtest',
+        expiration_timestamp=BASE_TIMESTAMP + 86_400, transport_endpoints=[],
+    ),
+    endpoints.INVOICE_STATUS_ENDPOINT: lambda data, body: InvoiceStatusResponseModel(
+        status='Pending',
+    ),
+    endpoints.CHECK_INDEXER_URL_ENDPOINT: lambda data, body: CheckIndexerUrlResponseModel(
+        indexer_protocol='Electrum',
+    ),
+    # Writes; the dataset is left unchanged
+    endpoints.INIT_ENDPOINT: lambda data, body: InitResponseModel(
+        mnemonic=' '.join(['abandon'] * 11 + ['about']),
+    ),
+    endpoints.UNLOCK_ENDPOINT: _status,
+    endpoints.LOCK_ENDPOINT: _status,
+    endpoints.BACKUP_ENDPOINT: _status,
+    endpoints.RESTORE_ENDPOINT: _status,
+    endpoints.CHANGE_PASSWORD_ENDPOINT: _status,
+    endpoints.SHUTDOWN_ENDPOINT: _status,
+    endpoints.CHECK_PROXY_ENDPOINT: _status,
+    endpoints.SEND_ONION_MESSAGE_ENDPOINT: _status,
+    endpoints.CONNECT_PEER_ENDPOINT: _status,
+    endpoints.DISCONNECT_PEER_ENDPOINT: _status,
+    endpoints.CLOSE_CHANNEL_ENDPOINT: _status,
+    endpoints.CREATE_UTXO_ENDPOINT: _status,
+    endpoints.REFRESH_TRANSFERS_ENDPOINT: _status,
+    endpoints.FAIL_TRANSFER_ENDPOINT: lambda data, body: {'transfers_changed': False},
+    endpoints.SIGN_MESSAGE_ENDPOINT: lambda data, body: SignMessageResponseModel(
+        signed_message=data.pubkey,
+    ),
+    endpoints.OPEN_CHANNEL_ENDPOINT: lambda data, body: OpenChannelResponseModel(
+        temporary_channel_id=data.pubkey[:64],
+    ),
+    endpoints.SEND_BTC_ENDPOINT: _txid,
+    endpoints.SEND_ASSET_ENDPOINT: lambda data, body: SendAssetResponseModel(
+        txid=_txid(data, body).txid,
+    ),
+    endpoints.KEY_SEND_ENDPOINT: _keysend,
+    endpoints.SEND_PAYMENT_ENDPOINT: _keysend,
+    endpoints.LN_INVOICE_ENDPOINT: lambda data, body: LnInvoiceResponseModel(
+        invoice=f'lnbcrt30u1mock{data.pubkey[:32]}',
+    ),
+    endpoints.RGB_INVOICE_ENDPOINT: lambda data, body: RgbInvoiceDataResponseModel(
+        recipient_id=data.pubkey[:32], invoice=f'rgb:~/~/~/bcrt:utxob:{
+            data.pubkey[:32]
+        }',
+        expiration_timestamp=BASE_TIMESTAMP + 86_400, batch_transfer_idx=1,
+    ),
+    endpoints.POST_ASSET_MEDIA: lambda data, body: PostAssetMediaModelResponseModel(
+        digest=data.pubkey[:64],
+    ),
+}
+for _schema, _endpoint in (
+    ('nia', endpoints.ISSUE_ASSET_ENDPOINT_NIA),
+    ('cfa', endpoints.ISSUE_ASSET_ENDPOINT_CFA),
+    ('uda', endpoints.ISSUE_ASSET_ENDPOINT_UDA),
+):
+    ROUTES[_endpoint] = lambda data, body, schema=_schema: data.new_asset(
+        schema,
+    )
+
+
+def _endpoint_latency(value: str) -> tuple[str, float]:
+    """Parse an `ENDPOINT=MILLISECONDS` command line value."""
+    endpoint, _, latency = value.partition('=')
+    try:
+        return endpoint, float(latency)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f'Expected ENDPOINT=MILLISECONDS, got {value}',
+        ) from exc
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments of the mock node."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--assets', type=int, default=DEFAULT_ASSETS)
+    parser.add_argument(
+        '--transfers', type=int, default=DEFAULT_TRANSFERS,
+        help='Number of transfers of each asset.',
+    )
+    parser.add_argument('--payments', type=int, default=DEFAULT_PAYMENTS)
+    parser.add_argument('--channels', type=int, default=DEFAULT_CHANNELS)
+    parser.add_argument(
+        '--transactions', type=int,
+        default=DEFAULT_TRANSACTIONS,
+    )
+    parser.add_argument('--unspents', type=int, default=DEFAULT_UNSPENTS)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument(
+        '--endpoint-latency', type=_endpoint_latency, action='append', default=[],
+        metavar='ENDPOINT=MS', help='Latency of one endpoint, e.g. /listassets=200.',
+    )
+    parser.add_argument('--error-rate', type=float, default=0)
+    parser.add_argument(
+        '--error-status', type=int,
+        default=DEFAULT_ERROR_STATUS,
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Start the mock node and serve requests until interrupted."""
+    args = parse_args(argv)
+    data = MockNodeData(
+        assets=args.assets,
+        transfers=args.transfers,
+        payments=args.payments,
+        channels=args.channels,
+        transactions=args.transactions,
+        unspents=args.unspents,
+        seed=args.seed,
+    )
+    server = MockNodeServer(
+        data,
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        endpoint_latency_ms=dict(args.endpoint_latency),
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    print(f'Mock node listening on {server.url}', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""
+Headless benchmark of the application startup.
+
+Runs the application several times under `QT_QPA_PLATFORM=offscreen` with
+startup tracing enabled, until the first paint of the target page, and
+reports the median duration of every startup phase. A stub node can be
+started for the duration of the benchmark, so that the node start and unlock
+phases do not depend on a real rgb-lightning-node; see
+`benchmarks/mock_node_server.py`.
+
+When a baseline file is given, phases whose median exceeds the baseline by
+more than the tolerance are reported and the script exits with status 1, so
+that startup regressions can be caught in CI.
+
+Usage:
+    python benchmarks/startup_benchmark.py --network regtest --runs 5
+    python benchmarks/startup_benchmark.py --network regtest --page TermCondition \\
+        --output startup.json --baseline benchmarks/startup_baseline.json
+    python benchmarks/startup_benchmark.py --network regtest \
+        --stub-node-command "python -m benchmarks.mock_node_server --assets 100"
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shlex
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_RUNS = 5
+DEFAULT_TIMEOUT = 120
+DEFAULT_TOLERANCE = 0.2
+DEFAULT_MIN_REGRESSION_MS = 50.0
+
+
+def run_once(network: str, page: str, timeout: float) -> dict[str, float]:
+    """Start the application once and return the phase durations of its startup trace."""
+    with tempfile.TemporaryDirectory() as trace_dir:
+        trace_path = os.path.join(trace_dir, 'startup_trace.json')
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+        try:
+            subprocess.run(
+                [
+                    sys.executable, '-m', 'src.main',
+                    '--network', network,
+                    '--startup-trace', trace_path,
+                    '--startup-trace-page', page,
+                    '--startup-trace-exit',
+                ],
+                cwd=ROOT_DIR, env=env, timeout=timeout, check=False,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+        except subprocess.TimeoutExpired as exc:
+            raise RuntimeError(f'{page} was not painted within {
+                               timeout
+                               } s') from exc
+        if not os.path.exists(trace_path):
+            raise RuntimeError(f'No startup trace written; {
+                               page
+                               } was never painted')
+        with open(trace_path, encoding='utf-8') as trace_file:
+            return json.load(trace_file)['otherData']['phases_ms']
+
+
+def summarize(runs: list[dict[str, float]]) -> dict[str, float]:
+    """Return the median duration of every phase recorded in at least one run."""
+    phases = sorted({name for run in runs for name in run})
+    return {
+        name: round(
+            statistics.median(
+                run[name]
+                for run in runs if name in run
+            ), 1,
+        )
+        for name in phases
+    }
+
+
+def find_regressions(
+    summary: dict[str, float],
+    baseline: dict[str, float],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_regression_ms: float = DEFAULT_MIN_REGRESSION_MS,
+) -> dict[str, tuple[float, float]]:
+    """Return the phases slower than their baseline by more than the tolerance."""
+    return {
+        name: (baseline[name], duration)
+        for name, duration in summary.items()
+        if name in baseline
+        and duration > baseline[name] * (1 + tolerance)
+        and duration - baseline[name] > min_regression_ms
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line arguments of the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        '--network', choices=['mainnet', 'testnet', 'regtest'], default='regtest',
+    )
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    parser.add_argument(
+        '--page', default='FungibleAssetWidget',
+        help='Page whose first paint ends each run.',
+    )
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument(
+        '--stub-node-command',
+        help='Command starting a stub node for the duration of the benchmark.',
+    )
+    parser.add_argument(
+        '--output', help='Write the median phase durations to this JSON file.',
+    )
+    parser.add_argument(
+        '--baseline', help='JSON file of median phase durations to compare with.',
+    )
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the benchmark and return the exit status."""
+    args = parse_args()
+    stub_node = None
+    if args.stub_node_command:
+        stub_node = subprocess.Popen(  # pylint: disable=consider-using-with
+            shlex.split(args.stub_node_command), cwd=ROOT_DIR,
+        )
+        time.sleep(1)
+    try:
+        runs = [
+            run_once(args.network, args.page, args.timeout)
+            for _ in range(args.runs)
+        ]
+    except RuntimeError as exc:
+        print(f'Startup benchmark failed: {exc}')
+        return 2
+    finally:
+        if stub_node is not None:
+            stub_node.terminate()
+            stub_node.wait(timeout=10)
+
+    summary = summarize(runs)
+    for name, duration in summary.items():
+        print(f'{name:<40} {duration:>10.1f} ms')
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(summary, output_file, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            regressions = find_regressions(
+                summary, json.load(baseline_file), args.tolerance,
+            )
+        for name, (expected, duration) in regressions.items():
+            print(f'Regression: {name} took {
+                  duration:.1f
+                  } ms, baseline {expected:.1f} ms')
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
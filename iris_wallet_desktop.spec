@@ -46,7 +46,8 @@ a = Analysis(
     pathex=[],
     binaries=rgb_lib_binaries,
     datas=datas,
-    hiddenimports=['pyqttoast', 'PySide6', 'bip32utils', 'mnemonic', 'importlib_metadata', 'hashlib', 'rgb_lib'],
+    # Page modules are imported by name on first navigation
+    hiddenimports=['pyqttoast', 'PySide6', 'bip32utils', 'mnemonic', 'importlib_metadata', 'hashlib', 'rgb_lib'] + collect_submodules('src.views'),
     hookspath=[],
     runtime_hooks=[],
     excludes=[
@@ -12,6 +12,7 @@ from src.model.btc_model import UnspentsListResponseModel
 from src.model.common_operation_model import SkipSyncModel
 from src.utils.cache import Cache
 from src.utils.custom_context import repository_custom_context
+from src.utils.decorators.read_only import read_only
 from src.utils.decorators.unlock_required import unlock_required
 from src.utils.endpoints import ADDRESS_ENDPOINT
 from src.utils.endpoints import BTC_BALANCE_ENDPOINT
@@ -37,6 +38,7 @@ class BtcRepository:
 
     @staticmethod
     @unlock_required
+    @read_only
     def get_btc_balance() -> BalanceResponseModel:
         """Get Bitcoin balance."""
         with repository_custom_context():
@@ -48,6 +50,7 @@ class BtcRepository:
 
     @staticmethod
     @unlock_required
+    @read_only
     def list_transactions() -> TransactionListResponse:
         """List Bitcoin transactions."""
         with repository_custom_context():
@@ -59,6 +62,7 @@ class BtcRepository:
 
     @staticmethod
     @unlock_required
+    @read_only
     def list_unspents() -> UnspentsListResponseModel:
         """List unspent Bitcoin."""
         with repository_custom_context():
@@ -78,11 +82,12 @@ class BtcRepository:
             data = response.json()
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(SEND_BTC_ENDPOINT)
             return SendBtcResponseModel(**data)
 
     @staticmethod
     @unlock_required
+    @read_only
     def estimate_fee(blocks: EstimateFeeRequestModel) -> EstimateFeeResponse:
         """Get Estimate Fee"""
         payload = blocks.dict()
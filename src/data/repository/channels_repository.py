@@ -8,6 +8,7 @@ from src.model.channels_model import OpenChannelResponseModel
 from src.model.channels_model import OpenChannelsRequestModel
 from src.utils.cache import Cache
 from src.utils.custom_context import repository_custom_context
+from src.utils.decorators.read_only import read_only
 from src.utils.decorators.unlock_required import unlock_required
 from src.utils.endpoints import CLOSE_CHANNEL_ENDPOINT
 from src.utils.endpoints import LIST_CHANNELS_ENDPOINT
@@ -28,7 +29,7 @@ class ChannelRepository:
             response.raise_for_status()  # Raises an exception for HTTP errors
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(CLOSE_CHANNEL_ENDPOINT)
             return CloseChannelResponseModel(status=True)
 
     @staticmethod
@@ -42,11 +43,12 @@ class ChannelRepository:
             data = response.json()
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(OPEN_CHANNEL_ENDPOINT)
             return OpenChannelResponseModel(**data)
 
     @staticmethod
     @unlock_required
+    @read_only
     def list_channel() -> ChannelsListResponseModel:
         """List channels."""
         with repository_custom_context():
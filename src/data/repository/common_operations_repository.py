@@ -22,6 +22,7 @@ from src.model.common_operation_model import UnlockResponseModel
 from src.utils.custom_context import repository_custom_context
 from src.utils.decorators.is_node_initialized import is_node_initialized
 from src.utils.decorators.lock_required import lock_required
+from src.utils.decorators.read_only import read_only
 from src.utils.decorators.unlock_required import unlock_required
 from src.utils.endpoints import BACKUP_ENDPOINT
 from src.utils.endpoints import CHANGE_PASSWORD_ENDPOINT
@@ -35,6 +36,7 @@ from src.utils.endpoints import SHUTDOWN_ENDPOINT
 from src.utils.endpoints import SIGN_MESSAGE_ENDPOINT
 from src.utils.endpoints import UNLOCK_ENDPOINT
 from src.utils.request import Request
+from src.utils.startup_trace import StartupTracer
 
 
 class CommonOperationRepository:
@@ -57,13 +59,14 @@ class CommonOperationRepository:
     def unlock(unlock: UnlockRequestModel) -> UnlockResponseModel:
         """Unlock operation."""
         payload = unlock.dict()
-        with repository_custom_context():
+        with repository_custom_context(), StartupTracer.get_instance().phase('unlock'):
             response = Request.post(UNLOCK_ENDPOINT, payload)
             response.raise_for_status()  # Raises an exception for HTTP errors
             return UnlockResponseModel(status=True)
 
     @staticmethod
     @unlock_required
+    @read_only
     def node_info() -> NodeInfoResponseModel:
         """Node info operation."""
         with repository_custom_context():
@@ -74,6 +77,7 @@ class CommonOperationRepository:
 
     @staticmethod
     @unlock_required
+    @read_only
     def network_info() -> NetworkInfoResponseModel:
         """Network info operation."""
         with repository_custom_context():
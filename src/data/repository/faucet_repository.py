@@ -11,6 +11,7 @@ from src.utils.cache import Cache
 from src.utils.constant import API_KEY
 from src.utils.constant import API_KEY_OPERATOR
 from src.utils.custom_context import repository_custom_context
+from src.utils.decorators.read_only import read_only
 from src.utils.endpoints import LIST_FAUCET_ASSETS
 from src.utils.endpoints import REQUEST_FAUCET_ASSET
 from src.utils.endpoints import WALLET_CONFIG
@@ -20,6 +21,7 @@ class FaucetRepository:
     """Faucet Repository class"""
 
     @staticmethod
+    @read_only
     def list_available_faucet_asset(faucet_url: str) -> ListAssetResponseModel:
         """List available asset of faucet"""
         headers = {
@@ -59,5 +61,5 @@ class FaucetRepository:
             data = response.json()
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(REQUEST_FAUCET_ASSET)
             return RequestAssetResponseModel(**data)
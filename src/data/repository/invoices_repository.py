@@ -8,6 +8,7 @@ from src.model.invoices_model import InvoiceStatusResponseModel
 from src.model.invoices_model import LnInvoiceRequestModel
 from src.model.invoices_model import LnInvoiceResponseModel
 from src.utils.custom_context import repository_custom_context
+from src.utils.decorators.read_only import read_only
 from src.utils.decorators.unlock_required import unlock_required
 from src.utils.endpoints import DECODE_LN_INVOICE_ENDPOINT
 from src.utils.endpoints import INVOICE_STATUS_ENDPOINT
@@ -20,6 +21,7 @@ class InvoiceRepository:
 
     @staticmethod
     @unlock_required
+    @read_only
     def decode_ln_invoice(invoice: DecodeLnInvoiceRequestModel) -> DecodeInvoiceResponseModel:
         """Decode LN invoice."""
         payload = invoice.dict()
@@ -31,6 +33,7 @@ class InvoiceRepository:
 
     @staticmethod
     @unlock_required
+    @read_only
     def invoice_status(invoice: InvoiceStatusRequestModel) -> InvoiceStatusResponseModel:
         """Get invoice status."""
         payload = invoice.dict()
@@ -8,6 +8,7 @@ from src.model.payments_model import SendPaymentRequestModel
 from src.model.payments_model import SendPaymentResponseModel
 from src.utils.cache import Cache
 from src.utils.custom_context import repository_custom_context
+from src.utils.decorators.read_only import read_only
 from src.utils.decorators.unlock_required import unlock_required
 from src.utils.endpoints import KEY_SEND_ENDPOINT
 from src.utils.endpoints import LIST_PAYMENTS_ENDPOINT
@@ -29,7 +30,7 @@ class PaymentRepository:
             data = response.json()
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(KEY_SEND_ENDPOINT)
             return KeysendResponseModel(**data)
 
     @staticmethod
@@ -43,11 +44,12 @@ class PaymentRepository:
             data = response.json()
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(SEND_PAYMENT_ENDPOINT)
             return SendPaymentResponseModel(**data)
 
     @staticmethod
     @unlock_required
+    @read_only
     def list_payment() -> ListPaymentResponseModel:
         """List payments."""
         with repository_custom_context():
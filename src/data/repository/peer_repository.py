@@ -7,6 +7,7 @@ from src.model.peers_model import DisconnectPeerRequestModel
 from src.model.peers_model import DisconnectResponseModel
 from src.model.peers_model import ListPeersResponseModel
 from src.utils.custom_context import repository_custom_context
+from src.utils.decorators.read_only import read_only
 from src.utils.decorators.unlock_required import unlock_required
 from src.utils.endpoints import CONNECT_PEER_ENDPOINT
 from src.utils.endpoints import DISCONNECT_PEER_ENDPOINT
@@ -39,6 +40,7 @@ class PeerRepository:
 
     @staticmethod
     @unlock_required
+    @read_only
     def list_peer() -> ListPeersResponseModel:
         """List connected peers."""
         with repository_custom_context():
@@ -31,6 +31,7 @@ from src.model.rgb_model import SendAssetResponseModel
 from src.utils.cache import Cache
 from src.utils.custom_context import repository_custom_context
 from src.utils.decorators.check_colorable_available import check_colorable_available
+from src.utils.decorators.read_only import read_only
 from src.utils.decorators.unlock_required import unlock_required
 from src.utils.endpoints import ASSET_BALANCE_ENDPOINT
 from src.utils.endpoints import CREATE_UTXO_ENDPOINT
@@ -62,11 +63,12 @@ class RgbRepository:
             response.raise_for_status()  # Raises an exception for HTTP errors
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(CREATE_UTXO_ENDPOINT)
             return CreateUtxosResponseModel(status=True)
 
     @staticmethod
     @unlock_required
+    @read_only
     def get_asset_balance(
         asset_balance: AssetIdModel,
     ) -> AssetBalanceResponseModel:
@@ -80,6 +82,7 @@ class RgbRepository:
 
     @staticmethod
     @unlock_required
+    @read_only
     def decode_invoice(invoice: DecodeRgbInvoiceRequestModel):
         """Decode RGB invoice."""
         payload = invoice.dict()
@@ -91,6 +94,7 @@ class RgbRepository:
 
     @staticmethod
     @unlock_required
+    @read_only
     def list_transfers(asset_id: ListTransfersRequestModel):
         """List transfers."""
         payload = asset_id.dict()
@@ -122,7 +126,7 @@ class RgbRepository:
             data = response.json()
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(RGB_INVOICE_ENDPOINT)
             return RgbInvoiceDataResponseModel(**data)
 
     @staticmethod
@@ -137,11 +141,12 @@ class RgbRepository:
             data = response.json()
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(SEND_ASSET_ENDPOINT)
             return SendAssetResponseModel(**data)
 
     @staticmethod
     @unlock_required
+    @read_only
     def get_assets(filter_asset_request_model: FilterAssetRequestModel) -> GetAssetResponseModel:
         """Get assets."""
         payload = filter_asset_request_model.dict()
@@ -149,9 +154,6 @@ class RgbRepository:
             response = Request.post(LIST_ASSETS_ENDPOINT, body=payload)
             response.raise_for_status()  # Raises an exception for HTTP errors
             data = response.json()
-            cache = Cache.get_cache_session()
-            if cache is not None:
-                cache.invalidate_cache()
             return GetAssetResponseModel(**data)
 
     @staticmethod
@@ -167,7 +169,7 @@ class RgbRepository:
             asset_data = data['asset']
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(ISSUE_ASSET_ENDPOINT_NIA)
             return IssueAssetResponseModel(**asset_data)
 
     @staticmethod
@@ -183,7 +185,7 @@ class RgbRepository:
             asset_data = data['asset']
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(ISSUE_ASSET_ENDPOINT_CFA)
             return IssueAssetResponseModel(**asset_data)
 
     @staticmethod
@@ -199,11 +201,12 @@ class RgbRepository:
             asset_data = data['asset']
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(ISSUE_ASSET_ENDPOINT_UDA)
             return IssueAssetResponseModel(**asset_data)
 
     @staticmethod
     @unlock_required
+    @read_only
     def get_asset_media_hex(digest: GetAssetMediaModelRequestModel) -> GetAssetMediaModelResponseModel:
         """Get asset media hex from digest"""
         payload = digest.dict()
@@ -234,5 +237,5 @@ class RgbRepository:
             data = response.json()
             cache = Cache.get_cache_session()
             if cache is not None:
-                cache.invalidate_cache()
+                cache.invalidate_for_endpoint(FAIL_TRANSFER_ENDPOINT)
             return FailTransferResponseModel(**data)
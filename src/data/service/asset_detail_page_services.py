@@ -12,6 +12,7 @@ from src.model.enums.enums_model import AssetTransferStatusEnumModel
 from src.model.enums.enums_model import TransactionStatusEnumModel
 from src.model.enums.enums_model import TransferStatusEnumModel
 from src.model.payments_model import ListPaymentResponseModel
+from src.model.payments_model import Payment
 from src.model.rgb_model import AssetBalanceResponseModel
 from src.model.rgb_model import AssetIdModel
 from src.model.rgb_model import ListOnAndOffChainTransfersWithBalance
@@ -22,6 +23,10 @@ from src.model.rgb_model import TransferAsset
 from src.utils.custom_exception import CommonException
 from src.utils.custom_exception import ServiceOperationException
 from src.utils.handle_exception import handle_exceptions
+from src.utils.history_store import HISTORY_KIND_ASSET_TRANSFER
+from src.utils.history_store import HISTORY_KIND_LN_PAYMENT
+from src.utils.history_store import sync_history
+from src.utils.service_executor import ServiceExecutor
 
 
 class AssetDetailPageService:
@@ -44,76 +49,50 @@ class AssetDetailPageService:
         ServiceOperationException: If an unknown transaction type is encountered.
         """
         try:
-            transactions: ListTransferAssetResponseModel = RgbRepository.list_transfers(
-                list_transfers_request_model,
-            )
-            balance: AssetBalanceResponseModel = RgbRepository.get_asset_balance(
-                AssetIdModel(asset_id=list_transfers_request_model.asset_id),
-            )
-            lightning: ListPaymentResponseModel = PaymentRepository.list_payment()
+            asset_id = list_transfers_request_model.asset_id
+            results = ServiceExecutor.get_instance().run_parallel({
+                'transactions': lambda: RgbRepository.list_transfers(
+                    list_transfers_request_model,
+                ),
+                'balance': lambda: RgbRepository.get_asset_balance(
+                    AssetIdModel(asset_id=asset_id),
+                ),
+                'lightning': PaymentRepository.list_payment,
+            })
+            transactions: ListTransferAssetResponseModel = results['transactions']
+            balance: AssetBalanceResponseModel = results['balance']
+            lightning: ListPaymentResponseModel = results['lightning']
+
+            # The node lists payments of every asset, keep only this asset's before formatting
+            if lightning and lightning.payments:
+                lightning.payments = [
+                    payment for payment in lightning.payments
+                    if payment is not None and payment.asset_id == asset_id
+                ]
 
             if (not transactions or not transactions.transfers) and (not lightning or not lightning.payments):
                 return ListOnAndOffChainTransfersWithBalance(transfers=[], lightning=[], asset_balance=balance)
             if lightning and lightning.payments:
-                for transaction in lightning.payments:
-                    if transaction is None:
-                        continue
-                    # Convert the timestamp to a datetime object and format it
-                    update_at = datetime.fromtimestamp(
-                        transaction.updated_at,
-                    )
-                    transaction.updated_at_date = update_at.strftime(
-                        '%Y-%m-%d',
-                    )
-                    transaction.updated_at_time = update_at.strftime(
-                        '%H:%M:%S',
-                    )
-                    # Convert the timestamp to a datetime object and format it
-                    create_at = datetime.fromtimestamp(transaction.created_at)
-                    transaction.created_at_date = create_at.strftime(
-                        '%Y-%m-%d',
-                    )
-                    transaction.created_at_time = create_at.strftime(
-                        '%H:%M:%S',
-                    )
-                    transaction.asset_amount_status = f'-{str(transaction.asset_amount)}' if not transaction.inbound else f'+{
-                        str(transaction.asset_amount)
-                    }'
+                lightning.payments = sync_history(
+                    HISTORY_KIND_LN_PAYMENT,
+                    asset_id,
+                    [
+                        (f'{payment.payment_hash}:{payment.inbound}', payment)
+                        for payment in lightning.payments
+                    ],
+                    AssetDetailPageService.format_payment,
+                )
 
             if transactions and transactions.transfers:
-                for transaction in transactions.transfers:
-                    if transaction is None:
-                        continue
-
-                    status_to_check = [
-                        TransactionStatusEnumModel.SETTLED,
-                        TransactionStatusEnumModel.FAILED,
-                        TransactionStatusEnumModel.CONFIRMED,
-                        TransactionStatusEnumModel.WAITING_CONFIRMATIONS,
-                        TransactionStatusEnumModel.WAITING_COUNTERPARTY,
-                    ]
-
-                    if transaction.status in [status.value for status in status_to_check]:
-                        # Convert the timestamp to a datetime object and format it
-                        update_at = datetime.fromtimestamp(
-                            transaction.updated_at,
-                        )
-                        transaction.updated_at_date = update_at.strftime(
-                            '%Y-%m-%d',
-                        )
-                        transaction.updated_at_time = update_at.strftime(
-                            '%H:%M:%S',
-                        )
-
-                    # Convert the timestamp to a datetime object and format it
-                    create_at = datetime.fromtimestamp(transaction.created_at)
-                    transaction.created_at_date = create_at.strftime(
-                        '%Y-%m-%d',
-                    )
-                    transaction.created_at_time = create_at.strftime(
-                        '%H:%M:%S',
-                    )
-                    AssetDetailPageService.assign_transfer_status(transaction)
+                transactions.transfers = sync_history(
+                    HISTORY_KIND_ASSET_TRANSFER,
+                    asset_id,
+                    [
+                        (str(transfer.idx), transfer)
+                        for transfer in transactions.transfers if transfer is not None
+                    ],
+                    AssetDetailPageService.format_transfer,
+                )
 
             transactions.transfers = sorted(
                 transactions.transfers or [],
@@ -126,6 +105,85 @@ class AssetDetailPageService:
         except Exception as exc:
             return handle_exceptions(exc)
 
+    @staticmethod
+    def format_payment(transaction: Payment) -> Payment:
+        """
+        Set the date, time and signed amount fields of a Lightning payment.
+
+        Args:
+            transaction (Payment): The payment as returned by the node.
+
+        Returns:
+            Payment: The same payment with its display fields set.
+        """
+        # Convert the timestamp to a datetime object and format it
+        update_at = datetime.fromtimestamp(
+            transaction.updated_at,
+        )
+        transaction.updated_at_date = update_at.strftime(
+            '%Y-%m-%d',
+        )
+        transaction.updated_at_time = update_at.strftime(
+            '%H:%M:%S',
+        )
+        # Convert the timestamp to a datetime object and format it
+        create_at = datetime.fromtimestamp(transaction.created_at)
+        transaction.created_at_date = create_at.strftime(
+            '%Y-%m-%d',
+        )
+        transaction.created_at_time = create_at.strftime(
+            '%H:%M:%S',
+        )
+        transaction.asset_amount_status = f'-{str(transaction.asset_amount)}' if not transaction.inbound else f'+{
+            str(transaction.asset_amount)
+        }'
+        return transaction
+
+    @staticmethod
+    def format_transfer(transaction: TransferAsset) -> TransferAsset:
+        """
+        Set the date, time and transfer status fields of an on-chain transfer.
+
+        Args:
+            transaction (TransferAsset): The transfer as returned by the node.
+
+        Returns:
+            TransferAsset: The same transfer with its display fields set.
+
+        Raises:
+            ServiceOperationException: If the transfer kind is unknown.
+        """
+        status_to_check = [
+            TransactionStatusEnumModel.SETTLED,
+            TransactionStatusEnumModel.FAILED,
+            TransactionStatusEnumModel.CONFIRMED,
+            TransactionStatusEnumModel.WAITING_CONFIRMATIONS,
+            TransactionStatusEnumModel.WAITING_COUNTERPARTY,
+        ]
+
+        if transaction.status in [status.value for status in status_to_check]:
+            # Convert the timestamp to a datetime object and format it
+            update_at = datetime.fromtimestamp(
+                transaction.updated_at,
+            )
+            transaction.updated_at_date = update_at.strftime(
+                '%Y-%m-%d',
+            )
+            transaction.updated_at_time = update_at.strftime(
+                '%H:%M:%S',
+            )
+
+        # Convert the timestamp to a datetime object and format it
+        create_at = datetime.fromtimestamp(transaction.created_at)
+        transaction.created_at_date = create_at.strftime(
+            '%Y-%m-%d',
+        )
+        transaction.created_at_time = create_at.strftime(
+            '%H:%M:%S',
+        )
+        AssetDetailPageService.assign_transfer_status(transaction)
+        return transaction
+
     @staticmethod
     def get_single_asset_transaction(asset_id: ListTransfersRequestModel, transaction_tx: TransactionTxModel) -> TransferAsset | None:
         """
@@ -12,10 +12,10 @@ from src.model.btc_model import BalanceResponseModel
 from src.model.btc_model import Transaction
 from src.model.btc_model import TransactionListResponse
 from src.model.btc_model import TransactionListWithBalanceResponse
-from src.model.enums.enums_model import TransactionStatusEnumModel
-from src.model.enums.enums_model import TransferStatusEnumModel
 from src.utils.custom_exception import ServiceOperationException
 from src.utils.handle_exception import handle_exceptions
+from src.utils.history_store import HISTORY_KIND_BTC_TRANSACTION
+from src.utils.history_store import sync_history
 
 
 class BitcoinPageService:
@@ -26,9 +26,6 @@ class BitcoinPageService:
     def get_btc_transaction() -> TransactionListWithBalanceResponse:
         """Gives transaction list for on-chain transactions"""
         try:
-            # For transaction status
-            transfer_status: TransferStatusEnumModel | None = None
-            transaction_status: TransactionStatusEnumModel | None = None
             bitcoin_balance: BalanceResponseModel = BtcRepository.get_btc_balance()
             transaction_list: TransactionListResponse = BtcRepository.list_transactions()
             if not transaction_list or not transaction_list.transactions:
@@ -38,61 +35,17 @@ class BitcoinPageService:
             confirm_transactions_list: list[Transaction] = []
             unconfirm_transaction_list: list[Transaction] = []
 
-            for transaction in transaction_list.transactions:
-                if transaction is None:
-                    continue
-
-                # Use helper to calculate amount
-                amount: str | None = calculate_transaction_amount(
-                    transaction=transaction,
-                )
-                if amount is None:
-                    raise ServiceOperationException(
-                        f'Unable to calculate amount {amount}',
-                    ) from None
-                transaction.amount = amount
-
-                # Getting transaction status
-                transfer_status, transaction_status = get_transaction_status(
-                    transaction,
-                )
-                if transfer_status is None or transaction_status is None:
-                    raise ServiceOperationException(
-                        'Unable to get transaction status',
-                    ) from None
-                transaction.transfer_status = transfer_status
-                transaction.transaction_status = transaction_status
-
-                if transaction.confirmation_time is not None:
-                    try:
-                        # Extract the timestamp from the ConfirmationTime object
-                        if transaction.confirmation_time.timestamp is None:
-                            raise ServiceOperationException(
-                                'Confirmation time is missing a timestamp',
-                            )
-
-                        timestamp = transaction.confirmation_time.timestamp
-
-                        # Convert the timestamp to a datetime object
-                        dt_object = datetime.fromtimestamp(timestamp)
-
-                        # Format the datetime object to the desired format
-                        date_str = dt_object.strftime('%Y-%m-%d')
-                        time_str = dt_object.strftime('%H:%M:%S')
-
-                        # Assign the formatted date and time to the transaction attributes
-                        transaction.confirmation_normal_time = time_str
-                        transaction.confirmation_date = date_str
-
-                    except AttributeError as exc:
-                        raise ServiceOperationException(
-                            f'AttributeError: {exc}',
-                        ) from exc
-                    except Exception as exc:
-                        raise ServiceOperationException(
-                            f'An error occurred: {exc}',
-                        ) from exc
+            transactions: list[Transaction] = sync_history(
+                HISTORY_KIND_BTC_TRANSACTION,
+                '',
+                [
+                    (transaction.txid, transaction)
+                    for transaction in transaction_list.transactions if transaction is not None
+                ],
+                BitcoinPageService.format_transaction,
+            )
 
+            for transaction in transactions:
                 if transaction.confirmation_time:
                     confirm_transactions_list.append(transaction)
                 else:
@@ -112,3 +65,70 @@ class BitcoinPageService:
             return TransactionListWithBalanceResponse(transactions=sorted_transactions.transactions, balance=bitcoin_balance)
         except Exception as exc:
             return handle_exceptions(exc)
+
+    @staticmethod
+    def format_transaction(transaction: Transaction) -> Transaction:
+        """
+        Set the amount, statuses and confirmation date and time of a transaction.
+
+        Args:
+            transaction (Transaction): The transaction as returned by the node.
+
+        Returns:
+            Transaction: The same transaction with its display fields set.
+
+        Raises:
+            ServiceOperationException: If the amount, status or confirmation time cannot be derived.
+        """
+        # Use helper to calculate amount
+        amount: str | None = calculate_transaction_amount(
+            transaction=transaction,
+        )
+        if amount is None:
+            raise ServiceOperationException(
+                f'Unable to calculate amount {amount}',
+            ) from None
+        transaction.amount = amount
+
+        # Getting transaction status
+        transfer_status, transaction_status = get_transaction_status(
+            transaction,
+        )
+        if transfer_status is None or transaction_status is None:
+            raise ServiceOperationException(
+                'Unable to get transaction status',
+            ) from None
+        transaction.transfer_status = transfer_status
+        transaction.transaction_status = transaction_status
+
+        if transaction.confirmation_time is not None:
+            try:
+                # Extract the timestamp from the ConfirmationTime object
+                if transaction.confirmation_time.timestamp is None:
+                    raise ServiceOperationException(
+                        'Confirmation time is missing a timestamp',
+                    )
+
+                timestamp = transaction.confirmation_time.timestamp
+
+                # Convert the timestamp to a datetime object
+                dt_object = datetime.fromtimestamp(timestamp)
+
+                # Format the datetime object to the desired format
+                date_str = dt_object.strftime('%Y-%m-%d')
+                time_str = dt_object.strftime('%H:%M:%S')
+
+                # Assign the formatted date and time to the transaction attributes
+                transaction.confirmation_normal_time = time_str
+                transaction.confirmation_date = date_str
+
+            except AttributeError as exc:
+                raise ServiceOperationException(
+                    f'AttributeError: {exc}',
+                ) from exc
+            except Exception as exc:
+                raise ServiceOperationException(
+                    f'An error occurred: {exc}',
+                ) from exc
+
+        return transaction
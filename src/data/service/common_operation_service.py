@@ -14,7 +14,6 @@ from src.model.node_info_model import NodeInfoModel
 from src.utils.constant import MNEMONIC_KEY
 from src.utils.constant import WALLET_PASSWORD_KEY
 from src.utils.custom_exception import CommonException
-from src.utils.decorators.unlock_required import is_node_locked
 from src.utils.error_message import ERROR_KEYRING_STORE_NOT_ACCESSIBLE
 from src.utils.error_message import ERROR_NETWORK_MISMATCH
 from src.utils.error_message import ERROR_UNABLE_GET_MNEMONIC
@@ -24,6 +23,7 @@ from src.utils.helpers import get_bitcoin_config
 from src.utils.helpers import hash_mnemonic
 from src.utils.helpers import validate_mnemonic
 from src.utils.keyring_storage import set_value
+from src.utils.node_state import is_node_locked
 
 
 class CommonOperationService:
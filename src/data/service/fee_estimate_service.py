@@ -0,0 +1,78 @@
+"""This module contains the service fetching and caching the node's fee estimates."""
+from __future__ import annotations
+
+from functools import partial
+
+from src.data.repository.btc_repository import BtcRepository
+from src.model.btc_model import EstimateFeeRequestModel
+from src.model.btc_model import EstimateFeeResponse
+from src.utils.constant import FEE_ESTIMATE_BLOCK_TARGETS
+from src.utils.custom_exception import CommonException
+from src.utils.fee_estimate_cache import FeeEstimateCache
+from src.utils.handle_exception import handle_exceptions
+from src.utils.logging import logger
+from src.utils.service_executor import ServiceExecutor
+
+
+class FeeEstimateService:
+    """Service class serving fee estimates from the shared cache."""
+
+    @staticmethod
+    def _estimate(blocks: int) -> EstimateFeeResponse | CommonException:
+        """Fetch the estimate of one block target, returning its error instead of raising it."""
+        try:
+            return BtcRepository.estimate_fee(EstimateFeeRequestModel(blocks=blocks))
+        except CommonException as exc:
+            return exc
+
+    @staticmethod
+    def refresh_fee_estimates() -> dict[int, EstimateFeeResponse | CommonException]:
+        """
+        Fetch the fee estimates of all block targets together and cache the successful ones.
+
+        Returns:
+            dict[int, EstimateFeeResponse | CommonException]: The estimate or error of each block target.
+        """
+        results = ServiceExecutor.get_instance().run_parallel({
+            str(blocks): partial(FeeEstimateService._estimate, blocks)
+            for blocks in FEE_ESTIMATE_BLOCK_TARGETS
+        })
+        cache = FeeEstimateCache.get_instance()
+        estimates: dict[int, EstimateFeeResponse | CommonException] = {}
+        for blocks in FEE_ESTIMATE_BLOCK_TARGETS:
+            result = results[str(blocks)]
+            if isinstance(result, EstimateFeeResponse):
+                cache.set(blocks, result.fee_rate)
+            else:
+                logger.warning(
+                    'Fee estimate for %d blocks failed: %s', blocks, result.message,
+                )
+            estimates[blocks] = result
+        return estimates
+
+    @staticmethod
+    def get_fee_rate(blocks: int) -> EstimateFeeResponse:
+        """
+        Return the fee estimate of the block target, fetching all targets if it is not cached.
+
+        Args:
+            blocks (int): The block target of the estimate.
+
+        Returns:
+            EstimateFeeResponse: The estimated fee rate.
+        """
+        try:
+            fee_rate = FeeEstimateCache.get_instance().get(blocks)
+            if fee_rate is not None:
+                return EstimateFeeResponse(fee_rate=fee_rate)
+
+            result = FeeEstimateService.refresh_fee_estimates().get(blocks)
+            if result is None:
+                result = FeeEstimateService._estimate(blocks)
+                if isinstance(result, EstimateFeeResponse):
+                    FeeEstimateCache.get_instance().set(blocks, result.fee_rate)
+            if isinstance(result, CommonException):
+                raise result
+            return result
+        except Exception as exc:
+            return handle_exceptions(exc)
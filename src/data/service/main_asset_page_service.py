@@ -4,6 +4,8 @@ This module provides the service for the main asset page.
 """
 from __future__ import annotations
 
+from concurrent.futures import wait
+
 from src.data.repository.btc_repository import BtcRepository
 from src.data.repository.rgb_repository import RgbRepository
 from src.data.repository.setting_repository import SettingRepository
@@ -19,6 +21,8 @@ from src.model.rgb_model import FilterAssetRequestModel
 from src.model.rgb_model import GetAssetResponseModel
 from src.model.setting_model import IsHideExhaustedAssetEnabled
 from src.utils.handle_exception import handle_exceptions
+from src.utils.image_cache import ImageCache
+from src.utils.service_executor import ServiceExecutor
 
 
 class MainAssetPageDataService:
@@ -45,10 +49,13 @@ class MainAssetPageDataService:
             )
             filtered_assets: list[AssetModel | None] = []
             RgbRepository.refresh_transfer()
-            asset_detail: GetAssetResponseModel = RgbRepository.get_assets(
-                request_model,
-            )
-            btc_balance: BalanceResponseModel = BtcRepository.get_btc_balance()
+            # Asset listing and BTC balance are independent once transfers are refreshed
+            results = ServiceExecutor.get_instance().run_parallel({
+                'asset_detail': lambda: RgbRepository.get_assets(request_model),
+                'btc_balance': BtcRepository.get_btc_balance,
+            })
+            asset_detail: GetAssetResponseModel = results['asset_detail']
+            btc_balance: BalanceResponseModel = results['btc_balance']
             stored_network: NetworkEnumModel = SettingRepository.get_wallet_network()
             btc_ticker: str = main_asset_page_helper.get_offline_asset_ticker(
                 network=stored_network,
@@ -90,6 +97,14 @@ class MainAssetPageDataService:
             if len(filtered_assets) > 0:
                 asset_detail.cfa = filtered_assets
 
+            # Fungible assets without media are shown with an identicon: render
+            # them here, off the GUI thread, before the page lists the assets
+            wait(
+                ImageCache.get_instance().prefetch_identicons(
+                    asset.asset_id for asset in asset_detail.nia or [] if asset is not None
+                ),
+            )
+
             return MainPageDataResponseModel(
                 nia=asset_detail.nia or [],
                 cfa=asset_detail.cfa or [],
@@ -5,8 +5,8 @@ from src.data.repository.btc_repository import BtcRepository
 from src.data.repository.channels_repository import ChannelRepository
 from src.data.repository.rgb_repository import RgbRepository
 from src.data.repository.setting_card_repository import SettingCardRepository
+from src.data.service.fee_estimate_service import FeeEstimateService
 from src.model.btc_model import BalanceResponseModel
-from src.model.btc_model import EstimateFeeRequestModel
 from src.model.btc_model import EstimateFeeResponse
 from src.model.btc_model import UnspentsListResponseModel
 from src.model.channels_model import OpenChannelResponseModel
@@ -47,8 +47,8 @@ class LnNodeChannelManagement:
         """
         try:
             # Request fee estimation
-            fee_response: EstimateFeeResponse = BtcRepository.estimate_fee(
-                EstimateFeeRequestModel(blocks=block_value),
+            fee_response: EstimateFeeResponse = FeeEstimateService.get_fee_rate(
+                block_value,
             )
             # Check if fee rate is valid
             if fee_response.fee_rate <= 0:
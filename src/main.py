@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import signal
 import sys
+import time
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
@@ -28,11 +29,19 @@ from src.utils.cache import Cache
 from src.utils.common_utils import disable_rln_node_termination_handling
 from src.utils.common_utils import load_translator
 from src.utils.common_utils import sigterm_handler
+from src.utils.connectivity_monitor import ConnectivityMonitor
 from src.utils.excluded_page import excluded_page
+from src.utils.gui_thread_watchdog import GuiThreadWatchdog
 from src.utils.helpers import check_google_auth_token_available
+from src.utils.helpers import preload_stylesheets
+from src.utils.http_session import SessionPool
+from src.utils.image_cache import ImageCache
 from src.utils.ln_node_manage import LnNodeServerManager
 from src.utils.logging import logger
+from src.utils.metrics import MetricsRegistry
 from src.utils.page_navigation import PageNavigation
+from src.utils.service_executor import ServiceExecutor
+from src.utils.startup_trace import StartupTracer
 from src.viewmodels.main_view_model import MainViewModel
 from src.views.components.custom_toast import ToasterManager
 from src.views.components.message_box import MessageBox
@@ -103,16 +112,35 @@ def main():
     """This method is the entry point of the application."""
     try:
         global PAGE_NAVIGATION
-        app = QApplication(sys.argv)
-        translator = load_translator()
-        app.installTranslator(translator)
-        view = IrisWalletMainWindow()
-        # Initialize PageNavigation
-        PAGE_NAVIGATION = PageNavigation(view.ui_)
-        # Initialize MainViewModel with PageNavigation
-        main_view_model = MainViewModel(PAGE_NAVIGATION)
-        # Set view model in your MainWindow instance
-        view.ui_.set_ui_and_model(main_view_model)
+        tracer = StartupTracer.get_instance()
+        tracer.record('imports', tracer.origin, time.perf_counter())
+        with tracer.phase('create_qapplication'):
+            app = QApplication(sys.argv)
+        with tracer.phase('load_translator'):
+            translator = load_translator()
+            app.installTranslator(translator)
+        with tracer.phase('preload_stylesheets'):
+            preload_stylesheets()
+        app.aboutToQuit.connect(SessionPool.get_instance().close_all)
+        app.aboutToQuit.connect(ServiceExecutor.get_instance().shutdown)
+        ImageCache.get_instance().prune_disk_in_background()
+        app.aboutToQuit.connect(ImageCache.get_instance().shutdown)
+        app.aboutToQuit.connect(ConnectivityMonitor.get_instance().stop)
+        watchdog = GuiThreadWatchdog.get_instance()
+        if watchdog.enabled:
+            MetricsRegistry.get_instance().register_source(
+                'gui_watchdog', watchdog.stats,
+            )
+            watchdog.start()
+            app.aboutToQuit.connect(watchdog.stop)
+        with tracer.phase('create_main_window'):
+            view = IrisWalletMainWindow()
+            # Initialize PageNavigation
+            PAGE_NAVIGATION = PageNavigation(view.ui_)
+            # Initialize MainViewModel with PageNavigation
+            main_view_model = MainViewModel(PAGE_NAVIGATION)
+            # Set view model in your MainWindow instance
+            view.ui_.set_ui_and_model(main_view_model)
         signal.signal(signal.SIGTERM, sigterm_handler)
         wallet: IsWalletInitialized = SettingRepository.is_wallet_initialized()
         if wallet.is_wallet_initialized:
@@ -120,6 +148,7 @@ def main():
         else:
             PAGE_NAVIGATION.term_and_condition_page()
         view.show()
+        PAGE_NAVIGATION.warm_up_pages()
         sys.exit(app.exec())
     except Exception as exc:
         logger.error(
@@ -125,3 +125,10 @@ class ChannelFetchingModel(str, Enum):
     FETCHING = 'fetching'
     FETCHED = 'fetched'
     FAILED = 'failed'
+
+
+class NodeLockState(str, Enum):
+    """Enum for the last known lock state of the node"""
+    UNKNOWN = 'unknown'
+    LOCKED = 'locked'
+    UNLOCKED = 'unlocked'
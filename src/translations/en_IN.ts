@@ -1786,5 +1786,17 @@ If you understand the above remarks and wish to proceed, press the button below
         <source>exit</source>
         <translation>Exit</translation>
     </message>
+    <message>
+        <source>diagnostics</source>
+        <translation>Diagnostics</translation>
+    </message>
+    <message>
+        <source>refresh_metrics</source>
+        <translation>Refresh</translation>
+    </message>
+    <message>
+        <source>export_metrics</source>
+        <translation>Export metrics</translation>
+    </message>
 </context>
 </TS>
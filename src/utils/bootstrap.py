@@ -17,6 +17,8 @@ from pathlib import Path
 import src.flavour as bitcoin_network
 from build_script import CONSTANT_PATH
 from build_script import TEMP_CONSTANT_PATH
+from src.utils.gui_thread_watchdog import GuiThreadWatchdog
+from src.utils.startup_trace import StartupTracer
 
 
 def network_configure():
@@ -40,6 +42,31 @@ def network_configure():
         help='Specify the app name to run multiple instances (Optional).',
     )
 
+    # Add the startup tracing arguments
+    parser.add_argument(
+        '--startup-trace',
+        required=False,
+        metavar='PATH',
+        help='Record the startup phases and write them to PATH as a Chrome trace (Optional).',
+    )
+    parser.add_argument(
+        '--startup-trace-page',
+        required=False,
+        help='Name of the page whose first paint ends the startup trace (Optional).',
+    )
+    parser.add_argument(
+        '--startup-trace-exit',
+        action='store_true',
+        help='Quit the application once the startup trace is written (Optional).',
+    )
+
+    # Add the GUI thread watchdog argument
+    parser.add_argument(
+        '--gui-watchdog',
+        action='store_true',
+        help='Report blocking calls made on the GUI thread and event loop stalls (Optional).',
+    )
+
     # Parse the arguments
     args = parser.parse_args()
 
@@ -98,6 +125,26 @@ def modify_constant_file(app_name: str | None):
         file.writelines(new_lines)
 
 
+def startup_trace_configure(args: argparse.Namespace | None = None):
+    """Enable startup tracing from the environment or the command line arguments."""
+    tracer = StartupTracer.get_instance()
+    tracer.configure_from_env()
+    if args is not None and args.startup_trace:
+        tracer.enable(
+            args.startup_trace,
+            args.startup_trace_page,
+            args.startup_trace_exit,
+        )
+
+
+def gui_watchdog_configure(args: argparse.Namespace | None = None):
+    """Enable the GUI thread watchdog from the environment or the command line arguments."""
+    watchdog = GuiThreadWatchdog.get_instance()
+    watchdog.configure_from_env()
+    if args is not None and args.gui_watchdog:
+        watchdog.enable()
+
+
 def restore_constant_file():
     """Restore the original constant file and remove the temporary backup."""
     temp_path = Path(TEMP_CONSTANT_PATH)
@@ -112,3 +159,8 @@ if not getattr(sys, 'frozen', False):
     # Use the app-name argument in modify_constant_file
     modify_constant_file(args.app_name)
     atexit.register(restore_constant_file)
+    startup_trace_configure(args)
+    gui_watchdog_configure(args)
+else:
+    startup_trace_configure()
+    gui_watchdog_configure()
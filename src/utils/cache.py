@@ -1,12 +1,17 @@
+# pylint: disable=too-many-instance-attributes, too-many-arguments
 """
 A thread-safe cache manager using SQLite for storing and managing cached data.
 
 This module provides a `Cache` class with functionality to store, retrieve,
-invalidate, and handle cache expiration. It uses SQLite as the backend and
-ensures thread safety with locks for concurrent access.
+invalidate, and handle cache expiration. It uses SQLite as the backend, with a
+bounded in-memory LRU tier in front of it, and ensures thread safety with locks
+for concurrent access.
 
 Key Features:
-- Cache expiration and invalidation.
+- Cache expiration (per key) and invalidation.
+- In-memory LRU tier bounded by entry count and size.
+- Hit, miss and eviction counters.
+- Read-only scopes, inside which repository reads cannot invalidate cached data.
 - Thread-safe access to cache.
 - Singleton instance for cache management.
 """
@@ -17,6 +22,10 @@ import pickle
 import sqlite3
 import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Any
 
 from PySide6.QtCore import QCoreApplication
@@ -25,13 +34,33 @@ import src.flavour as bitcoin_network
 from src.model.enums.enums_model import NetworkEnumModel
 from src.utils.build_app_path import app_paths
 from src.utils.constant import CACHE_EXPIRE_TIMEOUT
+from src.utils.constant import CACHE_EXPIRE_TIMEOUT_PER_KEY
 from src.utils.constant import CACHE_FILE_NAME
+from src.utils.constant import CACHE_KEY_ENDPOINTS
+from src.utils.constant import CACHE_MEMORY_MAX_BYTES
+from src.utils.constant import CACHE_MEMORY_MAX_ENTRIES
 from src.utils.constant import DEFAULT_CACHE_FILENAME
 from src.utils.constant import IRIS_WALLET_TRANSLATIONS_CONTEXT
+from src.utils.endpoints import CACHE_INVALIDATION_GRAPH
+from src.utils.endpoints import READ_ENDPOINTS
 from src.utils.error_mapping import ERROR_MAPPING
 from src.utils.global_toast import global_toaster
 from src.utils.local_store import local_store
 from src.utils.logging import logger
+from src.utils.metrics import MetricsRegistry
+from src.utils.startup_trace import StartupTracer
+
+# Depth of the read-only repository calls running on each thread
+_read_only_calls = threading.local()
+
+
+@dataclass
+class _MemoryEntry:
+    """Entry of the in-memory cache tier."""
+    # Kept serialized so that every reader gets its own copy of the cached object
+    data: bytes
+    timestamp: int
+    invalid: bool
 
 
 class Cache:
@@ -40,20 +69,46 @@ class Cache:
     _instance = None
     _lock = threading.Lock()
 
-    def __init__(self, db_name: str = 'cache.sqlite', expire_after: int = CACHE_EXPIRE_TIMEOUT, file_path: str | None = None):
+    def __init__(
+        self,
+        db_name: str = 'cache.sqlite',
+        expire_after: int = CACHE_EXPIRE_TIMEOUT,
+        file_path: str | None = None,
+        expire_after_per_key: dict[str, int] | None = None,
+        memory_max_entries: int = CACHE_MEMORY_MAX_ENTRIES,
+        memory_max_bytes: int = CACHE_MEMORY_MAX_BYTES,
+    ):
         """
         Initialize the Cache object.
 
         Args:
             db_name (str): The name of the SQLite database file.
-            expire_after (int): Cache expiration timeout in seconds.
+            expire_after (int): Default cache expiration timeout in seconds.
             file_path (str): Full path to the SQLite database file.
+            expire_after_per_key (dict[str, int]): Expiration timeouts overriding the default for specific keys.
+            memory_max_entries (int): Maximum number of entries kept in memory.
+            memory_max_bytes (int): Maximum serialized size of the entries kept in memory.
         """
         super().__init__()
         self.db_name = db_name
         self.expire_after = expire_after
+        self.expire_after_per_key: dict[str, int] = dict(
+            CACHE_EXPIRE_TIMEOUT_PER_KEY if expire_after_per_key is None else expire_after_per_key,
+        )
         if file_path is not None:
             self.cache_file_path = file_path
+        self.memory_max_entries = memory_max_entries
+        self.memory_max_bytes = memory_max_bytes
+        self._memory: OrderedDict[str, _MemoryEntry] = OrderedDict()
+        self._memory_bytes = 0
+        self._memory_lock = threading.Lock()
+        self._stats: dict[str, int] = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'refused_invalidations': 0,
+        }
         self._db_lock = threading.Lock()
         self._error_lock = threading.Lock()
         self.is_error: bool = False
@@ -126,14 +181,84 @@ class Cache:
                 )
                 raise
 
-    def _is_expired(self, timestamp: int) -> bool:
+    def get_expire_after(self, key: str) -> int:
+        """Return the expiration timeout in seconds for the given key."""
+        return self.expire_after_per_key.get(key, self.expire_after)
+
+    def set_expire_after(self, key: str, expire_after: int) -> None:
+        """
+        Override the expiration timeout for a specific key.
+
+        Args:
+            key (str): The cache key.
+            expire_after (int): Expiration timeout in seconds.
+        """
+        self.expire_after_per_key[key] = expire_after
+
+    def _is_expired(self, timestamp: int, key: str | None = None) -> bool:
         """Check if the cached data is expired."""
-        return (time.time() - timestamp) > self.expire_after
+        expire_after = self.expire_after if key is None else self.get_expire_after(
+            key,
+        )
+        return (time.time() - timestamp) > expire_after
+
+    def _count(self, counter: str) -> None:
+        """Increment one of the cache statistics counters."""
+        with self._memory_lock:
+            self._stats[counter] += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Return the cache statistics.
+
+        Returns:
+            dict[str, int]: Hit, miss and eviction counters and the size of the memory tier.
+        """
+        with self._memory_lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+            stats['memory_bytes'] = self._memory_bytes
+        return stats
+
+    def _memory_get(self, key: str) -> _MemoryEntry | None:
+        """Return the in-memory entry for the key and mark it as most recently used."""
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            return entry
+
+    def _memory_put(self, key: str, entry: _MemoryEntry) -> None:
+        """Store an entry in memory, evicting least recently used entries to stay within bounds."""
+        size = len(entry.data)
+        with self._memory_lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous.data)
+            if size > self.memory_max_bytes:
+                return
+            self._memory[key] = entry
+            self._memory_bytes += size
+            while len(self._memory) > self.memory_max_entries or self._memory_bytes > self.memory_max_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted.data)
+                self._stats['evictions'] += 1
+
+    def _memory_invalidate(self, key: str | None = None) -> None:
+        """Mark the in-memory entry for the key, or all entries, as invalid."""
+        with self._memory_lock:
+            if key is None:
+                for entry in self._memory.values():
+                    entry.invalid = True
+            elif key in self._memory:
+                self._memory[key].invalid = True
 
     def fetch_cache(self, key: str) -> tuple[Any | None, bool]:
         """
         Retrieve data from the cache or return None if not found or expired.
 
+        The in-memory tier is checked first; SQLite is only read on a memory miss.
+
         Args:
             key (str): The key to fetch data for.
 
@@ -141,26 +266,35 @@ class Cache:
             Tuple[Optional[Any], bool]: Cached data and validity status.
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                'SELECT data, timestamp, invalid FROM cache WHERE key = ?', (
-                    key,
-                ),
-            )
-            row = cursor.fetchone()
+            entry = self._memory_get(key)
+            if entry is not None:
+                self._count('memory_hits')
+            else:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    'SELECT data, timestamp, invalid FROM cache WHERE key = ?', (
+                        key,
+                    ),
+                )
+                row = cursor.fetchone()
+                if not row:
+                    self._count('misses')
+                    return None, False
+                self._count('disk_hits')
+                entry = _MemoryEntry(
+                    data=row[0], timestamp=row[1], invalid=bool(row[2]),
+                )
+                self._memory_put(key, entry)
 
-            if row:
-                data, timestamp, invalid = row
-                data = pickle.loads(data)
+            data = pickle.loads(entry.data)
 
-                if self._is_expired(timestamp):
-                    self.invalidate_cache(key)
-                    return data, False
-                if invalid:
-                    return data, False
+            if self._is_expired(entry.timestamp, key):
+                self.invalidate_cache(key)
+                return data, False
+            if entry.invalid:
+                return data, False
 
-                return data, True
-            return None, False
+            return data, True
         except Exception as exc:
             logger.error(
                 'Exception occur in cache: %s, Message: %s',
@@ -169,13 +303,50 @@ class Cache:
             self._report_cache_error(message_key='CacheFetchFailed')
             return None, False
 
+    @staticmethod
+    @contextmanager
+    def read_only_scope() -> Iterator[None]:
+        """Run a repository call that only reads the node state; see `refuse_in_read_only_scope`."""
+        depth = getattr(_read_only_calls, 'depth', 0)
+        _read_only_calls.depth = depth + 1
+        try:
+            yield
+        finally:
+            _read_only_calls.depth = depth
+
+    def refuse_in_read_only_scope(self, target: str) -> bool:
+        """
+        Refuse an invalidation requested from a read-only repository call.
+
+        Reads do not change the node state, so the data cached for other pages
+        is still valid; invalidating it would only force those pages to reload.
+
+        Args:
+            target (str): What the invalidation was for, for the log.
+
+        Returns:
+            bool: Whether the invalidation must be skipped.
+        """
+        if not getattr(_read_only_calls, 'depth', 0):
+            return False
+        self._count('refused_invalidations')
+        logger.error(
+            'Cache invalidation of %s requested by a read-only repository call was ignored', target,
+        )
+        return True
+
     def invalidate_cache(self, key: str | None = None) -> None:
         """
         Invalidate the cache entry for the specified key or all entries.
 
+        Invalidating all entries is refused inside a read-only repository call.
+
         Args:
             key (Optional[str]): The key to invalidate. Invalidates all if None.
         """
+        if key is None and self.refuse_in_read_only_scope('all entries'):
+            return
+        self._memory_invalidate(key)
         with self._db_lock:
             try:
                 cursor = self.conn.cursor()
@@ -197,6 +368,53 @@ class Cache:
                 )
                 self._report_cache_error(message_key='FailedToInvalidCache')
 
+    @staticmethod
+    def get_keys_affected_by(endpoint: str) -> list[str] | None:
+        """
+        Return the cache keys whose data is changed by a successful call to the endpoint.
+
+        Args:
+            endpoint (str): The mutating endpoint that was called.
+
+        Returns:
+            Optional[list[str]]: The affected keys, or None if the endpoint is not in the invalidation graph.
+        """
+        affected_endpoints = CACHE_INVALIDATION_GRAPH.get(endpoint)
+        if affected_endpoints is None:
+            return None
+        return [
+            key for key, key_endpoints in CACHE_KEY_ENDPOINTS.items()
+            if set(key_endpoints) & set(affected_endpoints)
+        ]
+
+    def invalidate_for_endpoint(self, endpoint: str) -> None:
+        """
+        Invalidate only the cache entries affected by a successful call to the endpoint.
+
+        Falls back to invalidating all entries if the endpoint is not in the invalidation graph.
+        Refused for read endpoints and inside a read-only repository call.
+
+        Args:
+            endpoint (str): The mutating endpoint that was called.
+        """
+        if endpoint in READ_ENDPOINTS:
+            self._count('refused_invalidations')
+            logger.error(
+                'Cache invalidation for the read endpoint %s was ignored', endpoint,
+            )
+            return
+        if self.refuse_in_read_only_scope(endpoint):
+            return
+        keys = self.get_keys_affected_by(endpoint)
+        if keys is None:
+            logger.warning(
+                'No cache dependencies declared for %s, invalidating all entries', endpoint,
+            )
+            self.invalidate_cache()
+            return
+        for key in keys:
+            self.invalidate_cache(key)
+
     def _update_cache(self, key: str, data: Any) -> None:
         """
         Store or update data in the cache.
@@ -209,6 +427,11 @@ class Cache:
             try:
                 timestamp = int(time.time())
                 serialized_data = pickle.dumps(data)
+                self._memory_put(
+                    key, _MemoryEntry(
+                        data=serialized_data, timestamp=timestamp, invalid=False,
+                    ),
+                )
 
                 cursor = self.conn.cursor()
                 cursor.execute(
@@ -257,5 +480,10 @@ class Cache:
         if Cache._instance is None:
             with Cache._lock:
                 if Cache._instance is None:
-                    Cache._instance = Cache._initialize_cache()
+                    with StartupTracer.get_instance().phase('open_cache'):
+                        Cache._instance = Cache._initialize_cache()
+                    if Cache._instance is not None:
+                        MetricsRegistry.get_instance().register_source(
+                            'cache', Cache._instance.get_stats,
+                        )
         return Cache._instance
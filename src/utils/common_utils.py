@@ -13,11 +13,7 @@ import zipfile
 from datetime import datetime
 from io import BytesIO
 
-import pydenticon
-import qrcode
 from PIL import Image
-from PIL import ImageDraw
-from PIL import ImageOps
 from PIL.ImageQt import ImageQt
 from PySide6.QtCore import QByteArray
 from PySide6.QtCore import QCoreApplication
@@ -48,14 +44,19 @@ from src.utils.constant import DEFAULT_LOCALE
 from src.utils.constant import FAST_TRANSACTION_FEE_BLOCKS
 from src.utils.constant import IRIS_WALLET_TRANSLATIONS_CONTEXT
 from src.utils.constant import MEDIUM_TRANSACTION_FEE_BLOCKS
+from src.utils.constant import METRICS_FILE_NAME
 from src.utils.constant import SLOW_TRANSACTION_FEE_BLOCKS
 from src.utils.custom_exception import CommonException
 from src.utils.error_message import ERROR_SAVE_LOGS
 from src.utils.error_message import ERROR_SOMETHING_WENT_WRONG
+from src.utils.image_cache import ImageCache
+from src.utils.image_cache import render_identicon_png
+from src.utils.image_cache import render_qr_code_png
 from src.utils.info_message import INFO_COPY_MESSAGE
 from src.utils.info_message import INFO_LOG_SAVE_DESCRIPTION
 from src.utils.ln_node_manage import LnNodeServerManager
 from src.utils.logging import logger
+from src.utils.metrics import MetricsRegistry
 from src.version import __version__
 from src.views.components.toast import ToastManager
 
@@ -124,26 +125,40 @@ def load_translator():
         return None
 
 
-def set_qr_code(data):
-    """This method generates a QR code from the provided data."""
+def render_qr_code(data: str) -> bytes | None:
+    """
+    Render the QR code of the provided data as PNG bytes, or return the cached one.
+
+    View models call it through `run_in_thread` before showing the data, so that
+    `set_qr_code` only finds the image in the cache on the GUI thread.
+
+    Args:
+        data (str): The payload of the QR code, e.g. an address or an invoice.
+
+    Returns:
+        bytes | None: The PNG bytes, or None if the data cannot be encoded.
+    """
     try:
-        # Create a QR code instance
-        _qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=1,
+        # QR codes of one-time invoices and addresses are rarely shown again: memory only
+        return ImageCache.get_instance().get_or_create(
+            ImageCache.qr_code_key(data),
+            lambda: render_qr_code_png(data),
+            persist=False,
         )
-        _qr.add_data(data)
-        _qr.make()
+    except (AttributeError, ValueError) as error:
+        logger.error('Error: Unable to create QR image - %s', error)
+        return None
+
 
-        # Create an image from the QR Code instance
-        img = _qr.make_image(
-            fill='black', back_color='white',
-        ).resize((335, 335))
+def set_qr_code(data):
+    """This method generates a QR code from the provided data."""
+    try:
+        png_data = render_qr_code(data)
+        if png_data is None:
+            return None
 
-        # Convert the PIL image to a QPixmap
-        qt_image = ImageQt(img)
+        # Convert the PIL image to a QImage
+        qt_image = ImageQt(Image.open(BytesIO(png_data)))
 
         return qt_image
     except (AttributeError, ValueError) as error:
@@ -153,39 +168,13 @@ def set_qr_code(data):
 
 def generate_identicon(data, size=40):
     """This method generates the identicon for rgb20 asset"""
-    generator = pydenticon.Generator(
-        5, 5,
-        foreground=[
-            'rgb(45,79,255)', 'rgb(254,180,44)', 'rgb(226,121,234)',
-            'rgb(30,179,253)', 'rgb(232,77,65)', 'rgb(49,203,115)', 'rgb(141,69,170)',
-        ],
-        background='rgb(224,224,224)',
+    png_data = ImageCache.get_instance().get_or_create(
+        ImageCache.identicon_key(data, size),
+        lambda: render_identicon_png(data, size),
     )
-    identicon = generator.generate(data, size, size, output_format='png')
-
-    # Convert identicon to a circular image
-    buffered = BytesIO(identicon)
-    image = Image.open(buffered).convert('RGBA')
-    # Ensure proper orientation for PyQt
-    image = image.transpose(Image.FLIP_TOP_BOTTOM)
-    size = image.size
-    # Create circular mask
-    mask = Image.new('L', size, 0)
-    draw = ImageDraw.Draw(mask)
-
-    # Draw a smooth ellipse using anti-aliasing
-    draw.ellipse([(0, 0), (size[0] - 1, size[1] - 1)], fill=255)
-
-    # Apply mask to create circular image
-    circular_image = ImageOps.fit(image, size, centering=(0.5, 0.5))
-    circular_image.putalpha(mask)
-
-    # Save circular image to a buffer
-    circular_buffer = BytesIO()
-    circular_image.save(circular_buffer, format='PNG')
 
     # Encode circular image to base64
-    img_str = base64.b64encode(circular_buffer.getvalue()).decode('utf-8')
+    img_str = base64.b64encode(png_data).decode('utf-8')
     return img_str
 
 
@@ -254,6 +243,17 @@ def zip_logger_folder(base_path) -> tuple[str, str, str]:
         for log_file in log_files:
             shutil.copy(log_file, log_output_dir)
 
+    # Include the request metrics of this session
+    try:
+        MetricsRegistry.get_instance().export_json(
+            os.path.join(output_dir, METRICS_FILE_NAME),
+        )
+    except OSError as exc:
+        logger.error(
+            'Exception occurred while exporting metrics: %s, Message: %s',
+            type(exc).__name__, str(exc),
+        )
+
     # Finally, zip the folder
     zip_file_path = os.path.join(base_path, zip_filename)
     shutil.make_archive(zip_file_path.replace('.zip', ''), 'zip', output_dir)
@@ -0,0 +1,143 @@
+"""
+An application-wide monitor of the internet connection.
+
+This module provides a `ConnectivityMonitor` class that checks whether the
+internet is reachable by opening a connection to a public DNS server. A single
+long-lived worker thread runs the checks for the whole application and
+publishes the result through `network_status_signal`, to which the header of
+every page subscribes, instead of each header starting a new thread and socket
+every few seconds.
+
+Key Features:
+- One worker thread and one socket per check, whatever the number of pages.
+- Checks every `PING_DNS_SERVER_CALL_INTERVAL` milliseconds while connected.
+- Backs off from `CONNECTIVITY_RETRY_INITIAL_DELAY_MS` to
+  `CONNECTIVITY_RETRY_MAX_DELAY_MS` while disconnected, starting over on every
+  state change.
+- Singleton instance for application-wide use.
+"""
+from __future__ import annotations
+
+import socket
+import threading
+
+from PySide6.QtCore import QObject
+from PySide6.QtCore import Signal
+
+from src.utils.constant import CONNECTIVITY_CHECK_TIMEOUT
+from src.utils.constant import CONNECTIVITY_RETRY_INITIAL_DELAY_MS
+from src.utils.constant import CONNECTIVITY_RETRY_MAX_DELAY_MS
+from src.utils.constant import PING_DNS_ADDRESS_FOR_NETWORK_CHECK
+from src.utils.constant import PING_DNS_SERVER_CALL_INTERVAL
+from src.utils.logging import logger
+
+
+class ConnectivityMonitor(QObject):
+    """Checks the internet connection on one worker thread and publishes the result."""
+
+    _instance = None
+    _lock = threading.Lock()
+    network_status_signal = Signal(bool)
+
+    def __init__(
+        self,
+        interval_ms: int = PING_DNS_SERVER_CALL_INTERVAL,
+        retry_initial_delay_ms: int = CONNECTIVITY_RETRY_INITIAL_DELAY_MS,
+        retry_max_delay_ms: int = CONNECTIVITY_RETRY_MAX_DELAY_MS,
+    ):
+        """
+        Initialize the ConnectivityMonitor object.
+
+        Args:
+            interval_ms (int): Delay between two checks while connected.
+            retry_initial_delay_ms (int): Delay before the first check after losing the connection.
+            retry_max_delay_ms (int): Maximum delay between two checks while disconnected.
+        """
+        super().__init__()
+        self.interval_ms = interval_ms
+        self.retry_initial_delay_ms = retry_initial_delay_ms
+        self.retry_max_delay_ms = retry_max_delay_ms
+        self.retry_delay_ms = retry_initial_delay_ms
+        self.is_connected: bool | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """
+        Start the worker thread, unless it is already running.
+
+        A worker that was stopped but is still completing its current check
+        keeps its own stop event and ends on its own; a new worker is started
+        next to it.
+        """
+        with ConnectivityMonitor._lock:
+            if self._thread is not None and self._thread.is_alive() and not self._stop_event.is_set():
+                return
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._stop_event,),
+                name='connectivity-monitor', daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the worker thread once its current check has completed."""
+        with ConnectivityMonitor._lock:
+            self._stop_event.set()
+
+    def _run(self, stop_event: threading.Event) -> None:
+        delay_ms = self.interval_ms
+        while not stop_event.wait(delay_ms / 1000):
+            delay_ms = self.check_connection()
+
+    def check_connection(self) -> int:
+        """
+        Check the connection once and publish the result.
+
+        Returns:
+            int: The delay in milliseconds before the next check.
+        """
+        is_connected = self.check_internet_conn()
+        if is_connected != self.is_connected:
+            logger.info(
+                'Internet connection %s',
+                'available' if is_connected else 'unavailable',
+            )
+            self.retry_delay_ms = self.retry_initial_delay_ms
+        self.is_connected = is_connected
+        self.network_status_signal.emit(is_connected)
+        return self.next_delay_ms()
+
+    def next_delay_ms(self) -> int:
+        """Return the delay before the next check, doubling it while disconnected."""
+        if self.is_connected:
+            return self.interval_ms
+        delay_ms = self.retry_delay_ms
+        self.retry_delay_ms = min(delay_ms * 2, self.retry_max_delay_ms)
+        return delay_ms
+
+    @staticmethod
+    def check_internet_conn() -> bool:
+        """Check internet connection and return status."""
+        try:
+            with socket.create_connection(
+                (PING_DNS_ADDRESS_FOR_NETWORK_CHECK, 53),
+                timeout=CONNECTIVITY_CHECK_TIMEOUT,
+            ):
+                return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def get_instance() -> ConnectivityMonitor:
+        """
+        Returns the singleton instance of ConnectivityMonitor in a thread-safe manner.
+
+        Returns:
+            ConnectivityMonitor: The singleton instance of the monitor.
+        """
+        if ConnectivityMonitor._instance is None:
+            with ConnectivityMonitor._lock:
+                if ConnectivityMonitor._instance is None:
+                    ConnectivityMonitor._instance = ConnectivityMonitor()
+        return ConnectivityMonitor._instance
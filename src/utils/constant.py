@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 from src.model.enums.enums_model import NetworkEnumModel
+from src.utils.endpoints import BTC_BALANCE_ENDPOINT
+from src.utils.endpoints import LIST_ASSETS_ENDPOINT
+from src.utils.endpoints import LIST_TRANSACTIONS_ENDPOINT
+from src.utils.endpoints import LIST_UNSPENT_ENDPOINT
 
 DEFAULT_LOCALE = 'en_IN'
 BACKED_URL_LIGHTNING_NETWORK = 'http://127.0.0.1:3001'
@@ -34,9 +38,71 @@ CACHE_FILE_NAME = {
 }
 DEFAULT_CACHE_FILENAME = 'iris-wallet-cache-default'
 CACHE_FOLDER_NAME = 'cache'
+# Rendered identicons and QR codes, stored inside the cache folder
+IMAGE_CACHE_FOLDER_NAME = 'images'
+IMAGE_CACHE_MAX_ENTRIES = 512
+# Images kept on disk; the least recently used are deleted at startup
+IMAGE_CACHE_MAX_DISK_ENTRIES = 2048
+IMAGE_CACHE_PREFETCH_WORKERS = 2
+HISTORY_FILE_NAME = {
+    NetworkEnumModel.MAINNET: 'iris-wallet-history-mainnet',
+    NetworkEnumModel.TESTNET: 'iris-wallet-history-testnet',
+    NetworkEnumModel.REGTEST: 'iris-wallet-history-regtest',
+}
+DEFAULT_HISTORY_FILENAME = 'iris-wallet-history-default'
+# Bump when the formatting of history rows or their stored fields change
+HISTORY_FORMAT_VERSION = 2
 CACHE_EXPIRE_TIMEOUT = 600
+# In-memory tier kept in front of the SQLite cache
+CACHE_MEMORY_MAX_ENTRIES = 128
+CACHE_MEMORY_MAX_BYTES = 16 * 1024 * 1024  # 16 mb
+# Cache keys used by the view models
+CACHE_KEY_MAIN_ASSET = 'mainassetviewmodel_get_asset'
+CACHE_KEY_BITCOIN_TRANSACTIONS = 'bitcoinviewmodel_get_transaction_list'
+CACHE_KEY_UNSPENT_LIST = 'unspentlistviewmodel_get_unspent_list'
+# Cached read endpoints each cache key is built from, used for targeted invalidation
+CACHE_KEY_ENDPOINTS: dict[str, list[str]] = {
+    CACHE_KEY_MAIN_ASSET: [LIST_ASSETS_ENDPOINT, BTC_BALANCE_ENDPOINT],
+    CACHE_KEY_BITCOIN_TRANSACTIONS: [
+        LIST_TRANSACTIONS_ENDPOINT,
+        BTC_BALANCE_ENDPOINT,
+    ],
+    CACHE_KEY_UNSPENT_LIST: [LIST_UNSPENT_ENDPOINT],
+}
+# Expiry in seconds for keys that should not use CACHE_EXPIRE_TIMEOUT
+CACHE_EXPIRE_TIMEOUT_PER_KEY: dict[str, int] = {
+    CACHE_KEY_MAIN_ASSET: 300,
+    CACHE_KEY_BITCOIN_TRANSACTIONS: 300,
+    CACHE_KEY_UNSPENT_LIST: 600,
+}
 REQUEST_TIMEOUT = 120  # In seconds
+# Keep-alive HTTP session pool used for node requests
+HTTP_POOL_MAX_SESSIONS = 16
+HTTP_POOL_CONNECTIONS = 4  # Number of hosts to keep connections for
+HTTP_POOL_MAXSIZE_PER_HOST = 8
+HTTP_MAX_RETRIES = 3
+HTTP_RETRY_BACKOFF_FACTOR = 0.3
+HTTP_RETRY_STATUS_CODES = (502, 503, 504)
+# Request metrics: recent latencies kept per endpoint, and latency histogram bucket bounds
+METRICS_MAX_SAMPLES = 1000
+METRICS_LATENCY_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000)
+METRICS_FILE_NAME = 'metrics.json'
+DIAGNOSTICS_PANEL_SHORTCUT = 'Ctrl+Shift+D'
+# Tasks of ThreadManager running at the same time, overall and per service function
+TASK_SCHEDULER_MAX_WORKERS = 8
+TASK_SCHEDULER_GROUP_LIMIT = 2
+# Workers used by services to issue independent node calls concurrently
+SERVICE_EXECUTOR_MAX_WORKERS = 4
+# Seconds for which non-secret keyring flags are served from memory
+KEYRING_CACHE_TTL_SECONDS = 30
 NO_OF_UTXO = 1
+# Transaction rows created at a time, and distance from the bottom that loads the next page
+TRANSACTION_LIST_PAGE_SIZE = 20
+TRANSACTION_LIST_LOAD_THRESHOLD_PX = 100
+# Sidebar pages kept alive by the page navigation for reuse
+PAGE_CACHE_MAX_SIZE = 6
+PAGE_WARM_UP_START_DELAY_MS = 2000
+PAGE_WARM_UP_INTERVAL_MS = 50
 MIN_CONFIRMATION = 1
 UTXO_SIZE_SAT = 1000
 UTXO_SIZE_SAT_FOR_OPENING_CHANNEL = 32000
@@ -50,7 +116,17 @@ MAX_ATTEMPTS_TO_WAIT_FOR_NODE = 15
 MAX_ATTEMPTS_FOR_CLOSE = 30
 NODE_CLOSE_INTERVAL = 1
 INTERVAL = 2
+# Node readiness probe: first delay and backoff cap in ms, overall wait in seconds
+NODE_READY_PROBE_INITIAL_DELAY_MS = 50
+NODE_READY_PROBE_MAX_DELAY_MS = INTERVAL * 1000
+NODE_READY_TIMEOUT = MAX_ATTEMPTS_TO_WAIT_FOR_NODE * INTERVAL
+# Seconds a single readiness probe may wait for the node to answer
+NODE_READY_PROBE_TIMEOUT = 5
+# Text of the node's output line announcing that the REST server is listening
+NODE_READY_OUTPUT_MARKER = 'listening'
 MAX_RETRY_REFRESH_API = 3
+# Seconds after which the remembered node lock state is probed again
+NODE_LOCK_STATE_MAX_AGE = 60
 FEE_RATE = 5
 LN_INVOICE_EXPIRY_TIME = 3
 LN_INVOICE_EXPIRY_TIME_UNIT = 'Hours'
@@ -63,6 +139,9 @@ LOG_FOLDER_NAME = 'logs'
 LN_BINARY_NAME = 'rgb-lightning-node'
 PING_DNS_ADDRESS_FOR_NETWORK_CHECK = '8.8.8.8'
 PING_DNS_SERVER_CALL_INTERVAL = 5000
+CONNECTIVITY_CHECK_TIMEOUT = 3
+CONNECTIVITY_RETRY_INITIAL_DELAY_MS = 1000
+CONNECTIVITY_RETRY_MAX_DELAY_MS = 30000
 
 BITCOIND_RPC_USER_REGTEST = 'user'
 BITCOIND_RPC_PASSWORD_REGTEST = 'password'
@@ -98,6 +177,16 @@ LDK_PORT = 9735
 SLOW_TRANSACTION_FEE_BLOCKS = 17
 MEDIUM_TRANSACTION_FEE_BLOCKS = 7
 FAST_TRANSACTION_FEE_BLOCKS = 1
+FEE_ESTIMATE_BLOCK_TARGETS = (
+    FAST_TRANSACTION_FEE_BLOCKS,
+    MEDIUM_TRANSACTION_FEE_BLOCKS,
+    SLOW_TRANSACTION_FEE_BLOCKS,
+)
+# Seconds a fetched fee estimate is used before it is fetched again
+FEE_ESTIMATE_MAX_AGE = 120
+# Background refresh of the fee estimates while a page uses them
+FEE_ESTIMATE_REFRESH_INTERVAL_MS = 60000
+FEE_ESTIMATE_IDLE_TIMEOUT = 300
 
 # Faucet urls
 rgbRegtestFaucetURLs: list[str] = ['http://127.0.0.1:8081']
@@ -4,6 +4,7 @@ an exception for repository operations.
 from __future__ import annotations
 
 from PySide6.QtCore import QCoreApplication
+from requests.exceptions import RequestException
 
 from src.utils.constant import IRIS_WALLET_TRANSLATIONS_CONTEXT
 from src.utils.error_mapping import ERROR_MAPPING
@@ -29,3 +30,7 @@ class ServiceOperationException(Exception):
     def __init__(self, message: str):
         super().__init__(message)
         self.message = message  # used for localization
+
+
+class RequestCancelledError(RequestException):
+    """Raised instead of sending a node request whose task has been cancelled."""
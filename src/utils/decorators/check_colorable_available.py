@@ -35,7 +35,7 @@ def create_utxos() -> None:
         response.raise_for_status()
         cache = Cache.get_cache_session()
         if cache is not None:
-            cache.invalidate_cache()
+            cache.invalidate_for_endpoint(CREATE_UTXO_ENDPOINT)
     except HTTPError as error:
         error_data = error.response.json()
         error_message = error_data.get('error', 'Unhandled error')
@@ -0,0 +1,25 @@
+"""
+This module contains the decorator classifying repository methods which only read the node state.
+
+Methods decorated with `read_only` run inside `Cache.read_only_scope`, in which
+requests to invalidate all cached data or the data affected by an endpoint are
+refused: a read path can never wipe the data other pages depend on. Methods
+changing the node state are not decorated and invalidate what they affect
+with `Cache.invalidate_for_endpoint`.
+"""
+from __future__ import annotations
+
+from functools import wraps
+from typing import Any
+from typing import Callable
+
+from src.utils.cache import Cache
+
+
+def read_only(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Mark a repository method as a read, which cannot invalidate the cache."""
+    @wraps(method)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with Cache.read_only_scope():
+            return method(*args, **kwargs)
+    return wrapper
@@ -14,8 +14,8 @@ import src.flavour as bitcoin_network
 from src.data.repository.setting_repository import SettingRepository
 from src.model.common_operation_model import UnlockRequestModel
 from src.model.enums.enums_model import NetworkEnumModel
+from src.model.enums.enums_model import NodeLockState
 from src.utils.constant import WALLET_PASSWORD_KEY
-from src.utils.endpoints import NODE_INFO_ENDPOINT
 from src.utils.endpoints import UNLOCK_ENDPOINT
 from src.utils.error_message import ERROR_NODE_IS_LOCKED_CALL_UNLOCK
 from src.utils.error_message import ERROR_NODE_WALLET_NOT_INITIALIZED
@@ -24,6 +24,8 @@ from src.utils.handle_exception import CommonException
 from src.utils.helpers import get_bitcoin_config
 from src.utils.keyring_storage import get_value
 from src.utils.logging import logger
+from src.utils.node_state import is_node_locked_cached
+from src.utils.node_state import NodeStateTracker
 from src.utils.page_navigation_events import PageNavigationEventManager
 from src.utils.request import Request
 
@@ -45,6 +47,9 @@ def unlock_node() -> Any:
         payload = bitcoin_config.dict()
         response = Request.post(UNLOCK_ENDPOINT, payload)
         response.raise_for_status()
+        NodeStateTracker.get_instance().set_state(
+            Request.load_base_url(), NodeLockState.UNLOCKED,
+        )
         return True
     except HTTPError as error:
         error_data = error.response.json()
@@ -73,48 +78,34 @@ def unlock_node() -> Any:
         ) from exc
 
 
-def is_node_locked() -> bool:
-    """Check if the node is locked by sending a request to the node info endpoint."""
-    try:
-        response = Request.get(NODE_INFO_ENDPOINT)
-        response.raise_for_status()
-        return False
-    except HTTPError as error:
-        if error.response.status_code == 403:
-            try:
-                error_data = error.response.json()
-                if error_data.get('error') == ERROR_NODE_IS_LOCKED_CALL_UNLOCK and error_data.get('code') == 403:
-                    return True
-            except ValueError:
-                pass
-        else:
-            error_data = error.response.json()
-            error_message = error_data.get('error', 'Unhandled error')
-            logger.error(error_message)
-            raise CommonException(error_message) from error
-    except RequestsConnectionError as exc:
-        logger.error(
-            'Exception occurred at Decorator(unlock_required): %s, Message: %s',
-            type(exc).__name__, str(exc),
-        )
-        raise CommonException('Unable to connect to node') from exc
-    except Exception as exc:
-        logger.error(
-            'Exception occurred at Decorator(unlock_required): %s, Message: %s',
-            type(exc).__name__, str(exc),
-        )
-        raise CommonException(
-            'Decorator(unlock_required): Error while checking if node is locked',
-        ) from exc
-
-    return False
+def _is_locked_error(exc: CommonException) -> bool:
+    """Check whether the exception was raised because the node is locked."""
+    return getattr(exc, 'name', None) == 'LockedNode' or exc.message == ERROR_NODE_IS_LOCKED_CALL_UNLOCK
 
 
 def unlock_required(method: Callable[..., Any]) -> Callable[..., Any]:
-    """Decorator to ensure the node is unlocked before proceeding with the decorated method."""
+    """
+    Decorator to ensure the node is unlocked before proceeding with the decorated method.
+
+    The lock state is taken from the NodeStateTracker, so the node is only probed when the
+    state is unknown or stale. If the call still fails because the node got locked in the
+    meantime, the node is unlocked and the call is retried once.
+    """
     @wraps(method)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        if is_node_locked():
+        if is_node_locked_cached():
+            unlock_node()
+        try:
+            return method(*args, **kwargs)
+        except CommonException as exc:
+            if not _is_locked_error(exc):
+                raise
+            logger.info(
+                'Node locked while calling %s, unlocking and retrying once', method.__name__,
+            )
+            NodeStateTracker.get_instance().set_state(
+                Request.load_base_url(), NodeLockState.LOCKED,
+            )
             unlock_node()
-        return method(*args, **kwargs)
+            return method(*args, **kwargs)
     return wrapper
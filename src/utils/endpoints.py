@@ -75,6 +75,75 @@ REQUEST_FAUCET_ASSET = '/receive/asset'
 
 ENDPOINTS_TO_CACHE: list[str] = [
     BTC_BALANCE_ENDPOINT,
+    LIST_ASSETS_ENDPOINT,
     LIST_TRANSACTIONS_ENDPOINT,
     LIST_UNSPENT_ENDPOINT,
 ]
+
+# Cached read endpoints whose results change when a mutating endpoint succeeds
+CACHE_INVALIDATION_GRAPH: dict[str, list[str]] = {
+    SEND_ASSET_ENDPOINT: [
+        LIST_ASSETS_ENDPOINT,
+        BTC_BALANCE_ENDPOINT,
+        LIST_TRANSACTIONS_ENDPOINT,
+        LIST_UNSPENT_ENDPOINT,
+    ],
+    RGB_INVOICE_ENDPOINT: [LIST_ASSETS_ENDPOINT, LIST_UNSPENT_ENDPOINT],
+    CREATE_UTXO_ENDPOINT: [
+        BTC_BALANCE_ENDPOINT,
+        LIST_TRANSACTIONS_ENDPOINT,
+        LIST_UNSPENT_ENDPOINT,
+    ],
+    SEND_BTC_ENDPOINT: [
+        BTC_BALANCE_ENDPOINT,
+        LIST_TRANSACTIONS_ENDPOINT,
+        LIST_UNSPENT_ENDPOINT,
+    ],
+    OPEN_CHANNEL_ENDPOINT: [
+        LIST_ASSETS_ENDPOINT,
+        BTC_BALANCE_ENDPOINT,
+        LIST_TRANSACTIONS_ENDPOINT,
+        LIST_UNSPENT_ENDPOINT,
+    ],
+    CLOSE_CHANNEL_ENDPOINT: [
+        LIST_ASSETS_ENDPOINT,
+        BTC_BALANCE_ENDPOINT,
+        LIST_TRANSACTIONS_ENDPOINT,
+        LIST_UNSPENT_ENDPOINT,
+    ],
+    KEY_SEND_ENDPOINT: [LIST_ASSETS_ENDPOINT],
+    SEND_PAYMENT_ENDPOINT: [LIST_ASSETS_ENDPOINT],
+    ISSUE_ASSET_ENDPOINT_NIA: [LIST_ASSETS_ENDPOINT, LIST_UNSPENT_ENDPOINT],
+    ISSUE_ASSET_ENDPOINT_CFA: [LIST_ASSETS_ENDPOINT, LIST_UNSPENT_ENDPOINT],
+    ISSUE_ASSET_ENDPOINT_UDA: [LIST_ASSETS_ENDPOINT, LIST_UNSPENT_ENDPOINT],
+    FAIL_TRANSFER_ENDPOINT: [LIST_ASSETS_ENDPOINT, LIST_UNSPENT_ENDPOINT],
+    REFRESH_TRANSFERS_ENDPOINT: [LIST_ASSETS_ENDPOINT, LIST_UNSPENT_ENDPOINT],
+    REQUEST_FAUCET_ASSET: [LIST_ASSETS_ENDPOINT],
+}
+
+# Endpoints which only read the node state. Calls to them never invalidate
+# the cache, see Cache.invalidate_for_endpoint. Endpoints creating an address
+# or an invoice are not listed: they change the node state.
+READ_ENDPOINTS: frozenset[str] = frozenset({
+    LIST_CHANNELS_ENDPOINT,
+    LIST_PEERS_ENDPOINT,
+    LIST_PAYMENTS_ENDPOINT,
+    DECODE_LN_INVOICE_ENDPOINT,
+    INVOICE_STATUS_ENDPOINT,
+    BTC_BALANCE_ENDPOINT,
+    LIST_TRANSACTIONS_ENDPOINT,
+    LIST_UNSPENT_ENDPOINT,
+    ESTIMATE_FEE_ENDPOINT,
+    ASSET_BALANCE_ENDPOINT,
+    DECODE_RGB_INVOICE_ENDPOINT,
+    LIST_ASSETS_ENDPOINT,
+    LIST_TRANSFERS_ENDPOINT,
+    GET_ASSET_MEDIA,
+    LIST_TRADES_ENDPOINT,
+    NETWORK_INFO_ENDPOINT,
+    NODE_INFO_ENDPOINT,
+})
+
+# Read endpoints whose concurrent identical calls share one request, see
+# src/utils/single_flight.py.
+COALESCED_ENDPOINTS: frozenset[str] = READ_ENDPOINTS
@@ -71,3 +71,4 @@ ERROR_UNABLE_TO_SET_PROXY_ENDPOINT = 'The proxy endpoint is invalid'
 ERROR_UNABLE_TO_SET_MIN_CONFIRMATION = 'Unable to set min confirmation'
 ERROR_NODE_INCOMPATIBILITY = 'The commit ID of the RGB Lightning Node is incompatible with the one used to initialize the wallet'
 ERROR_WHILE_DOWNLOADING_LOGS = 'An error occurred while downloading logs.'
+ERROR_WHILE_EXPORTING_METRICS = 'An error occurred while exporting metrics.'
@@ -0,0 +1,93 @@
+"""
+A thread-safe store of the last fee rates estimated by the node.
+
+This module provides a `FeeEstimateCache` class shared by the send and channel
+flows, so that switching between slow, medium and fast fees reads a fee rate
+fetched shortly before instead of issuing a new `/estimatefee` call. Fee rates
+are remembered per block target together with the time they were fetched.
+
+Key Features:
+- Remembers the fee rate of each block target.
+- Treats fee rates older than `FEE_ESTIMATE_MAX_AGE` seconds as missing.
+- Singleton instance shared by all threads.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+from src.utils.constant import FEE_ESTIMATE_BLOCK_TARGETS
+from src.utils.constant import FEE_ESTIMATE_MAX_AGE
+
+
+class FeeEstimateCache:
+    """Remembers the fee rate estimated for each block target."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, max_age: float = FEE_ESTIMATE_MAX_AGE):
+        """
+        Initialize the FeeEstimateCache object.
+
+        Args:
+            max_age (float): Seconds after which a fee rate is considered stale.
+        """
+        self.max_age = max_age
+        self._rates_lock = threading.Lock()
+        self._rates: dict[int, tuple[float, float]] = {}
+
+    def get(self, blocks: int) -> float | None:
+        """
+        Return the remembered fee rate for the block target.
+
+        Args:
+            blocks (int): The block target of the estimate.
+
+        Returns:
+            float | None: The fee rate, or None if it is unknown or stale.
+        """
+        with self._rates_lock:
+            entry = self._rates.get(blocks)
+        if entry is None:
+            return None
+        fee_rate, fetched_at = entry
+        if (time.monotonic() - fetched_at) > self.max_age:
+            return None
+        return fee_rate
+
+    def set(self, blocks: int, fee_rate: float) -> None:
+        """
+        Remember the fee rate estimated for the block target.
+
+        Args:
+            blocks (int): The block target of the estimate.
+            fee_rate (float): The estimated fee rate in sat/vB.
+        """
+        with self._rates_lock:
+            self._rates[blocks] = (fee_rate, time.monotonic())
+
+    def is_fresh(self) -> bool:
+        """Whether every prefetched block target has a fee rate that is not stale."""
+        return all(
+            self.get(blocks) is not None for blocks in FEE_ESTIMATE_BLOCK_TARGETS
+        )
+
+    def clear(self) -> None:
+        """Forget every remembered fee rate."""
+        with self._rates_lock:
+            self._rates.clear()
+
+    @staticmethod
+    def get_instance() -> FeeEstimateCache:
+        """
+        Returns the singleton instance of FeeEstimateCache in a thread-safe manner.
+
+        Returns:
+            FeeEstimateCache: The singleton instance of the cache.
+        """
+        if FeeEstimateCache._instance is None:
+            with FeeEstimateCache._lock:
+                if FeeEstimateCache._instance is None:
+                    FeeEstimateCache._instance = FeeEstimateCache()
+        return FeeEstimateCache._instance
@@ -0,0 +1,210 @@
+# pylint: disable=too-many-instance-attributes
+"""
+Flags blocking I/O made on the GUI thread and measures event loop stalls.
+
+This module provides a `GuiThreadWatchdog` class, enabled in debug runs with
+the `--gui-watchdog` command line flag or the `IRIS_WALLET_GUI_WATCHDOG=1`
+environment variable. Once enabled:
+
+- `Request` and the keyring storage report every call they make; calls made
+  on the GUI thread are counted and logged with the stack of their first
+  occurrence, since the interface cannot repaint until they return;
+- a heartbeat timer on the GUI thread measures how late the event loop runs
+  it, and records every delay above `GUI_WATCHDOG_STALL_MS` as a stall;
+- a monitor thread logs the stack of the GUI thread while it is stalled, so
+  that the blocking call is known even when it is not a node request.
+
+The counters are shown in the diagnostics panel through the metrics registry.
+When the watchdog is disabled every method returns immediately. Like the
+startup tracer, the module only depends on the standard library and QtCore,
+so that bootstrap can enable it before the rest of the application is
+imported.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtCore import QThread
+from PySide6.QtCore import QTimer
+
+GUI_WATCHDOG_ENV = 'IRIS_WALLET_GUI_WATCHDOG'
+GUI_WATCHDOG_HEARTBEAT_MS = 50
+GUI_WATCHDOG_STALL_MS = 100
+GUI_WATCHDOG_STACK_DEPTH = 12
+
+# See startup_trace: the application logger is looked up by name, because
+# bootstrap imports this module before the logging setup can run.
+logger = logging.getLogger('iris-wallet')
+
+
+class GuiThreadWatchdog:
+    """Reports blocking calls made on the GUI thread and stalls of its event loop."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        heartbeat_ms: int = GUI_WATCHDOG_HEARTBEAT_MS,
+        stall_ms: int = GUI_WATCHDOG_STALL_MS,
+    ):
+        """
+        Initialize the GuiThreadWatchdog object.
+
+        Args:
+            heartbeat_ms (int): Interval of the heartbeat timer, in milliseconds.
+            stall_ms (int): Delay of the heartbeat above which the event loop is considered stalled.
+        """
+        self.heartbeat_ms = heartbeat_ms
+        self.stall_ms = stall_ms
+        self.enabled = False
+        self.blocking_calls: dict[str, int] = {}
+        self.stalls = 0
+        self.max_stall_ms = 0.0
+        self.total_stall_ms = 0.0
+        self._reported_calls: set[str] = set()
+        self._last_beat = time.perf_counter()
+        self._gui_thread_id: int | None = None
+        self._timer: QTimer | None = None
+        self._stop = threading.Event()
+        self._stats_lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Start reporting blocking calls; call `start` once the application exists to measure stalls."""
+        self.enabled = True
+        logger.info(
+            'GUI thread watchdog enabled, stalls above %d ms are reported', self.stall_ms,
+        )
+
+    def configure_from_env(self) -> None:
+        """Enable the watchdog when its environment variable is set to 1."""
+        if os.environ.get(GUI_WATCHDOG_ENV, '') == '1':
+            self.enable()
+
+    @staticmethod
+    def is_gui_thread() -> bool:
+        """Whether the calling thread is the thread of the application's event loop."""
+        app = QCoreApplication.instance()
+        return app is not None and QThread.currentThread() == app.thread()
+
+    def check_blocking_call(self, kind: str, name: str) -> None:
+        """
+        Report a blocking call if it is made on the GUI thread.
+
+        Args:
+            kind (str): The kind of I/O, e.g. 'request' or 'keyring'.
+            name (str): What is called, e.g. the endpoint or the keyring key.
+        """
+        if not self.enabled or not self.is_gui_thread():
+            return
+        call = f'{kind}:{name}'
+        with self._stats_lock:
+            self.blocking_calls[call] = self.blocking_calls.get(call, 0) + 1
+            is_first = call not in self._reported_calls
+            self._reported_calls.add(call)
+        if is_first:
+            stack = traceback.format_stack(limit=GUI_WATCHDOG_STACK_DEPTH)[:-1]
+            logger.warning(
+                'Blocking %s call %s made on the GUI thread:\n%s',
+                kind, name, ''.join(stack),
+            )
+
+    def start(self) -> None:
+        """Start measuring event loop stalls; must be called on the GUI thread."""
+        if not self.enabled or self._timer is not None:
+            return
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop.clear()
+        self._timer = QTimer()
+        self._timer.setInterval(self.heartbeat_ms)
+        self._timer.timeout.connect(self._on_heartbeat)
+        self._timer.start()
+        threading.Thread(
+            target=self._monitor, name='gui-watchdog', daemon=True,
+        ).start()
+
+    def stop(self) -> None:
+        """Stop measuring event loop stalls."""
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    def _on_heartbeat(self) -> None:
+        """Record the delay of the heartbeat beyond its interval as a stall."""
+        now = time.perf_counter()
+        delay_ms = (now - self._last_beat) * 1000 - self.heartbeat_ms
+        self._last_beat = now
+        if delay_ms >= self.stall_ms:
+            self.record_stall(delay_ms)
+
+    def record_stall(self, stall_ms: float) -> None:
+        """
+        Record a stall of the event loop.
+
+        Args:
+            stall_ms (float): How long the event loop could not run, in milliseconds.
+        """
+        with self._stats_lock:
+            self.stalls += 1
+            self.total_stall_ms += stall_ms
+            self.max_stall_ms = max(self.max_stall_ms, stall_ms)
+        logger.warning('GUI event loop stalled for %.0f ms', stall_ms)
+
+    def _monitor(self) -> None:
+        """Log the stack of the GUI thread once per stall, while it is stalled."""
+        reported_beat = None
+        while not self._stop.wait(self.heartbeat_ms / 1000):
+            beat = self._last_beat
+            if beat == reported_beat or (time.perf_counter() - beat) * 1000 < self.heartbeat_ms + self.stall_ms:
+                continue
+            reported_beat = beat
+            frame = sys._current_frames().get(  # pylint: disable=protected-access
+                self._gui_thread_id,
+            )
+            if frame is not None:
+                logger.warning(
+                    'GUI thread blocked for more than %d ms in:\n%s', self.stall_ms,
+                    ''.join(
+                        traceback.format_stack(
+                            frame, limit=GUI_WATCHDOG_STACK_DEPTH,
+                        ),
+                    ),
+                )
+
+    def stats(self) -> dict:
+        """Return the blocking calls made on the GUI thread and the event loop stalls."""
+        with self._stats_lock:
+            return {
+                'blocking_calls': sum(self.blocking_calls.values()),
+                'blocking_calls_by_name': dict(
+                    sorted(
+                        self.blocking_calls.items(),
+                        key=lambda item: -item[1],
+                    ),
+                ),
+                'stalls': self.stalls,
+                'max_stall_ms': round(self.max_stall_ms, 1),
+                'total_stall_ms': round(self.total_stall_ms, 1),
+            }
+
+    @staticmethod
+    def get_instance() -> GuiThreadWatchdog:
+        """
+        Returns the singleton instance of GuiThreadWatchdog in a thread-safe manner.
+
+        Returns:
+            GuiThreadWatchdog: The singleton instance of the watchdog.
+        """
+        if GuiThreadWatchdog._instance is None:
+            with GuiThreadWatchdog._lock:
+                if GuiThreadWatchdog._instance is None:
+                    GuiThreadWatchdog._instance = GuiThreadWatchdog()
+        return GuiThreadWatchdog._instance
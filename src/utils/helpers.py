@@ -60,6 +60,7 @@ from src.utils.constant import SAVED_PROXY_ENDPOINT
 from src.utils.gauth import TOKEN_PICKLE_PATH
 from src.utils.local_store import local_store
 from src.utils.logging import logger
+from src.utils.stylesheet_registry import StylesheetRegistry
 
 
 def handle_asset_address(address: str, short_len: int = 12) -> str:
@@ -80,10 +81,33 @@ def handle_asset_address(address: str, short_len: int = 12) -> str:
     return shortened_address
 
 
+def get_stylesheet_folder() -> str:
+    """
+    Returns the folder containing the QSS stylesheets of the application.
+
+    Returns:
+    str: The path of the "views/qss" folder, inside the bundle when the application is frozen.
+    """
+    if getattr(sys, 'frozen', False):
+        # If the application is frozen (compiled with PyInstaller)
+        base_path = getattr(
+            sys,
+            '_MEIPASS',
+            os.path.dirname(os.path.abspath(__file__)),
+        )
+        return os.path.join(base_path, 'views/qss')
+    # Get the directory of the current script (helpers.py)
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, '..', 'views/qss')
+
+
 def load_stylesheet(file: str = 'views/qss/style.qss') -> str:
     """
     Loads the QSS stylesheet from the specified file.
 
+    The file is read from disk only once; later calls return its content from the
+    stylesheet registry.
+
     Parameters:
     file (str): The relative path to the QSS file. Defaults to "views/qss/style.qss".
 
@@ -95,14 +119,8 @@ def load_stylesheet(file: str = 'views/qss/style.qss') -> str:
     """
     if getattr(sys, 'frozen', False):
         # If the application is frozen (compiled with PyInstaller)
-        base_path = getattr(
-            sys,
-            '_MEIPASS',
-            os.path.dirname(os.path.abspath(__file__)),
-        )
-        qss_folder_path = os.path.join(base_path, 'views/qss')
         filename = os.path.basename(file)
-        file = os.path.join(qss_folder_path, filename)
+        file = os.path.join(get_stylesheet_folder(), filename)
     else:
         if not os.path.isabs(file):
             # Get the directory of the current script (helpers.py)
@@ -111,14 +129,22 @@ def load_stylesheet(file: str = 'views/qss/style.qss') -> str:
             file = os.path.join(base_path, '..', file)
 
     try:
-        with open(file, encoding='utf-8') as _f:
-            stylesheet = _f.read()
-        return stylesheet
+        return StylesheetRegistry.get_instance().get(file)
     except FileNotFoundError:
         logger.error("Error: Stylesheet file '%s' not found.", file)
         raise
 
 
+def preload_stylesheets() -> int:
+    """
+    Reads every QSS stylesheet of the application into the stylesheet registry.
+
+    Returns:
+    int: The number of stylesheets held in memory.
+    """
+    return StylesheetRegistry.get_instance().preload(get_stylesheet_folder())
+
+
 def create_circular_pixmap(diameter: int, color: QColor) -> QPixmap:
     """
     Create a circular pixmap with a transparent background.
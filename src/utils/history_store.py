@@ -0,0 +1,253 @@
+"""
+A local, indexed store of formatted transaction history rows.
+
+This module provides a `HistoryStore` class used by the page services to avoid
+reprocessing the full history on every visit. The node still returns the full
+list, but each row is fingerprinted and only new or changed rows go through the
+service's formatting; unchanged rows are read back pre-formatted from SQLite.
+Rows that the node no longer returns are removed, so the store always mirrors
+the last sync.
+
+Formatted rows are stored as JSON fields, never as pickled objects. Since the
+formatted output depends on the formatters and on the local timezone, the
+fingerprint of a row also covers the format version, the app version and the
+timezone: after an upgrade or a timezone change every row is formatted again.
+A stored row that no longer validates against its model is formatted again too.
+
+Key Features:
+- Rows keyed by kind (on-chain, transfer, payment), scope (e.g. asset ID) and row key (txid, idx, payment hash).
+- Merge of new and changed rows in a single transaction per sync.
+- Thread-safe access to the store.
+- Singleton instance stored next to the cache, so it is cleared with it.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+import src.flavour as bitcoin_network
+from src.model.enums.enums_model import NetworkEnumModel
+from src.utils.build_app_path import app_paths
+from src.utils.constant import DEFAULT_HISTORY_FILENAME
+from src.utils.constant import HISTORY_FILE_NAME
+from src.utils.constant import HISTORY_FORMAT_VERSION
+from src.utils.local_store import local_store
+from src.utils.logging import logger
+from src.version import __version__
+
+RowT = TypeVar('RowT', bound=BaseModel)
+
+HISTORY_KIND_BTC_TRANSACTION = 'btc_transaction'
+HISTORY_KIND_ASSET_TRANSFER = 'asset_transfer'
+HISTORY_KIND_LN_PAYMENT = 'ln_payment'
+
+
+class HistoryStore:
+    """SQLite store merging history rows fetched from the node with their formatted form."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the HistoryStore object.
+
+        Args:
+            file_path (str): Full path to the SQLite database file.
+        """
+        self.file_path = file_path
+        self._db_lock = threading.Lock()
+        self.conn: sqlite3.Connection = sqlite3.connect(
+            file_path,
+            check_same_thread=False,
+        )
+        self._create_table()
+
+    @staticmethod
+    def _initialize_store() -> HistoryStore | None:
+        """
+        Create and return a HistoryStore instance for the current network.
+
+        Returns:
+            HistoryStore: A HistoryStore instance if successful, None otherwise.
+        """
+        try:
+            current_network = NetworkEnumModel(bitcoin_network.__network__)
+            file_name = f"{
+                HISTORY_FILE_NAME.get(
+                    current_network, DEFAULT_HISTORY_FILENAME
+                )
+            }.sqlite"
+            if not os.path.exists(app_paths.cache_path):
+                local_store.create_folder(app_paths.cache_path)
+            return HistoryStore(os.path.join(app_paths.cache_path, file_name))
+        except Exception as exc:
+            logger.error(
+                'Exception occurred in history store: %s, Message: %s',
+                type(exc).__name__, str(exc),
+            )
+        return None
+
+    def _create_table(self) -> None:
+        """Create the table storing history rows if it doesn't exist."""
+        with self._db_lock, self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS history (
+                    kind TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    row_key TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    data TEXT,
+                    PRIMARY KEY (kind, scope, row_key)
+                );
+                """,
+            )
+
+    @staticmethod
+    def formatting_context() -> str:
+        """Return what, besides the row itself, the formatted output depends on."""
+        utc_offset = datetime.now().astimezone().utcoffset()
+        return f'{HISTORY_FORMAT_VERSION}:{__version__}:{"/".join(time.tzname)}:{utc_offset}'
+
+    @staticmethod
+    def fingerprint(row: BaseModel, context: str = '') -> str:
+        """
+        Return a digest of the row as received from the node.
+
+        Args:
+            row (BaseModel): The raw row.
+            context (str): The formatting context, see `formatting_context`.
+        """
+        return hashlib.sha1(
+            f'{context}\n{row.model_dump_json()}'.encode('utf-8'), usedforsecurity=False,
+        ).hexdigest()
+
+    @staticmethod
+    def _load(row: RowT, data: str | bytes | None) -> RowT | None:
+        """Rebuild a stored formatted row with the model of the raw row, or None if it is unreadable."""
+        if not isinstance(data, str):
+            return None
+        try:
+            return type(row).model_validate_json(data)
+        except ValueError as exc:
+            logger.warning(
+                'Stored history row could not be read, formatting it again: %s', exc,
+            )
+            return None
+
+    def sync(
+        self,
+        kind: str,
+        scope: str,
+        rows: list[tuple[str, RowT]],
+        formatter: Callable[[RowT], RowT],
+    ) -> list[RowT]:
+        """
+        Merge the rows fetched from the node into the store and return them formatted.
+
+        Only rows that are new, whose content or formatting context changed since
+        the last sync, or whose stored form cannot be read are passed to the
+        formatter; the others are read back from the store.
+
+        Args:
+            kind (str): The kind of history rows, one of the HISTORY_KIND_* constants.
+            scope (str): The scope of the rows, e.g. the asset ID, or '' for wallet-wide rows.
+            rows (list[tuple[str, RowT]]): The fetched rows with their unique key, in display order.
+            formatter (Callable[[RowT], RowT]): Formats a raw row; may raise to abort the sync.
+
+        Returns:
+            list[RowT]: The formatted rows, in the order they were given.
+        """
+        context = self.formatting_context()
+        fingerprints = [self.fingerprint(row, context) for _, row in rows]
+        with self._db_lock:
+            stored = {
+                row_key: (fingerprint, data)
+                for row_key, fingerprint, data in self.conn.execute(
+                    'SELECT row_key, fingerprint, data FROM history WHERE kind = ? AND scope = ?',
+                    (kind, scope),
+                )
+            }
+
+        formatted_rows: list[RowT] = []
+        upserts: list[tuple[str, str, str, str, str]] = []
+        for (row_key, row), fingerprint in zip(rows, fingerprints):
+            stored_row = stored.get(row_key)
+            if stored_row is not None and stored_row[0] == fingerprint:
+                loaded = self._load(row, stored_row[1])
+                if loaded is not None:
+                    formatted_rows.append(loaded)
+                    continue
+            formatted = formatter(row)
+            formatted_rows.append(formatted)
+            upserts.append(
+                (kind, scope, row_key, fingerprint, formatted.model_dump_json()),
+            )
+
+        removed = set(stored) - {row_key for row_key, _ in rows}
+        if upserts or removed:
+            with self._db_lock, self.conn:
+                self.conn.executemany(
+                    'INSERT OR REPLACE INTO history (kind, scope, row_key, fingerprint, data) VALUES (?, ?, ?, ?, ?)',
+                    upserts,
+                )
+                self.conn.executemany(
+                    'DELETE FROM history WHERE kind = ? AND scope = ? AND row_key = ?',
+                    [(kind, scope, row_key) for row_key in removed],
+                )
+        logger.info(
+            'History sync %s[%s]: %d rows, %d formatted, %d removed',
+            kind, scope, len(rows), len(upserts), len(removed),
+        )
+        return formatted_rows
+
+    def clear(self) -> None:
+        """Remove every stored row."""
+        with self._db_lock, self.conn:
+            self.conn.execute('DELETE FROM history')
+
+    @staticmethod
+    def get_history_store() -> HistoryStore | None:
+        """
+        Returns the singleton instance of HistoryStore in a thread-safe manner.
+
+        Returns:
+            HistoryStore: The singleton instance of the store, or None if it could not be opened.
+        """
+        if HistoryStore._instance is None:
+            with HistoryStore._lock:
+                if HistoryStore._instance is None:
+                    HistoryStore._instance = HistoryStore._initialize_store()
+        return HistoryStore._instance
+
+
+def sync_history(
+    kind: str,
+    scope: str,
+    rows: list[tuple[str, RowT]],
+    formatter: Callable[[RowT], RowT],
+) -> list[RowT]:
+    """
+    Format the rows through the history store, or directly if the store is unavailable.
+
+    Formatter errors are raised to the caller; store errors fall back to formatting every row.
+    """
+    store = HistoryStore.get_history_store()
+    if store is not None:
+        try:
+            return store.sync(kind, scope, rows, formatter)
+        except sqlite3.Error as exc:
+            logger.error(
+                'Exception occurred in history store: %s, Message: %s',
+                type(exc).__name__, str(exc),
+            )
+    return [formatter(row) for _, row in rows]
@@ -0,0 +1,166 @@
+"""
+A thread-safe pool of keep-alive HTTP sessions shared by every node request.
+
+This module provides a `SessionPool` class that hands out `requests.Session`
+objects to callers (repositories, `QThreadPool` workers) and takes them back
+once a request has completed. All pooled sessions share a single transport
+adapter, so TCP/TLS connections opened by one request are reused by the next
+one, whichever thread it runs on.
+
+Key Features:
+- Bounded number of sessions, one per concurrent caller.
+- Per-host connection limits shared by all sessions.
+- Retry with exponential backoff for connection errors and gateway failures.
+- Sessions without retries for probes that must fail fast.
+- Singleton instance for application-wide use.
+"""
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
+from urllib3.util.retry import Retry
+
+from src.utils.constant import HTTP_MAX_RETRIES
+from src.utils.constant import HTTP_POOL_CONNECTIONS
+from src.utils.constant import HTTP_POOL_MAX_SESSIONS
+from src.utils.constant import HTTP_POOL_MAXSIZE_PER_HOST
+from src.utils.constant import HTTP_RETRY_BACKOFF_FACTOR
+from src.utils.constant import HTTP_RETRY_STATUS_CODES
+from src.utils.logging import logger
+
+
+class SessionPool:
+    """Pool of `requests.Session` objects backed by one shared connection pool."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_sessions: int = HTTP_POOL_MAX_SESSIONS,
+        pool_connections: int = HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE_PER_HOST,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_factor: float = HTTP_RETRY_BACKOFF_FACTOR,
+    ):
+        """
+        Initialize the SessionPool object.
+
+        Args:
+            max_sessions (int): Maximum number of sessions alive at the same time.
+            pool_connections (int): Number of hosts for which connections are kept.
+            pool_maxsize (int): Maximum number of open connections per host.
+            max_retries (int): Number of retries for failed connections.
+            backoff_factor (float): Backoff factor applied between retries.
+        """
+        self.max_sessions = max_sessions
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=True,
+            max_retries=self._build_retry(max_retries, backoff_factor),
+        )
+        self._no_retry_adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=True,
+            max_retries=self._build_retry(0, 0),
+        )
+        self._idle_sessions: dict[bool, queue.LifoQueue[requests.Session]] = {
+            True: queue.LifoQueue(),
+            False: queue.LifoQueue(),
+        }
+        self._slots = threading.BoundedSemaphore(max_sessions)
+        self._sessions_lock = threading.Lock()
+        self._sessions: list[requests.Session] = []
+
+    @staticmethod
+    def _build_retry(max_retries: int, backoff_factor: float) -> Retry:
+        """
+        Build the retry policy used by the shared adapter.
+
+        Connection errors are retried for every method because the request never
+        reached the node. Gateway errors are only retried for idempotent methods,
+        since most node POST endpoints mutate the wallet. With `max_retries` set
+        to 0 the first error is raised at once.
+        """
+        return Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=HTTP_RETRY_STATUS_CODES,
+            allowed_methods=frozenset(
+                {'GET', 'PUT', 'DELETE', 'HEAD', 'OPTIONS'},
+            ),
+            raise_on_status=False,
+        )
+
+    def _create_session(self, retry: bool = True) -> requests.Session:
+        """Create a new session that uses the shared adapter, or the one without retries."""
+        adapter = self._adapter if retry else self._no_retry_adapter
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        with self._sessions_lock:
+            self._sessions.append(session)
+        return session
+
+    def acquire(self, retry: bool = True) -> requests.Session:
+        """
+        Take a session out of the pool, creating one if none is idle.
+
+        Blocks while `max_sessions` sessions are already in use.
+
+        Args:
+            retry (bool): Whether failed connections are retried; probes pass False.
+        """
+        self._slots.acquire()  # pylint: disable=consider-using-with
+        try:
+            return self._idle_sessions[retry].get_nowait()
+        except queue.Empty:
+            return self._create_session(retry)
+
+    def release(self, session: requests.Session, retry: bool = True) -> None:
+        """Return a session acquired with the same `retry` to the pool so that its caller slot can be reused."""
+        self._idle_sessions[retry].put(session)
+        self._slots.release()
+
+    @contextmanager
+    def session(self, retry: bool = True) -> Iterator[requests.Session]:
+        """Context manager yielding a pooled session for the duration of a request, see `acquire`."""
+        session = self.acquire(retry)
+        try:
+            yield session
+        finally:
+            self.release(session, retry)
+
+    def close_all(self) -> None:
+        """Drop all keep-alive connections; pooled sessions reconnect on next use."""
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.close()
+        self._adapter.close()
+        self._no_retry_adapter.close()
+        logger.info('Closed %d pooled HTTP sessions.', len(sessions))
+
+    @staticmethod
+    def get_instance() -> SessionPool:
+        """
+        Returns the singleton instance of SessionPool in a thread-safe manner.
+
+        Returns:
+            SessionPool: The singleton instance of the session pool.
+        """
+        if SessionPool._instance is None:
+            with SessionPool._lock:
+                if SessionPool._instance is None:
+                    SessionPool._instance = SessionPool()
+        return SessionPool._instance
@@ -0,0 +1,371 @@
+"""
+A content-addressed cache of rendered images (identicons and QR codes).
+
+This module provides an `ImageCache` class holding the PNG bytes of generated
+images, so that pages listing many assets do not run pydenticon and PIL for
+every row on every visit. Images are keyed by what they are rendered from
+(the asset ID and size for identicons, the payload for QR codes), which makes
+entries valid forever: they never need to be invalidated, only evicted.
+
+Key Features:
+- In-memory LRU of PNG bytes, bounded by `IMAGE_CACHE_MAX_ENTRIES`.
+- On-disk copy of persisted images (identicons) in the cache folder, so they
+  survive restarts; QR codes of one-time invoices and addresses stay in memory.
+- On-disk copies bounded by `IMAGE_CACHE_MAX_DISK_ENTRIES`, the least recently
+  used being deleted at startup.
+- Background generation of images that a page is about to show.
+- Concurrent requests for the same missing image share a single render.
+- Thread-safe; PNG bytes are converted to Qt images by the caller on the GUI thread.
+- Singleton instance for application-wide use.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pydenticon
+import qrcode
+from PIL import Image
+from PIL import ImageDraw
+from PIL import ImageOps
+
+from src.utils.build_app_path import app_paths
+from src.utils.constant import IMAGE_CACHE_FOLDER_NAME
+from src.utils.constant import IMAGE_CACHE_MAX_DISK_ENTRIES
+from src.utils.constant import IMAGE_CACHE_MAX_ENTRIES
+from src.utils.constant import IMAGE_CACHE_PREFETCH_WORKERS
+from src.utils.logging import logger
+
+IDENTICON_DEFAULT_SIZE = 40
+QR_CODE_SIZE = 335
+
+
+def render_identicon_png(data: str, size: int = IDENTICON_DEFAULT_SIZE) -> bytes:
+    """Render the circular identicon of the given data as PNG bytes."""
+    generator = pydenticon.Generator(
+        5, 5,
+        foreground=[
+            'rgb(45,79,255)', 'rgb(254,180,44)', 'rgb(226,121,234)',
+            'rgb(30,179,253)', 'rgb(232,77,65)', 'rgb(49,203,115)', 'rgb(141,69,170)',
+        ],
+        background='rgb(224,224,224)',
+    )
+    identicon = generator.generate(data, size, size, output_format='png')
+
+    # Convert identicon to a circular image
+    buffered = BytesIO(identicon)
+    image = Image.open(buffered).convert('RGBA')
+    # Ensure proper orientation for PyQt
+    image = image.transpose(Image.FLIP_TOP_BOTTOM)
+    image_size = image.size
+    # Create circular mask
+    mask = Image.new('L', image_size, 0)
+    draw = ImageDraw.Draw(mask)
+
+    # Draw a smooth ellipse using anti-aliasing
+    draw.ellipse(
+        [(0, 0), (image_size[0] - 1, image_size[1] - 1)], fill=255,
+    )
+
+    # Apply mask to create circular image
+    circular_image = ImageOps.fit(image, image_size, centering=(0.5, 0.5))
+    circular_image.putalpha(mask)
+
+    circular_buffer = BytesIO()
+    circular_image.save(circular_buffer, format='PNG')
+    return circular_buffer.getvalue()
+
+
+def render_qr_code_png(data: str) -> bytes:
+    """Render the QR code of the given data as PNG bytes."""
+    _qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=1,
+    )
+    _qr.add_data(data)
+    _qr.make()
+
+    img = _qr.make_image(
+        fill='black', back_color='white',
+    ).resize((QR_CODE_SIZE, QR_CODE_SIZE))
+
+    buffer = BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+class ImageCache:
+    """Memory and disk cache of rendered images, keyed by the content they are rendered from."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        directory: str | None,
+        max_entries: int = IMAGE_CACHE_MAX_ENTRIES,
+        max_disk_entries: int = IMAGE_CACHE_MAX_DISK_ENTRIES,
+    ):
+        """
+        Initialize the ImageCache object.
+
+        Args:
+            directory (str | None): Folder storing the images on disk, or None to keep them in memory only.
+            max_entries (int): Maximum number of images kept in memory.
+            max_disk_entries (int): Maximum number of images kept on disk, see `prune_disk`.
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_lock = threading.Lock()
+        # Renders in progress, by key, awaited by the other callers of `get_or_create`
+        self._rendering: dict[str, threading.Event] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    @staticmethod
+    def identicon_key(data: str, size: int = IDENTICON_DEFAULT_SIZE) -> str:
+        """Return the cache key of the identicon of the given data and size."""
+        return ImageCache._digest(f'identicon:{size}:{data}')
+
+    @staticmethod
+    def qr_code_key(data: str) -> str:
+        """Return the cache key of the QR code of the given payload."""
+        return ImageCache._digest(f'qr:{QR_CODE_SIZE}:{data}')
+
+    @staticmethod
+    def _digest(value: str) -> str:
+        return hashlib.sha1(value.encode('utf-8'), usedforsecurity=False).hexdigest()
+
+    def _file_path(self, key: str) -> str | None:
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, f'{key}.png')
+
+    def _remember(self, key: str, data: bytes) -> None:
+        with self._memory_lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Return the PNG bytes stored under the key, from memory or from disk.
+
+        Args:
+            key (str): The cache key of the image.
+
+        Returns:
+            bytes | None: The PNG bytes, or None if the image was never stored.
+        """
+        with self._memory_lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+
+        file_path = self._file_path(key)
+        if file_path is None or not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, 'rb') as image_file:
+                data = image_file.read()
+            # The modification time orders the files for `prune_disk`
+            os.utime(file_path)
+        except OSError as exc:
+            logger.error(
+                'Exception occurred in image cache: %s, Message: %s',
+                type(exc).__name__, str(exc),
+            )
+            return None
+        self._remember(key, data)
+        return data
+
+    def put(self, key: str, data: bytes, persist: bool = True) -> None:
+        """
+        Store PNG bytes under the key, in memory and on disk.
+
+        Args:
+            key (str): The cache key of the image.
+            data (bytes): The PNG bytes.
+            persist (bool): Whether to also write the image to disk.
+        """
+        self._remember(key, data)
+        file_path = self._file_path(key) if persist else None
+        if file_path is None:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = f'{file_path}.{threading.get_ident()}.tmp'
+            with open(temp_path, 'wb') as image_file:
+                image_file.write(data)
+            os.replace(temp_path, file_path)
+        except OSError as exc:
+            logger.error(
+                'Exception occurred in image cache: %s, Message: %s',
+                type(exc).__name__, str(exc),
+            )
+
+    def get_or_create(self, key: str, create: Callable[[], bytes], persist: bool = True) -> bytes:
+        """
+        Return the cached image, rendering and storing it first if needed.
+
+        While another thread renders the same image, the call waits for that
+        render instead of starting its own.
+
+        Args:
+            key (str): The cache key of the image.
+            create (Callable[[], bytes]): Renders the PNG bytes; its errors are raised to the caller.
+            persist (bool): Whether a rendered image is also written to disk.
+
+        Returns:
+            bytes: The PNG bytes of the image.
+        """
+        data = self.get(key)
+        if data is not None:
+            return data
+        with self._memory_lock:
+            rendered = self._rendering.get(key)
+            is_renderer = rendered is None
+            if is_renderer:
+                rendered = self._rendering[key] = threading.Event()
+        if not is_renderer:
+            rendered.wait()
+            data = self.get(key)
+            if data is not None:
+                return data
+            # The other render failed: render here, so that its error reaches this caller too
+            data = create()
+            self.put(key, data, persist)
+            return data
+        try:
+            data = create()
+            self.put(key, data, persist)
+        finally:
+            with self._memory_lock:
+                del self._rendering[key]
+            rendered.set()
+        return data
+
+    def prune_disk(self) -> int:
+        """
+        Delete the least recently used images beyond `max_disk_entries` from disk.
+
+        Returns:
+            int: The number of deleted images.
+        """
+        if self.directory is None or not os.path.isdir(self.directory):
+            return 0
+        try:
+            with os.scandir(self.directory) as entries:
+                files = [
+                    (entry.stat().st_mtime, entry.path) for entry in entries
+                    if entry.is_file() and entry.name.endswith('.png')
+                ]
+        except OSError as exc:
+            logger.error(
+                'Exception occurred in image cache: %s, Message: %s',
+                type(exc).__name__, str(exc),
+            )
+            return 0
+        files.sort()
+        deleted = 0
+        for _, file_path in files[:max(len(files) - self.max_disk_entries, 0)]:
+            try:
+                os.remove(file_path)
+                deleted += 1
+            except OSError as exc:
+                logger.error(
+                    'Exception occurred in image cache: %s, Message: %s',
+                    type(exc).__name__, str(exc),
+                )
+        if deleted:
+            logger.info('Deleted %d images from the image cache', deleted)
+        return deleted
+
+    def prune_disk_in_background(self) -> None:
+        """Run `prune_disk` on a background thread."""
+        self._get_executor().submit(self.prune_disk)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with ImageCache._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=IMAGE_CACHE_PREFETCH_WORKERS,
+                        thread_name_prefix='image-cache',
+                    )
+        return self._executor
+
+    def prefetch_identicons(self, values: Iterable[str], size: int = IDENTICON_DEFAULT_SIZE) -> list[Future]:
+        """
+        Render the missing identicons of the given values on background threads.
+
+        Args:
+            values (Iterable[str]): The data of the identicons, e.g. asset IDs.
+            size (int): The size of the identicons.
+
+        Returns:
+            list[Future]: The renders, which callers about to show the identicons can wait for.
+        """
+        missing = [
+            value for value in dict.fromkeys(values)
+            if self.get(self.identicon_key(value, size)) is None
+        ]
+        if not missing:
+            return []
+        executor = self._get_executor()
+        return [
+            executor.submit(self._prefetch_identicon, value, size)
+            for value in missing
+        ]
+
+    def _prefetch_identicon(self, value: str, size: int) -> None:
+        try:
+            self.get_or_create(
+                self.identicon_key(value, size),
+                lambda: render_identicon_png(value, size),
+            )
+        except Exception as exc:
+            logger.error(
+                'Exception occurred while rendering identicon: %s, Message: %s',
+                type(exc).__name__, str(exc),
+            )
+
+    def clear(self) -> None:
+        """Forget the images kept in memory."""
+        with self._memory_lock:
+            self._memory.clear()
+
+    def shutdown(self) -> None:
+        """Cancel pending background renders and release the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def get_instance() -> ImageCache:
+        """
+        Returns the singleton instance of ImageCache in a thread-safe manner.
+
+        Returns:
+            ImageCache: The singleton instance of the cache.
+        """
+        if ImageCache._instance is None:
+            with ImageCache._lock:
+                if ImageCache._instance is None:
+                    ImageCache._instance = ImageCache(
+                        os.path.join(
+                            app_paths.cache_path, IMAGE_CACHE_FOLDER_NAME,
+                        ),
+                    )
+        return ImageCache._instance
@@ -1,14 +1,64 @@
 """
 This module contains the keyring class, which represents
 an operation manager for keyring functionalities.
+
+The native authentication flags are read on every settings page load and
+sensitive operation, and each keyring read can be a D-Bus round-trip to the
+Secret Service on Linux. These flags, which are not secrets, are therefore
+kept in memory for `KEYRING_CACHE_TTL_SECONDS` and updated on writes; the
+mnemonic and password are never cached.
 """
 from __future__ import annotations
 
+import threading
+import time
+
 import keyring as kr
 
 from src.utils.constant import APP_NAME
+from src.utils.constant import IS_NATIVE_AUTHENTICATION_ENABLED
+from src.utils.constant import KEYRING_CACHE_TTL_SECONDS
+from src.utils.constant import NATIVE_LOGIN_ENABLED
+from src.utils.gui_thread_watchdog import GuiThreadWatchdog
 from src.utils.logging import logger
 
+# Keys whose values may be cached, before the network suffix is added
+CACHED_KEYS = frozenset(
+    {NATIVE_LOGIN_ENABLED, IS_NATIVE_AUTHENTICATION_ENABLED},
+)
+
+_cache: dict[str, tuple[str | None, float]] = {}
+_cache_lock = threading.Lock()
+
+
+def _cache_key(key: str, network: str | None) -> str | None:
+    """Return the key under which the value is cached, or None if it must not be cached."""
+    if key not in CACHED_KEYS:
+        return None
+    return f'{key}_{network}' if network is not None else key
+
+
+def _store_in_cache(cache_key: str | None, value: str | None) -> None:
+    """Cache a value read from, or written to, the keyring."""
+    if cache_key is not None:
+        with _cache_lock:
+            _cache[cache_key] = (
+                value, time.monotonic() + KEYRING_CACHE_TTL_SECONDS,
+            )
+
+
+def _remove_from_cache(cache_key: str | None) -> None:
+    """Forget a cached value."""
+    if cache_key is not None:
+        with _cache_lock:
+            _cache.pop(cache_key, None)
+
+
+def clear_cache() -> None:
+    """Forget all cached values, so that they are read from the keyring again."""
+    with _cache_lock:
+        _cache.clear()
+
 
 def set_value(key: str, value: str, network: str | None = None) -> bool:
     """Set a value in the keyring with a specific key, considering the backend being used.
@@ -21,8 +71,11 @@ def set_value(key: str, value: str, network: str | None = None) -> bool:
     Returns:
         bool: True if the operation succeeded, False otherwise.
     """
+    cache_key = _cache_key(key, network)
     if network is not None:
         key = f'{key}_{network}'
+    GuiThreadWatchdog.get_instance().check_blocking_call('keyring', key)
+    _remove_from_cache(cache_key)
 
     try:
         # Get the current backend being used by keyring
@@ -37,6 +90,7 @@ def set_value(key: str, value: str, network: str | None = None) -> bool:
         check_value = kr.get_password(APP_NAME, key)
         if check_value is None:
             return False
+        _store_in_cache(cache_key, check_value)
         return True
 
     except kr.errors.KeyringError as error:
@@ -62,10 +116,19 @@ def get_value(key: str, network: str | None = None):
     Returns:
         The retrieved value or None if an error occurred.
     """
+    cache_key = _cache_key(key, network)
+    if cache_key is not None:
+        with _cache_lock:
+            value, expires_at = _cache.get(cache_key, (None, 0.0))
+        if time.monotonic() < expires_at:
+            return value
     if network is not None:
         key = f'{key}_{network}'
+    GuiThreadWatchdog.get_instance().check_blocking_call('keyring', key)
     try:
-        return kr.get_password(APP_NAME, key)
+        value = kr.get_password(APP_NAME, key)
+        _store_in_cache(cache_key, value)
+        return value
     except kr.errors.KeyringError as error:
         logger.error(
             'Exception occurred while getting value from keyring: %s, Message: %s',
@@ -80,9 +143,11 @@ def delete_value(key: str, network: str | None = None) -> None:
     Args:
         key: The key for which the value should be deleted.
     """
+    _remove_from_cache(_cache_key(key, network))
     try:
         if network is not None:
             key = f'{key}_{network}'
+        GuiThreadWatchdog.get_instance().check_blocking_call('keyring', key)
         kr.delete_password(APP_NAME, key)
         logger.info('Password deleted successfully for key: %s', key)
     except kr.errors.KeyringError as error:
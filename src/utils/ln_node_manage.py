@@ -1,3 +1,4 @@
+# pylint: disable=too-many-instance-attributes
 """
 This module provides a class to manage the lifecycle of an LN node server process.
 It uses PySide6's QProcess for starting and stopping the server, and includes
@@ -7,10 +8,17 @@ Classes:
     LnNodeServerManager: Manages the LN node server process, including starting,
                          stopping, and monitoring the server.
 
+The server is reported ready as soon as its REST API answers. The API is probed
+with an exponential backoff, and immediately when the node prints the line
+announcing that it is listening. Probes run on the task scheduler, never on the
+GUI thread, and do not retry refused connections, so that each one fails fast.
+
 Constants:
-    INTERVAL: Time interval in seconds to check the server status.
     LN_BINARY_NAME: The name of the LN node binary.
-    MAX_ATTEMPTS_TO_WAIT_FOR_NODE: Maximum number of attempts to wait for the server to start.
+    NODE_READY_PROBE_INITIAL_DELAY_MS: Delay before the first probe of the server status.
+    NODE_READY_PROBE_MAX_DELAY_MS: Maximum delay between two probes.
+    NODE_READY_PROBE_TIMEOUT: Time in seconds a single probe waits for an answer.
+    NODE_READY_TIMEOUT: Time in seconds to wait for the server to start.
     NODE_INFO_ENDPOINT: The endpoint to check the server's status.
     PageNameEnum: Enum for different page names in the application.
 """
@@ -18,6 +26,7 @@ from __future__ import annotations
 
 import os
 import sys
+import time
 
 from PySide6.QtCore import QObject
 from PySide6.QtCore import QProcess
@@ -26,16 +35,25 @@ from PySide6.QtCore import Signal
 from requests import HTTPError
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
-from src.utils.constant import INTERVAL
 from src.utils.constant import LN_BINARY_NAME
 from src.utils.constant import MAX_ATTEMPTS_FOR_CLOSE
-from src.utils.constant import MAX_ATTEMPTS_TO_WAIT_FOR_NODE
 from src.utils.constant import NODE_CLOSE_INTERVAL
+from src.utils.constant import NODE_READY_OUTPUT_MARKER
+from src.utils.constant import NODE_READY_PROBE_INITIAL_DELAY_MS
+from src.utils.constant import NODE_READY_PROBE_MAX_DELAY_MS
+from src.utils.constant import NODE_READY_PROBE_TIMEOUT
+from src.utils.constant import NODE_READY_TIMEOUT
 from src.utils.endpoints import NODE_INFO_ENDPOINT
+from src.utils.logging import logger
+from src.utils.metrics import MetricsRegistry
+from src.utils.node_state import NodeStateTracker
 from src.utils.request import Request
+from src.utils.startup_trace import StartupTracer
+from src.utils.task_scheduler import CancellationToken
+from src.utils.worker import ThreadManager
 
 
-class LnNodeServerManager(QObject):
+class LnNodeServerManager(QObject, ThreadManager):
     """
     Manages the LN node server process, including starting, stopping, and monitoring the server.
 
@@ -44,6 +62,7 @@ class LnNodeServerManager(QObject):
         process_terminated (Signal): Signal emitted when the server process terminates.
         process_error (Signal): Signal emitted when an error occurs in the server process.
         process_already_running (Signal): Signal emitted when attempting to start an already running server.
+        time_to_ready (float | None): Seconds between the last server start and its API answering.
         _instance (LnNodeServerManager): Singleton instance of the manager.
     """
 
@@ -66,12 +85,27 @@ class LnNodeServerManager(QObject):
         self.process.started.connect(self.on_process_started)
         self.process.finished.connect(self.on_process_terminated)
         self.process.errorOccurred.connect(self.on_process_error)
+        self.process.setProcessChannelMode(QProcess.MergedChannels)
+        self.process.readyReadStandardOutput.connect(self.on_process_output)
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.check_node_status)
         self.attempts = 0
+        self.probe_delay = NODE_READY_PROBE_INITIAL_DELAY_MS
+        self.started_at: float | None = None
+        self.time_to_ready: float | None = None
+        self._probe_token: CancellationToken | None = None
         self.attempts_for_close = 0
         self.is_stop = False
         self._timer_for_on_close = QTimer(self)
+        MetricsRegistry.get_instance().register_source('node', self.get_metrics)
+
+    def get_metrics(self) -> dict[str, float | int | None]:
+        """Return how long the last server start took to answer, for the metrics registry."""
+        return {
+            'time_to_ready_s': self.time_to_ready,
+            'readiness_probes': self.attempts,
+        }
 
     def start_server(self, arguments: list):
         """
@@ -82,6 +116,9 @@ class LnNodeServerManager(QObject):
             page_name (PageNameEnum): The name of the page initiating the server start.
         """
         if self.process.state() == QProcess.NotRunning:
+            self.started_at = time.monotonic()
+            self.time_to_ready = None
+            StartupTracer.get_instance().begin('node_start')
             self.process.start(self.executable_path, arguments)
         else:
             self.process_already_running.emit()
@@ -99,6 +136,7 @@ class LnNodeServerManager(QObject):
             )
             self._timer_for_on_close.start(NODE_CLOSE_INTERVAL * 1000)
         self.timer.stop()
+        self._cancel_probe()
 
     def _check_process_on_close_button_click(self):
         if self.attempts_for_close >= MAX_ATTEMPTS_FOR_CLOSE:
@@ -113,42 +151,122 @@ class LnNodeServerManager(QObject):
 
     def on_process_started(self):
         """
-        Slot called when the server process starts. Starts a timer to check the server status.
+        Slot called when the server process starts. Schedules the first check of the server status.
         """
+        NodeStateTracker.get_instance().reset()
         if self.process.state() == QProcess.Running:
             self.attempts = 0
-            # Convert seconds to milliseconds
-            self.timer.start(INTERVAL * 1000)
+            self.probe_delay = NODE_READY_PROBE_INITIAL_DELAY_MS
+            if self.started_at is None:
+                self.started_at = time.monotonic()
+            self.timer.start(self.probe_delay)
         else:
             self.process_error.emit(500, 'Unable to start server')
 
     def check_node_status(self):
         """
         Checks the status of the LN node server by making a request to the NODE_INFO_ENDPOINT.
-        Emits process_started if the server is running, or process_error if the server fails to start.
+        The request runs on a worker thread and its result is handled by `on_node_status`.
+        Emits process_error if the server did not answer within NODE_READY_TIMEOUT.
         """
-        if self.attempts >= MAX_ATTEMPTS_TO_WAIT_FOR_NODE:
+        if self._seconds_since_start() >= NODE_READY_TIMEOUT:
             self.process_error.emit(500, 'Unable to start server')
             self.timer.stop()
             self.main_window_loader.emit(False)
             return
+        if self._probe_token is not None:
+            # The probe in flight schedules the next one when it completes
+            return
+        self._probe_token = self.run_in_thread(
+            self.probe_node_status, {
+                'callback': self.on_node_status,
+                'group': 'node_ready_probe',
+            },
+        )
 
+    @staticmethod
+    def probe_node_status() -> int:
+        """
+        Requests the node info once, without retrying a refused connection.
+
+        Returns:
+            int: The HTTP status of the answer, or 0 if the server did not answer.
+        """
         try:
-            response = Request.get(NODE_INFO_ENDPOINT)
+            response = Request.get(
+                NODE_INFO_ENDPOINT, timeout=NODE_READY_PROBE_TIMEOUT, retry=False,
+            )
             response.raise_for_status()
-            self.process_started.emit()
-            self.timer.stop()
-            self.main_window_loader.emit(False)
-        except HTTPError:
-            self.process_started.emit()
-            self.timer.stop()
-        except (RequestsConnectionError, Exception):
-            self.attempts += 1
+            return response.status_code if isinstance(response.status_code, int) else 200
+        except HTTPError as exc:
+            response = exc.response
+            return getattr(response, 'status_code', None) or 500
+        except (RequestsConnectionError, Exception):  # pylint: disable=broad-exception-caught
+            return 0
+
+    def on_node_status(self, status: int):
+        """
+        Handles the result of a status check on the GUI thread.
+        Emits process_started if the server answered; otherwise the next check is
+        scheduled with a doubled delay.
+
+        Args:
+            status (int): The result of `probe_node_status`.
+        """
+        self._probe_token = None
+        if status:
+            self._on_node_ready()
+            if status < 400:
+                self.main_window_loader.emit(False)
+            return
+        self.attempts += 1
+        self.probe_delay = min(
+            self.probe_delay * 2, NODE_READY_PROBE_MAX_DELAY_MS,
+        )
+        self.timer.start(self.probe_delay)
+
+    def _cancel_probe(self):
+        """Drops the result of the status check in flight, if any."""
+        if self._probe_token is not None:
+            self._probe_token.cancel()
+            self._probe_token = None
+
+    def _seconds_since_start(self) -> float:
+        """Returns the seconds elapsed since the server was started, or 0 if unknown."""
+        if self.started_at is None:
+            return 0.0
+        return time.monotonic() - self.started_at
+
+    def _on_node_ready(self):
+        """Records the time the server took to answer and reports it as started."""
+        self.timer.stop()
+        self.time_to_ready = self._seconds_since_start()
+        logger.info(
+            'LN node ready in %.3f s after %d failed status checks',
+            self.time_to_ready, self.attempts,
+        )
+        self.started_at = None
+        StartupTracer.get_instance().end('node_start')
+        self.process_started.emit()
+
+    def on_process_output(self):
+        """
+        Slot called when the server process writes output.
+        Checks the server status right away once the node announces that it is listening.
+        """
+        output = bytes(self.process.readAllStandardOutput().data()).decode(
+            'utf-8', errors='replace',
+        )
+        for line in output.splitlines():
+            logger.debug('LN node: %s', line)
+        if self.timer.isActive() and NODE_READY_OUTPUT_MARKER in output.lower():
+            self.timer.start(0)
 
     def on_process_terminated(self):
         """
         Slot called when the server process terminates. Emits the process_terminated signal.
         """
+        NodeStateTracker.get_instance().reset()
         if self.is_stop:
             self.process_terminated.emit()
 
@@ -4,17 +4,29 @@ Local storage utility for application settings and data.
 from __future__ import annotations
 
 import os
+import threading
 
 from PySide6.QtCore import QCoreApplication
 from PySide6.QtCore import QDir
+from PySide6.QtCore import QObject
 from PySide6.QtCore import QSettings
 from PySide6.QtCore import QStandardPaths
+from PySide6.QtCore import Signal
 
 from src.flavour import __network__
 from src.utils.constant import APP_DIR
 from src.utils.constant import APP_NAME
 from src.utils.constant import ORGANIZATION_DOMAIN
 
+# Marks keys whose value has not been read from the settings file yet
+_NOT_LOADED = object()
+
+
+class LocalStoreSignals(QObject):
+    """Signals of the local store, which widgets can connect to."""
+    # Emitted with the key and its new value, or None once removed
+    value_changed = Signal(str, object)
+
 
 class LocalStore:
     """
@@ -23,6 +35,9 @@ class LocalStore:
     This class provides an interface to store and retrieve application settings
     and create network-specific directories for data storage.
 
+    Each value is read from the settings file once and then served from
+    memory; writes go to the file and to memory together, under a lock, and
+    emit `signals.value_changed` when a value changes.
     """
 
     def __init__(self, app_name, org_domain):
@@ -49,6 +64,9 @@ class LocalStore:
             os.path.join(APP_DIR, f'{app_name}-{__network__}.ini'),
         )
         self.settings = QSettings(self.config_file_path, QSettings.IniFormat)
+        self.signals = LocalStoreSignals()
+        self._values: dict = {}
+        self._values_lock = threading.Lock()
 
     def set_value(self, key, value):
         """
@@ -58,7 +76,12 @@ class LocalStore:
             key (str): The key to store the value under.
             value: The value to store.
         """
-        self.settings.setValue(key, value)
+        with self._values_lock:
+            self.settings.setValue(key, value)
+            previous = self._values.get(key, _NOT_LOADED)
+            self._values[key] = value
+        if previous is _NOT_LOADED or previous != value:
+            self.signals.value_changed.emit(key, value)
 
     def get_value(self, key, value_type=None):
         """
@@ -72,7 +95,10 @@ class LocalStore:
         Returns:
             The value associated with the key, or None if conversion fails.
         """
-        value = self.settings.value(key)
+        with self._values_lock:
+            value = self._values.get(key, _NOT_LOADED)
+            if value is _NOT_LOADED:
+                value = self._values[key] = self.settings.value(key)
         if value_type and value is not None:
             try:
                 return value_type(value)
@@ -87,11 +113,35 @@ class LocalStore:
         Args:
             key (str): The key to remove.
         """
-        self.settings.remove(key)
+        with self._values_lock:
+            self.settings.remove(key)
+            # Removing a key also removes the keys of its group
+            removed = {
+                cached_key: value for cached_key, value in self._values.items()
+                if cached_key == key or cached_key.startswith(f'{key}/')
+            }
+            for cached_key in removed:
+                del self._values[cached_key]
+            self._values[key] = None
+        for cached_key, value in removed.items():
+            if value is not None:
+                self.signals.value_changed.emit(cached_key, None)
 
     def clear_settings(self):
         """Clear all settings."""
-        self.settings.clear()
+        with self._values_lock:
+            self.settings.clear()
+            removed = [
+                key for key, value in self._values.items() if value is not None
+            ]
+            self._values.clear()
+        for key in removed:
+            self.signals.value_changed.emit(key, None)
+
+    def reload(self):
+        """Forget the values read so far, so that they are read from the settings file again."""
+        with self._values_lock:
+            self._values.clear()
 
     def all_keys(self):
         """
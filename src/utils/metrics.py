@@ -0,0 +1,294 @@
+# pylint: disable=too-many-arguments, too-few-public-methods
+"""
+An application-wide registry of node request metrics.
+
+This module provides a `MetricsRegistry` class that aggregates what `Request`
+used to only log: for each endpoint, the call and error counts, latency
+percentiles and histogram, and request and response payload sizes. It also
+records how long `ThreadManager` workers waited in the queue before running,
+which page was shown when each request was made, and statistics reported by
+other components such as the `Cache` hit and miss counters.
+
+The metrics are shown in the hidden diagnostics panel of the About page and
+exported as JSON in the log bundle made by `zip_logger_folder`.
+
+Key Features:
+- Per-endpoint call counts, errors, coalesced calls, payload sizes and p50/p95/p99 latencies
+  over the most recent `METRICS_MAX_SAMPLES` calls.
+- Latency histogram over all calls, with `METRICS_LATENCY_BUCKETS_MS` bounds.
+- Node traffic per page.
+- Thread-safe; singleton instance for application-wide use.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from src.utils.constant import METRICS_LATENCY_BUCKETS_MS
+from src.utils.constant import METRICS_MAX_SAMPLES
+from src.utils.logging import logger
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """
+    Return the nearest-rank percentile of the samples.
+
+    Args:
+        samples (list[float]): The samples, in any order.
+        fraction (float): The percentile as a fraction, e.g. 0.95.
+
+    Returns:
+        float: The percentile, or 0 when there are no samples.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+class _Timings:
+    """Recent durations of one measured operation, and a histogram of all of them."""
+
+    def __init__(self, max_samples: int):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples: deque[float] = deque(maxlen=max_samples)
+        self.buckets = [0] * (len(METRICS_LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, duration_ms: float) -> None:
+        """Record one duration."""
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.samples.append(duration_ms)
+        for index, bound in enumerate(METRICS_LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                self.buckets[index] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+
+    def summary(self) -> dict[str, Any]:
+        """Return the count, mean, maximum and percentiles in milliseconds."""
+        samples = list(self.samples)
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'max_ms': round(self.max_ms, 3),
+            'p50_ms': round(percentile(samples, 0.50), 3),
+            'p95_ms': round(percentile(samples, 0.95), 3),
+            'p99_ms': round(percentile(samples, 0.99), 3),
+        }
+
+    def histogram(self) -> dict[str, int]:
+        """Return the number of durations in each bucket, labelled by its upper bound."""
+        labels = [f'<={bound}' for bound in METRICS_LATENCY_BUCKETS_MS]
+        labels.append(f'>{METRICS_LATENCY_BUCKETS_MS[-1]}')
+        return dict(zip(labels, self.buckets))
+
+
+class _EndpointMetrics:
+    """Counters of one node endpoint."""
+
+    def __init__(self, max_samples: int):
+        self.errors = 0
+        self.coalesced = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.methods: set[str] = set()
+        self.latency = _Timings(max_samples)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the counters as JSON-serialisable values."""
+        summary = self.latency.summary()
+        return {
+            'methods': sorted(self.methods),
+            'calls': summary.pop('count'),
+            'errors': self.errors,
+            'coalesced': self.coalesced,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'latency': summary,
+            'histogram_ms': self.latency.histogram(),
+        }
+
+
+class MetricsRegistry:
+    """Aggregates request, queue and component metrics for the whole application."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, max_samples: int = METRICS_MAX_SAMPLES):
+        """
+        Initialize the MetricsRegistry object.
+
+        Args:
+            max_samples (int): Number of recent durations kept per operation for percentiles.
+        """
+        self.max_samples = max_samples
+        self.started_at = time.time()
+        self.current_page: str | None = None
+        self._endpoints: dict[str, _EndpointMetrics] = {}
+        self._queue_waits: dict[str, _Timings] = {}
+        self._pages: dict[str, dict[str, int]] = {}
+        self._sources: dict[str, Callable[[], dict[str, Any]]] = {}
+        self._metrics_lock = threading.Lock()
+
+    def record_request(
+        self,
+        method: str,
+        endpoint: str,
+        duration_s: float,
+        ok: bool = True,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ) -> None:
+        """
+        Record one request to the node.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint requested, without the base URL.
+            duration_s (float): The time taken by the request, in seconds.
+            ok (bool): Whether the request succeeded.
+            request_bytes (int): The size of the request body.
+            response_bytes (int): The size of the response body.
+        """
+        with self._metrics_lock:
+            metrics = self._endpoint_metrics(endpoint)
+            metrics.methods.add(method)
+            metrics.latency.add(duration_s * 1000)
+            metrics.request_bytes += request_bytes
+            metrics.response_bytes += response_bytes
+            if not ok:
+                metrics.errors += 1
+            page = self.current_page or 'unknown'
+            page_requests = self._pages.setdefault(page, {})
+            page_requests[endpoint] = page_requests.get(endpoint, 0) + 1
+
+    def record_coalesced(self, endpoint: str) -> None:
+        """
+        Record a call which shared the response of an identical call in flight.
+
+        Args:
+            endpoint (str): The endpoint requested, without the base URL.
+        """
+        with self._metrics_lock:
+            self._endpoint_metrics(endpoint).coalesced += 1
+
+    def _endpoint_metrics(self, endpoint: str) -> _EndpointMetrics:
+        """Return the metrics of an endpoint, creating them if needed; the lock must be held."""
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = _EndpointMetrics(
+                self.max_samples,
+            )
+        return metrics
+
+    def record_queue_wait(self, queue_name: str, wait_s: float) -> None:
+        """
+        Record how long a task waited before a worker started it.
+
+        Args:
+            queue_name (str): The name of the queue or pool.
+            wait_s (float): The wait, in seconds.
+        """
+        with self._metrics_lock:
+            timings = self._queue_waits.get(queue_name)
+            if timings is None:
+                timings = self._queue_waits[queue_name] = _Timings(
+                    self.max_samples,
+                )
+            timings.add(wait_s * 1000)
+
+    def set_current_page(self, page_name: str) -> None:
+        """Attribute the following requests to the page being shown."""
+        self.current_page = page_name
+
+    def register_source(self, name: str, source: Callable[[], dict[str, Any]]) -> None:
+        """
+        Include the statistics returned by `source` in every snapshot.
+
+        Args:
+            name (str): The section of the snapshot the statistics are shown in.
+            source (Callable[[], dict[str, Any]]): Returns the current statistics.
+        """
+        with self._metrics_lock:
+            self._sources[name] = source
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return all metrics as JSON-serialisable values."""
+        with self._metrics_lock:
+            endpoints = {
+                endpoint: metrics.to_dict()
+                for endpoint, metrics in sorted(self._endpoints.items())
+            }
+            queue_waits = {
+                name: timings.summary()
+                for name, timings in sorted(self._queue_waits.items())
+            }
+            pages = {
+                page: dict(sorted(requests.items(), key=lambda item: -item[1]))
+                for page, requests in self._pages.items()
+            }
+            sources = dict(self._sources)
+
+        components = {}
+        for name, source in sources.items():
+            try:
+                components[name] = source()
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.error(
+                    'Exception occurred while collecting %s metrics: %s, Message: %s',
+                    name, type(exc).__name__, str(exc),
+                )
+        return {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'uptime_s': round(time.time() - self.started_at, 1),
+            'endpoints': endpoints,
+            'pages': dict(
+                sorted(pages.items(), key=lambda item: -sum(item[1].values())),
+            ),
+            'queue_waits': queue_waits,
+            'components': components,
+        }
+
+    def export_json(self, path: str) -> None:
+        """
+        Write a snapshot of the metrics to a JSON file.
+
+        Args:
+            path (str): The file to write.
+        """
+        with open(path, 'w', encoding='utf-8') as metrics_file:
+            json.dump(self.snapshot(), metrics_file, indent=2, default=str)
+
+    def reset(self) -> None:
+        """Forget all recorded requests and queue waits."""
+        with self._metrics_lock:
+            self._endpoints.clear()
+            self._queue_waits.clear()
+            self._pages.clear()
+            self.started_at = time.time()
+
+    @staticmethod
+    def get_instance() -> MetricsRegistry:
+        """
+        Returns the singleton instance of MetricsRegistry in a thread-safe manner.
+
+        Returns:
+            MetricsRegistry: The singleton instance of the registry.
+        """
+        if MetricsRegistry._instance is None:
+            with MetricsRegistry._lock:
+                if MetricsRegistry._instance is None:
+                    MetricsRegistry._instance = MetricsRegistry()
+        return MetricsRegistry._instance
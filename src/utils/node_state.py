@@ -0,0 +1,198 @@
+"""
+A thread-safe tracker remembering whether the node is locked or unlocked.
+
+This module provides a `NodeStateTracker` class used by the `unlock_required`
+and `lock_required` decorators to avoid probing `/nodeinfo` before every API
+call. The state is learned from the responses of `/unlock`, `/lock` and
+`/shutdown` and from the node's "locked"/"unlocked" 403 errors, which `Request`
+reports to the tracker as they are received. The `/nodeinfo` probe itself,
+`is_node_locked`, and its cached variant `is_node_locked_cached` are shared by
+both decorators.
+
+Key Features:
+- Remembers the lock state per node URL.
+- Marks the state stale after `NODE_LOCK_STATE_MAX_AGE` seconds.
+- Singleton instance shared by all threads.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import requests  # type: ignore
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import HTTPError
+
+from src.model.enums.enums_model import NodeLockState
+from src.utils.constant import NODE_LOCK_STATE_MAX_AGE
+from src.utils.custom_exception import CommonException
+from src.utils.endpoints import LOCK_ENDPOINT
+from src.utils.endpoints import NODE_INFO_ENDPOINT
+from src.utils.endpoints import SHUTDOWN_ENDPOINT
+from src.utils.endpoints import UNLOCK_ENDPOINT
+from src.utils.error_message import ERROR_NODE_IS_LOCKED_CALL_UNLOCK
+from src.utils.error_message import ERROR_NODE_IS_UNLOCKED_CALL_LOCK
+from src.utils.logging import logger
+
+
+class NodeStateTracker:
+    """Remembers the last known lock state of the node."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, max_age: float = NODE_LOCK_STATE_MAX_AGE):
+        """
+        Initialize the NodeStateTracker object.
+
+        Args:
+            max_age (float): Seconds after which a known state is considered stale.
+        """
+        self.max_age = max_age
+        self._state_lock = threading.Lock()
+        self._state: NodeLockState = NodeLockState.UNKNOWN
+        self._node_url: str | None = None
+        self._updated_at: float = 0.0
+
+    def get_state(self, node_url: str) -> NodeLockState:
+        """
+        Return the remembered lock state for the given node.
+
+        Args:
+            node_url (str): Base URL of the node the caller is talking to.
+
+        Returns:
+            NodeLockState: UNKNOWN if nothing is known, the node changed or the state is stale.
+        """
+        with self._state_lock:
+            if self._node_url != node_url:
+                return NodeLockState.UNKNOWN
+            if (time.monotonic() - self._updated_at) > self.max_age:
+                return NodeLockState.UNKNOWN
+            return self._state
+
+    def set_state(self, node_url: str, state: NodeLockState) -> None:
+        """
+        Remember the lock state of the given node.
+
+        Args:
+            node_url (str): Base URL of the node.
+            state (NodeLockState): The new lock state.
+        """
+        with self._state_lock:
+            if self._node_url != node_url or self._state != state:
+                logger.info('Node lock state changed to %s', state.value)
+            self._node_url = node_url
+            self._state = state
+            self._updated_at = time.monotonic()
+
+    def reset(self) -> None:
+        """Forget the remembered state, forcing a probe on next use."""
+        with self._state_lock:
+            self._state = NodeLockState.UNKNOWN
+            self._node_url = None
+            self._updated_at = 0.0
+
+    def observe_response(self, node_url: str, endpoint: str, response: requests.Response) -> None:
+        """
+        Update the remembered state from a response received from the node.
+
+        Args:
+            node_url (str): Base URL of the node that sent the response.
+            endpoint (str): Endpoint that was called.
+            response (requests.Response): The response received.
+        """
+        status_code = getattr(response, 'status_code', None)
+        if not isinstance(status_code, int):
+            return
+        if 200 <= status_code < 300:
+            if endpoint == UNLOCK_ENDPOINT:
+                self.set_state(node_url, NodeLockState.UNLOCKED)
+            elif endpoint == LOCK_ENDPOINT:
+                self.set_state(node_url, NodeLockState.LOCKED)
+            elif endpoint == SHUTDOWN_ENDPOINT:
+                self.reset()
+            return
+        if status_code == 403:
+            error = self._error_message(response)
+            if error == ERROR_NODE_IS_LOCKED_CALL_UNLOCK:
+                self.set_state(node_url, NodeLockState.LOCKED)
+            elif error == ERROR_NODE_IS_UNLOCKED_CALL_LOCK:
+                self.set_state(node_url, NodeLockState.UNLOCKED)
+
+    @staticmethod
+    def _error_message(response: requests.Response) -> str | None:
+        """Return the error message of a node error response, if any."""
+        try:
+            error_data = response.json()
+        except ValueError:
+            return None
+        if not isinstance(error_data, dict):
+            return None
+        return error_data.get('error')
+
+    @staticmethod
+    def get_instance() -> NodeStateTracker:
+        """
+        Returns the singleton instance of NodeStateTracker in a thread-safe manner.
+
+        Returns:
+            NodeStateTracker: The singleton instance of the tracker.
+        """
+        if NodeStateTracker._instance is None:
+            with NodeStateTracker._lock:
+                if NodeStateTracker._instance is None:
+                    NodeStateTracker._instance = NodeStateTracker()
+        return NodeStateTracker._instance
+
+
+def is_node_locked() -> bool:
+    """Check if the node is locked by sending a request to the node info endpoint."""
+    # Request reports every response to the tracker, so it imports this module
+    from src.utils.request import Request  # pylint: disable=import-outside-toplevel
+    node_url = Request.load_base_url()
+    tracker = NodeStateTracker.get_instance()
+    try:
+        response = Request.get(NODE_INFO_ENDPOINT, retry=False)
+        response.raise_for_status()
+        tracker.set_state(node_url, NodeLockState.UNLOCKED)
+        return False
+    except HTTPError as error:
+        if error.response.status_code == 403:
+            try:
+                error_data = error.response.json()
+                if error_data.get('error') == ERROR_NODE_IS_LOCKED_CALL_UNLOCK and error_data.get('code') == 403:
+                    tracker.set_state(node_url, NodeLockState.LOCKED)
+                    return True
+            except ValueError:
+                pass
+        else:
+            error_data = error.response.json()
+            error_message = error_data.get('error', 'Unhandled error')
+            logger.error(error_message)
+            raise CommonException(error_message) from error
+    except RequestsConnectionError as exc:
+        logger.error(
+            'Exception occurred at is_node_locked: %s, Message: %s',
+            type(exc).__name__, str(exc),
+        )
+        raise CommonException('Unable to connect to node') from exc
+    except Exception as exc:
+        logger.error(
+            'Exception occurred at is_node_locked: %s, Message: %s',
+            type(exc).__name__, str(exc),
+        )
+        raise CommonException(
+            'is_node_locked: Error while checking if node is locked',
+        ) from exc
+
+    return False
+
+
+def is_node_locked_cached() -> bool:
+    """Return the remembered lock state, probing the node only when it is unknown or stale."""
+    from src.utils.request import Request  # pylint: disable=import-outside-toplevel
+    state = NodeStateTracker.get_instance().get_state(Request.load_base_url())
+    if state == NodeLockState.UNKNOWN:
+        return is_node_locked()
+    return state == NodeLockState.LOCKED
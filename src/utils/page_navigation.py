@@ -4,89 +4,130 @@ logic for the application's pages.
 """
 from __future__ import annotations
 
+import importlib
+from collections import OrderedDict
+from collections.abc import Iterator
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QWidget
+
 from src.model.rgb_model import RgbAssetPageLoadModel
 from src.model.selection_page_model import SelectionPageModel
 from src.model.success_model import SuccessPageModel
 from src.model.transaction_detail_page_model import TransactionDetailPageModel
+from src.utils.constant import PAGE_CACHE_MAX_SIZE
+from src.utils.constant import PAGE_WARM_UP_INTERVAL_MS
+from src.utils.constant import PAGE_WARM_UP_START_DELAY_MS
 from src.utils.logging import logger
+from src.utils.metrics import MetricsRegistry
 from src.utils.page_navigation_events import PageNavigationEventManager
+from src.utils.page_scope import PageScope
+from src.utils.startup_trace import StartupTracer
 from src.views.components.error_report_dialog_box import ErrorReportDialog
 from src.views.main_window import MainWindow
-from src.views.ui_about import AboutWidget
-from src.views.ui_backup import Backup
-from src.views.ui_bitcoin import BtcWidget
-from src.views.ui_bitcoin_transaction import BitcoinTransactionDetail
-from src.views.ui_channel_management import ChannelManagement
-from src.views.ui_collectible_asset import CollectiblesAssetWidget
-from src.views.ui_create_channel import CreateChannelWidget
-from src.views.ui_create_ln_invoice import CreateLnInvoiceWidget
-from src.views.ui_enter_wallet_password import EnterWalletPassword
-from src.views.ui_faucets import FaucetsWidget
-from src.views.ui_fungible_asset import FungibleAssetWidget
-from src.views.ui_help import HelpWidget
-from src.views.ui_issue_rgb20 import IssueRGB20Widget
-from src.views.ui_issue_rgb25 import IssueRGB25Widget
-from src.views.ui_ln_endpoint import LnEndpointWidget
-from src.views.ui_network_selection_page import NetworkSelectionWidget
-from src.views.ui_receive_bitcoin import ReceiveBitcoinWidget
-from src.views.ui_receive_rgb_asset import ReceiveRGBAssetWidget
-from src.views.ui_rgb_asset_detail import RGBAssetDetailWidget
-from src.views.ui_rgb_asset_transaction_detail import RGBAssetTransactionDetail
-from src.views.ui_send_bitcoin import SendBitcoinWidget
-from src.views.ui_send_ln_invoice import SendLnInvoiceWidget
-from src.views.ui_send_rgb_asset import SendRGBAssetWidget
-from src.views.ui_set_wallet_password import SetWalletPasswordWidget
-from src.views.ui_settings import SettingsWidget
-from src.views.ui_splash_screen import SplashScreenWidget
-from src.views.ui_success import SuccessWidget
-from src.views.ui_swap import SwapWidget
-from src.views.ui_term_condition import TermConditionWidget
-from src.views.ui_view_unspent_list import ViewUnspentList
-from src.views.ui_wallet_or_transfer_selection import WalletOrTransferSelectionWidget
-from src.views.ui_welcome import WelcomeWidget
+
+
+# Pages built from the view model alone, which are kept and refreshed instead of rebuilt
+CACHEABLE_PAGES = frozenset({
+    'FungibleAssetWidget',
+    'CollectiblesAssetWidget',
+    'Bitcoin',
+    'ChannelManagement',
+    'ViewUnspentList',
+    'AboutWidget',
+    'FaucetsWidget',
+    'HelpWidget',
+})
+
+# Pages that start a new wallet session, which drop the cached pages
+SESSION_BOUNDARY_PAGES = frozenset({
+    'Welcome',
+    'LnEndpoint',
+    'SetWalletPassword',
+    'EnterWalletPassword',
+    'SplashScreenWidget',
+})
+
+
+class LazyPage:
+    """
+    Factory of a page widget which imports the module of the page on first use.
+
+    Page modules pull in most of the application (view models, services, image
+    libraries), so they are imported when a page is first shown or warmed up
+    instead of when the navigation is created.
+
+    Attributes:
+        module_name (str): The dotted name of the module defining the page.
+        class_name (str): The name of the page widget class in that module.
+    """
+
+    def __init__(self, module_name: str, class_name: str):
+        self.module_name = module_name
+        self.class_name = class_name
+        self._page_class: type[QWidget] | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the module of the page has been imported."""
+        return self._page_class is not None
+
+    def load(self) -> type[QWidget]:
+        """Import the module of the page, if needed, and return the page widget class."""
+        if self._page_class is None:
+            module = importlib.import_module(self.module_name)
+            self._page_class = getattr(module, self.class_name)
+        return self._page_class
+
+    def __call__(self, *args, **kwargs) -> QWidget:
+        """Create the page widget with the given arguments."""
+        return self.load()(*args, **kwargs)
 
 
 class PageNavigation:
     """This class represents app navigation."""
 
-    def __init__(self, _ui):
+    def __init__(self, _ui, max_cached_pages: int = PAGE_CACHE_MAX_SIZE):
         self._ui: MainWindow = _ui
         self.current_stack = {}
+        self.max_cached_pages = max_cached_pages
+        self.page_cache: OrderedDict[str, QWidget] = OrderedDict()
+        self.warm_up_queue: Iterator[LazyPage] | None = None
         self.event_based_navigation = PageNavigationEventManager.get_instance()
         self.pages = {
-            'Welcome': WelcomeWidget,
-            'LnEndpoint': LnEndpointWidget,
-            'WalletOrTransferSelectionWidget': WalletOrTransferSelectionWidget,
-            'WalletConnectionTypePage': WalletOrTransferSelectionWidget,
-            'TermCondition': TermConditionWidget,
-            'FungibleAssetWidget': FungibleAssetWidget,
-            'CollectiblesAssetWidget': CollectiblesAssetWidget,
-            'SetWalletPassword': SetWalletPasswordWidget,
-            'IssueRGB20': IssueRGB20Widget,
-            'Bitcoin': BtcWidget,
-            'IssueRGB25': IssueRGB25Widget,
-            'SendRGB25': SendRGBAssetWidget,
-            'ReceiveRGB25': ReceiveRGBAssetWidget,
-            'RGB25Detail': RGBAssetDetailWidget,
-            'SendBitcoin': SendBitcoinWidget,
-            'ReceiveBitcoin': ReceiveBitcoinWidget,
-            'ChannelManagement': ChannelManagement,
-            'CreateChannel': CreateChannelWidget,
-            'ViewUnspentList': ViewUnspentList,
-            'EnterWalletPassword': EnterWalletPassword,
-            'RGB25TransactionDetail': RGBAssetTransactionDetail,
-            'BitcoinTransactionDetail': BitcoinTransactionDetail,
-            'Backup': Backup,
-            'Swap': SwapWidget,
-            'SuccessWidget': SuccessWidget,
-            'Settings': SettingsWidget,
-            'CreateLnInvoiceWidget': CreateLnInvoiceWidget,
-            'SendLnInvoiceWidget': SendLnInvoiceWidget,
-            'SplashScreenWidget': SplashScreenWidget,
-            'AboutWidget': AboutWidget,
-            'FaucetsWidget': FaucetsWidget,
-            'HelpWidget': HelpWidget,
-            'NetworkSelectionWidget': NetworkSelectionWidget,
+            'Welcome': LazyPage('src.views.ui_welcome', 'WelcomeWidget'),
+            'LnEndpoint': LazyPage('src.views.ui_ln_endpoint', 'LnEndpointWidget'),
+            'WalletOrTransferSelectionWidget': LazyPage('src.views.ui_wallet_or_transfer_selection', 'WalletOrTransferSelectionWidget'),
+            'WalletConnectionTypePage': LazyPage('src.views.ui_wallet_or_transfer_selection', 'WalletOrTransferSelectionWidget'),
+            'TermCondition': LazyPage('src.views.ui_term_condition', 'TermConditionWidget'),
+            'FungibleAssetWidget': LazyPage('src.views.ui_fungible_asset', 'FungibleAssetWidget'),
+            'CollectiblesAssetWidget': LazyPage('src.views.ui_collectible_asset', 'CollectiblesAssetWidget'),
+            'SetWalletPassword': LazyPage('src.views.ui_set_wallet_password', 'SetWalletPasswordWidget'),
+            'IssueRGB20': LazyPage('src.views.ui_issue_rgb20', 'IssueRGB20Widget'),
+            'Bitcoin': LazyPage('src.views.ui_bitcoin', 'BtcWidget'),
+            'IssueRGB25': LazyPage('src.views.ui_issue_rgb25', 'IssueRGB25Widget'),
+            'SendRGB25': LazyPage('src.views.ui_send_rgb_asset', 'SendRGBAssetWidget'),
+            'ReceiveRGB25': LazyPage('src.views.ui_receive_rgb_asset', 'ReceiveRGBAssetWidget'),
+            'RGB25Detail': LazyPage('src.views.ui_rgb_asset_detail', 'RGBAssetDetailWidget'),
+            'SendBitcoin': LazyPage('src.views.ui_send_bitcoin', 'SendBitcoinWidget'),
+            'ReceiveBitcoin': LazyPage('src.views.ui_receive_bitcoin', 'ReceiveBitcoinWidget'),
+            'ChannelManagement': LazyPage('src.views.ui_channel_management', 'ChannelManagement'),
+            'CreateChannel': LazyPage('src.views.ui_create_channel', 'CreateChannelWidget'),
+            'ViewUnspentList': LazyPage('src.views.ui_view_unspent_list', 'ViewUnspentList'),
+            'EnterWalletPassword': LazyPage('src.views.ui_enter_wallet_password', 'EnterWalletPassword'),
+            'RGB25TransactionDetail': LazyPage('src.views.ui_rgb_asset_transaction_detail', 'RGBAssetTransactionDetail'),
+            'BitcoinTransactionDetail': LazyPage('src.views.ui_bitcoin_transaction', 'BitcoinTransactionDetail'),
+            'Backup': LazyPage('src.views.ui_backup', 'Backup'),
+            'Swap': LazyPage('src.views.ui_swap', 'SwapWidget'),
+            'SuccessWidget': LazyPage('src.views.ui_success', 'SuccessWidget'),
+            'Settings': LazyPage('src.views.ui_settings', 'SettingsWidget'),
+            'CreateLnInvoiceWidget': LazyPage('src.views.ui_create_ln_invoice', 'CreateLnInvoiceWidget'),
+            'SendLnInvoiceWidget': LazyPage('src.views.ui_send_ln_invoice', 'SendLnInvoiceWidget'),
+            'SplashScreenWidget': LazyPage('src.views.ui_splash_screen', 'SplashScreenWidget'),
+            'AboutWidget': LazyPage('src.views.ui_about', 'AboutWidget'),
+            'FaucetsWidget': LazyPage('src.views.ui_faucets', 'FaucetsWidget'),
+            'HelpWidget': LazyPage('src.views.ui_help', 'HelpWidget'),
+            'NetworkSelectionWidget': LazyPage('src.views.ui_network_selection_page', 'NetworkSelectionWidget'),
         }
 
         self.event_based_navigation.navigate_to_page_signal.connect(
@@ -202,26 +243,138 @@ class PageNavigation:
     def show_current_page(self):
         """This method toggles the display of the current page."""
         if self.current_stack:
-            page_name = self.current_stack['name']
-            if page_name not in self._ui.stacked_widget.children():
+            if self._ui.stacked_widget.indexOf(self.current_stack['widget']) == -1:
                 self._ui.stacked_widget.addWidget(self.current_stack['widget'])
             self._ui.stacked_widget.setCurrentWidget(
                 self.current_stack['widget'],
             )
+            StartupTracer.get_instance().watch_first_paint(
+                self.current_stack['widget'], self.current_stack['name'],
+            )
         else:
             logger.info('No current stack set.')
 
     def navigate_and_toggle(self, show_sidebar):
         """This method toggles the display of the current page and sidebar."""
+        if self.current_stack.get('name') in SESSION_BOUNDARY_PAGES:
+            self.clear_page_cache()
         self.show_current_page()
         self.toggle_sidebar(show_sidebar)
 
+    def get_page_widget(self, page_name: str) -> QWidget:
+        """
+        Return the widget of a page built from the view model alone.
+
+        Cacheable pages are reused while they stay in the cache and asked to reload
+        their data through their `refresh_page` method; the least recently shown
+        page is dropped once more than `max_cached_pages` are kept.
+
+        Args:
+            page_name (str): The name of the page in `self.pages`.
+
+        Returns:
+            QWidget: The cached or newly created page widget.
+        """
+        self.enter_page(page_name)
+        if page_name not in CACHEABLE_PAGES:
+            return self.pages[page_name](self._ui.view_model)
+
+        widget = self.page_cache.get(page_name)
+        if widget is not None:
+            self.page_cache.move_to_end(page_name)
+            refresh_page = getattr(widget, 'refresh_page', None)
+            if callable(refresh_page):
+                refresh_page()
+            return widget
+
+        widget = self.pages[page_name](self._ui.view_model)
+        self.page_cache[page_name] = widget
+        while len(self.page_cache) > self.max_cached_pages:
+            _, evicted_widget = self.page_cache.popitem(last=False)
+            self.discard_page_widget(evicted_widget)
+        return widget
+
+    def enter_page(self, page_name: str) -> None:
+        """
+        Start showing a page, before its widget is built or refreshed.
+
+        The page-scoped tasks of the previous page are cancelled, and the node
+        requests made from now on are attributed to the new page in the metrics.
+
+        Args:
+            page_name (str): The name of the page in `self.pages`.
+        """
+        PageScope.get_instance().enter(page_name)
+        MetricsRegistry.get_instance().set_current_page(page_name)
+
+    def build_page(self, page_name: str, *args) -> QWidget:
+        """
+        Build the widget of a page which needs arguments besides the view model.
+
+        Args:
+            page_name (str): The name of the page in `self.pages`.
+            *args: The arguments of the page widget.
+
+        Returns:
+            QWidget: The new page widget.
+        """
+        self.enter_page(page_name)
+        return self.pages[page_name](*args)
+
+    def discard_page_widget(self, widget: QWidget) -> None:
+        """Remove a page widget from the stacked widget and schedule its deletion."""
+        if widget is self.current_stack.get('widget'):
+            return
+        self._ui.stacked_widget.removeWidget(widget)
+        widget.deleteLater()
+
+    def clear_page_cache(self) -> None:
+        """Drop every cached page, e.g. when a new wallet session starts."""
+        while self.page_cache:
+            _, widget = self.page_cache.popitem(last=False)
+            self.discard_page_widget(widget)
+
+    def warm_up_pages(self, start_delay_ms: int = PAGE_WARM_UP_START_DELAY_MS) -> None:
+        """
+        Import the modules of the pages not shown yet, one per event loop turn.
+
+        The imports run on the GUI thread in short steps spaced by
+        `PAGE_WARM_UP_INTERVAL_MS`, so the first visit of each page does not
+        wait for its module while the window stays responsive.
+
+        Args:
+            start_delay_ms (int): Delay before the first import, leaving time for the first page to paint.
+        """
+        self.warm_up_queue = iter([
+            page for page in dict.fromkeys(self.pages.values())
+            if isinstance(page, LazyPage) and not page.is_loaded
+        ])
+        QTimer.singleShot(start_delay_ms, self.warm_up_next_page)
+
+    def warm_up_next_page(self) -> None:
+        """Import the module of the next page waiting to be warmed up."""
+        if self.warm_up_queue is None:
+            return
+        page = next(self.warm_up_queue, None)
+        if page is None:
+            self.warm_up_queue = None
+            logger.info('Page modules warmed up')
+            return
+        try:
+            page.load()
+        except ImportError as exc:
+            logger.error(
+                'Exception occurred while warming up page %s: %s, Message: %s',
+                page.class_name, type(exc).__name__, str(exc),
+            )
+        QTimer.singleShot(PAGE_WARM_UP_INTERVAL_MS, self.warm_up_next_page)
+
     def navigate_to_page(self, page_name, show_sidebar=False):
         """This method displays the specified page."""
         if page_name in self.pages:
             self.current_stack = {
                 'name': page_name,
-                'widget': self.pages[page_name](self._ui.view_model),
+                'widget': self.get_page_widget(page_name),
             }
             self.navigate_and_toggle(show_sidebar)
         else:
@@ -231,7 +384,7 @@ class PageNavigation:
         """This method display enter lightning node endpoint page."""
         self.current_stack = {
             'name': 'LnEndpoint',
-            'widget': self.pages['LnEndpoint'](self._ui.view_model, originating_page),
+            'widget': self.build_page('LnEndpoint', self._ui.view_model, originating_page),
         }
         self.navigate_and_toggle(False)
 
@@ -243,7 +396,7 @@ class PageNavigation:
         """This method display the wallet method page."""
         self.current_stack = {
             'name': 'WalletOrTransferSelectionWidget',
-            'widget': self.pages['WalletOrTransferSelectionWidget'](self._ui.view_model, params),
+            'widget': self.build_page('WalletOrTransferSelectionWidget', self._ui.view_model, params),
         }
         self.navigate_and_toggle(False)
 
@@ -251,7 +404,7 @@ class PageNavigation:
         """This method display the wallet network selection page."""
         self.current_stack = {
             'name': 'NetworkSelectionWidget',
-            'widget': self.pages['NetworkSelectionWidget'](self._ui.view_model, originating_page, network),
+            'widget': self.build_page('NetworkSelectionWidget', self._ui.view_model, originating_page, network),
         }
         self.navigate_and_toggle(False)
 
@@ -259,7 +412,7 @@ class PageNavigation:
         """This method display the wallet connection page."""
         self.current_stack = {
             'name': 'WalletConnectionTypePage',
-            'widget': self.pages['WalletConnectionTypePage'](self._ui.view_model, params),
+            'widget': self.build_page('WalletConnectionTypePage', self._ui.view_model, params),
         }
         self.navigate_and_toggle(False)
 
@@ -283,7 +436,7 @@ class PageNavigation:
         """This method display the set wallet password page."""
         self.current_stack = {
             'name': 'SetWalletPassword',
-            'widget': self.pages['SetWalletPassword'](self._ui.view_model, params),
+            'widget': self.build_page('SetWalletPassword', self._ui.view_model, params),
         }
         self.navigate_and_toggle(False)
 
@@ -311,7 +464,7 @@ class PageNavigation:
         """This method display the receive rgb25 asset page."""
         self.current_stack = {
             'name': 'ReceiveRGB25',
-            'widget': self.pages['ReceiveRGB25'](self._ui.view_model, params),
+            'widget': self.build_page('ReceiveRGB25', self._ui.view_model, params),
         }
         self.navigate_and_toggle(False)
 
@@ -319,7 +472,7 @@ class PageNavigation:
         """This method display the rgb25 detail page."""
         self.current_stack = {
             'name': 'RGB25Detail',
-            'widget': self.pages['RGB25Detail'](self._ui.view_model, params),
+            'widget': self.build_page('RGB25Detail', self._ui.view_model, params),
         }
         self.navigate_and_toggle(False)
 
@@ -347,7 +500,7 @@ class PageNavigation:
         """This method display the rgb25 transaction detail page."""
         self.current_stack = {
             'name': 'RGB25TransactionDetail',
-            'widget': self.pages['RGB25TransactionDetail'](self._ui.view_model, params),
+            'widget': self.build_page('RGB25TransactionDetail', self._ui.view_model, params),
         }
         self.navigate_and_toggle(False)
 
@@ -355,7 +508,7 @@ class PageNavigation:
         """This method display the bitcoin transaction detail page."""
         self.current_stack = {
             'name': 'BitcoinTransactionDetail',
-            'widget': self.pages['BitcoinTransactionDetail'](self._ui.view_model, params),
+            'widget': self.build_page('BitcoinTransactionDetail', self._ui.view_model, params),
         }
         self.navigate_and_toggle(False)
 
@@ -375,7 +528,7 @@ class PageNavigation:
         """This method display the create ln invoice page"""
         self.current_stack = {
             'name': 'CreateLnInvoiceWidget',
-            'widget': self.pages['CreateLnInvoiceWidget'](self._ui.view_model, params, asset_name, asset_type),
+            'widget': self.build_page('CreateLnInvoiceWidget', self._ui.view_model, params, asset_name, asset_type),
         }
         self.navigate_and_toggle(False)
 
@@ -383,7 +536,7 @@ class PageNavigation:
         """This method display the send ln invoice page"""
         self.current_stack = {
             'name': 'SendLnInvoiceWidget',
-            'widget': self.pages['SendLnInvoiceWidget'](self._ui.view_model, asset_type),
+            'widget': self.build_page('SendLnInvoiceWidget', self._ui.view_model, asset_type),
         }
         self.navigate_and_toggle(False)
 
@@ -391,7 +544,7 @@ class PageNavigation:
         """This method display the success page."""
         self.current_stack = {
             'name': 'SuccessWidget',
-            'widget': self.pages['SuccessWidget'](params),
+            'widget': self.build_page('SuccessWidget', params),
         }
         self.navigate_and_toggle(False)
 
@@ -0,0 +1,82 @@
+"""
+Ties the background reads of a page to the time it is shown.
+
+This module provides a `PageScope` class handing out cancellation tokens to
+the tasks a page starts to load its data. When the navigation shows another
+page, the tokens of the previous page are cancelled:
+
+- tasks still queued in the `TaskScheduler` are dropped,
+- workers of tasks already running drop their results and errors, so view
+  models do not re-render a page that is no longer shown,
+- node requests not yet sent by those tasks are aborted, see `Request`.
+
+Cached pages reload their data when they are shown again, so nothing is lost.
+Only tasks started with the `page_scoped` option of `ThreadManager` are tied to
+the page; calls that change the wallet always run to completion.
+
+Key Features:
+- One scope per shown page; entering a page cancels the previous scope.
+- Tokens are held weakly, so completed tasks are forgotten.
+- Thread-safe; singleton instance for application-wide use.
+"""
+from __future__ import annotations
+
+import threading
+import weakref
+
+from src.utils.logging import logger
+from src.utils.task_scheduler import CancellationToken
+
+
+class PageScope:
+    """Cancellation tokens of the tasks started for the page being shown."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        """Initialize the PageScope object."""
+        self.page_name: str | None = None
+        self.cancelled_tasks = 0
+        self._tokens: weakref.WeakSet[CancellationToken] = weakref.WeakSet()
+        self._tokens_lock = threading.Lock()
+
+    def token(self) -> CancellationToken:
+        """Return a new token, cancelled when another page is shown."""
+        token = CancellationToken()
+        with self._tokens_lock:
+            self._tokens.add(token)
+        return token
+
+    def enter(self, page_name: str) -> None:
+        """
+        Start the scope of a page, cancelling the tasks of the previous one.
+
+        Args:
+            page_name (str): The name of the page being shown.
+        """
+        with self._tokens_lock:
+            tokens = [token for token in self._tokens if not token.is_cancelled]
+            self._tokens = weakref.WeakSet()
+            previous_page, self.page_name = self.page_name, page_name
+            self.cancelled_tasks += len(tokens)
+        for token in tokens:
+            token.cancel()
+        if tokens:
+            logger.info(
+                'Cancelled %d tasks of page %s', len(tokens), previous_page,
+            )
+
+    @staticmethod
+    def get_instance() -> PageScope:
+        """
+        Returns the singleton instance of PageScope in a thread-safe manner.
+
+        Returns:
+            PageScope: The singleton instance.
+        """
+        if PageScope._instance is None:
+            with PageScope._lock:
+                if PageScope._instance is None:
+                    PageScope._instance = PageScope()
+        return PageScope._instance
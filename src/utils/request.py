@@ -1,6 +1,7 @@
 """Request class for making HTTP requests with common methods like GET, POST, PUT, and DELETE."""
 from __future__ import annotations
 
+import time
 from typing import Any
 
 import requests  # type: ignore
@@ -8,21 +9,39 @@ import requests  # type: ignore
 from src.utils.constant import BACKED_URL_LIGHTNING_NETWORK
 from src.utils.constant import LIGHTNING_URL_KEY
 from src.utils.constant import REQUEST_TIMEOUT
+from src.utils.custom_exception import RequestCancelledError
+from src.utils.endpoints import COALESCED_ENDPOINTS
+from src.utils.gui_thread_watchdog import GuiThreadWatchdog
+from src.utils.http_session import SessionPool
 from src.utils.local_store import local_store
 from src.utils.logging import logger
+from src.utils.metrics import MetricsRegistry
+from src.utils.node_state import NodeStateTracker
+from src.utils.single_flight import SingleFlight
+from src.utils.task_scheduler import current_token
 
 
 class Request:
     """
     This class provides utility methods to handle HTTP requests to a base URL, which is loaded from
     local storage or uses a default backup URL. It also handles merging custom headers with default
-    headers, and logs the response time for each request.
+    headers, and logs the response time for each request. Requests are sent through pooled
+    keep-alive sessions so that consecutive calls to the node reuse open connections.
 
     Key Features:
         - Load base URL from local storage or fallback to a default Lightning Network URL.
         - Merge additional headers with default 'Content-Type: application/json' header.
-        - Send GET, POST, PUT, and DELETE requests.
+        - Send GET, POST, PUT, and DELETE requests over pooled keep-alive sessions.
         - Log the time taken for each request along with the endpoint being accessed.
+        - Report every response to the node state tracker so the lock state stays current.
+        - Record the latency, outcome and payload sizes of every request in the metrics registry.
+        - Share one request between concurrent identical calls to read-only endpoints.
+        - Skip the requests of tasks cancelled by the navigation.
+
+    Failed connections are retried with backoff by the session pool: when the node refuses
+    the connection, the error is raised after about 1.8 seconds instead of at once, and an
+    unreachable host can take up to four connect timeouts. Probes that must fail fast, such
+    as liveness and lock-state checks, pass `retry=False` to `get()`.
 
     Methods:
         - load_base_url(): Load the base URL for network requests.
@@ -47,6 +66,72 @@ class Request:
             headers.update(extra_headers)
         return headers
 
+    @staticmethod
+    def _payload_size(payload: Any) -> int:
+        """Return the size of a request or response body, or 0 if it is not in memory."""
+        return len(payload) if isinstance(payload, (bytes, str)) else 0
+
+    @staticmethod
+    def _send(method: str, url: str, endpoint: str, retry: bool = True, **kwargs: Any) -> requests.Response:
+        """
+        Send a request, or wait for an identical one in flight if the endpoint only reads.
+
+        Calls to `COALESCED_ENDPOINTS` made while the same call (method, URL and
+        payload) is in flight share its response instead of sending their own.
+
+        Raises:
+            RequestCancelledError: The task making the request has been cancelled.
+        """
+        token = current_token()
+        if token is not None and token.is_cancelled:
+            logger.info(
+                '%s request to %s skipped: its task was cancelled', method, url,
+            )
+            raise RequestCancelledError(f'{method} {endpoint} cancelled')
+
+        GuiThreadWatchdog.get_instance().check_blocking_call('request', endpoint)
+
+        if endpoint not in COALESCED_ENDPOINTS or 'files' in kwargs or not retry:
+            return Request._send_request(method, url, endpoint, retry, **kwargs)
+
+        single_flight = SingleFlight.get_instance()
+        response, shared = single_flight.do(
+            single_flight.make_key(method, url, **kwargs),
+            lambda: Request._send_request(
+                method, url, endpoint, retry, **kwargs,
+            ),
+        )
+        if shared:
+            logger.info(
+                '%s request to %s shared an identical request in flight', method, url,
+            )
+            MetricsRegistry.get_instance().record_coalesced(endpoint)
+        return response
+
+    @staticmethod
+    def _send_request(method: str, url: str, endpoint: str, retry: bool = True, **kwargs: Any) -> requests.Response:
+        """Send a request using a session borrowed from the shared session pool, and record its metrics."""
+        started = time.perf_counter()
+        response: requests.Response | None = None
+        try:
+            with SessionPool.get_instance().session(retry) as session:
+                response = session.request(method, url, **kwargs)
+            return response
+        finally:
+            prepared = getattr(response, 'request', None)
+            MetricsRegistry.get_instance().record_request(
+                method,
+                endpoint,
+                time.perf_counter() - started,
+                ok=response is not None and bool(response.ok),
+                request_bytes=Request._payload_size(
+                    getattr(prepared, 'body', None),
+                ),
+                response_bytes=Request._payload_size(
+                    getattr(response, 'content', None),
+                ),
+            )
+
     @staticmethod
     def get(
         endpoint: str,
@@ -54,17 +139,22 @@ class Request:
         headers: dict[str, str] | None = None,
         params: dict[str, Any] | None = None,
         timeout: float | tuple[float, float] | None = None,
+        retry: bool = True,
     ) -> requests.Response:
-        """Send a GET request to the specified endpoint."""
+        """Send a GET request to the specified endpoint; with `retry` False, failed connections are not retried."""
         headers = Request._merge_headers(headers)
         params = params if params is not None else {}
-        url = f'{Request.load_base_url()}{endpoint}'
+        base_url = Request.load_base_url()
+        url = f'{base_url}{endpoint}'
 
         # Log request initiation
         logger.info('Starting GET request to %s', url)
 
-        response = requests.get(
+        response = Request._send(
+            'GET',
             url,
+            endpoint,
+            retry=retry,
             headers=headers,
             params=params,
             timeout=timeout,
@@ -76,6 +166,9 @@ class Request:
             'GET request to %s took %.3f seconds',
             response.url, response.elapsed.total_seconds(),
         )
+        NodeStateTracker.get_instance().observe_response(
+            base_url, endpoint, response,
+        )
 
         return response
 
@@ -91,16 +184,21 @@ class Request:
         """Send a POST request to the specified endpoint with a JSON body."""
         headers = Request._merge_headers(headers)
         params = params if params is not None else {}
-        url = f'{Request.load_base_url()}{endpoint}'
+        base_url = Request.load_base_url()
+        url = f'{base_url}{endpoint}'
 
         # Log request initiation
         logger.info('Starting POST request to %s', url)
 
         if files is not None:
-            response = requests.post(url, files=files, timeout=REQUEST_TIMEOUT)
+            response = Request._send(
+                'POST', url, endpoint, files=files, timeout=REQUEST_TIMEOUT,
+            )
         else:
-            response = requests.post(
+            response = Request._send(
+                'POST',
                 url,
+                endpoint,
                 json=body,
                 headers=headers,
                 params=params,
@@ -112,6 +210,9 @@ class Request:
             'POST request to %s took %.3f seconds',
             response.url, response.elapsed.total_seconds(),
         )
+        NodeStateTracker.get_instance().observe_response(
+            base_url, endpoint, response,
+        )
 
         return response
 
@@ -126,13 +227,16 @@ class Request:
         """Send a PUT request to the specified endpoint with a JSON body."""
         headers = Request._merge_headers(headers)
         params = params if params is not None else {}
-        url = f'{Request.load_base_url()}{endpoint}'
+        base_url = Request.load_base_url()
+        url = f'{base_url}{endpoint}'
 
         # Log request initiation
         logger.info('Starting PUT request to %s', url)
 
-        response = requests.put(
+        response = Request._send(
+            'PUT',
             url,
+            endpoint,
             json=body,
             headers=headers,
             params=params,
@@ -144,6 +248,9 @@ class Request:
             'PUT request to %s took %.3f seconds',
             response.url, response.elapsed.total_seconds(),
         )
+        NodeStateTracker.get_instance().observe_response(
+            base_url, endpoint, response,
+        )
 
         return response
 
@@ -157,13 +264,16 @@ class Request:
         """Send a DELETE request to the specified endpoint."""
         headers = Request._merge_headers(headers)
         params = params if params is not None else {}
-        url = f'{Request.load_base_url()}{endpoint}'
+        base_url = Request.load_base_url()
+        url = f'{base_url}{endpoint}'
 
         # Log request initiation
         logger.info('Starting DELETE request to %s', url)
 
-        response = requests.delete(
+        response = Request._send(
+            'DELETE',
             url,
+            endpoint,
             headers=headers,
             params=params,
             timeout=timeout,
@@ -174,5 +284,8 @@ class Request:
             'DELETE request to %s took %.3f seconds',
             response.url, response.elapsed.total_seconds(),
         )
+        NodeStateTracker.get_instance().observe_response(
+            base_url, endpoint, response,
+        )
 
         return response
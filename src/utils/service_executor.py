@@ -0,0 +1,118 @@
+"""
+A bounded thread pool used by services to issue independent node calls concurrently.
+
+This module provides a `ServiceExecutor` class. Services already run on a
+`QThreadPool` worker; when a service needs several node calls whose inputs do not
+depend on each other, it hands them to the executor so that the page waits for
+the slowest call instead of the sum of all of them.
+
+Key Features:
+- Bounded number of worker threads shared by all services.
+- Every call is awaited before returning, so no request outlives its service.
+- Failures are re-raised in the order the calls were declared, so the service's
+  error handling sees the same exception it would have seen sequentially.
+- Calls run with the cancellation token of the calling task, so that their
+  requests are skipped too once the task is cancelled.
+- Singleton instance for application-wide use.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Any
+
+from src.utils.constant import SERVICE_EXECUTOR_MAX_WORKERS
+from src.utils.logging import logger
+from src.utils.task_scheduler import bind_token
+from src.utils.task_scheduler import current_token
+
+THREAD_NAME_PREFIX = 'service-executor'
+
+
+class ServiceExecutor:
+    """Runs independent service calls on a shared bounded thread pool."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, max_workers: int = SERVICE_EXECUTOR_MAX_WORKERS):
+        """
+        Initialize the ServiceExecutor object.
+
+        Args:
+            max_workers (int): Maximum number of calls running at the same time.
+        """
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=THREAD_NAME_PREFIX,
+        )
+
+    def run_parallel(self, calls: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+        """
+        Run the given calls concurrently and wait for all of them.
+
+        Calls made from an executor thread run inline, so that nested use can
+        never exhaust the pool and deadlock.
+
+        Args:
+            calls (dict[str, Callable[[], Any]]): Zero-argument callables keyed by name.
+
+        Returns:
+            dict[str, Any]: The result of each call under the same name.
+
+        Raises:
+            Exception: The exception of the first failed call, in declaration order.
+        """
+        if threading.current_thread().name.startswith(THREAD_NAME_PREFIX):
+            return {name: call() for name, call in calls.items()}
+
+        token = current_token()
+
+        def run_with_token(call: Callable[[], Any]) -> Any:
+            with bind_token(token):
+                return call()
+
+        futures: dict[str, Future] = {
+            name: self._executor.submit(run_with_token, call)
+            for name, call in calls.items()
+        }
+        wait(futures.values())
+
+        results: dict[str, Any] = {}
+        first_error: BaseException | None = None
+        for name, future in futures.items():
+            error = future.exception()
+            if error is None:
+                results[name] = future.result()
+                continue
+            logger.error(
+                'Concurrent call %s failed: %s, Message: %s',
+                name, type(error).__name__, str(error),
+            )
+            if first_error is None:
+                first_error = error
+        if first_error is not None:
+            raise first_error
+        return results
+
+    def shutdown(self) -> None:
+        """Stop accepting calls and release the worker threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def get_instance() -> ServiceExecutor:
+        """
+        Returns the singleton instance of ServiceExecutor in a thread-safe manner.
+
+        Returns:
+            ServiceExecutor: The singleton instance of the executor.
+        """
+        if ServiceExecutor._instance is None:
+            with ServiceExecutor._lock:
+                if ServiceExecutor._instance is None:
+                    ServiceExecutor._instance = ServiceExecutor()
+        return ServiceExecutor._instance
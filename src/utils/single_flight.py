@@ -0,0 +1,128 @@
+# pylint: disable=too-few-public-methods
+"""
+Coalesces concurrent identical read requests to the node into one.
+
+This module provides a `SingleFlight` class through which `Request` sends the
+calls to read-only endpoints. While a call is in flight, identical calls
+(same method, URL, body, parameters and headers) made from other threads do
+not send their own request: they wait for the first one and share its
+response, or its exception. Page transitions and repeated refresh clicks
+therefore cost the node a single `/listassets` or `/listchannels` call.
+
+Only the endpoints listed in `COALESCED_ENDPOINTS` are coalesced; calls that
+mutate the wallet are always sent.
+
+Key Features:
+- Calls keyed by method, URL and canonical JSON of their payload.
+- Followers receive the leader's response or exception.
+- Nothing is kept once the leader's call completes; this is not a cache.
+- Thread-safe; singleton instance for application-wide use.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Callable
+from typing import Any
+from typing import TypeVar
+
+_T = TypeVar('_T')
+
+
+class _Call:
+    """An in-flight call and, once it completes, its outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time, sharing its outcome with concurrent callers."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        """Initialize the SingleFlight object."""
+        self._calls: dict[str, _Call] = {}
+        self._calls_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(method: str, url: str, **kwargs: Any) -> str:
+        """
+        Build the key identifying a request.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The full URL of the request.
+            **kwargs: The `json`, `params` and `headers` of the request; others are ignored.
+
+        Returns:
+            str: The key, equal for requests with the same method, URL and payload.
+        """
+        payload = {
+            name: kwargs.get(name)
+            for name in ('json', 'params', 'headers')
+        }
+        return f'{method} {url} {json.dumps(payload, sort_keys=True, default=str)}'
+
+    def do(self, key: str, func: Callable[[], _T]) -> tuple[_T, bool]:
+        """
+        Run `func`, unless a call with the same key is in flight, in which case wait for it.
+
+        Args:
+            key (str): The key of the call, see `make_key`.
+            func (Callable[[], _T]): Sends the request.
+
+        Returns:
+            tuple[_T, bool]: The result, and whether it was shared from another caller's call.
+
+        Raises:
+            Exception: Whatever the call raised, in the leader and in every follower.
+        """
+        with self._calls_lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                call.followers += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+            return call.result, False
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._calls_lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        """Return the number of calls in flight."""
+        with self._calls_lock:
+            return len(self._calls)
+
+    @staticmethod
+    def get_instance() -> SingleFlight:
+        """
+        Returns the singleton instance of SingleFlight in a thread-safe manner.
+
+        Returns:
+            SingleFlight: The singleton instance.
+        """
+        if SingleFlight._instance is None:
+            with SingleFlight._lock:
+                if SingleFlight._instance is None:
+                    SingleFlight._instance = SingleFlight()
+        return SingleFlight._instance
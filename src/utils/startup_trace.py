@@ -0,0 +1,253 @@
+"""
+Records how long the application takes to start, as a Chrome trace.
+
+This module provides a `StartupTracer` class that records named startup
+phases (imports, QApplication creation, translator load, cache open, node
+start, unlock, first paint of each page) when startup tracing is enabled,
+either with the `--startup-trace` command line flag or the
+`IRIS_WALLET_STARTUP_TRACE` environment variable. Once the target page has
+been painted for the first time, the phases are written as a JSON file in
+the Chrome trace event format, which can be opened in `chrome://tracing` or
+Perfetto and is read back by the startup benchmark.
+
+When tracing is disabled every method returns immediately, so the calls can
+stay in place in production code. The module only depends on the standard
+library and QtCore, so that bootstrap can enable it before anything else of
+the application is imported.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtCore import QEvent
+from PySide6.QtCore import QObject
+from PySide6.QtCore import QTimer
+
+STARTUP_TRACE_ENV = 'IRIS_WALLET_STARTUP_TRACE'
+STARTUP_TRACE_PAGE_ENV = 'IRIS_WALLET_STARTUP_TRACE_PAGE'
+STARTUP_TRACE_EXIT_ENV = 'IRIS_WALLET_STARTUP_TRACE_EXIT'
+STARTUP_TRACE_DEFAULT_PAGE = 'FungibleAssetWidget'
+STARTUP_TRACE_CATEGORY = 'startup'
+
+# The application logger is looked up by name rather than imported from
+# src.utils.logging, because bootstrap imports this module before the
+# constants the logging setup depends on are configured.
+logger = logging.getLogger('iris-wallet')
+
+
+class _FirstPaintWatcher(QObject):
+    """Event filter reporting the first paint of a widget to the tracer."""
+
+    def __init__(self, tracer: StartupTracer, widget: QObject, name: str):
+        super().__init__(widget)
+        self.tracer = tracer
+        self.name = name
+
+    def eventFilter(self, watched, event):  # pylint:disable=invalid-name
+        """Record the first paint event of the watched widget and stop watching."""
+        if event.type() == QEvent.Type.Paint:
+            watched.removeEventFilter(self)
+            # Let the paint complete before recording it
+            QTimer.singleShot(0, lambda: self.tracer.on_first_paint(self.name))
+        return False
+
+
+class StartupTracer:
+    """Collects the timed phases of the application startup."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        """Initialize the StartupTracer object; the time origin is its creation."""
+        self.origin = time.perf_counter()
+        self.output_path: str | None = None
+        self.target_page = STARTUP_TRACE_DEFAULT_PAGE
+        self.exit_when_done = False
+        self.is_finished = False
+        self.events: list[dict] = []
+        self._open_spans: dict[str, float] = {}
+        self._watched_pages: set[str] = set()
+        self._events_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether startup phases are being recorded."""
+        return self.output_path is not None and not self.is_finished
+
+    def enable(
+        self,
+        output_path: str,
+        target_page: str | None = None,
+        exit_when_done: bool = False,
+    ) -> None:
+        """
+        Start recording startup phases.
+
+        Args:
+            output_path (str): The file the trace is written to.
+            target_page (str | None): The page whose first paint ends the trace.
+            exit_when_done (bool): Whether to quit the application once the trace is written.
+        """
+        self.output_path = output_path
+        self.target_page = target_page or STARTUP_TRACE_DEFAULT_PAGE
+        self.exit_when_done = exit_when_done
+        logger.info(
+            'Startup tracing enabled until the first paint of %s, writing to %s',
+            self.target_page, output_path,
+        )
+
+    def configure_from_env(self) -> None:
+        """Enable tracing when the startup trace environment variable is set."""
+        output_path = os.environ.get(STARTUP_TRACE_ENV)
+        if output_path:
+            self.enable(
+                output_path,
+                os.environ.get(STARTUP_TRACE_PAGE_ENV),
+                os.environ.get(STARTUP_TRACE_EXIT_ENV, '') == '1',
+            )
+
+    def _timestamp(self, moment: float) -> int:
+        return int((moment - self.origin) * 1_000_000)
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """
+        Record a phase that ran between two `time.perf_counter()` values.
+
+        Args:
+            name (str): The name of the phase.
+            start (float): The moment the phase started.
+            end (float): The moment the phase ended.
+        """
+        if not self.enabled:
+            return
+        with self._events_lock:
+            self.events.append({
+                'name': name,
+                'cat': STARTUP_TRACE_CATEGORY,
+                'ph': 'X',
+                'ts': self._timestamp(start),
+                'dur': max(0, int((end - start) * 1_000_000)),
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+            })
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the code run inside the context as a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def begin(self, name: str) -> None:
+        """Start a phase which ends in another callback, see `end`."""
+        if self.enabled:
+            with self._events_lock:
+                self._open_spans.setdefault(name, time.perf_counter())
+
+    def end(self, name: str) -> None:
+        """End a phase started with `begin`; ignored if it was not started."""
+        if not self.enabled:
+            return
+        with self._events_lock:
+            start = self._open_spans.pop(name, None)
+        if start is not None:
+            self.record(name, start, time.perf_counter())
+
+    def mark(self, name: str) -> None:
+        """Record an instant event."""
+        if not self.enabled:
+            return
+        with self._events_lock:
+            self.events.append({
+                'name': name,
+                'cat': STARTUP_TRACE_CATEGORY,
+                'ph': 'i',
+                's': 'p',
+                'ts': self._timestamp(time.perf_counter()),
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+            })
+
+    def watch_first_paint(self, widget: QObject, page_name: str) -> None:
+        """
+        Record the first paint of a page, and finish the trace if it is the target page.
+
+        Args:
+            widget (QObject): The widget of the page.
+            page_name (str): The name of the page.
+        """
+        if not self.enabled or page_name in self._watched_pages:
+            return
+        self._watched_pages.add(page_name)
+        widget.installEventFilter(_FirstPaintWatcher(self, widget, page_name))
+
+    def on_first_paint(self, page_name: str) -> None:
+        """Record the first paint of a page; the target page finishes the trace."""
+        if not self.enabled:
+            return
+        self.record(
+            f'first_paint:{page_name}', self.origin, time.perf_counter(),
+        )
+        if page_name == self.target_page:
+            self.finish()
+
+    def phase_durations(self) -> dict[str, float]:
+        """Return the duration in milliseconds of each recorded phase."""
+        with self._events_lock:
+            return {
+                event['name']: event['dur'] / 1000
+                for event in self.events if event['ph'] == 'X'
+            }
+
+    def to_trace(self) -> dict:
+        """Return the recorded phases in the Chrome trace event format."""
+        with self._events_lock:
+            events = sorted(self.events, key=lambda event: event['ts'])
+        return {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'phases_ms': self.phase_durations()},
+        }
+
+    def finish(self) -> None:
+        """Write the trace file, stop recording and quit the application if requested."""
+        if not self.enabled:
+            return
+        trace = self.to_trace()
+        self.is_finished = True
+        try:
+            with open(self.output_path, 'w', encoding='utf-8') as trace_file:
+                json.dump(trace, trace_file, indent=1)
+            logger.info('Startup trace written to %s', self.output_path)
+        except OSError as exc:
+            logger.error(
+                'Exception occurred while writing startup trace: %s, Message: %s',
+                type(exc).__name__, str(exc),
+            )
+        app = QCoreApplication.instance()
+        if self.exit_when_done and app is not None:
+            app.exit(0)
+
+    @staticmethod
+    def get_instance() -> StartupTracer:
+        """
+        Returns the singleton instance of StartupTracer in a thread-safe manner.
+
+        Returns:
+            StartupTracer: The singleton instance of the tracer.
+        """
+        if StartupTracer._instance is None:
+            with StartupTracer._lock:
+                if StartupTracer._instance is None:
+                    StartupTracer._instance = StartupTracer()
+        return StartupTracer._instance
@@ -0,0 +1,111 @@
+"""
+An in-memory registry of the application's QSS stylesheets.
+
+This module provides a `StylesheetRegistry` class that keeps the content of
+every `.qss` file once it has been read, so that widgets built on each page
+visit get their stylesheet from memory instead of reading the same file from
+disk again. The whole stylesheet folder is read once at startup, and files
+that were not preloaded are read on first use.
+
+Key Features:
+- Reads each stylesheet file at most once.
+- Preloads a whole folder of stylesheets in one pass.
+- Thread-safe; singleton instance for application-wide use.
+"""
+from __future__ import annotations
+
+import os
+import threading
+
+from src.utils.logging import logger
+
+STYLESHEET_EXTENSION = '.qss'
+
+
+class StylesheetRegistry:
+    """Keeps the content of the stylesheet files in memory, keyed by their path."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        """Initialize the StylesheetRegistry object."""
+        self._stylesheets: dict[str, str] = {}
+        self._stylesheets_lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.normpath(path))
+
+    def get(self, path: str) -> str:
+        """
+        Return the content of the stylesheet file, reading it only the first time.
+
+        Args:
+            path (str): The path of the QSS file.
+
+        Returns:
+            str: The content of the QSS file.
+
+        Raises:
+            FileNotFoundError: If the QSS file is not found at the given path.
+        """
+        key = self._key(path)
+        with self._stylesheets_lock:
+            stylesheet = self._stylesheets.get(key)
+        if stylesheet is not None:
+            return stylesheet
+
+        with open(path, encoding='utf-8') as _f:
+            stylesheet = _f.read()
+        with self._stylesheets_lock:
+            self._stylesheets[key] = stylesheet
+        return stylesheet
+
+    def preload(self, folder: str) -> int:
+        """
+        Read every stylesheet file of the folder into memory.
+
+        Args:
+            folder (str): The folder containing the QSS files.
+
+        Returns:
+            int: The number of stylesheets held in memory afterwards.
+        """
+        try:
+            file_names = sorted(os.listdir(folder))
+        except OSError as exc:
+            logger.error(
+                'Exception occurred while preloading stylesheets: %s, Message: %s',
+                type(exc).__name__, str(exc),
+            )
+            return len(self)
+
+        for file_name in file_names:
+            if file_name.endswith(STYLESHEET_EXTENSION):
+                self.get(os.path.join(folder, file_name))
+        logger.info('Preloaded %d stylesheets from %s', len(self), folder)
+        return len(self)
+
+    def clear(self) -> None:
+        """Forget every stylesheet held in memory."""
+        with self._stylesheets_lock:
+            self._stylesheets.clear()
+
+    def __len__(self) -> int:
+        with self._stylesheets_lock:
+            return len(self._stylesheets)
+
+    @staticmethod
+    def get_instance() -> StylesheetRegistry:
+        """
+        Returns the singleton instance of StylesheetRegistry in a thread-safe manner.
+
+        Returns:
+            StylesheetRegistry: The singleton instance of the registry.
+        """
+        if StylesheetRegistry._instance is None:
+            with StylesheetRegistry._lock:
+                if StylesheetRegistry._instance is None:
+                    StylesheetRegistry._instance = StylesheetRegistry()
+        return StylesheetRegistry._instance
@@ -0,0 +1,289 @@
+# pylint: disable=too-few-public-methods
+"""
+An application-wide scheduler running the background tasks of the views.
+
+This module provides a `TaskScheduler` class to which `ThreadManager` submits
+every task, instead of each view, view model and widget starting its own
+`QThreadPool`. Tasks wait in a single priority queue: the data of the visible
+page runs before background refreshes, which run before prefetches. A burst of
+navigation therefore queues its tasks instead of starting an unbounded number
+of parallel node calls.
+
+Key Features:
+- One bounded thread pool for all tasks.
+- Priority classes, first in first out within a class.
+- At most `TASK_SCHEDULER_GROUP_LIMIT` running tasks per group, by default the
+  service function called, so that repeated clicks cannot occupy every worker.
+- Cancellation tokens dropping tasks that have not started yet, with a
+  callback telling their submitter; running tasks can read theirs with
+  `current_token`.
+- Queue wait per priority class and queue depth in the metrics registry.
+- Singleton instance for application-wide use.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import IntEnum
+
+from PySide6.QtCore import QThreadPool
+
+from src.utils.constant import TASK_SCHEDULER_GROUP_LIMIT
+from src.utils.constant import TASK_SCHEDULER_MAX_WORKERS
+from src.utils.logging import logger
+from src.utils.metrics import MetricsRegistry
+
+# Prefix of the names under which queue waits are recorded in the metrics
+SCHEDULER_QUEUE_NAME = 'scheduler'
+
+_running_task = threading.local()
+
+
+class TaskPriority(IntEnum):
+    """Priority classes of the scheduled tasks; higher values run first."""
+    PREFETCH = 0
+    BACKGROUND = 1
+    VISIBLE = 2
+
+
+class CancellationToken:
+    """Lets the submitter of a task cancel it."""
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Cancel the task; it is dropped if it has not started yet."""
+        self._cancelled.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether the task has been cancelled."""
+        return self._cancelled.is_set()
+
+
+def current_token() -> CancellationToken | None:
+    """Return the token of the task running on the calling thread, if any."""
+    return getattr(_running_task, 'token', None)
+
+
+@contextmanager
+def bind_token(token: CancellationToken | None) -> Iterator[None]:
+    """Make `token` the token of the calling thread inside the context, see `current_token`."""
+    previous = current_token()
+    _running_task.token = token
+    try:
+        yield
+    finally:
+        _running_task.token = previous
+
+
+class _Task:
+    """A submitted task waiting for, or holding, a worker."""
+
+    def __init__(
+        self,
+        func: Callable[[], None],
+        priority: TaskPriority,
+        group: str | None,
+        token: CancellationToken,
+        on_cancel: Callable[[], None] | None = None,
+    ):
+        self.func = func
+        self.priority = priority
+        self.group = group
+        self.token = token
+        self.on_cancel = on_cancel
+        self.queued_at = time.perf_counter()
+
+    def drop(self) -> None:
+        """Tell the submitter that the task was cancelled before it started."""
+        if self.on_cancel is None:
+            return
+        try:
+            self.on_cancel()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.error(
+                'Exception occurred in cancelled task callback: %s, Message: %s',
+                type(exc).__name__, str(exc),
+            )
+
+
+class TaskScheduler:
+    """Runs submitted tasks on one bounded thread pool, by priority."""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_workers: int = TASK_SCHEDULER_MAX_WORKERS,
+        group_limit: int = TASK_SCHEDULER_GROUP_LIMIT,
+    ):
+        """
+        Initialize the TaskScheduler object.
+
+        Args:
+            max_workers (int): Maximum number of tasks running at the same time.
+            group_limit (int): Maximum number of running tasks of the same group.
+        """
+        self.max_workers = max_workers
+        self.group_limit = group_limit
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_workers)
+        self._queue: list[tuple[int, int, _Task]] = []
+        self._sequence = itertools.count()
+        self._running = 0
+        self._running_by_group: dict[str, int] = {}
+        self._stats: dict[str, int] = {
+            'submitted': 0,
+            'cancelled': 0,
+            'peak_queued': 0,
+        }
+        self._tasks_lock = threading.Lock()
+
+    def submit(
+        self,
+        func: Callable[[], None],
+        priority: TaskPriority = TaskPriority.VISIBLE,
+        group: str | None = None,
+        token: CancellationToken | None = None,
+        on_cancel: Callable[[], None] | None = None,
+    ) -> CancellationToken:
+        """
+        Queue a task and start it as soon as a worker is free.
+
+        Args:
+            func (Callable[[], None]): The task.
+            priority (TaskPriority): The priority class of the task.
+            group (str | None): Tasks of the same group share `group_limit` workers.
+            token (CancellationToken | None): Token cancelling the task; a new one if None.
+            on_cancel (Callable[[], None] | None): Called instead of the task when it
+                is cancelled before it starts.
+
+        Returns:
+            CancellationToken: The token cancelling the task.
+        """
+        token = token or CancellationToken()
+        task = _Task(func, priority, group, token, on_cancel)
+        with self._tasks_lock:
+            heapq.heappush(
+                self._queue, (-priority, next(self._sequence), task),
+            )
+            self._stats['submitted'] += 1
+            self._stats['peak_queued'] = max(
+                self._stats['peak_queued'], len(self._queue),
+            )
+        self._dispatch()
+        return token
+
+    def _dispatch(self) -> None:
+        """Start the queued tasks of highest priority while workers are free."""
+        started: list[_Task] = []
+        dropped: list[_Task] = []
+        with self._tasks_lock:
+            deferred = []
+            while self._queue and self._running < self.max_workers:
+                entry = heapq.heappop(self._queue)
+                task = entry[2]
+                if task.token.is_cancelled:
+                    self._stats['cancelled'] += 1
+                    dropped.append(task)
+                    continue
+                if task.group is not None and self._running_by_group.get(task.group, 0) >= self.group_limit:
+                    deferred.append(entry)
+                    continue
+                self._running += 1
+                if task.group is not None:
+                    self._running_by_group[task.group] = self._running_by_group.get(
+                        task.group, 0,
+                    ) + 1
+                started.append(task)
+            for entry in deferred:
+                heapq.heappush(self._queue, entry)
+
+        for task in dropped:
+            task.drop()
+        for task in started:
+            MetricsRegistry.get_instance().record_queue_wait(
+                f'{SCHEDULER_QUEUE_NAME}:{task.priority.name.lower()}',
+                time.perf_counter() - task.queued_at,
+            )
+            self._pool.start(
+                lambda task=task: self._run(task), int(task.priority),
+            )
+
+    def _run(self, task: _Task) -> None:
+        """Run a task on a worker, then start the next queued ones."""
+        try:
+            if task.token.is_cancelled:
+                task.drop()
+            else:
+                with bind_token(task.token):
+                    task.func()
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.error(
+                'Exception occurred in scheduled task: %s, Message: %s',
+                type(exc).__name__, str(exc),
+            )
+        finally:
+            with self._tasks_lock:
+                self._running -= 1
+                if task.group is not None:
+                    self._running_by_group[task.group] -= 1
+                    if not self._running_by_group[task.group]:
+                        del self._running_by_group[task.group]
+            self._dispatch()
+
+    def stats(self) -> dict[str, int]:
+        """Return the queue depth per priority class, running tasks and counters."""
+        with self._tasks_lock:
+            queued = [entry[2].priority for entry in self._queue]
+            stats = {
+                f'queued_{priority.name.lower()}': queued.count(priority)
+                for priority in TaskPriority
+            }
+            stats['running'] = self._running
+            stats.update(self._stats)
+        return stats
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        """
+        Wait until no task is queued or running.
+
+        Args:
+            timeout_ms (int): Maximum wait in milliseconds, or -1 to wait indefinitely.
+
+        Returns:
+            bool: Whether all tasks completed within the timeout.
+        """
+        deadline = None if timeout_ms < 0 else time.monotonic() + timeout_ms / 1000
+        while True:
+            with self._tasks_lock:
+                if not self._queue and not self._running:
+                    return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            self._pool.waitForDone(10)
+
+    @staticmethod
+    def get_instance() -> TaskScheduler:
+        """
+        Returns the singleton instance of TaskScheduler in a thread-safe manner.
+
+        Returns:
+            TaskScheduler: The singleton instance of the scheduler.
+        """
+        if TaskScheduler._instance is None:
+            with TaskScheduler._lock:
+                if TaskScheduler._instance is None:
+                    TaskScheduler._instance = TaskScheduler()
+                    MetricsRegistry.get_instance().register_source(
+                        SCHEDULER_QUEUE_NAME, TaskScheduler._instance.stats,
+                    )
+        return TaskScheduler._instance
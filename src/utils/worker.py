@@ -1,4 +1,4 @@
-# pylint: disable=too-few-public-methods
+# pylint: disable=too-few-public-methods, too-many-arguments
 """
 This module contains the method to execute
 blocking methods in a thread using QThread provided by Qt.
@@ -9,21 +9,29 @@ from typing import Callable
 
 from PySide6.QtCore import QObject
 from PySide6.QtCore import QRunnable
-from PySide6.QtCore import QThreadPool
 from PySide6.QtCore import Signal
 from PySide6.QtCore import Slot
 
 from src.utils.cache import Cache
 from src.utils.custom_exception import CommonException
+from src.utils.page_scope import PageScope
+from src.utils.task_scheduler import CancellationToken
+from src.utils.task_scheduler import TaskPriority
+from src.utils.task_scheduler import TaskScheduler
+
+
+def is_cancelled(token: CancellationToken | None) -> bool:
+    """Return whether a worker's token has been cancelled, so that its results must be dropped."""
+    return token is not None and token.is_cancelled
 
 
 class ThreadManager:
     """
-    Manages the execution of functions in separate threads using QThreadPool.
+    Manages the execution of functions in separate threads using the shared TaskScheduler.
 
     Methods:
         run_in_thread(func, args=None, kwargs=None, callback=None, error_callback=None):
-            Executes a given function in a separate thread.
+            Submits a given function to the scheduler, to run in a separate thread.
         _handle_error(error):
             Handles any errors that occur during the execution of the function.
         print_output(output):
@@ -33,32 +41,50 @@ class ThreadManager:
     """
 
     def __init__(self):
-        self.threadpool = QThreadPool()
         self.worker: WorkerWithoutCache | None = None
 
-    def run_in_thread(self, func: Callable, options: dict | None = None):
+    def run_in_thread(self, func: Callable, options: dict | None = None) -> CancellationToken:
         """
         Executes the given function in a separate thread.
 
+        The function is queued in the application-wide TaskScheduler with the
+        'priority' option, by default `TaskPriority.VISIBLE`, and grouped with
+        the other calls of the same function unless a 'group' option is given.
+        With the 'page_scoped' option, the call is cancelled when another page
+        is shown; only calls reading data for the current page may use it.
+        A cancelled call emits neither result nor error, but calls its
+        'cancel_callback', so that a loader waiting for it can be stopped.
+
         Args:
             func (Callable): The function to be executed.
             options (Optional[dict]): Options including 'args', 'kwargs', 'callback', 'error_callback',
-                                    'key', 'page', and 'use_cache'. Defaults to None.
+                                    'cancel_callback', 'key', 'page', 'use_cache', 'priority', 'group'
+                                    and 'page_scoped'.
+                                    Defaults to None.
+
+        Returns:
+            CancellationToken: The token cancelling the call; once cancelled, its result is dropped.
         """
         options = options or {}
         args = options.get('args', [])
         kwargs = options.get('kwargs', {})
         callback = options.get('callback')
         error_callback = options.get('error_callback')
+        cancel_callback = options.get('cancel_callback')
         key = options.get('key')
         use_cache = options.get('use_cache', False)
+        token = PageScope.get_instance().token() if options.get(
+            'page_scoped',
+        ) else CancellationToken()
 
         if use_cache:
             self.worker = WorkerWithCache(
-                func, key, use_cache, args=args, kwargs=kwargs,
+                func, key, use_cache, args=args, kwargs=kwargs, token=token,
             )
         else:
-            self.worker = WorkerWithoutCache(func, args=args, kwargs=kwargs)
+            self.worker = WorkerWithoutCache(
+                func, args=args, kwargs=kwargs, token=token,
+            )
 
         if callback:
             self.worker.result.connect(callback)
@@ -66,9 +92,24 @@ class ThreadManager:
         if error_callback:
             self.worker.error.connect(error_callback)
 
+        if cancel_callback:
+            self.worker.cancelled.connect(cancel_callback)
+
         self.worker.finished.connect(self.thread_complete)
 
-        self.threadpool.start(self.worker)
+        return TaskScheduler.get_instance().submit(
+            self.worker.run,
+            priority=options.get('priority', TaskPriority.VISIBLE),
+            group=options.get('group') or self._task_group(func),
+            token=token,
+            on_cancel=self.worker.drop,
+        )
+
+    @staticmethod
+    def _task_group(func: Callable) -> str | None:
+        """Return the qualified name of the function, which groups its calls in the scheduler."""
+        name = getattr(func, '__qualname__', None)
+        return f'{getattr(func, "__module__", "")}.{name}' if isinstance(name, str) else None
 
     def thread_complete(self):
         """
@@ -87,11 +128,18 @@ class WorkerSignalsWithoutCache(QObject):
         error (Signal): Emitted when an error occurs.
         result (Signal): Emitted with the result of the function execution.
         progress (Signal): Emitted to report progress (not used in this implementation).
+        cancelled (Signal): Emitted instead of result or error once the worker is cancelled.
     """
     finished = Signal()
     error = Signal(Exception)
     result = Signal(object)
     progress = Signal(object)
+    cancelled = Signal()
+
+    def drop(self):
+        """Emits the signals of a worker cancelled before it started running."""
+        self.cancelled.emit()
+        self.finished.emit()
 
 
 class WorkerSignalsWithCache(WorkerSignalsWithoutCache):
@@ -103,6 +151,7 @@ class WorkerSignalsWithCache(WorkerSignalsWithoutCache):
         error (Signal): Emitted when an error occurs.
         result (Signal): Emitted with the result of the function execution.
         progress (Signal): Emitted to report progress (not used in this implementation).
+        cancelled (Signal): Emitted instead of result or error once the worker is cancelled.
     """
     result = Signal(object, bool)
 
@@ -116,25 +165,39 @@ class WorkerWithoutCache(QRunnable, WorkerSignalsWithoutCache):
             Executes the function in the thread and emits signals based on the outcome.
     """
 
-    def __init__(self, func: Callable, args: list | None = None, kwargs: dict | None = None):
+    def __init__(
+        self,
+        func: Callable,
+        args: list | None = None,
+        kwargs: dict | None = None,
+        token: CancellationToken | None = None,
+    ):
         super().__init__()
         self.func = func
         self.args = args if args else []
         self.kwargs = kwargs if kwargs else {}
+        self.token = token
 
     @Slot()
     def run(self):
         """
         Runs the function with the provided arguments and keyword arguments.
-        Emits result or error signals based on the outcome.
+        Emits result or error signals based on the outcome, unless the worker
+        has been cancelled meanwhile.
         """
         try:
             self.progress.emit(True)
             result = self.func(*self.args, **self.kwargs)
         except (TypeError, ValueError, RuntimeError, CommonException) as exc:
-            self.error.emit(exc)
+            if is_cancelled(self.token):
+                self.cancelled.emit()
+            else:
+                self.error.emit(exc)
         else:
-            self.result.emit(result)
+            if is_cancelled(self.token):
+                self.cancelled.emit()
+            else:
+                self.result.emit(result)
         finally:
             self.finished.emit()
 
@@ -145,13 +208,22 @@ class WorkerWithCache(QRunnable, WorkerSignalsWithCache):
     Includes logic for caching method responses.
     """
 
-    def __init__(self, func: Callable, key: str | None = None, use_cache: bool = False, args: list | None = None, kwargs: dict | None = None):
+    def __init__(
+        self,
+        func: Callable,
+        key: str | None = None,
+        use_cache: bool = False,
+        args: list | None = None,
+        kwargs: dict | None = None,
+        token: CancellationToken | None = None,
+    ):
         super().__init__()
         self.func = func
         self.key = key
         self.use_cache = use_cache
         self.args = args if args else []
         self.kwargs = kwargs if kwargs else {}
+        self.token = token
 
     @Slot()
     def run(self):
@@ -161,6 +233,8 @@ class WorkerWithCache(QRunnable, WorkerSignalsWithCache):
         - Displays cached data immediately if available.
         - Calls the API in parallel to fetch fresh data.
         - Updates the cache and UI once the fresh data is fetched.
+        Once the worker is cancelled, fresh data still updates the cache but no
+        signal other than `cancelled` and `finished` is emitted.
         """
         try:
             # Emit progress signal to indicate task has started
@@ -170,7 +244,7 @@ class WorkerWithCache(QRunnable, WorkerSignalsWithCache):
             # Step 1: Check and emit cached result (if available)
             if self.use_cache and self.key and cache is not None:
                 cached_result, valid = cache.fetch_cache(self.key)
-                if cached_result:
+                if cached_result and not is_cancelled(self.token):
                     # Display cached data immediately
                     self.result.emit(cached_result, valid)
                     if valid:
@@ -179,11 +253,17 @@ class WorkerWithCache(QRunnable, WorkerSignalsWithCache):
             result = self.func(*self.args, **self.kwargs)
         except (TypeError, ValueError, RuntimeError, CommonException) as exc:
             # Handle any errors encountered during execution
+            if is_cancelled(self.token):
+                self.cancelled.emit()
+                return
             if cached_result:
                 self.result.emit(cached_result, True)
             self.error.emit(exc)
         else:
-            self.result.emit(result, True)
+            if is_cancelled(self.token):
+                self.cancelled.emit()
+            else:
+                self.result.emit(result, True)
             if cache is not None:
                 cache.on_success(self.key, result)
         # make customize except error for cache
@@ -13,6 +13,7 @@ from src.data.service.bitcoin_page_service import BitcoinPageService
 from src.model.btc_model import Transaction
 from src.model.btc_model import TransactionListWithBalanceResponse
 from src.utils.cache import Cache
+from src.utils.constant import CACHE_KEY_BITCOIN_TRANSACTIONS
 from src.utils.custom_exception import CommonException
 from src.utils.error_message import ERROR_FAILED_TO_GET_BALANCE
 from src.utils.error_message import ERROR_NAVIGATION_BITCOIN_PAGE
@@ -68,10 +69,11 @@ class BitcoinViewModel(QObject, ThreadManager):
         self.run_in_thread(
             BitcoinPageService.get_btc_transaction,
             {
-                'key': 'bitcoinviewmodel_get_transaction_list',
+                'key': CACHE_KEY_BITCOIN_TRANSACTIONS,
                 'use_cache': True,
                 'callback': on_success,
                 'error_callback': on_error,
+                'page_scoped': True,
             },
         )
 
@@ -107,6 +107,7 @@ class ChannelManagementViewModel(QObject, ThreadManager):
             {
                 'callback': success,
                 'error_callback': on_error,
+                'page_scoped': True,
             },
         )
 
@@ -188,6 +189,7 @@ class ChannelManagementViewModel(QObject, ThreadManager):
                 'args': [FilterAssetRequestModel(filter_asset_schemas=[FilterAssetEnumModel.NIA, FilterAssetEnumModel.CFA])],
                 'callback': on_success,
                 'error_callback': on_error,
+                'page_scoped': True,
             },
         )
 
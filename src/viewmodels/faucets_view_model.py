@@ -39,6 +39,8 @@ class FaucetsViewModel(QObject, ThreadManager):
                 'args': [],
                 'callback': self.on_success_get_faucet_list,
                 'error_callback': self.on_error,
+                'cancel_callback': self.on_cancel,
+                'page_scoped': True,
             },
         )
 
@@ -54,6 +56,10 @@ class FaucetsViewModel(QObject, ThreadManager):
         self.faucet_list.emit(None)
         self.faucet_available.emit(False)
 
+    def on_cancel(self) -> None:
+        """This method stops the loading of the faucet asset list once the faucets page is left."""
+        self.stop_loading.emit(False)
+
     def request_faucet_asset(self):
         """
         This method request the faucet asset.
@@ -3,15 +3,21 @@ This module contains the EstimateFeeViewModel class, which represents the view m
 """
 from __future__ import annotations
 
+import time
+
 from PySide6.QtCore import QObject
+from PySide6.QtCore import QTimer
 from PySide6.QtCore import Signal
 
-from src.data.repository.btc_repository import BtcRepository
-from src.model.btc_model import EstimateFeeRequestModel
+from src.data.service.fee_estimate_service import FeeEstimateService
 from src.model.btc_model import EstimateFeeResponse
 from src.utils.common_utils import TRANSACTION_SPEEDS
+from src.utils.constant import FEE_ESTIMATE_IDLE_TIMEOUT
+from src.utils.constant import FEE_ESTIMATE_REFRESH_INTERVAL_MS
 from src.utils.error_message import ERROR_SOMETHING_WENT_WRONG
+from src.utils.fee_estimate_cache import FeeEstimateCache
 from src.utils.info_message import INFO_CUSTOM_FEE_RATE
+from src.utils.task_scheduler import TaskPriority
 from src.utils.worker import ThreadManager
 from src.views.components.toast import ToastManager
 
@@ -25,6 +31,36 @@ class EstimateFeeViewModel(QObject, ThreadManager):
     def __init__(self):
         super().__init__()
         self.blocks = 0
+        self.last_used_at = 0.0
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(FEE_ESTIMATE_REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.on_refresh_timeout)
+
+    def prefetch_fee_rates(self) -> None:
+        """
+        Fetch the estimates of all transaction speeds in the background and keep them fresh.
+
+        Pages offering a fee choice call this when they open; the estimates are then
+        refreshed on a schedule until no page has asked for them for a while.
+        """
+        self.last_used_at = time.monotonic()
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+        if not FeeEstimateCache.get_instance().is_fresh():
+            self.run_in_thread(
+                FeeEstimateService.refresh_fee_estimates,
+                {'priority': TaskPriority.PREFETCH},
+            )
+
+    def on_refresh_timeout(self) -> None:
+        """Refresh the cached estimates, or stop refreshing once they are no longer used."""
+        if (time.monotonic() - self.last_used_at) > FEE_ESTIMATE_IDLE_TIMEOUT:
+            self.refresh_timer.stop()
+            return
+        self.run_in_thread(
+            FeeEstimateService.refresh_fee_estimates,
+            {'priority': TaskPriority.BACKGROUND},
+        )
 
     def get_fee_rate(self, tx_speed: str) -> None:
         """
@@ -41,13 +77,19 @@ class EstimateFeeViewModel(QObject, ThreadManager):
             )
             return
 
+        self.last_used_at = time.monotonic()
+        fee_rate = FeeEstimateCache.get_instance().get(self.blocks)
+        if fee_rate is not None:
+            self.fee_estimation_success.emit(fee_rate)
+            return
+
         self.loading_status.emit(True, True)
 
         try:
             self.run_in_thread(
-                BtcRepository.estimate_fee,
+                FeeEstimateService.get_fee_rate,
                 {
-                    'args': [EstimateFeeRequestModel(blocks=self.blocks)],
+                    'args': [self.blocks],
                     'callback': self.on_success_fee_estimation,
                     'error_callback': self.on_estimate_fee_error,
                 },
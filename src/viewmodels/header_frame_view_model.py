@@ -1,35 +1,10 @@
 """View model to handle network connectivity check or other logic for header"""
 from __future__ import annotations
 
-import socket
-
 from PySide6.QtCore import QObject
-from PySide6.QtCore import QThread
-from PySide6.QtCore import QTimer
 from PySide6.QtCore import Signal
 
-from src.utils.constant import PING_DNS_ADDRESS_FOR_NETWORK_CHECK
-from src.utils.constant import PING_DNS_SERVER_CALL_INTERVAL
-
-
-class NetworkCheckerThread(QThread):
-    """Thread to handle network connectivity checking."""
-    network_status_signal = Signal(bool)
-
-    def run(self):
-        """Run the network check once."""
-        is_connected = self.check_internet_conn()
-        self.network_status_signal.emit(is_connected)
-
-    def check_internet_conn(self):
-        """Check internet connection and return status."""
-        try:
-            socket.create_connection(
-                (PING_DNS_ADDRESS_FOR_NETWORK_CHECK, 53), timeout=3,
-            )
-            return True
-        except OSError:
-            return False
+from src.utils.connectivity_monitor import ConnectivityMonitor
 
 
 class HeaderFrameViewModel(QObject):
@@ -39,23 +14,14 @@ class HeaderFrameViewModel(QObject):
     def __init__(self):
         super().__init__()
 
-        self.network_checker = None
-
-        # Use QTimer in the main thread
-        self.timer = QTimer(self)
-        self.timer.setInterval(PING_DNS_SERVER_CALL_INTERVAL)
-        self.timer.timeout.connect(self.start_network_check)
-
-        # Start checking
-        self.timer.start()
-
-    def start_network_check(self):
-        """Start a new network check using a separate thread."""
-        self.network_checker = NetworkCheckerThread()
-        self.network_checker.network_status_signal.connect(
+        # All headers share the application-wide connectivity monitor
+        self.connectivity_monitor = ConnectivityMonitor.get_instance()
+        self.connectivity_monitor.network_status_signal.connect(
             self.handle_network_status,
         )
-        self.network_checker.start()
+
+        # Start checking
+        self.connectivity_monitor.start()
 
     def handle_network_status(self, is_connected):
         """Emit network status signal."""
@@ -63,4 +29,4 @@ class HeaderFrameViewModel(QObject):
 
     def stop_network_checker(self):
         """Stop network checking when it's no longer needed."""
-        self.timer.stop()
+        self.connectivity_monitor.stop()
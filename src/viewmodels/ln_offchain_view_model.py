@@ -16,6 +16,7 @@ from src.model.invoices_model import LnInvoiceRequestModel
 from src.model.invoices_model import LnInvoiceResponseModel
 from src.model.payments_model import CombinedDecodedModel
 from src.model.payments_model import ListPaymentResponseModel
+from src.utils.common_utils import render_qr_code
 from src.utils.custom_exception import CommonException
 from src.utils.error_message import ERROR_LN_OFF_CHAIN_UNABLE_TO_SEND_ASSET
 from src.utils.error_message import ERROR_SOMETHING_WENT_WRONG
@@ -79,9 +80,19 @@ class LnOffChainViewModel(QObject, ThreadManager):
         )
 
     def on_success_get_invoice(self, encoded_invoice: LnInvoiceResponseModel) -> None:
-        """Handle the successful retrieval of an invoice."""
+        """Handle the successful retrieval of an invoice, rendering its QR code in a thread before showing it."""
+        self.run_in_thread(
+            render_qr_code,
+            {
+                'args': [encoded_invoice.invoice],
+                'callback': lambda _: self.on_invoice_qr_code_rendered(encoded_invoice.invoice),
+            },
+        )
+
+    def on_invoice_qr_code_rendered(self, invoice: str) -> None:
+        """Show the invoice once its QR code is cached."""
         self.is_loading.emit(False)
-        self.invoice_get_event.emit(encoded_invoice.invoice)
+        self.invoice_get_event.emit(invoice)
 
     def send_asset_offchain(self, ln_invoice: str) -> None:
         """
@@ -125,6 +136,8 @@ class LnOffChainViewModel(QObject, ThreadManager):
                 'args': [],
                 'callback': self.on_success_of_list,
                 'error_callback': self._handle_error,
+                'cancel_callback': lambda: self.is_loading.emit(False),
+                'page_scoped': True,
             },
         )
 
@@ -12,6 +12,7 @@ from src.data.service.main_asset_page_service import MainAssetPageDataService
 from src.model.common_operation_model import MainPageDataResponseModel
 from src.model.enums.enums_model import ToastPreset
 from src.utils.cache import Cache
+from src.utils.constant import CACHE_KEY_MAIN_ASSET
 from src.utils.custom_exception import CommonException
 from src.utils.error_message import ERROR_NODE_CHANGING_STATE
 from src.utils.worker import ThreadManager
@@ -66,10 +67,11 @@ class MainAssetViewModel(QObject, ThreadManager):
         self.run_in_thread(
             MainAssetPageDataService.get_assets,
             {
-                'key': 'mainassetviewmodel_get_asset',
+                'key': CACHE_KEY_MAIN_ASSET,
                 'use_cache': True,
                 'callback': on_success,
                 'error_callback': on_error,
+                'page_scoped': True,
             },
         )
 
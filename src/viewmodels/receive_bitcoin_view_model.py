@@ -9,6 +9,7 @@ from PySide6.QtCore import Signal
 from src.data.repository.btc_repository import BtcRepository
 from src.model.btc_model import AddressResponseModel
 from src.utils.cache import Cache
+from src.utils.common_utils import render_qr_code
 from src.utils.custom_exception import CommonException
 from src.utils.worker import ThreadManager
 
@@ -39,8 +40,18 @@ class ReceiveBitcoinViewModel(QObject, ThreadManager):
         )
 
     def on_success(self, response: AddressResponseModel):
-        """This method handled onsuccess logic"""
-        self.address.emit(response.address)
+        """This method renders the QR code of the new address in a thread before showing it"""
+        self.run_in_thread(
+            render_qr_code,
+            {
+                'args': [response.address],
+                'callback': lambda _: self.on_qr_code_rendered(response.address),
+            },
+        )
+
+    def on_qr_code_rendered(self, address: str):
+        """This method shows the address once its QR code is cached"""
+        self.address.emit(address)
         self.is_loading.emit(False)
 
     def on_error(self, error: CommonException):
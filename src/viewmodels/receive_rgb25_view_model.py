@@ -11,6 +11,7 @@ from src.data.repository.rgb_repository import RgbRepository
 from src.model.enums.enums_model import ToastPreset
 from src.model.rgb_model import RgbInvoiceDataResponseModel
 from src.model.rgb_model import RgbInvoiceRequestModel
+from src.utils.common_utils import render_qr_code
 from src.utils.custom_exception import CommonException
 from src.utils.worker import ThreadManager
 from src.views.components.toast import ToastManager
@@ -50,9 +51,21 @@ class ReceiveRGB25ViewModel(QObject, ThreadManager):
         )
 
     def on_success(self, response: RgbInvoiceDataResponseModel):
-        """Handles success logic."""
-        if response.invoice:
-            self.address.emit(response.invoice)
+        """Handles success logic, rendering the QR code of the invoice in a thread before showing it."""
+        if not response.invoice:
+            self.hide_loading.emit(False)
+            return
+        self.run_in_thread(
+            render_qr_code,
+            {
+                'args': [response.invoice],
+                'callback': lambda _: self.on_qr_code_rendered(response.invoice),
+            },
+        )
+
+    def on_qr_code_rendered(self, invoice: str):
+        """Shows the invoice once its QR code is cached."""
+        self.address.emit(invoice)
         self.hide_loading.emit(False)
 
     def on_error(self, error: CommonException):
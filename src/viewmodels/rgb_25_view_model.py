@@ -16,6 +16,8 @@ from src.data.service.asset_detail_page_services import AssetDetailPageService
 from src.model.enums.enums_model import AssetType
 from src.model.enums.enums_model import NativeAuthType
 from src.model.enums.enums_model import ToastPreset
+from src.model.rgb_model import DecodeRgbInvoiceRequestModel
+from src.model.rgb_model import DecodeRgbInvoiceResponseModel
 from src.model.rgb_model import FailTransferRequestModel
 from src.model.rgb_model import FailTransferResponseModel
 from src.model.rgb_model import ListOnAndOffChainTransfersWithBalance
@@ -27,9 +29,11 @@ from src.utils.custom_exception import CommonException
 from src.utils.error_message import ERROR_AUTHENTICATION_CANCELLED
 from src.utils.error_message import ERROR_FAIL_TRANSFER
 from src.utils.error_message import ERROR_SOMETHING_WENT_WRONG
+from src.utils.error_message import ERROR_UNEXPECTED
 from src.utils.info_message import INFO_ASSET_SENT
 from src.utils.info_message import INFO_FAIL_TRANSFER_SUCCESSFULLY
 from src.utils.info_message import INFO_REFRESH_SUCCESSFULLY
+from src.utils.task_scheduler import CancellationToken
 from src.utils.worker import ThreadManager
 from src.views.components.toast import ToastManager
 
@@ -61,6 +65,7 @@ class RGB25ViewModel(QObject, ThreadManager):
         self.fee_rate = None
         self.min_confirmation = None
         self.txn_list = []
+        self.txn_list_token: CancellationToken | None = None
 
     def get_rgb25_asset_detail(self, asset_id: str, asset_name: str, image_path: str, asset_type: str) -> None:
         """Retrieve RGB25 asset list."""
@@ -82,15 +87,23 @@ class RGB25ViewModel(QObject, ThreadManager):
             self.is_loading.emit(False)
             ToastManager.error(description=error)
 
+        def on_cancel() -> None:
+            """Stop the loader of a left page, unless a newer request is loading."""
+            if self.txn_list_token is token:
+                self.is_loading.emit(False)
+
         try:
-            self.run_in_thread(
+            token = self.run_in_thread(
                 AssetDetailPageService.get_asset_transactions,
                 {
                     'args': [ListTransfersRequestModel(asset_id=asset_id)],
                     'callback': on_success,
                     'error_callback': on_error,
+                    'cancel_callback': on_cancel,
+                    'page_scoped': True,
                 },
             )
+            self.txn_list_token = token
         except Exception as e:
             on_error(CommonException(message=str(e)))
 
@@ -162,6 +175,30 @@ class RGB25ViewModel(QObject, ThreadManager):
             },
         )
 
+    def on_send_invoice_click(self, invoice: str, amount: int, fee_rate: int, min_confirmation: int) -> None:
+        """Decodes the invoice in a thread, then sends the asset to its recipient with on_send_click."""
+        def on_success_decode(decoded_invoice: DecodeRgbInvoiceResponseModel) -> None:
+            """Send the asset to the recipient of the decoded invoice."""
+            self.on_send_click(
+                amount, decoded_invoice.recipient_id, decoded_invoice.transport_endpoints, fee_rate, min_confirmation,
+            )
+
+        def on_error_decode(error: Exception) -> None:
+            """Handle error for decoding the invoice."""
+            message = error.message if isinstance(
+                error, CommonException,
+            ) else str(error)
+            ToastManager.error(description=ERROR_UNEXPECTED.format(message))
+
+        self.run_in_thread(
+            RgbRepository.decode_invoice,
+            {
+                'args': [DecodeRgbInvoiceRequestModel(invoice=invoice)],
+                'callback': on_success_decode,
+                'error_callback': on_error_decode,
+            },
+        )
+
     def on_refresh_click(self) -> None:
         """Executes the refresh operation in a separate thread."""
         cache = Cache.get_cache_session()
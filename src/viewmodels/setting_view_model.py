@@ -15,23 +15,12 @@ from src.model.common_operation_model import CheckIndexerUrlRequestModel
 from src.model.common_operation_model import CheckProxyEndpointRequestModel
 from src.model.enums.enums_model import NativeAuthType
 from src.model.enums.enums_model import NetworkEnumModel
-from src.model.setting_model import DefaultAnnounceAddress
-from src.model.setting_model import DefaultAnnounceAlias
-from src.model.setting_model import DefaultBitcoindHost
-from src.model.setting_model import DefaultBitcoindPort
-from src.model.setting_model import DefaultExpiryTime
-from src.model.setting_model import DefaultFeeRate
-from src.model.setting_model import DefaultIndexerUrl
-from src.model.setting_model import DefaultMinConfirmation
-from src.model.setting_model import DefaultProxyEndpoint
 from src.model.setting_model import IsDefaultEndpointSet
 from src.model.setting_model import IsDefaultExpiryTimeSet
 from src.model.setting_model import IsDefaultFeeRateSet
 from src.model.setting_model import IsDefaultMinConfirmationSet
 from src.model.setting_model import IsHideExhaustedAssetEnabled
-from src.model.setting_model import IsNativeLoginIntoAppEnabled
 from src.model.setting_model import IsShowHiddenAssetEnabled
-from src.model.setting_model import NativeAuthenticationStatus
 from src.model.setting_model import SettingPageLoadModel
 from src.utils.constant import FEE_RATE
 from src.utils.constant import IRIS_WALLET_TRANSLATIONS_CONTEXT
@@ -281,55 +270,48 @@ class SettingViewModel(QObject, ThreadManager):
 
     def on_page_load(self):
         'This method call on setting page load'
-        try:
-            status_of_native_auth_res: NativeAuthenticationStatus = (
-                SettingRepository.get_native_authentication_status()
-            )
-            status_of_native_logging_auth_res: IsNativeLoginIntoAppEnabled = (
-                SettingRepository.native_login_enabled()
-            )
-            status_of_hide_asset_res: IsShowHiddenAssetEnabled = (
-                SettingRepository.is_show_hidden_assets_enabled()
-            )
-            status_of_exhausted_asset_res: IsHideExhaustedAssetEnabled = (
-                SettingRepository.is_exhausted_asset_enabled()
-            )
-            value_of_default_fee_res: DefaultFeeRate = SettingCardRepository.get_default_fee_rate()
-            value_of_default_expiry_time_res: DefaultExpiryTime = SettingCardRepository.get_default_expiry_time()
-            value_of_default_indexer_url_res: DefaultIndexerUrl = SettingCardRepository.get_default_indexer_url()
-            value_of_default_proxy_endpoint_res: DefaultProxyEndpoint = SettingCardRepository.get_default_proxy_endpoint()
-            value_of_default_bitcoind_rpc_host_res: DefaultBitcoindHost = SettingCardRepository.get_default_bitcoind_host()
-            value_of_default_bitcoind_rpc_port_res: DefaultBitcoindPort = SettingCardRepository.get_default_bitcoind_port()
-            value_of_default_announce_address_res: DefaultAnnounceAddress = SettingCardRepository.get_default_announce_address()
-            value_of_default_announce_alias_res: DefaultAnnounceAlias = SettingCardRepository.get_default_announce_alias()
-            value_of_default_min_confirmation_res: DefaultMinConfirmation = SettingCardRepository.get_default_min_confirmation()
-            self.on_page_load_event.emit(
-                SettingPageLoadModel(
-                    status_of_native_auth=status_of_native_auth_res,
-                    status_of_native_logging_auth=status_of_native_logging_auth_res,
-                    status_of_hide_asset=status_of_hide_asset_res,
-                    status_of_exhausted_asset=status_of_exhausted_asset_res,
-                    value_of_default_fee=value_of_default_fee_res,
-                    value_of_default_expiry_time=value_of_default_expiry_time_res,
-                    value_of_default_indexer_url=value_of_default_indexer_url_res,
-                    value_of_default_proxy_endpoint=value_of_default_proxy_endpoint_res,
-                    value_of_default_bitcoind_rpc_host=value_of_default_bitcoind_rpc_host_res,
-                    value_of_default_bitcoind_rpc_port=value_of_default_bitcoind_rpc_port_res,
-                    value_of_default_announce_address=value_of_default_announce_address_res,
-                    value_of_default_announce_alias=value_of_default_announce_alias_res,
-                    value_of_default_min_confirmation=value_of_default_min_confirmation_res,
-                ),
-            )
-        except CommonException as exc:
+        self.run_in_thread(
+            self._load_page_settings,
+            {
+                'callback': self.on_success_of_page_load,
+                'error_callback': self.on_error_of_page_load,
+            },
+        )
+
+    @staticmethod
+    def _load_page_settings() -> SettingPageLoadModel:
+        """Read the settings and keyring values shown on the setting page; runs in a worker thread."""
+        return SettingPageLoadModel(
+            status_of_native_auth=SettingRepository.get_native_authentication_status(),
+            status_of_native_logging_auth=SettingRepository.native_login_enabled(),
+            status_of_hide_asset=SettingRepository.is_show_hidden_assets_enabled(),
+            status_of_exhausted_asset=SettingRepository.is_exhausted_asset_enabled(),
+            value_of_default_fee=SettingCardRepository.get_default_fee_rate(),
+            value_of_default_expiry_time=SettingCardRepository.get_default_expiry_time(),
+            value_of_default_indexer_url=SettingCardRepository.get_default_indexer_url(),
+            value_of_default_proxy_endpoint=SettingCardRepository.get_default_proxy_endpoint(),
+            value_of_default_bitcoind_rpc_host=SettingCardRepository.get_default_bitcoind_host(),
+            value_of_default_bitcoind_rpc_port=SettingCardRepository.get_default_bitcoind_port(),
+            value_of_default_announce_address=SettingCardRepository.get_default_announce_address(),
+            value_of_default_announce_alias=SettingCardRepository.get_default_announce_alias(),
+            value_of_default_min_confirmation=SettingCardRepository.get_default_min_confirmation(),
+        )
+
+    def on_success_of_page_load(self, settings: SettingPageLoadModel):
+        """Callback on success of reading the settings of the setting page"""
+        self.on_page_load_event.emit(settings)
+
+    def on_error_of_page_load(self, error: Exception):
+        """Callback on error while reading the settings of the setting page"""
+        if isinstance(error, CommonException):
             ToastManager.error(
-                description=exc.message,
+                description=error.message,
             )
-            self._page_navigation.fungibles_asset_page()
-        except Exception:
+        else:
             ToastManager.error(
                 description=ERROR_SOMETHING_WENT_WRONG,
             )
-            self._page_navigation.fungibles_asset_page()
+        self._page_navigation.fungibles_asset_page()
 
     def on_success_of_keyring_validation(self):
         """This is a callback call on successfully unlock of node"""
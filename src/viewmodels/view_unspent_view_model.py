@@ -10,6 +10,7 @@ from src.data.repository.btc_repository import BtcRepository
 from src.model.btc_model import Unspent
 from src.model.btc_model import UnspentsListResponseModel
 from src.utils.cache import Cache
+from src.utils.constant import CACHE_KEY_UNSPENT_LIST
 from src.utils.custom_exception import CommonException
 from src.utils.worker import ThreadManager
 from src.views.components.toast import ToastManager
@@ -56,10 +57,11 @@ class UnspentListViewModel(QObject, ThreadManager):
             self.run_in_thread(
                 BtcRepository.list_unspents,
                 {
-                    'key': 'unspentlistviewmodel_get_unspent_list',
+                    'key': CACHE_KEY_UNSPENT_LIST,
                     'use_cache': True,
                     'callback': success,
                     'error_callback': error,
+                    'page_scoped': True,
                 },
             )
         except Exception as e:
@@ -2,11 +2,10 @@
 """This module has the UI and the logic for the custom toast notification"""
 from __future__ import annotations
 
-from PySide6.QtCore import QElapsedTimer
 from PySide6.QtCore import QPoint
+from PySide6.QtCore import QPropertyAnimation
 from PySide6.QtCore import QSize
 from PySide6.QtCore import Qt
-from PySide6.QtCore import QTimer
 from PySide6.QtGui import QColor
 from PySide6.QtGui import QCursor
 from PySide6.QtGui import QGuiApplication
@@ -196,13 +195,17 @@ class ToasterUi(QWidget):
         )
         self.vertical_layout_2.addWidget(self.progress_bar)
 
-        # Timer for the progress bar
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_progress)
-        self.timer.start(1)
-
-        self.elapsed_timer = QElapsedTimer()
-        self.elapsed_timer.start()
+        # Animation of the progress bar, closing the toaster once it runs out.
+        # Qt advances all running animations from one shared timer at display
+        # refresh rate, so stacked toasters do not add timers of their own.
+        self.progress_animation = QPropertyAnimation(
+            self.progress_bar, b'value', self,
+        )
+        self.progress_animation.setStartValue(100)
+        self.progress_animation.setEndValue(0)
+        self.progress_animation.setDuration(self.duration)
+        self.progress_animation.finished.connect(self.close_toaster)
+        self.progress_animation.start()
 
         self.retranslate_ui()
         self.setup_ui_connections()
@@ -223,7 +226,7 @@ class ToasterUi(QWidget):
 
     def close_toaster(self):
         """this method closes the toaster when close button is clicked"""
-        self.timer.stop()
+        self.progress_animation.stop()
         self.close()
         ToasterManager.remove_toaster(self)
 
@@ -232,15 +235,6 @@ class ToasterUi(QWidget):
         self.show()
         ToasterManager.add_toaster(self)
 
-    def update_progress(self):
-        """this method updates the progress bar"""
-        elapsed_time = self.elapsed_timer.elapsed()
-        progress = max(0, 100 - (elapsed_time / self.duration) * 100)
-        self.progress_bar.setValue(progress)
-
-        if elapsed_time >= self.duration:
-            self.close_toaster()
-
     def _wrap_resize_event(self, original_resize_event):
         """this is a wrapped resize event which moves the toaster along with parent"""
         def wrapped_resize_event(event):
@@ -249,20 +243,18 @@ class ToasterUi(QWidget):
 
     def closeEvent(self, event):  # pylint:disable=invalid-name
         """this method handles the close event for toaster"""
-        if self.timer.isActive():
-            self.timer.stop()
+        self.progress_animation.stop()
         super().closeEvent(event)
 
     def enterEvent(self, event):  # pylint:disable=invalid-name
-        """Stop the timer when the user hovers over the widget."""
-        self.timer.stop()
+        """Stop the progress when the user hovers over the widget."""
+        self.progress_animation.stop()
         self.progress_bar.setValue(100)
         super().enterEvent(event)
 
     def leaveEvent(self, event):  # pylint:disable=invalid-name
-        """Restart the timer when the user stops hovering."""
-        self.elapsed_timer.restart()  # Restart the timer when leaving
-        self.timer.start(1)  # Restart the progress update
+        """Restart the progress when the user stops hovering."""
+        self.progress_animation.start()  # Restart the progress from full
         super().leaveEvent(event)
 
     def adjust_toaster_size(self):
@@ -0,0 +1,176 @@
+# pylint: disable=too-many-instance-attributes
+"""This module contains the DiagnosticsPanel class,
+a hidden panel of the about page showing the node request metrics.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtCore import QDir
+from PySide6.QtCore import QSize
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QCursor
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import QFileDialog
+from PySide6.QtWidgets import QFrame
+from PySide6.QtWidgets import QHBoxLayout
+from PySide6.QtWidgets import QLabel
+from PySide6.QtWidgets import QPlainTextEdit
+from PySide6.QtWidgets import QPushButton
+from PySide6.QtWidgets import QVBoxLayout
+
+from src.model.enums.enums_model import ToastPreset
+from src.utils.constant import IRIS_WALLET_TRANSLATIONS_CONTEXT
+from src.utils.constant import METRICS_FILE_NAME
+from src.utils.error_message import ERROR_WHILE_EXPORTING_METRICS
+from src.utils.logging import logger
+from src.utils.metrics import MetricsRegistry
+from src.views.components.toast import ToastManager
+
+# Number of endpoints listed for each page
+TOP_PAGE_ENDPOINTS = 3
+
+
+def format_metrics(snapshot: dict[str, Any]) -> str:
+    """
+    Format a metrics snapshot as plain text tables.
+
+    Args:
+        snapshot (dict[str, Any]): A snapshot returned by `MetricsRegistry.snapshot`.
+
+    Returns:
+        str: Endpoints by call count, pages by node traffic, queue waits and component statistics.
+    """
+    lines = [
+        f"{'Endpoint':<24}{'Calls':>7}{'Errors':>8}{'Shared':>8}{'p50 ms':>10}"
+        f"{'p95 ms':>10}{'p99 ms':>10}{'KB in':>10}",
+    ]
+    endpoints = sorted(
+        snapshot['endpoints'].items(), key=lambda item: -item[1]['calls'],
+    )
+    for endpoint, metrics in endpoints:
+        latency = metrics['latency']
+        lines.append(
+            f"{endpoint:<24}{metrics['calls']:>7}{
+                metrics['errors']:>8
+            }{metrics['coalesced']:>8}"
+            f"{latency['p50_ms']:>10.1f}{latency['p95_ms']:>10.1f}"
+            f"{latency['p99_ms']:>10.1f}{
+                metrics['response_bytes'] / 1024:>10.1f
+            }",
+        )
+
+    lines.extend(['', 'Node requests by page'])
+    for page, requests in snapshot['pages'].items():
+        top = ', '.join(
+            f'{endpoint} {count}'
+            for endpoint, count in list(requests.items())[:TOP_PAGE_ENDPOINTS]
+        )
+        lines.append(f'{page:<32}{sum(requests.values()):>7}  {top}')
+
+    lines.extend(['', 'Worker queue wait'])
+    for queue_name, wait in snapshot['queue_waits'].items():
+        lines.append(
+            f"{queue_name:<24}{wait['count']:>7}  p50 {wait['p50_ms']:.1f} ms"
+            f"  p95 {wait['p95_ms']:.1f} ms  p99 {wait['p99_ms']:.1f} ms",
+        )
+
+    for name, stats in snapshot['components'].items():
+        lines.extend(['', name.capitalize()])
+        lines.extend(
+            f'{key:<24}{str(value):>7}' for key,
+            value in stats.items()
+        )
+    return '\n'.join(lines)
+
+
+class DiagnosticsPanel(QFrame):
+    """A panel showing the node request metrics, with buttons to refresh and export them."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName('diagnostics_panel')
+        self.vertical_layout = QVBoxLayout(self)
+        self.vertical_layout.setContentsMargins(0, 0, 0, 0)
+        self.vertical_layout.setSpacing(10)
+
+        self.title_label = QLabel(self)
+        self.title_label.setObjectName('diagnostics_title_label')
+        self.vertical_layout.addWidget(self.title_label)
+
+        self.metrics_text = QPlainTextEdit(self)
+        self.metrics_text.setObjectName('metrics_text')
+        self.metrics_text.setReadOnly(True)
+        self.metrics_text.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.metrics_text.setFont(
+            QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont),
+        )
+        self.metrics_text.setMinimumHeight(220)
+        self.vertical_layout.addWidget(self.metrics_text)
+
+        self.button_layout = QHBoxLayout()
+        self.refresh_button = QPushButton(self)
+        self.refresh_button.setObjectName('refresh_metrics_button')
+        self.export_button = QPushButton(self)
+        self.export_button.setObjectName('export_metrics_button')
+        for button in (self.refresh_button, self.export_button):
+            button.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+            button.setMinimumSize(QSize(150, 30))
+            button.setMaximumSize(QSize(150, 30))
+            self.button_layout.addWidget(button)
+        self.button_layout.addStretch()
+        self.vertical_layout.addLayout(self.button_layout)
+
+        self.refresh_button.clicked.connect(self.refresh)
+        self.export_button.clicked.connect(self.export_metrics)
+        self.retranslate_ui()
+
+    def retranslate_ui(self):
+        """Retranslate the UI elements."""
+        self.title_label.setText(
+            QCoreApplication.translate(
+                IRIS_WALLET_TRANSLATIONS_CONTEXT, 'diagnostics', None,
+            ),
+        )
+        self.refresh_button.setText(
+            QCoreApplication.translate(
+                IRIS_WALLET_TRANSLATIONS_CONTEXT, 'refresh_metrics', None,
+            ),
+        )
+        self.export_button.setText(
+            QCoreApplication.translate(
+                IRIS_WALLET_TRANSLATIONS_CONTEXT, 'export_metrics', None,
+            ),
+        )
+
+    def refresh(self):
+        """Show the current metrics."""
+        self.metrics_text.setPlainText(
+            format_metrics(MetricsRegistry.get_instance().snapshot()),
+        )
+
+    def toggle(self):
+        """Show the panel with fresh metrics, or hide it."""
+        if not self.isHidden():
+            self.hide()
+        else:
+            self.refresh()
+            self.show()
+
+    def export_metrics(self):
+        """Ask for a file and write the current metrics to it as JSON."""
+        save_path, _ = QFileDialog.getSaveFileName(
+            self, 'Save metrics File', QDir.homePath(
+            ) + '/' + METRICS_FILE_NAME, 'JSON Files (*.json)',
+        )
+        if not save_path:
+            return
+        try:
+            MetricsRegistry.get_instance().export_json(save_path)
+        except OSError as exc:
+            logger.error('%s : %s', ERROR_WHILE_EXPORTING_METRICS, exc)
+            ToastManager.show_toast(
+                self, ToastPreset.ERROR,
+                description=ERROR_WHILE_EXPORTING_METRICS,
+            )
@@ -179,6 +179,9 @@ class HeaderFrame(QFrame, QObject):
             self.handle_network_frame_visibility,
         )
         self.set_wallet_backup_frame()
+        # Show the connection error right away if another page already detected it
+        if self.header_frame_view_model.connectivity_monitor.is_connected is False:
+            self.handle_network_frame_visibility(False)
 
     def retranslate_ui(self):
         """Retranslate the UI elements."""
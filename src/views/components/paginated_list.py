@@ -0,0 +1,121 @@
+"""This module contains the PaginatedRowLoader class,
+which fills a scrollable grid layout with rows one page at a time.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from PySide6.QtCore import QEvent
+from PySide6.QtCore import QObject
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QGridLayout
+from PySide6.QtWidgets import QScrollArea
+from PySide6.QtWidgets import QSizePolicy
+from PySide6.QtWidgets import QSpacerItem
+from PySide6.QtWidgets import QWidget
+
+from src.utils.constant import TRANSACTION_LIST_LOAD_THRESHOLD_PX
+from src.utils.constant import TRANSACTION_LIST_PAGE_SIZE
+
+
+class PaginatedRowLoader(QObject):
+    """
+    Creates the row widgets of a long list lazily as the user scrolls.
+
+    Only the first page of rows is created when the items are set; the next page is
+    appended when the scroll position gets close to the bottom of the scroll area.
+    While the loaded rows do not fill the visible scroll area there is nothing to
+    scroll, so pages keep being appended until the rows overflow it.
+    A spacer is kept after the last loaded row so that rows stay top-aligned.
+
+    Rows are never removed once created, not even when they are scrolled far out
+    of view: the loader bounds the cost of opening a list, not the memory of one
+    scrolled through, which grows linearly with the number of rows scrolled past
+    until the items are replaced.
+
+    Attributes:
+        scroll_area (QScrollArea): The scroll area showing the rows.
+        layout (QGridLayout): The layout of the scroll area widget the rows are added to.
+        create_row (Callable[[Any], QWidget]): Builds the widget of a single item.
+        page_size (int): The number of rows created per page.
+    """
+
+    def __init__(
+        self,
+        scroll_area: QScrollArea,
+        layout: QGridLayout,
+        create_row: Callable[[Any], QWidget],
+        page_size: int = TRANSACTION_LIST_PAGE_SIZE,
+    ):
+        super().__init__(scroll_area)
+        self.scroll_area = scroll_area
+        self.layout = layout
+        self.create_row = create_row
+        self.page_size = page_size
+        self.items: list[Any] = []
+        self.loaded_count = 0
+        self.spacer: QSpacerItem | None = None
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.on_scroll)
+        scroll_bar.rangeChanged.connect(self.fill_viewport)
+        # Showing or resizing the viewport can leave it with room for more rows
+        self.scroll_area.viewport().installEventFilter(self)
+
+    @property
+    def has_more(self) -> bool:
+        """Whether some items have no row widget yet."""
+        return self.loaded_count < len(self.items)
+
+    def clear(self) -> None:
+        """Forget the items and remove the spacer.
+
+        The caller is responsible for removing the row widgets from the layout.
+        """
+        if self.spacer is not None:
+            self.layout.removeItem(self.spacer)
+            self.spacer = None
+        self.items = []
+        self.loaded_count = 0
+
+    def set_items(self, items: list[Any]) -> None:
+        """Replace the items and create the rows of the first page."""
+        self.clear()
+        self.items = list(items)
+        self.load_next_page()
+
+    def load_next_page(self) -> None:
+        """Create the rows of the next page and move the spacer after them."""
+        if self.spacer is not None:
+            self.layout.removeItem(self.spacer)
+        end = min(self.loaded_count + self.page_size, len(self.items))
+        for row_index in range(self.loaded_count, end):
+            self.layout.addWidget(
+                self.create_row(
+                    self.items[row_index],
+                ), row_index, 0, 1, 1,
+            )
+        self.loaded_count = end
+        self.spacer = QSpacerItem(
+            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding,
+        )
+        self.layout.addItem(self.spacer, self.loaded_count, 0, 1, 1)
+        # The scroll range is only updated once the layout has placed the new rows
+        QTimer.singleShot(0, self.fill_viewport)
+
+    def fill_viewport(self, *_: Any) -> None:
+        """Load the next page while the loaded rows leave nothing to scroll."""
+        if self.has_more and self.scroll_area.isVisible() and self.scroll_area.verticalScrollBar().maximum() == 0:
+            self.load_next_page()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # pylint:disable=invalid-name
+        """Fill the viewport when it is shown or resized."""
+        if event.type() in (QEvent.Type.Show, QEvent.Type.Resize):
+            QTimer.singleShot(0, self.fill_viewport)
+        return super().eventFilter(watched, event)
+
+    def on_scroll(self, value: int) -> None:
+        """Load the next page once the scroll position is close to the bottom."""
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        if self.has_more and value >= scroll_bar.maximum() - TRANSACTION_LIST_LOAD_THRESHOLD_PX:
+            self.load_next_page()
@@ -428,6 +428,7 @@ class SendAssetWidget(QWidget):
         self._view_model.estimate_fee_view_model.fee_estimation_error.connect(
             self.show_fee_estimation_error,
         )
+        self._view_model.estimate_fee_view_model.prefetch_fee_rates()
         self.asset_amount_value.textChanged.connect(
             self.validate_amount,
         )
@@ -9,6 +9,8 @@ from PySide6.QtCore import QDir
 from PySide6.QtCore import QSize
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QCursor
+from PySide6.QtGui import QKeySequence
+from PySide6.QtGui import QShortcut
 from PySide6.QtWidgets import QFileDialog
 from PySide6.QtWidgets import QGridLayout
 from PySide6.QtWidgets import QLabel
@@ -48,6 +50,7 @@ from src.utils.common_utils import zip_logger_folder
 from src.utils.constant import ANNOUNCE_ADDRESS
 from src.utils.constant import ANNOUNCE_ALIAS
 from src.utils.constant import CURRENT_RLN_NODE_COMMIT
+from src.utils.constant import DIAGNOSTICS_PANEL_SHORTCUT
 from src.utils.constant import IRIS_WALLET_TRANSLATIONS_CONTEXT
 from src.utils.constant import LDK_PORT_KEY
 from src.utils.constant import PRIVACY_POLICY_URL
@@ -60,6 +63,7 @@ from src.utils.local_store import local_store
 from src.utils.logging import logger
 from src.version import __version__
 from src.viewmodels.main_view_model import MainViewModel
+from src.views.components.diagnostics_panel import DiagnosticsPanel
 from src.views.components.header_frame import HeaderFrame
 from src.views.components.toast import ToastManager
 from src.views.components.wallet_detail_frame import NodeInfoWidget
@@ -237,6 +241,11 @@ class AboutWidget(QWidget):
 
         self.about_vertical_layout.addWidget(self.download_log)
 
+        # Hidden until toggled with DIAGNOSTICS_PANEL_SHORTCUT
+        self.diagnostics_panel = DiagnosticsPanel(self.about_widget)
+        self.diagnostics_panel.hide()
+        self.about_vertical_layout.addWidget(self.diagnostics_panel)
+
         self.vertical_layout.addLayout(self.about_vertical_layout)
 
         self.widget__vertical_spacer = QSpacerItem(
@@ -295,6 +304,12 @@ class AboutWidget(QWidget):
     def setup_ui_connection(self):
         """Set up connections for UI elements."""
         self.download_log.clicked.connect(self.download_logs)
+        self.diagnostics_shortcut = QShortcut(
+            QKeySequence(DIAGNOSTICS_PANEL_SHORTCUT), self,
+        )
+        self.diagnostics_shortcut.activated.connect(
+            self.diagnostics_panel.toggle,
+        )
 
     def download_logs(self):
         """
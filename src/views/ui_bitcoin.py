@@ -29,6 +29,7 @@ from accessible_constant import BITCOIN_SPENDABLE_BALANCE
 from accessible_constant import BITCOIN_TRANSACTION_DETAIL_FRAME
 from accessible_constant import RECEIVE_BITCOIN_BUTTON
 from accessible_constant import SEND_BITCOIN_BUTTON
+from src.model.btc_model import Transaction
 from src.model.btc_model import TransactionListResponse
 from src.model.enums.enums_model import AssetType
 from src.model.enums.enums_model import TransactionStatusEnumModel
@@ -43,6 +44,7 @@ from src.utils.render_timer import RenderTimer
 from src.viewmodels.main_view_model import MainViewModel
 from src.views.components.buttons import AssetTransferButton
 from src.views.components.loading_screen import LoadingTranslucentScreen
+from src.views.components.paginated_list import PaginatedRowLoader
 from src.views.components.transaction_detail_frame import TransactionDetailFrame
 from src.views.components.wallet_logo_frame import WalletLogoFrame
 
@@ -243,6 +245,10 @@ class BtcWidget(QWidget):
         self.btc_grid_layout_20.setHorizontalSpacing(6)
         self.btc_grid_layout_20.setVerticalSpacing(9)
         self.btc_grid_layout_20.setContentsMargins(0, 0, 0, 0)
+        self.transaction_list_loader = PaginatedRowLoader(
+            self.btc_scroll_area, self.btc_grid_layout_20,
+            self.create_transaction_frame,
+        )
         self.set_transaction_detail_frame()
 
         self.btc_scroll_area.setWidget(self.btc_scroll_area_widget_contents)
@@ -351,6 +357,10 @@ class BtcWidget(QWidget):
             self.hide_loading_screen,
         )
 
+    def refresh_page(self):
+        """Reload the page data when the cached page is shown again."""
+        self._view_model.bitcoin_view_model.get_transaction_list()
+
     def handle_asset_frame_click(self, signal_value: TransactionDetailPageModel):
         """
         Handle the click event on an asset frame.
@@ -450,6 +460,7 @@ class BtcWidget(QWidget):
                 widget_to_remove.setParent(None)
 
         if not sorted_transactions:
+            self.transaction_list_loader.clear()
             self.transaction_detail_frame = TransactionDetailFrame(
                 self.btc_scroll_area_widget_contents,
             )
@@ -464,98 +475,84 @@ class BtcWidget(QWidget):
             )
             return
 
-        # Initialize the row index for the grid layout
-        row_index = 0
-
         self.transactions.show()
-        for transaction_detail in sorted_transactions:
-            tx_id = str(transaction_detail.txid)
-            amount = str(transaction_detail.amount)
-            self.transaction_detail_frame = TransactionDetailFrame(
-                self.btc_scroll_area_widget_contents,
-                TransactionDetailPageModel(
-                    tx_id=tx_id, amount=amount, confirmation_date=transaction_detail.confirmation_date,
-                    confirmation_time=transaction_detail.confirmation_normal_time, transaction_status=transaction_detail.transaction_status,
-                    transfer_status=transaction_detail.transfer_status,
-                ),
-            )
-            self.transaction_detail_frame.setAccessibleName(
-                BITCOIN_TRANSACTION_DETAIL_FRAME,
+        self.transaction_list_loader.set_items(sorted_transactions)
+
+    def create_transaction_frame(self, transaction_detail: Transaction) -> TransactionDetailFrame:
+        """This method creates the frame showing a single transaction in the list."""
+        tx_id = str(transaction_detail.txid)
+        amount = str(transaction_detail.amount)
+        transaction_detail_frame = TransactionDetailFrame(
+            self.btc_scroll_area_widget_contents,
+            TransactionDetailPageModel(
+                tx_id=tx_id, amount=amount, confirmation_date=transaction_detail.confirmation_date,
+                confirmation_time=transaction_detail.confirmation_normal_time, transaction_status=transaction_detail.transaction_status,
+                transfer_status=transaction_detail.transfer_status,
+            ),
+        )
+        transaction_detail_frame.setAccessibleName(
+            BITCOIN_TRANSACTION_DETAIL_FRAME,
+        )
+        transaction_detail_frame.setCursor(
+            QCursor(Qt.CursorShape.PointingHandCursor),
+        )
+        transaction_detail_frame.close_button.hide()
+        transaction_date = str(transaction_detail.confirmation_date)
+        transaction_time = str(transaction_detail.confirmation_normal_time)
+        transfer_status = str(transaction_detail.transfer_status.value)
+        transfer_amount = amount
+        transaction_type = str(transaction_detail.transaction_type)
+        transaction_status = str(
+            transaction_detail.transaction_status.value,
+        )
+        if transfer_status == TransferStatusEnumModel.SENT:
+            transaction_detail_frame.transaction_amount.setStyleSheet(
+                'color:#EB5A5A;font-weight: 600;border:none',
             )
-            self.transaction_detail_frame.setCursor(
-                QCursor(Qt.CursorShape.PointingHandCursor),
+        if transfer_status == TransferStatusEnumModel.RECEIVED:
+            transaction_detail_frame.transaction_amount.setStyleSheet(
+                'color:#01A781;font-weight: 600;border:none',
             )
-            self.transaction_detail_frame.close_button.hide()
-            transaction_date = str(transaction_detail.confirmation_date)
-            transaction_time = str(transaction_detail.confirmation_normal_time)
-            transfer_status = str(transaction_detail.transfer_status.value)
-            transfer_amount = amount
-            transaction_type = str(transaction_detail.transaction_type)
-            transaction_status = str(
-                transaction_detail.transaction_status.value,
+        if transaction_status == TransactionStatusEnumModel.WAITING_CONFIRMATIONS:
+            transaction_detail_frame.transaction_amount.setStyleSheet(
+                'color:#959BAE;font-weight: 600',
             )
-            if transfer_status == TransferStatusEnumModel.SENT:
-                self.transaction_detail_frame.transaction_amount.setStyleSheet(
-                    'color:#EB5A5A;font-weight: 600;border:none',
-                )
-            if transfer_status == TransferStatusEnumModel.RECEIVED:
-                self.transaction_detail_frame.transaction_amount.setStyleSheet(
-                    'color:#01A781;font-weight: 600;border:none',
-                )
-            if transaction_status == TransactionStatusEnumModel.WAITING_CONFIRMATIONS:
-                self.transaction_detail_frame.transaction_amount.setStyleSheet(
-                    'color:#959BAE;font-weight: 600',
-                )
 
-            self.transaction_detail_frame.transaction_time.setText(
-                transaction_time,
+        transaction_detail_frame.transaction_time.setText(
+            transaction_time,
+        )
+        transaction_detail_frame.transaction_date.setText(
+            transaction_date,
+        )
+        if transaction_date == 'None':
+            transaction_detail_frame.transaction_time.setStyleSheet(
+                'color:#959BAE;font-weight: 400; font-size:14px',
             )
-            self.transaction_detail_frame.transaction_date.setText(
-                transaction_date,
+            transaction_detail_frame.transaction_time.setText(
+                transaction_status,
             )
-            if transaction_date == 'None':
-                self.transaction_detail_frame.transaction_time.setStyleSheet(
-                    'color:#959BAE;font-weight: 400; font-size:14px',
-                )
-                self.transaction_detail_frame.transaction_time.setText(
-                    transaction_status,
-                )
-                self.transaction_detail_frame.transaction_date.setText(
-                    transfer_status,
-                )
-            self.transaction_detail_frame.transaction_amount.setText(
-                transfer_amount,
+            transaction_detail_frame.transaction_date.setText(
+                transfer_status,
             )
+        transaction_detail_frame.transaction_amount.setText(
+            transfer_amount,
+        )
 
-            if transfer_status == TransferStatusEnumModel.SENT or TransferStatusEnumModel.RECEIVED:
-                if transaction_type == TransferType.CREATEUTXOS.value:
-                    self.transaction_detail_frame.transaction_type.setText(
-                        TransferStatusEnumModel.INTERNAL.value,
-                    )
-
-                    self.transaction_detail_frame.transaction_type.show()
-                else:
-                    self.transaction_detail_frame.transaction_type.hide()
-
-            self.transaction_detail_frame.transfer_type.hide()
-
-            # Add the transaction detail frame to the grid layout at the current row index
-            self.btc_grid_layout_20.addWidget(
-                self.transaction_detail_frame, row_index, 0, 1, 1,
-            )
-            row_index += 1
-            self.transaction_detail_frame.click_frame.connect(
-                self.handle_asset_frame_click,
-            )
+        if transfer_status == TransferStatusEnumModel.SENT or TransferStatusEnumModel.RECEIVED:
+            if transaction_type == TransferType.CREATEUTXOS.value:
+                transaction_detail_frame.transaction_type.setText(
+                    TransferStatusEnumModel.INTERNAL.value,
+                )
 
-        # Create and add the spacer item at the next available row index
-        self.btc_vertical_spacer_25 = QSpacerItem(
-            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding,
-        )
+                transaction_detail_frame.transaction_type.show()
+            else:
+                transaction_detail_frame.transaction_type.hide()
 
-        self.btc_grid_layout_20.addItem(
-            self.btc_vertical_spacer_25, row_index, 0, 1, 1,
+        transaction_detail_frame.transfer_type.hide()
+        transaction_detail_frame.click_frame.connect(
+            self.handle_asset_frame_click,
         )
+        return transaction_detail_frame
 
     def show_bitcoin_loading_screen(self):
         """This method handled show loading screen on main asset page"""
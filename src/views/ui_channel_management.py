@@ -458,6 +458,11 @@ class ChannelManagement(QWidget):
             ),
         )
 
+    def refresh_page(self):
+        """Reload the page data when the cached page is shown again."""
+        self._view_model.channel_view_model.available_channels()
+        self._view_model.channel_view_model.get_asset_list()
+
     def trigger_render_and_refresh(self):
         """This method start the render timer and perform the channel list refresh"""
         self.channel_ui_render_timer.start()
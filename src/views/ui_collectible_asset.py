@@ -317,6 +317,10 @@ class CollectiblesAssetWidget(QWidget):
             self.show_message,
         )
 
+    def refresh_page(self):
+        """Reload the page data when the cached page is shown again."""
+        self._view_model.main_asset_view_model.get_assets()
+
     def trigger_render_and_refresh(self):
         """This method start the render timer and perform the collectible asset list refresh"""
         self.render_timer.start()
@@ -342,12 +346,14 @@ class CollectiblesAssetWidget(QWidget):
         """This method handles collectibles asset click of the main asset page."""
         if asset_id is None or asset_name is None or image_path is None or asset_type is None:
             return
-        self._view_model.rgb25_view_model.asset_info.emit(
-            asset_id, asset_name, image_path, asset_type,
-        )
+        # Entering the page cancels the page-scoped tasks of the previous one,
+        # so the transactions are only requested once on the detail page
         self._view_model.page_navigation.rgb25_detail_page(
             RgbAssetPageLoadModel(asset_type=asset_type),
         )
+        self._view_model.rgb25_view_model.asset_info.emit(
+            asset_id, asset_name, image_path, asset_type,
+        )
 
     def show_collectible_asset_loading(self):
         """This method handled show loading screen on main asset page"""
@@ -462,6 +462,8 @@ class CreateChannelWidget(QWidget):
         self.channel_next_button.clicked.connect(self.handle_next)
         self.channel_prev_button.clicked.connect(self.handle_prev)
         self.show_asset_in_combo_box()
+        # The channel UTXOs are created with the estimated fee rate
+        self._view_model.estimate_fee_view_model.prefetch_fee_rates()
         self.combo_box.currentIndexChanged.connect(self.on_combo_box_changed)
         self.amount_line_edit.textChanged.connect(self.on_amount_changed)
         self.public_key_input.textChanged.connect(self.on_public_url_changed)
@@ -89,6 +89,10 @@ class FaucetsWidget(QWidget):
         self.setup_ui_connection()
         self.retranslate_ui()
 
+    def refresh_page(self):
+        """Reload the page data when the cached page is shown again."""
+        self._view_model.faucets_view_model.get_faucet_list()
+
     def create_faucet_frames(self, faucets_list):
         """This method creates the faucet frames according to the faucet list."""
         for i in reversed(range(self.faucet_vertical_layout.count())):
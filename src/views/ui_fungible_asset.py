@@ -40,6 +40,7 @@ from src.utils.helpers import load_stylesheet
 from src.utils.info_message import INFO_FAUCET_NOT_AVAILABLE
 from src.utils.info_message import INFO_TITLE
 from src.utils.render_timer import RenderTimer
+from src.utils.task_scheduler import TaskPriority
 from src.utils.worker import ThreadManager
 from src.viewmodels.main_view_model import MainViewModel
 from src.views.components.header_frame import HeaderFrame
@@ -62,7 +63,11 @@ class FungibleAssetWidget(QWidget, ThreadManager):
             self.show_assets,
         )
         self.network: NetworkEnumModel = SettingRepository.get_wallet_network()
-        CommonOperationService.set_node_info()
+        # Fetched once per session for the pages opened from this one
+        self.run_in_thread(
+            CommonOperationService.set_node_info,
+            {'priority': TaskPriority.BACKGROUND},
+        )
         self.sidebar = None
         self.__loading_translucent_screen = None
         self.setStyleSheet(
@@ -424,6 +429,12 @@ class FungibleAssetWidget(QWidget, ThreadManager):
             self.show_message,
         )
 
+    def refresh_page(self):
+        """Reload the page data when the cached page is shown again."""
+        self.handle_backup_visibility()
+        self._view_model.faucets_view_model.get_faucet_list()
+        self._view_model.main_asset_view_model.get_assets()
+
     def retranslate_ui(self):
         """Retranslate the UI elements."""
         self.show_fungible_loading_screen()
@@ -445,12 +456,14 @@ class FungibleAssetWidget(QWidget, ThreadManager):
         if asset_type == AssetType.BITCOIN.value:
             self._view_model.page_navigation.bitcoin_page()
         else:
-            self._view_model.rgb25_view_model.asset_info.emit(
-                asset_id, asset_name, image_path, asset_type,
-            )
+            # Entering the page cancels the page-scoped tasks of the previous one,
+            # so the transactions are only requested once on the detail page
             self._view_model.page_navigation.rgb25_detail_page(
                 RgbAssetPageLoadModel(asset_type=asset_type),
             )
+            self._view_model.rgb25_view_model.asset_info.emit(
+                asset_id, asset_name, image_path, asset_type,
+            )
 
     def show_fungible_loading_screen(self):
         """This method handled show loading screen on main asset page"""
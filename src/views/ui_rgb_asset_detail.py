@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import re
+from typing import Any
 
 from PySide6.QtCore import QCoreApplication
 from PySide6.QtCore import QRect
@@ -59,6 +60,7 @@ from src.viewmodels.main_view_model import MainViewModel
 from src.views.components.buttons import AssetTransferButton
 from src.views.components.confirmation_dialog import ConfirmationDialog
 from src.views.components.loading_screen import LoadingTranslucentScreen
+from src.views.components.paginated_list import PaginatedRowLoader
 from src.views.components.transaction_detail_frame import TransactionDetailFrame
 from src.views.components.wallet_logo_frame import WalletLogoFrame
 
@@ -85,7 +87,6 @@ class RGBAssetDetailWidget(QWidget):
         self.transfer_amount = None
         self.transaction_type = None
         self.transaction_status = None
-        self.vertical_spacer_3 = None
         self.scroll_area_widget_layout = None
         self.label_asset_name = None
         self.filtered_lightning_transactions = None
@@ -200,6 +201,10 @@ class RGBAssetDetailWidget(QWidget):
         self.scroll_area_widget_layout.setObjectName('gridLayout_20')
         self.scroll_area_widget_layout.setHorizontalSpacing(6)
         self.scroll_area_widget_layout.setContentsMargins(0, 0, 0, 0)
+        self.transaction_list_loader = PaginatedRowLoader(
+            self.scroll_area, self.scroll_area_widget_layout,
+            self.create_transaction_row,
+        )
         self.horizontal_layout_balance_frames = QHBoxLayout()
         self.asset_balance_frame = QFrame(self.rgb_asset_detail_widget)
         self.scroll_area.setWidget(self.scroll_area_widget_contents)
@@ -579,6 +584,7 @@ class RGBAssetDetailWidget(QWidget):
         if not asset_transactions or (
             not asset_transactions.onchain_transfers and not asset_transactions.off_chain_transfers
         ):
+            self.transaction_list_loader.clear()
             transaction_detail_frame = TransactionDetailFrame(
                 self.scroll_area_widget_contents,
             )
@@ -597,8 +603,6 @@ class RGBAssetDetailWidget(QWidget):
             self.scroll_area.setMaximumSize(QSize(335, 225))
             self.lightning_balance_frame.setMaximumSize(QSize(159, 120))
             self.asset_balance_frame.setMaximumSize(QSize(158, 120))
-        # Initialize the row index for the grid layout
-        row_index = 0
         self.filtered_lightning_transactions = [
             payment for payment in asset_transactions.off_chain_transfers
             if payment.asset_id == asset_id
@@ -610,31 +614,27 @@ class RGBAssetDetailWidget(QWidget):
         all_transactions = sorted(
             all_transactions, key=lambda x: x[1].updated_at, reverse=True,
         )
-        for tx_type, transaction in all_transactions:
-            if tx_type == TransferOptionModel.ON_CHAIN:
-                self.set_on_chain_transaction_frame(
-                    transaction, asset_name, asset_type, asset_id, image_path,
-                )
-            if tx_type == TransferOptionModel.LIGHTNING:
-                self.set_lightning_transaction_frame(
-                    transaction, asset_name, asset_type,
-                )
-            self.transaction_detail_frame.click_frame.connect(
-                self.handle_asset_frame_click,
-            )
-            self.transaction_detail_frame.setCursor(
-                QCursor(Qt.CursorShape.PointingHandCursor),
-            )
-            self.scroll_area_widget_layout.addWidget(
-                self.transaction_detail_frame, row_index, 0, 1, 1,
-            )
-            row_index += 1
-        self.vertical_spacer_3 = QSpacerItem(
-            20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding,
-        )
-        self.scroll_area_widget_layout.addItem(
-            self.vertical_spacer_3, row_index, 0, 1, 1,
+        self.transaction_list_loader.set_items(all_transactions)
+
+    def create_transaction_row(self, row: tuple[str, Any]) -> TransactionDetailFrame:
+        """This method creates the frame showing a single on-chain or lightning transaction in the list."""
+        tx_type, transaction = row
+        if tx_type == TransferOptionModel.ON_CHAIN:
+            self.set_on_chain_transaction_frame(
+                transaction, self.asset_name, self.asset_type,
+                self.asset_id_detail.toPlainText(), self.image_path,
+            )
+        if tx_type == TransferOptionModel.LIGHTNING:
+            self.set_lightning_transaction_frame(
+                transaction, self.asset_name, self.asset_type,
+            )
+        self.transaction_detail_frame.click_frame.connect(
+            self.handle_asset_frame_click,
+        )
+        self.transaction_detail_frame.setCursor(
+            QCursor(Qt.CursorShape.PointingHandCursor),
         )
+        return self.transaction_detail_frame
 
     def handle_asset_frame_click(self, params: TransactionDetailPageModel):
         """Pass emit value to navigation page"""
@@ -442,20 +442,21 @@ class RGBAssetTransactionDetail(QWidget):
         """
         Handle the close action for the transaction detail view.
 
-        This method emits a signal with the asset information and navigates to the RGB25 detail page.
+        This method navigates to the RGB25 detail page and then emits a signal with the asset information,
+        so that the transactions are requested once the detail page is entered.
 
         Attributes:
             self (object): The instance of the class containing the view model and navigation logic.
         """
+        self._view_model.page_navigation.rgb25_detail_page(
+            RgbAssetPageLoadModel(asset_type=self.params.asset_type),
+        )
         self._view_model.rgb25_view_model.asset_info.emit(
             self.params.asset_id,
             self.params.asset_name,
             self.params.image_path,
             self.params.asset_type,
         )
-        self._view_model.page_navigation.rgb25_detail_page(
-            RgbAssetPageLoadModel(asset_type=self.params.asset_type),
-        )
 
     def handle_lightning_detail(self):
         """
@@ -11,16 +11,12 @@ from rgb_lib import Invoice
 from rgb_lib import RgbLibError
 
 import src.resources_rc
-from src.data.repository.rgb_repository import RgbRepository
 from src.data.repository.setting_card_repository import SettingCardRepository
 from src.model.enums.enums_model import ToastPreset
-from src.model.rgb_model import DecodeRgbInvoiceRequestModel
-from src.model.rgb_model import DecodeRgbInvoiceResponseModel
 from src.model.rgb_model import ListTransferAssetWithBalanceResponseModel
 from src.model.setting_model import DefaultFeeRate
 from src.utils.constant import IRIS_WALLET_TRANSLATIONS_CONTEXT
 from src.utils.custom_exception import CommonException
-from src.utils.error_message import ERROR_SEND_ASSET
 from src.utils.error_message import ERROR_UNEXPECTED
 from src.utils.render_timer import RenderTimer
 from src.viewmodels.main_view_model import MainViewModel
@@ -140,21 +136,9 @@ class SendRGBAssetWidget(QWidget):
             amount = self.send_rgb_asset_page.asset_amount_value.text()
             fee_rate = self.send_rgb_asset_page.fee_rate_value.text()
             default_min_confirmation = SettingCardRepository.get_default_min_confirmation()
-
-            # Attempt to decode the RGB invoice
-            decoded_rgb_invoice: DecodeRgbInvoiceResponseModel = RgbRepository.decode_invoice(
-                DecodeRgbInvoiceRequestModel(invoice=provided_invoice),
+            self._view_model.rgb25_view_model.on_send_invoice_click(
+                provided_invoice, amount, fee_rate, default_min_confirmation.min_confirmation,
             )
-            try:
-                self._view_model.rgb25_view_model.on_send_click(
-                    amount, decoded_rgb_invoice.recipient_id, decoded_rgb_invoice.transport_endpoints, fee_rate, default_min_confirmation.min_confirmation,
-                )
-                # Success toast or indicator can be added here if needed
-            except CommonException as e:
-                # Handle any errors during the sending process
-                ToastManager.error(
-                    description=ERROR_SEND_ASSET.format(str(e)),
-                )
         except CommonException as e:
             # Handle any unexpected errors during the button click processing
             ToastManager.error(
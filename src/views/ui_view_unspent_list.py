@@ -48,7 +48,7 @@ class ViewUnspentList(QWidget):
         self.resizeEvent = self.change_layout  # pylint: disable=invalid-name
         self._view_model: MainViewModel = view_model
         self._view_model.unspent_view_model.list_loaded.connect(
-            lambda: self.show_unspent_list(update_layout=self.event_val),
+            self.handle_list_loaded,
         )
         self.network: NetworkEnumModel = SettingRepository.get_wallet_network()
         self.setStyleSheet(load_stylesheet('views/qss/unspent_list_style.qss'))
@@ -154,6 +154,10 @@ class ViewUnspentList(QWidget):
         self.setup_ui_connection()
         self.resizeEvent = self.change_layout  # pylint: disable=invalid-name
 
+    def handle_list_loaded(self):
+        """Show the loaded unspent list with the layout matching the window size."""
+        self.show_unspent_list(update_layout=self.event_val)
+
     def show_unspent_list(self, update_layout: bool = False):
         """This method shows the unspent list"""
         self.clear_unspent_list_layout()
@@ -185,6 +189,10 @@ class ViewUnspentList(QWidget):
         )
         self.show_view_unspent_loading()
 
+    def refresh_page(self):
+        """Reload the page data when the cached page is shown again."""
+        self._view_model.unspent_view_model.get_unspent_list()
+
     def trigger_render_and_refresh(self):
         """This method start the render timer and perform the unspent list refresh"""
         self.render_timer.start()
@@ -0,0 +1,138 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument
+"""Unit tests for the mock RGB Lightning Node server."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.mock_node_server import MockNodeData
+from benchmarks.mock_node_server import MockNodeServer
+from benchmarks.mock_node_server import parse_args
+from benchmarks.mock_node_server import ROUTES
+from src.data.repository.btc_repository import BtcRepository
+from src.data.repository.channels_repository import ChannelRepository
+from src.data.repository.common_operations_repository import CommonOperationRepository
+from src.data.repository.payments_repository import PaymentRepository
+from src.data.repository.rgb_repository import RgbRepository
+from src.model.enums.enums_model import FilterAssetEnumModel
+from src.model.rgb_model import FilterAssetRequestModel
+from src.model.rgb_model import ListTransfersRequestModel
+from src.utils import endpoints
+from src.utils.custom_exception import CommonException
+
+
+@pytest.fixture
+def mock_node():
+    """Fixture serving a small dataset, with the repositories pointed at it."""
+    data = MockNodeData(
+        assets=6, transfers=4, payments=7, channels=3, transactions=5, unspents=4,
+    )
+    server = MockNodeServer(data, port=0)
+    server.start()
+    with patch('src.utils.request.Request.load_base_url', return_value=server.url), \
+            patch('src.utils.cache.Cache.get_cache_session', return_value=None):
+        yield server
+    server.stop()
+
+
+def test_dataset_is_deterministic():
+    """The same seed gives the same data, and the requested volumes."""
+    first = MockNodeData(assets=5, transfers=3, payments=4, channels=2, seed=7)
+    second = MockNodeData(
+        assets=5, transfers=3,
+        payments=4, channels=2, seed=7,
+    )
+
+    assert first.payments == second.payments
+    assert first.channels == second.channels
+    assert sum(len(assets) for assets in first.assets.values()) == 5
+    assert all(len(transfers) == 3 for transfers in first.transfers.values())
+    assert first.payments != MockNodeData(payments=4, seed=8).payments
+
+
+def test_every_node_endpoint_is_served():
+    """Every node endpoint has a route; only the faucet endpoints are left out."""
+    node_endpoints = {
+        value for name, value in vars(endpoints).items()
+        if name.isupper() and isinstance(value, str) and value.startswith('/')
+    }
+    faucet_endpoints = {
+        endpoints.LIST_FAUCET_ASSETS, endpoints.WALLET_CONFIG, endpoints.REQUEST_FAUCET_ASSET,
+    }
+    swap_endpoints = {
+        endpoints.LIST_TRADES_ENDPOINT, endpoints.MAKER_EXECUTE_ENDPOINT,
+        endpoints.MAKER_INIT_ENDPOINT, endpoints.TAKER_ENDPOINT,
+    }
+
+    assert node_endpoints - faucet_endpoints - swap_endpoints <= set(ROUTES)
+
+
+def test_repositories_parse_responses(mock_node):
+    """The repositories parse the responses of the mock node into their models."""
+    data = mock_node.data
+    assets = RgbRepository.get_assets(
+        FilterAssetRequestModel(
+            filter_asset_schemas=[
+                FilterAssetEnumModel.NIA, FilterAssetEnumModel.CFA, FilterAssetEnumModel.UDA,
+            ],
+        ),
+    )
+    asset_id = assets.nia[0].asset_id
+    transfers = RgbRepository.list_transfers(
+        ListTransfersRequestModel(asset_id=asset_id),
+    )
+
+    assert len(assets.nia) + len(assets.cfa) + len(assets.uda) == 6
+    assert len(transfers.transfers) == 4
+    assert len(PaymentRepository.list_payment().payments) == 7
+    assert len(ChannelRepository.list_channel().channels) == 3
+    assert len(BtcRepository.list_transactions().transactions) == 5
+    assert len(BtcRepository.list_unspents().unspents) == 4
+    assert BtcRepository.get_btc_balance() == data.btc_balance()
+    assert CommonOperationRepository.node_info().num_channels == 3
+    assert mock_node.request_counts[endpoints.LIST_ASSETS_ENDPOINT] == 1
+
+
+def test_list_assets_filters_schemas(mock_node):
+    """Only the requested asset schemas are listed."""
+    assets = RgbRepository.get_assets(FilterAssetRequestModel())
+
+    assert len(assets.nia) == 2
+    assert not assets.cfa
+    assert not assets.uda
+
+
+def test_injected_errors(mock_node):
+    """Injected errors carry the node's error body and surface as CommonException."""
+    mock_node.error_rate = 1
+
+    with pytest.raises(CommonException) as exc_info:
+        PaymentRepository.list_payment()
+
+    assert exc_info.value.message == 'Injected failure'
+
+
+def test_injected_latency(mock_node):
+    """Endpoint latencies override the default latency of the server."""
+    mock_node.latency_ms = 5
+    mock_node.jitter_ms = 2
+    mock_node.endpoint_latency_ms = {endpoints.LIST_ASSETS_ENDPOINT: 50}
+
+    delay, fails = mock_node.plan_request(endpoints.LIST_ASSETS_ENDPOINT)
+    assert 0.05 <= delay <= 0.052
+    assert not fails
+    delay, _ = mock_node.plan_request(endpoints.LIST_PAYMENTS_ENDPOINT)
+    assert 0.005 <= delay <= 0.007
+
+
+def test_parse_args_endpoint_latency():
+    """Per-endpoint latencies are parsed from ENDPOINT=MS values."""
+    args = parse_args(
+        ['--assets', '100', '--endpoint-latency', '/listassets=200'],
+    )
+
+    assert args.assets == 100
+    assert args.endpoint_latency == [('/listassets', 200.0)]
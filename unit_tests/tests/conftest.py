@@ -1,23 +1,42 @@
+# pylint: disable=redefined-outer-name,protected-access
 """
-Pytest fixture to ensure a QApplication instance is available for the test session.
+Fixtures shared by every test.
 
-This fixture is automatically used for the entire test session (`autouse=True`)
-and ensures that a single instance of `QApplication` is created and shared
-among all tests. If an instance of `QApplication` already exists, it will use
-the existing one; otherwise, it creates a new instance.
-
-The `scope="session"` parameter ensures that the `QApplication` instance is
-created only once per test session, and is reused across all tests, which is
-useful for tests that involve PySide6/Qt widgets.
-
-Yields:
-    QApplication: An instance of `QApplication` to be used in tests.
+- `qt_app`: a single `QApplication` for the whole session, created unless one
+  already exists, for tests involving PySide6/Qt widgets.
+- `history_store`, `image_cache`, `fee_estimate_cache`, `connectivity_monitor`,
+  `stylesheet_registry`, `metrics_registry`, `task_scheduler` and `page_scope`:
+  a fresh instance of the singleton of the same name in every test, returned
+  to the tests taking the fixture.
+- `lazy_singletons`: resets `Cache`, `GuiThreadWatchdog`, `NodeStateTracker`,
+  `ServiceExecutor`, `SessionPool`, `SingleFlight` and `StartupTracer`, so that
+  each test creating one of them gets a new instance, released afterwards.
+- `settings_cache`: makes each test read the settings and keyring values it
+  mocks rather than values cached by earlier tests.
 """
 from __future__ import annotations
 
 import pytest
 from PySide6.QtWidgets import QApplication
 
+from src.utils.cache import Cache
+from src.utils.connectivity_monitor import ConnectivityMonitor
+from src.utils.fee_estimate_cache import FeeEstimateCache
+from src.utils.gui_thread_watchdog import GuiThreadWatchdog
+from src.utils.history_store import HistoryStore
+from src.utils.http_session import SessionPool
+from src.utils.image_cache import ImageCache
+from src.utils.keyring_storage import clear_cache as clear_keyring_cache
+from src.utils.local_store import local_store
+from src.utils.metrics import MetricsRegistry
+from src.utils.node_state import NodeStateTracker
+from src.utils.page_scope import PageScope
+from src.utils.service_executor import ServiceExecutor
+from src.utils.single_flight import SingleFlight
+from src.utils.startup_trace import StartupTracer
+from src.utils.stylesheet_registry import StylesheetRegistry
+from src.utils.task_scheduler import TaskScheduler
+
 
 @pytest.fixture(scope='session', autouse=True)
 def qt_app():
@@ -27,3 +46,101 @@ def qt_app():
         app = QApplication([])
     yield app
     app.quit()
+
+
+@pytest.fixture(autouse=True)
+def history_store(monkeypatch):
+    """Fixture giving each test an empty in-memory HistoryStore."""
+    store = HistoryStore(':memory:')
+    monkeypatch.setattr(HistoryStore, '_instance', store)
+    yield store
+    store.conn.close()
+
+
+@pytest.fixture(autouse=True)
+def image_cache(monkeypatch):
+    """Fixture giving each test an ImageCache kept in memory only."""
+    cache = ImageCache(None)
+    monkeypatch.setattr(ImageCache, '_instance', cache)
+    yield cache
+    cache.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def fee_estimate_cache(monkeypatch):
+    """Fixture giving each test an empty FeeEstimateCache."""
+    cache = FeeEstimateCache()
+    monkeypatch.setattr(FeeEstimateCache, '_instance', cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def connectivity_monitor(monkeypatch):
+    """Fixture giving each test its own ConnectivityMonitor, stopped afterwards."""
+    monitor = ConnectivityMonitor()
+    monkeypatch.setattr(ConnectivityMonitor, '_instance', monitor)
+    yield monitor
+    monitor.stop()
+
+
+@pytest.fixture(autouse=True)
+def stylesheet_registry(monkeypatch):
+    """Fixture giving each test an empty StylesheetRegistry."""
+    registry = StylesheetRegistry()
+    monkeypatch.setattr(StylesheetRegistry, '_instance', registry)
+    return registry
+
+
+@pytest.fixture(autouse=True)
+def metrics_registry(monkeypatch):
+    """Fixture giving each test an empty MetricsRegistry."""
+    registry = MetricsRegistry()
+    monkeypatch.setattr(MetricsRegistry, '_instance', registry)
+    return registry
+
+
+@pytest.fixture(autouse=True)
+def task_scheduler(monkeypatch):
+    """Fixture giving each test an idle TaskScheduler."""
+    scheduler = TaskScheduler()
+    monkeypatch.setattr(TaskScheduler, '_instance', scheduler)
+    return scheduler
+
+
+@pytest.fixture(autouse=True)
+def page_scope(monkeypatch):
+    """Fixture giving each test a PageScope with no current page."""
+    scope = PageScope()
+    monkeypatch.setattr(PageScope, '_instance', scope)
+    return scope
+
+
+@pytest.fixture(autouse=True)
+def lazy_singletons(monkeypatch):
+    """Fixture making the singletons created on first use start afresh in each test, released afterwards."""
+    monkeypatch.setattr(Cache, '_instance', None)
+    monkeypatch.setattr(GuiThreadWatchdog, '_instance', None)
+    monkeypatch.setattr(NodeStateTracker, '_instance', None)
+    monkeypatch.setattr(ServiceExecutor, '_instance', None)
+    monkeypatch.setattr(SessionPool, '_instance', None)
+    monkeypatch.setattr(SingleFlight, '_instance', None)
+    monkeypatch.setattr(StartupTracer, '_instance', None)
+    yield
+    if isinstance(Cache._instance, Cache):
+        Cache._instance.conn.close()
+    if isinstance(GuiThreadWatchdog._instance, GuiThreadWatchdog):
+        GuiThreadWatchdog._instance.stop()
+    if isinstance(ServiceExecutor._instance, ServiceExecutor):
+        ServiceExecutor._instance.shutdown()
+    if isinstance(SessionPool._instance, SessionPool):
+        SessionPool._instance.close_all()
+
+
+@pytest.fixture(autouse=True)
+def settings_cache():
+    """Fixture making each test read the settings and keyring values it mocks, not those cached by others."""
+    local_store.reload()
+    clear_keyring_cache()
+    yield
+    local_store.reload()
+    clear_keyring_cache()
@@ -6,6 +6,7 @@ import pytest
 
 from src.data.service.asset_detail_page_services import AssetDetailPageService
 from src.model.payments_model import ListPaymentResponseModel
+from src.model.payments_model import Payment
 from src.model.rgb_model import AssetBalanceResponseModel
 from src.model.rgb_model import AssetIdModel
 from src.model.rgb_model import ListOnAndOffChainTransfersWithBalance
@@ -282,9 +283,48 @@ def test_list_transfers_error(mocker, mock_rgb_repository, request_mock, mock_li
         ListTransfersRequestModel(asset_id=mocked_data_asset_id),
     )
 
-    # Verify other mocks were not called
-    mock_rgb_repository.get_asset_balance.assert_not_called()
-    mock_list_payment.assert_not_called()
+    # The other fetches run concurrently, the list_transfers error is still surfaced
+    mock_rgb_repository.get_asset_balance.assert_called_once_with(
+        AssetIdModel(asset_id=mocked_data_asset_id),
+    )
+    mock_list_payment.assert_called_once()
 
     # Assert the exception message
     assert str(exc_info.value) == 'Test error'
+
+
+def test_lightning_payments_filtered_by_asset(mocker, mock_list_transfers, mock_get_asset_balance, request_mock):
+    """case 8: Only the Lightning payments of the requested asset are returned"""
+    def make_payment(asset_id, payment_hash):
+        return Payment(
+            amt_msat=3000000,
+            asset_amount=10,
+            asset_id=asset_id,
+            payment_hash=payment_hash,
+            inbound=True,
+            status='Succeeded',
+            payee_pubkey='pubkey',
+            created_at=1717565000,
+            updated_at=1717565100,
+        )
+    mocker.patch(
+        'src.data.repository.payments_repository.PaymentRepository.list_payment',
+        return_value=ListPaymentResponseModel(
+            payments=[
+                make_payment(mocked_data_asset_id, 'own'),
+                make_payment('rgb:other-asset', 'other'),
+                None,
+            ],
+        ),
+    )
+    mock_list_transfers(mocked_data_list_no_transaction)
+    mock_get_asset_balance(mocked_data_asset_balance)
+
+    result = AssetDetailPageService.get_asset_transactions(
+        ListTransfersRequestModel(asset_id=mocked_data_asset_id),
+    )
+
+    assert [payment.payment_hash for payment in result.off_chain_transfers] == [
+        'own',
+    ]
+    assert result.off_chain_transfers[0].asset_amount_status == '+10'
@@ -0,0 +1,83 @@
+"""Unit tests for the fee estimate service."""
+# pylint: disable=redefined-outer-name,unused-argument
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from src.data.service.fee_estimate_service import FeeEstimateService
+from src.model.btc_model import EstimateFeeResponse
+from src.utils.constant import FAST_TRANSACTION_FEE_BLOCKS
+from src.utils.constant import MEDIUM_TRANSACTION_FEE_BLOCKS
+from src.utils.constant import SLOW_TRANSACTION_FEE_BLOCKS
+from src.utils.custom_exception import CommonException
+
+FEE_RATES = {
+    FAST_TRANSACTION_FEE_BLOCKS: 20.0,
+    MEDIUM_TRANSACTION_FEE_BLOCKS: 10.0,
+    SLOW_TRANSACTION_FEE_BLOCKS: 2.0,
+}
+
+
+def estimate_fee(request):
+    """Return the fee rate of the requested block target."""
+    if request.blocks not in FEE_RATES:
+        raise CommonException('Cannot estimate fees')
+    return EstimateFeeResponse(fee_rate=FEE_RATES[request.blocks])
+
+
+@pytest.fixture
+def mock_estimate_fee():
+    """Mock the estimate fee repository call."""
+    with patch(
+        'src.data.service.fee_estimate_service.BtcRepository.estimate_fee',
+        side_effect=estimate_fee,
+    ) as mock:
+        yield mock
+
+
+def test_get_fee_rate_fetches_all_targets_once(mock_estimate_fee, fee_estimate_cache):
+    """The first request fetches every block target; the others are served from the cache."""
+    response = FeeEstimateService.get_fee_rate(MEDIUM_TRANSACTION_FEE_BLOCKS)
+
+    assert response.fee_rate == 10.0
+    assert mock_estimate_fee.call_count == 3
+    assert fee_estimate_cache.is_fresh()
+
+    assert FeeEstimateService.get_fee_rate(
+        FAST_TRANSACTION_FEE_BLOCKS,
+    ).fee_rate == 20.0
+    assert FeeEstimateService.get_fee_rate(
+        SLOW_TRANSACTION_FEE_BLOCKS,
+    ).fee_rate == 2.0
+    assert mock_estimate_fee.call_count == 3
+
+
+def test_refresh_keeps_successful_targets(mock_estimate_fee, fee_estimate_cache):
+    """A failing block target does not prevent caching the others."""
+    fee_rates_without_slow = {
+        blocks: fee_rate for blocks, fee_rate in FEE_RATES.items()
+        if blocks != SLOW_TRANSACTION_FEE_BLOCKS
+    }
+    with patch.dict(FEE_RATES, fee_rates_without_slow, clear=True):
+        estimates = FeeEstimateService.refresh_fee_estimates()
+
+    assert isinstance(estimates[SLOW_TRANSACTION_FEE_BLOCKS], CommonException)
+    assert fee_estimate_cache.get(FAST_TRANSACTION_FEE_BLOCKS) == 20.0
+    assert fee_estimate_cache.get(SLOW_TRANSACTION_FEE_BLOCKS) is None
+
+
+def test_get_fee_rate_raises_target_error(mock_estimate_fee):
+    """The error of the requested block target reaches the caller."""
+    with patch.dict(FEE_RATES, {}, clear=True):
+        with pytest.raises(CommonException, match='Cannot estimate fees'):
+            FeeEstimateService.get_fee_rate(FAST_TRANSACTION_FEE_BLOCKS)
+
+
+def test_get_fee_rate_for_other_target(mock_estimate_fee, fee_estimate_cache):
+    """A block target outside the prefetched ones is fetched and cached on its own."""
+    with patch.dict(FEE_RATES, {3: 15.0}):
+        assert FeeEstimateService.get_fee_rate(3).fee_rate == 15.0
+    assert fee_estimate_cache.get(3) == 15.0
+    assert mock_estimate_fee.call_count == 4
@@ -182,3 +182,25 @@ def test_when_asset_exhausted(
     get_btc_balance.assert_called_once()
     wallet_type.assert_called_once()
     is_exhausted_asset_enabled.assert_called_once()
+
+
+def test_get_assets_when_btc_balance_fails(
+    mocker,
+    mock_get_asset,
+    mock_refresh_transfer,
+    mock_get_wallet_type,
+):
+    """Test that a failure of a concurrent call is surfaced by the service"""
+    mock_refresh_transfer(RefreshTransferResponseModel(status=True))
+    get_asset = mock_get_asset(mock_get_asset_response_model)
+    mock_get_wallet_type(WalletType.EMBEDDED_TYPE_WALLET)
+    mocker.patch(
+        'src.data.repository.btc_repository.BtcRepository.get_btc_balance',
+        side_effect=CommonException('Balance unavailable'),
+    )
+
+    with pytest.raises(CommonException) as exc_info:
+        MainAssetPageDataService.get_assets()
+
+    assert exc_info.value.message == 'Balance unavailable'
+    get_asset.assert_called_once()
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
+from PySide6.QtCore import QAbstractAnimation
 from PySide6.QtCore import QEvent
 from PySide6.QtCore import QPoint
 from PySide6.QtCore import QSize
@@ -16,7 +17,6 @@ from PySide6.QtGui import QCloseEvent
 from PySide6.QtGui import QEnterEvent
 from PySide6.QtGui import QPixmap
 from PySide6.QtGui import QPointingDevice
-from PySide6.QtTest import QTest
 from PySide6.QtWidgets import QMainWindow
 from PySide6.QtWidgets import QWidget
 
@@ -41,8 +41,8 @@ def toaster_ui(qtbot, mock_main_window):
     # Mock ToasterManager to prevent repositioning during tests
     ToasterManager.reposition_toasters = MagicMock()
 
-    # Stop the timer from automatically starting
-    with patch('PySide6.QtCore.QTimer.start'):
+    # Stop the progress animation from automatically starting
+    with patch('PySide6.QtCore.QPropertyAnimation.start'):
         toaster = ToasterUi(description='Test Description', duration=5000)
         toaster.show()
         qtbot.waitExposed(toaster)
@@ -80,10 +80,9 @@ def test_toaster_progress_update(toaster_ui, qtbot):
     toaster = toaster_ui
     toaster.show_toast()  # Show the toaster
 
-    # Manually trigger the progress update without relying on real time
-    toaster.elapsed_timer.restart()  # Restart the timer
+    # Run the progress animation for a short while
+    toaster.progress_animation.start()
     qtbot.wait(100)
-    toaster.update_progress()  # Update the progress bar
 
     # Check if the progress is less than 100, as the progress should have decreased
     assert toaster.progress_bar.value() < 100
@@ -177,9 +176,9 @@ def test_wrap_resize_event(toaster_ui):
 
 
 def test_toaster_close_event(toaster_ui, qtbot):
-    """Test that the close event stops the timer and properly closes the toaster."""
+    """Test that the close event stops the progress and properly closes the toaster."""
     toaster = toaster_ui
-    toaster.timer.start(1000)  # Start the timer
+    toaster.progress_animation.start()  # Start the progress
 
     # Create an actual QCloseEvent instance (not a MagicMock)
     mock_event = QCloseEvent()
@@ -187,16 +186,16 @@ def test_toaster_close_event(toaster_ui, qtbot):
     # Call the close event with the QCloseEvent
     toaster.closeEvent(mock_event)
 
-    # Assert that the timer was stopped
-    assert not toaster.timer.isActive()
+    # Assert that the progress was stopped
+    assert toaster.progress_animation.state() == QAbstractAnimation.State.Stopped
     # Ensure the close event of the parent was called (you can check for other behaviors as needed)
     assert toaster.isVisible() is False
 
 
 def test_toaster_enter_event(toaster_ui, qtbot):
-    """Test that entering the toaster stops the timer and sets the progress bar to 100."""
+    """Test that entering the toaster stops the progress and sets the progress bar to 100."""
     toaster = toaster_ui
-    toaster.timer.start(1000)  # Start the timer
+    toaster.progress_animation.start()  # Start the progress
     toaster.progress_bar.setValue(50)  # Set some progress initially
 
     # Create start and end points for the event (using QPoint or QPointF)
@@ -214,49 +213,47 @@ def test_toaster_enter_event(toaster_ui, qtbot):
     # Trigger the enter event
     toaster.enterEvent(mock_event)
 
-    # Assert that the timer was stopped and progress bar was set to 100
-    assert toaster.timer.isActive() is False
+    # Assert that the progress was stopped and progress bar was set to 100
+    assert toaster.progress_animation.state() == QAbstractAnimation.State.Stopped
     assert toaster.progress_bar.value() == 100
 
 
 def test_toaster_leave_event(toaster_ui, qtbot):
-    """Test that leaving the toaster restarts the timer and the progress updates."""
+    """Test that leaving the toaster restarts the progress from full."""
     toaster = toaster_ui
-    toaster.timer.start(1000)  # Start the timer
+    toaster.progress_animation.stop()  # Stop the progress
     toaster.progress_bar.setValue(50)  # Set some progress initially
 
     # Simulate the leave event (user stops hovering)
     mock_event = QEvent(QEvent.Leave)
     toaster.leaveEvent(mock_event)
 
-    # Assert that the timer was restarted
-    assert toaster.timer.isActive() is True
-    # Check that the progress bar is updated (or will be updated when the timer ticks)
-    # This depends on your progress update logic
-    assert toaster.progress_bar.value() == 50
+    # Assert that the progress was restarted from the start value
+    assert toaster.progress_animation.state() == QAbstractAnimation.State.Running
+    assert toaster.progress_bar.value() == 100
+    toaster.progress_animation.stop()
 
 
-def test_update_progress(toaster_ui, qtbot):
-    """Test the progress bar update functionality and toaster close logic."""
+def test_progress_animation(toaster_ui, qtbot):
+    """Test the progress bar animation and toaster close logic."""
     toaster = toaster_ui
+    animation = toaster.progress_animation
 
-    # Set initial progress to 100
-    toaster.progress_bar.setValue(100)
+    # The animation drives the progress bar value over the toaster duration
+    assert animation.targetObject() is toaster.progress_bar
+    assert animation.propertyName() == b'value'
+    assert animation.duration() == toaster.duration
 
-    # Start the timer and force an elapsed time
-    toaster.elapsed_timer.restart()
-    QTest.qWait(100)  # Short wait to ensure timer has started
+    animation.start()
 
     # Simulate elapsed time being half of duration
-    with patch.object(toaster.elapsed_timer, 'elapsed', return_value=toaster.duration / 2):
-        toaster.update_progress()
-        assert toaster.progress_bar.value() == 50  # Should be at 50% progress
+    animation.setCurrentTime(toaster.duration // 2)
+    assert toaster.progress_bar.value() == 50  # Should be at 50% progress
 
     # Simulate elapsed time being full duration
-    with patch.object(toaster.elapsed_timer, 'elapsed', return_value=toaster.duration):
-        toaster.update_progress()
-        assert toaster.progress_bar.value() == 0  # Should be at 0% progress
-        assert not toaster.isVisible()  # Should be closed
+    animation.setCurrentTime(toaster.duration)
+    assert toaster.progress_bar.value() == 0  # Should be at 0% progress
+    assert not toaster.isVisible()  # Should be closed
     # Ensure toaster is not displayed
     assert not toaster.isVisible()  # Confirm toaster is not visible
 
@@ -279,7 +276,7 @@ def test_toaster_positioning(mock_main_window, qtbot):
         description='Test Description',
         parent=mock_main_window, duration=5000,
     )
-    toaster.timer.stop()  # Stop the auto-close timer
+    toaster.progress_animation.stop()  # Stop the auto-close progress
     qtbot.addWidget(toaster)
 
     # Calculate expected position
@@ -348,7 +345,7 @@ def test_multiple_toasters_positioning(mock_main_window, qtbot):
             parent=mock_main_window,
             duration=5000,
         )
-        toaster.timer.stop()  # Stop auto-close timer
+        toaster.progress_animation.stop()  # Stop auto-close progress
 
         # Calculate expected position for this toaster
         x = window_size.width() - toaster.width() - 20
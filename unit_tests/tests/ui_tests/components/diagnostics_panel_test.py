@@ -0,0 +1,79 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument
+"""Unit tests for the DiagnosticsPanel class."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from src.views.components.diagnostics_panel import DiagnosticsPanel
+from src.views.components.diagnostics_panel import format_metrics
+
+
+@pytest.fixture
+def diagnostics_panel(qtbot):
+    """Fixture to create a DiagnosticsPanel instance."""
+    panel = DiagnosticsPanel()
+    qtbot.addWidget(panel)
+    return panel
+
+
+def test_format_metrics(metrics_registry):
+    """Endpoints are listed by call count, with pages, queue waits and components."""
+    metrics_registry.set_current_page('ChannelManagement')
+    metrics_registry.record_request('GET', '/nodeinfo', 0.01)
+    metrics_registry.record_request('GET', '/listchannels', 0.02)
+    metrics_registry.record_request('GET', '/listchannels', 0.03)
+    metrics_registry.record_queue_wait('thread_manager', 0.001)
+    metrics_registry.register_source('node', lambda: {'time_to_ready_s': None})
+
+    text = format_metrics(metrics_registry.snapshot())
+
+    lines = text.splitlines()
+    assert lines[1].startswith('/listchannels')
+    assert lines[2].startswith('/nodeinfo')
+    assert 'ChannelManagement' in text
+    assert 'thread_manager' in text
+    assert 'time_to_ready_s' in text
+
+
+def test_toggle_refreshes_metrics(diagnostics_panel, metrics_registry):
+    """Showing the panel displays the current metrics; toggling again hides it."""
+    metrics_registry.record_request('POST', '/listassets', 0.01)
+
+    diagnostics_panel.toggle()
+    assert not diagnostics_panel.isHidden()
+    assert '/listassets' in diagnostics_panel.metrics_text.toPlainText()
+
+    diagnostics_panel.toggle()
+    assert diagnostics_panel.isHidden()
+
+
+def test_export_metrics(diagnostics_panel, tmp_path):
+    """Metrics are written to the chosen file, and nothing is written when cancelled."""
+    path = tmp_path / 'metrics.json'
+    with patch(
+        'src.views.components.diagnostics_panel.QFileDialog.getSaveFileName',
+        return_value=(str(path), ''),
+    ):
+        diagnostics_panel.export_metrics()
+    assert path.exists()
+
+    with patch(
+        'src.views.components.diagnostics_panel.QFileDialog.getSaveFileName',
+        return_value=('', ''),
+    ), patch('src.views.components.diagnostics_panel.MetricsRegistry.export_json') as mock_export:
+        diagnostics_panel.export_metrics()
+    mock_export.assert_not_called()
+
+
+def test_export_metrics_error(diagnostics_panel, tmp_path):
+    """A failed export is reported with a toast."""
+    with patch(
+        'src.views.components.diagnostics_panel.QFileDialog.getSaveFileName',
+        return_value=(str(tmp_path / 'missing' / 'metrics.json'), ''),
+    ), patch('src.views.components.diagnostics_panel.ToastManager.show_toast') as mock_toast:
+        diagnostics_panel.export_metrics()
+    mock_toast.assert_called_once()
@@ -267,3 +267,14 @@ def test_set_button_visibility(header_frame):
     # Assertions to check if the buttons are not visible
     assert header_frame.action_button.isVisible() is False
     assert header_frame.refresh_page_button.isVisible() is False
+
+
+def test_new_header_shows_known_connection_error(connectivity_monitor):
+    """Test that a new header shows the connection error already detected by the monitor."""
+    connectivity_monitor.is_connected = False
+    with patch.object(HeaderFrame, 'handle_network_frame_visibility') as mock_handle, \
+            patch('src.data.repository.setting_repository.SettingRepository.is_backup_configured') as mock_is_backup_configured:
+        mock_is_backup_configured.return_value.is_backup_configured = True
+        HeaderFrame('Test Title', 'test_logo.png')
+
+    mock_handle.assert_called_once_with(False)
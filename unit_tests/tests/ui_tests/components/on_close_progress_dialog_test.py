@@ -28,10 +28,17 @@ from src.views.ui_restore_mnemonic import RestoreMnemonicWidget
 
 @pytest.fixture
 def on_close_progress_dialog_widget(qtbot):
-    """Fixture to create and return an instance of OnCloseDialogBox."""
-    widget = OnCloseDialogBox()
-    qtbot.addWidget(widget)
-    return widget
+    """Fixture to create and return an instance of OnCloseDialogBox.
+
+    Closing the dialog exits the application, which would make every event loop
+    of the following tests return at once, so exiting is mocked until the
+    dialog is closed at the end of the test.
+    """
+    with patch.object(QApplication, 'exit'):
+        widget = OnCloseDialogBox()
+        yield widget
+        widget.close()
+        widget.deleteLater()
 
 
 @patch.object(OnCloseDialogBox, '_close_node_app')
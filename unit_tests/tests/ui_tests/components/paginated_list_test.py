@@ -0,0 +1,114 @@
+"""Unit test for paginated row loader component."""
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked objects in test functions
+# pylint: disable=redefined-outer-name,unused-argument,protected-access
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from PySide6.QtWidgets import QGridLayout
+from PySide6.QtWidgets import QLabel
+from PySide6.QtWidgets import QScrollArea
+from PySide6.QtWidgets import QSpacerItem
+from PySide6.QtWidgets import QWidget
+
+from src.utils.constant import TRANSACTION_LIST_LOAD_THRESHOLD_PX
+from src.views.components.paginated_list import PaginatedRowLoader
+
+
+@pytest.fixture
+def scroll_area():
+    """Fixture to create a scroll area with a grid layout."""
+    area = QScrollArea()
+    contents = QWidget()
+    area.layout_ = QGridLayout(contents)
+    area.setWidget(contents)
+    return area
+
+
+@pytest.fixture
+def row_loader(scroll_area):
+    """Fixture to create a loader creating label rows three at a time."""
+    create_row = MagicMock(side_effect=lambda item: QLabel(str(item)))
+    return PaginatedRowLoader(scroll_area, scroll_area.layout_, create_row, page_size=3)
+
+
+def test_set_items_creates_first_page(row_loader):
+    """Only the first page of rows is created, followed by a spacer."""
+    row_loader.set_items(range(10))
+
+    assert row_loader.create_row.call_count == 3
+    assert row_loader.loaded_count == 3
+    assert row_loader.has_more
+    layout = row_loader.layout
+    assert layout.count() == 4
+    assert layout.itemAtPosition(2, 0).widget().text() == '2'
+    assert isinstance(layout.itemAtPosition(3, 0), QSpacerItem)
+
+
+def test_load_next_page_moves_spacer(row_loader):
+    """Loading the next page appends rows and keeps a single spacer after them."""
+    row_loader.set_items(range(5))
+    row_loader.load_next_page()
+
+    assert row_loader.loaded_count == 5
+    assert not row_loader.has_more
+    layout = row_loader.layout
+    assert layout.count() == 6
+    assert layout.itemAtPosition(4, 0).widget().text() == '4'
+    assert isinstance(layout.itemAtPosition(5, 0), QSpacerItem)
+
+
+def test_scroll_near_bottom_loads_next_page(row_loader):
+    """Scrolling close to the bottom loads more rows, scrolling elsewhere does not."""
+    row_loader.set_items(range(10))
+    scroll_bar = row_loader.scroll_area.verticalScrollBar()
+    scroll_bar.setMaximum(1000)
+
+    row_loader.on_scroll(0)
+    assert row_loader.loaded_count == 3
+
+    row_loader.on_scroll(1000 - TRANSACTION_LIST_LOAD_THRESHOLD_PX)
+    assert row_loader.loaded_count == 6
+
+
+def test_clear_removes_spacer(row_loader):
+    """Clearing forgets the items and removes the spacer."""
+    row_loader.set_items(range(2))
+    row_loader.clear()
+
+    assert row_loader.items == []
+    assert row_loader.spacer is None
+    assert all(
+        not isinstance(row_loader.layout.itemAt(i), QSpacerItem)
+        for i in range(row_loader.layout.count())
+    )
+
+
+def test_short_first_page_keeps_loading_until_viewport_is_filled(qtbot, scroll_area):
+    """Pages keep loading while the rows do not fill the viewport, then stop."""
+    scroll_area.setWidgetResizable(True)
+    scroll_area.resize(300, 400)
+    loader = PaginatedRowLoader(
+        scroll_area, scroll_area.layout_,
+        lambda item: QLabel(str(item)), page_size=3,
+    )
+    qtbot.addWidget(scroll_area)
+    scroll_area.show()
+
+    loader.set_items(range(200))
+
+    scroll_bar = scroll_area.verticalScrollBar()
+    qtbot.waitUntil(lambda: scroll_bar.maximum() > 0, timeout=2000)
+    qtbot.wait(50)
+    assert 3 < loader.loaded_count < 200
+    assert loader.has_more
+
+
+def test_hidden_list_loads_a_single_page(qtbot, row_loader):
+    """Pages are not loaded ahead while the list is not shown."""
+    row_loader.set_items(range(10))
+    qtbot.wait(20)
+
+    assert row_loader.loaded_count == 3
@@ -451,3 +451,14 @@ def test_announce_alias_custom(about_widget, mocker, mock_node_info_widget, mock
         call.kwargs.get('v_layout') == about_widget.about_vertical_layout
         for call in mock_node_info_widget.call_args_list
     ), 'Expected a NodeInfoWidget call with announce_alias translation key'
+
+
+def test_diagnostics_shortcut_toggles_panel(about_widget):
+    """The diagnostics panel is hidden until its shortcut is activated."""
+    assert about_widget.diagnostics_panel.isHidden()
+
+    about_widget.diagnostics_shortcut.activated.emit()
+    assert not about_widget.diagnostics_panel.isHidden()
+
+    about_widget.diagnostics_shortcut.activated.emit()
+    assert about_widget.diagnostics_panel.isHidden()
@@ -18,6 +18,7 @@ from PySide6.QtWidgets import QSpacerItem
 from PySide6.QtWidgets import QVBoxLayout
 from PySide6.QtWidgets import QWidget
 
+from src.data.service.asset_detail_page_services import AssetDetailPageService
 from src.model.enums.enums_model import AssetType
 from src.model.enums.enums_model import NetworkEnumModel
 from src.model.enums.enums_model import ToastPreset
@@ -26,6 +27,7 @@ from src.model.enums.enums_model import WalletType
 from src.model.rgb_model import RgbAssetPageLoadModel
 from src.utils.constant import IRIS_WALLET_TRANSLATIONS_CONTEXT
 from src.utils.info_message import INFO_FAUCET_NOT_AVAILABLE
+from src.viewmodels.rgb_25_view_model import RGB25ViewModel
 from src.views.ui_fungible_asset import FungibleAssetWidget
 
 
@@ -467,6 +469,35 @@ def test_handle_asset_frame_click(create_fungible_asset_widget):
     widget._view_model.page_navigation.bitcoin_page.assert_not_called()
 
 
+def test_asset_click_loads_transactions_on_detail_page(create_fungible_asset_widget, page_scope, task_scheduler, qtbot):
+    """Clicking an RGB asset loads its transactions, although entering the detail page cancels the previous page's tasks."""
+    widget = create_fungible_asset_widget
+    rgb25_view_model = RGB25ViewModel(page_navigation=MagicMock())
+    widget._view_model.rgb25_view_model = rgb25_view_model
+    # Like PageNavigation, entering the detail page cancels the page-scoped tasks
+    widget._view_model.page_navigation.rgb25_detail_page.side_effect = lambda _: page_scope.enter(
+        'RGB25Detail',
+    )
+    txn_list_loaded = MagicMock()
+    is_loading = MagicMock()
+    rgb25_view_model.txn_list_loaded.connect(txn_list_loaded)
+    rgb25_view_model.is_loading.connect(is_loading)
+    page_scope.enter('FungibleAssets')
+
+    with patch.object(AssetDetailPageService, 'get_asset_transactions', return_value=MagicMock()):
+        widget.handle_asset_frame_click(
+            'rgb_asset_id', 'RGB Asset', ':/assets/rgb.png', AssetType.RGB20.value,
+        )
+        assert task_scheduler.wait_for_done(5000)
+        qtbot.waitUntil(lambda: txn_list_loaded.called, timeout=2000)
+
+    txn_list_loaded.assert_called_once_with(
+        'rgb_asset_id', 'RGB Asset', ':/assets/rgb.png', AssetType.RGB20.value,
+    )
+    is_loading.assert_called_once_with(False)
+    assert page_scope.cancelled_tasks == 0
+
+
 def test_create_fungible_card(create_fungible_asset_widget, qtbot):
     """Test that create_fungible_card creates and configures the fungible card correctly."""
     widget = create_fungible_asset_widget
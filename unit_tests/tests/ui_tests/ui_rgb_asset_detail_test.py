@@ -225,15 +225,15 @@ def test_set_transaction_detail_frame(rgb_asset_detail_widget: RGBAssetDetailWid
     assert rgb_asset_detail_widget.widget_title_asset_name.text() == asset_name
 
     # Verify that the transaction detail frame was configured correctly
+    # One transaction frame + one spacer item, the spacer of the first load is not left behind
+    assert rgb_asset_detail_widget.scroll_area_widget_layout.count() == 2
     transaction_detail_frame: QWidget | None = rgb_asset_detail_widget.scroll_area_widget_layout.itemAt(
         0,
     ).widget()
-    if transaction_detail_frame:
-        assert transaction_detail_frame.transaction_amount.text() == '1000'
-        assert transaction_detail_frame.transaction_type.text(
-        ) == TransferStatusEnumModel.SENT.value
-        assert transaction_detail_frame.transaction_amount.text(
-        ) == mock_transaction.amount_status
+    assert transaction_detail_frame is not None
+    assert transaction_detail_frame.transaction_amount.text() == '1000'
+    assert transaction_detail_frame.transaction_amount.text(
+    ) == mock_transaction.amount_status
 
 
 @patch('src.views.ui_rgb_asset_detail.convert_hex_to_image')
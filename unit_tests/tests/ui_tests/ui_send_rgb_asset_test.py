@@ -16,7 +16,6 @@ from src.model.rgb_model import Balance
 from src.model.rgb_model import ListTransferAssetWithBalanceResponseModel
 from src.utils.constant import IRIS_WALLET_TRANSLATIONS_CONTEXT
 from src.utils.custom_exception import CommonException
-from src.utils.error_message import ERROR_SEND_ASSET
 from src.utils.error_message import ERROR_UNEXPECTED
 from src.viewmodels.main_view_model import MainViewModel
 from src.views.ui_send_rgb_asset import SendRGBAssetWidget
@@ -259,100 +258,43 @@ def test_send_rgb_asset_button_success(send_rgb_asset_widget: SendRGBAssetWidget
         return_value=mock_default_min_confirmation,
     )
 
-    # Mock the decoded RGB invoice response
-    mock_decoded_rgb_invoice = MagicMock()
-    mock_decoded_rgb_invoice.recipient_id = 'recipient_id'
-    mock_decoded_rgb_invoice.transport_endpoints = 'some_endpoints'
-    mocker.patch(
-        'src.data.repository.rgb_repository.RgbRepository.decode_invoice',
-        return_value=mock_decoded_rgb_invoice,
-    )
-
-    # Mock the on_send_click method
-    mock_on_send_click = MagicMock()
-    send_rgb_asset_widget._view_model.rgb25_view_model.on_send_click = mock_on_send_click
+    # Mock the on_send_invoice_click method, which decodes the invoice in a thread
+    mock_on_send_invoice_click = MagicMock()
+    send_rgb_asset_widget._view_model.rgb25_view_model.on_send_invoice_click = mock_on_send_invoice_click
 
-    # Mock ToastManager to prevent actual toast displays
-    mock_toast_manager = MagicMock()
-    send_rgb_asset_widget.ToastManager = mock_toast_manager
+    # Use patch to mock ToastManager
+    with patch('src.views.ui_send_rgb_asset.ToastManager') as mock_toast_manager:
+        # Simulate the button click
+        send_rgb_asset_widget.send_rgb_asset_button()
 
-    # Simulate the button click
-    send_rgb_asset_widget.send_rgb_asset_button()
+        # Verify that no error toast was shown
+        mock_toast_manager.error.assert_not_called()
 
     # Verify loading_performer is set correctly
     assert send_rgb_asset_widget.loading_performer == 'SEND_BUTTON'
 
-    # Verify that the on_send_click method was called with the correct parameters
-    mock_on_send_click.assert_called_once_with(
-        '10', 'recipient_id', 'some_endpoints', '0.01', 1,
+    # Verify that the invoice is handed to the view model with the correct parameters
+    mock_on_send_invoice_click.assert_called_once_with(
+        'some_invoice', '10', '0.01', 1,
     )
 
-    # Verify that no error toast was shown
-    mock_toast_manager.error.assert_not_called()
-
 
-def test_send_rgb_asset_button_decode_error(send_rgb_asset_widget: SendRGBAssetWidget, mocker):
-    """Test the send_rgb_asset_button method when decode invoice fails."""
+def test_send_rgb_asset_button_min_confirmation_error(send_rgb_asset_widget: SendRGBAssetWidget, mocker):
+    """Test the send_rgb_asset_button method when reading the minimum confirmation fails."""
 
     # Mock the required objects and methods
     mock_send_rgb_asset_page = MagicMock()
     send_rgb_asset_widget.send_rgb_asset_page = mock_send_rgb_asset_page
-
-    # Mock the text fields
-    mock_send_rgb_asset_page.asset_address_value.text.return_value = 'invalid_invoice'
-
-    # Mock RgbRepository.decode_invoice to raise CommonException
-    mock_error = CommonException('Invalid invoice')
-    mocker.patch(
-        'src.data.repository.rgb_repository.RgbRepository.decode_invoice',
-        side_effect=mock_error,
-    )
-
-    # Use patch to mock ToastManager
-    with patch('src.views.ui_send_rgb_asset.ToastManager') as mock_toast_manager:
-        # Simulate the button click
-        send_rgb_asset_widget.send_rgb_asset_button()
-
-        # Verify error toast was shown with correct message
-        mock_toast_manager.error.assert_called_once_with(
-            description=ERROR_UNEXPECTED.format(str(mock_error.message)),
-        )
-        mock_toast_manager.success.assert_not_called()
-
-
-def test_send_rgb_asset_button_send_error(send_rgb_asset_widget: SendRGBAssetWidget, mocker):
-    """Test the send_rgb_asset_button method when send fails."""
-
-    # Mock the required objects and methods
-    mock_send_rgb_asset_page = MagicMock()
-    send_rgb_asset_widget.send_rgb_asset_page = mock_send_rgb_asset_page
-
-    # Mock the text fields
     mock_send_rgb_asset_page.asset_address_value.text.return_value = 'some_invoice'
-    mock_send_rgb_asset_page.asset_amount_value.text.return_value = '10'
-    mock_send_rgb_asset_page.fee_rate_value.text.return_value = '0.01'
 
-    # Mock minimum confirmation
-    mock_default_min_confirmation = MagicMock()
-    mock_default_min_confirmation.min_confirmation = 1
+    # Mock SettingCardRepository.get_default_min_confirmation to raise CommonException
+    mock_error = CommonException('Unable to read setting')
     mocker.patch(
         'src.data.repository.setting_card_repository.SettingCardRepository.get_default_min_confirmation',
-        return_value=mock_default_min_confirmation,
-    )
-
-    # Mock successful decode invoice
-    mock_decoded_rgb_invoice = MagicMock()
-    mock_decoded_rgb_invoice.recipient_id = 'recipient_id'
-    mock_decoded_rgb_invoice.transport_endpoints = 'some_endpoints'
-    mocker.patch(
-        'src.data.repository.rgb_repository.RgbRepository.decode_invoice',
-        return_value=mock_decoded_rgb_invoice,
+        side_effect=mock_error,
     )
-
-    # Mock on_send_click to raise CommonException
-    mock_error = CommonException('Send failed')
-    mock_on_send_click = MagicMock(side_effect=mock_error)
-    send_rgb_asset_widget._view_model.rgb25_view_model.on_send_click = mock_on_send_click
+    mock_on_send_invoice_click = MagicMock()
+    send_rgb_asset_widget._view_model.rgb25_view_model.on_send_invoice_click = mock_on_send_invoice_click
 
     # Use patch to mock ToastManager
     with patch('src.views.ui_send_rgb_asset.ToastManager') as mock_toast_manager:
@@ -361,9 +303,9 @@ def test_send_rgb_asset_button_send_error(send_rgb_asset_widget: SendRGBAssetWid
 
         # Verify error toast was shown with correct message
         mock_toast_manager.error.assert_called_once_with(
-            description=ERROR_SEND_ASSET.format(str(mock_error)),
+            description=ERROR_UNEXPECTED.format(str(mock_error.message)),
         )
-        mock_toast_manager.success.assert_not_called()
+    mock_on_send_invoice_click.assert_not_called()
 
 
 def test_handle_spendable_balance_validation_show_when_zero(send_rgb_asset_widget: SendRGBAssetWidget, mocker):
@@ -10,7 +10,19 @@ import time
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+from src.data.repository.btc_repository import BtcRepository
+from src.data.repository.rgb_repository import RgbRepository
+from src.model.rgb_model import FilterAssetRequestModel
 from src.utils.cache import Cache
+from src.utils.constant import CACHE_KEY_BITCOIN_TRANSACTIONS
+from src.utils.constant import CACHE_KEY_MAIN_ASSET
+from src.utils.constant import CACHE_KEY_UNSPENT_LIST
+from src.utils.endpoints import CREATE_UTXO_ENDPOINT
+from src.utils.endpoints import KEY_SEND_ENDPOINT
+from src.utils.endpoints import LIST_ASSETS_ENDPOINT
+from src.utils.endpoints import NODE_INFO_ENDPOINT
+from src.utils.endpoints import RESTORE_ENDPOINT
+from src.utils.request import Request
 
 
 @patch('src.utils.cache.Cache._connect_db')
@@ -184,3 +196,220 @@ def test_report_cache_error(mock_connect_db):
             cache = Cache()
             cache._report_cache_error('cache_fetch_failed')
             mock_event.emit.assert_called_once_with('')
+
+
+def make_memory_cache(**kwargs):
+    """Create a cache backed by an in-memory SQLite database."""
+    with patch.object(Cache, '_connect_db', return_value=sqlite3.connect(':memory:', check_same_thread=False)):
+        return Cache(db_name='test.db', file_path=':memory:', **kwargs)
+
+
+def test_fetch_cache_served_from_memory():
+    """Test that a cached value is read from memory without querying SQLite."""
+    cache = make_memory_cache()
+    cache.on_success('memory_key', {'result': 'success'})
+    cache.conn = MagicMock()
+
+    data, valid = cache.fetch_cache('memory_key')
+
+    assert data == {'result': 'success'}
+    assert valid is True
+    cache.conn.cursor.assert_not_called()
+    assert cache.get_stats()['memory_hits'] == 1
+
+
+def test_fetch_cache_returns_copies():
+    """Test that every read gets its own copy so callers can mutate results."""
+    cache = make_memory_cache()
+    cache.on_success('copy_key', [1, 2, 3])
+
+    first, _ = cache.fetch_cache('copy_key')
+    first.reverse()
+    second, _ = cache.fetch_cache('copy_key')
+
+    assert second == [1, 2, 3]
+
+
+def test_fetch_cache_populates_memory_from_disk():
+    """Test that a disk hit is promoted to the memory tier."""
+    cache = make_memory_cache()
+    cache.on_success('disk_key', 'value')
+    cache._memory.clear()
+
+    assert cache.fetch_cache('disk_key') == ('value', True)
+    assert cache.fetch_cache('disk_key') == ('value', True)
+
+    stats = cache.get_stats()
+    assert stats['disk_hits'] == 1
+    assert stats['memory_hits'] == 1
+
+
+def test_fetch_cache_counts_misses():
+    """Test that missing keys are counted as misses."""
+    cache = make_memory_cache()
+    assert cache.fetch_cache('missing_key') == (None, False)
+    assert cache.get_stats()['misses'] == 1
+
+
+def test_memory_tier_evicts_least_recently_used_entry():
+    """Test that the memory tier is bounded by entry count."""
+    cache = make_memory_cache(memory_max_entries=2)
+    cache.on_success('first', 1)
+    cache.on_success('second', 2)
+    cache.fetch_cache('first')
+    cache.on_success('third', 3)
+
+    assert list(cache._memory) == ['first', 'third']
+    assert cache.get_stats()['evictions'] == 1
+
+
+def test_memory_tier_bounded_by_size():
+    """Test that the memory tier is bounded by serialized size."""
+    cache = make_memory_cache(memory_max_bytes=200)
+    cache.on_success('small', 'x')
+    cache.on_success('large', 'y' * 500)
+
+    assert 'large' not in cache._memory
+    assert cache.get_stats()['memory_bytes'] <= 200
+    assert cache.fetch_cache('large') == ('y' * 500, True)
+
+
+def test_invalidate_cache_marks_memory_entries():
+    """Test that invalidation applies to the memory tier."""
+    cache = make_memory_cache()
+    cache.on_success('first', 1)
+    cache.on_success('second', 2)
+
+    cache.invalidate_cache('first')
+    assert cache.fetch_cache('first') == (1, False)
+    assert cache.fetch_cache('second') == (2, True)
+
+    cache.invalidate_cache()
+    assert cache.fetch_cache('second') == (2, False)
+
+
+def test_expire_after_per_key():
+    """Test that keys can have their own expiration timeout."""
+    cache = make_memory_cache(
+        expire_after=600, expire_after_per_key={'short': 10},
+    )
+    cache.on_success('short', 'a')
+    cache.on_success('default', 'b')
+
+    with patch('src.utils.cache.time.time', return_value=time.time() + 60):
+        assert cache.fetch_cache('short') == ('a', False)
+        assert cache.fetch_cache('default') == ('b', True)
+
+    cache.set_expire_after('default', 30)
+    assert cache.get_expire_after('default') == 30
+
+
+def test_get_keys_affected_by():
+    """Test that mutating endpoints map to the cache keys built from the reads they change."""
+    assert Cache.get_keys_affected_by(KEY_SEND_ENDPOINT) == [
+        CACHE_KEY_MAIN_ASSET,
+    ]
+    assert set(Cache.get_keys_affected_by(CREATE_UTXO_ENDPOINT)) == {
+        CACHE_KEY_MAIN_ASSET,
+        CACHE_KEY_BITCOIN_TRANSACTIONS,
+        CACHE_KEY_UNSPENT_LIST,
+    }
+    assert Cache.get_keys_affected_by(NODE_INFO_ENDPOINT) is None
+
+
+def test_invalidate_for_endpoint_is_targeted():
+    """Test that only the affected keys are invalidated."""
+    cache = make_memory_cache()
+    cache.on_success(CACHE_KEY_MAIN_ASSET, 'assets')
+    cache.on_success(CACHE_KEY_BITCOIN_TRANSACTIONS, 'transactions')
+    cache.on_success(CACHE_KEY_UNSPENT_LIST, 'unspent')
+
+    cache.invalidate_for_endpoint(KEY_SEND_ENDPOINT)
+
+    assert cache.fetch_cache(CACHE_KEY_MAIN_ASSET) == ('assets', False)
+    assert cache.fetch_cache(
+        CACHE_KEY_BITCOIN_TRANSACTIONS,
+    ) == ('transactions', True)
+    assert cache.fetch_cache(CACHE_KEY_UNSPENT_LIST) == ('unspent', True)
+
+
+def test_invalidate_for_unknown_endpoint_invalidates_all():
+    """Test that an endpoint without declared dependencies invalidates everything."""
+    cache = make_memory_cache()
+    cache.on_success(CACHE_KEY_MAIN_ASSET, 'assets')
+    cache.on_success(CACHE_KEY_UNSPENT_LIST, 'unspent')
+
+    cache.invalidate_for_endpoint(RESTORE_ENDPOINT)
+
+    assert cache.fetch_cache(CACHE_KEY_MAIN_ASSET) == ('assets', False)
+    assert cache.fetch_cache(CACHE_KEY_UNSPENT_LIST) == ('unspent', False)
+
+
+def test_read_only_scope_refuses_global_invalidation():
+    """Test that a read-only call cannot invalidate all entries, but can invalidate one key."""
+    cache = make_memory_cache()
+    cache.on_success(CACHE_KEY_MAIN_ASSET, 'assets')
+    cache.on_success(CACHE_KEY_UNSPENT_LIST, 'unspent')
+
+    with Cache.read_only_scope():
+        cache.invalidate_cache()
+        cache.invalidate_for_endpoint(CREATE_UTXO_ENDPOINT)
+        cache.invalidate_cache(CACHE_KEY_UNSPENT_LIST)
+
+    assert cache.fetch_cache(CACHE_KEY_MAIN_ASSET) == ('assets', True)
+    assert cache.fetch_cache(CACHE_KEY_UNSPENT_LIST) == ('unspent', False)
+    assert cache.get_stats()['refused_invalidations'] == 2
+
+    cache.invalidate_cache()
+    assert cache.fetch_cache(CACHE_KEY_MAIN_ASSET) == ('assets', False)
+
+
+def test_invalidate_for_read_endpoint_is_refused():
+    """Test that read endpoints never invalidate cached data."""
+    cache = make_memory_cache()
+    cache.on_success(CACHE_KEY_MAIN_ASSET, 'assets')
+
+    cache.invalidate_for_endpoint(LIST_ASSETS_ENDPOINT)
+
+    assert cache.fetch_cache(CACHE_KEY_MAIN_ASSET) == ('assets', True)
+    assert cache.get_stats()['refused_invalidations'] == 1
+
+
+@patch('src.utils.decorators.unlock_required.is_node_locked_cached', return_value=False)
+@patch.object(Request, 'post')
+def test_navigation_is_served_from_cache(mock_post, mock_is_node_locked):
+    """Test that pages visited again are served from the cache while their reads keep it valid."""
+    mock_post.return_value.json.return_value = {
+        'nia': [], 'uda': [], 'cfa': [], 'transactions': [], 'unspents': [],
+    }
+    cache = make_memory_cache()
+    pages = {
+        CACHE_KEY_MAIN_ASSET: lambda: RgbRepository.get_assets(
+            FilterAssetRequestModel(),
+        ),
+        CACHE_KEY_BITCOIN_TRANSACTIONS: BtcRepository.list_transactions,
+        CACHE_KEY_UNSPENT_LIST: BtcRepository.list_unspents,
+    }
+    navigation = [
+        CACHE_KEY_MAIN_ASSET,
+        CACHE_KEY_BITCOIN_TRANSACTIONS,
+        CACHE_KEY_MAIN_ASSET,
+        CACHE_KEY_UNSPENT_LIST,
+        CACHE_KEY_MAIN_ASSET,
+        CACHE_KEY_BITCOIN_TRANSACTIONS,
+        CACHE_KEY_MAIN_ASSET,
+        CACHE_KEY_UNSPENT_LIST,
+    ]
+
+    with patch.object(Cache, 'get_cache_session', return_value=cache):
+        for key in navigation:
+            # Same steps as WorkerWithCache: serve valid data, otherwise fetch it
+            _, valid = cache.fetch_cache(key)
+            if not valid:
+                cache.on_success(key, pages[key]())
+
+    stats = cache.get_stats()
+    hits = stats['memory_hits'] + stats['disk_hits']
+    assert stats['misses'] == len(pages)
+    assert hits / (len(navigation) - len(pages)) == 1.0
+    assert mock_post.call_count == len(pages)
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import base64
 import binascii
+import json
 import os
 import time
 import zipfile
@@ -49,6 +50,7 @@ from src.utils.constant import APP_NAME
 from src.utils.constant import DEFAULT_LOCALE
 from src.utils.constant import IRIS_WALLET_TRANSLATIONS_CONTEXT
 from src.utils.constant import LOG_FOLDER_NAME
+from src.utils.constant import METRICS_FILE_NAME
 from src.utils.custom_exception import CommonException
 from src.utils.ln_node_manage import LnNodeServerManager
 from src.utils.logging import logger
@@ -1042,7 +1044,7 @@ def test_convert_timestamp(mock_convert_timestamp):
 # Test for failure in QR code generation (invalid data)
 
 
-@patch('src.utils.common_utils.qrcode.QRCode')
+@patch('src.utils.image_cache.qrcode.QRCode')
 @patch('src.utils.common_utils.ImageQt')
 def test_set_qr_code_failure(mock_imageqt, mock_qrcode):
     """Test for set_qr_code method failure case."""
@@ -1216,3 +1218,25 @@ def test_cleanup_zip_and_logs_files_not_exist(mock_rmtree, mock_remove, mock_exi
     # Verify the calls
     mock_remove.assert_not_called()
     mock_rmtree.assert_not_called()
+
+
+def test_zip_logger_folder_includes_metrics(tmp_path, metrics_registry):
+    """The log bundle contains the request metrics of the session as JSON."""
+    metrics_registry.record_request('GET', '/nodeinfo', 0.01)
+    missing = str(tmp_path / 'missing')
+    with patch(
+        'src.utils.common_utils.SettingRepository.get_wallet_network',
+        return_value=NetworkEnumModel.REGTEST,
+    ), patch(
+        'src.utils.common_utils.app_paths',
+        MagicMock(
+            node_logs_path=missing,
+            app_logs_path=missing, ldk_logs_path=missing,
+        ),
+    ), patch('src.utils.common_utils.find_files_with_name', return_value=[]):
+        _, output_dir, zip_file_path = zip_logger_folder(str(tmp_path))
+
+    with open(os.path.join(output_dir, METRICS_FILE_NAME), encoding='utf-8') as metrics_file:
+        assert json.load(metrics_file)['endpoints']['/nodeinfo']['calls'] == 1
+    with zipfile.ZipFile(zip_file_path) as zip_file:
+        assert METRICS_FILE_NAME in zip_file.namelist()
@@ -0,0 +1,119 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument,protected-access
+"""Unit tests for the ConnectivityMonitor class."""
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from src.utils.connectivity_monitor import ConnectivityMonitor
+from src.utils.constant import PING_DNS_ADDRESS_FOR_NETWORK_CHECK
+
+
+def test_check_internet_conn_success():
+    """check_internet_conn returns True and closes the socket when the connection succeeds."""
+    connection = MagicMock()
+    with patch('socket.create_connection', return_value=connection) as mock_connect:
+        assert ConnectivityMonitor.check_internet_conn() is True
+
+    assert mock_connect.call_args.args[0] == (
+        PING_DNS_ADDRESS_FOR_NETWORK_CHECK, 53,
+    )
+    connection.__exit__.assert_called_once()
+
+
+def test_check_internet_conn_failure():
+    """check_internet_conn returns False when the connection fails."""
+    with patch('socket.create_connection', side_effect=OSError):
+        assert ConnectivityMonitor.check_internet_conn() is False
+
+
+def test_check_connection_publishes_status():
+    """Every check publishes its result and remembers it."""
+    monitor = ConnectivityMonitor(interval_ms=5000)
+    received = []
+    monitor.network_status_signal.connect(received.append)
+
+    with patch.object(ConnectivityMonitor, 'check_internet_conn', side_effect=[True, False]):
+        assert monitor.check_connection() == 5000
+        assert monitor.is_connected is True
+        monitor.check_connection()
+
+    assert received == [True, False]
+    assert monitor.is_connected is False
+
+
+def test_backoff_while_disconnected():
+    """Checks back off while disconnected and start over when the state changes."""
+    monitor = ConnectivityMonitor(
+        interval_ms=5000, retry_initial_delay_ms=1000, retry_max_delay_ms=3000,
+    )
+    results = [False, False, False, False, True, False]
+    with patch.object(ConnectivityMonitor, 'check_internet_conn', side_effect=results):
+        delays = [monitor.check_connection() for _ in results]
+
+    assert delays == [1000, 2000, 3000, 3000, 5000, 1000]
+
+
+def test_start_runs_one_worker_until_stopped():
+    """The monitor runs a single worker thread, which ends once stopped."""
+    monitor = ConnectivityMonitor(interval_ms=10)
+    checked = threading.Event()
+
+    def check_internet_conn():
+        checked.set()
+        return True
+
+    with patch.object(ConnectivityMonitor, 'check_internet_conn', side_effect=check_internet_conn):
+        monitor.start()
+        thread = monitor._thread
+        monitor.start()
+        assert monitor._thread is thread
+        assert checked.wait(timeout=1)
+
+        monitor.stop()
+        thread.join(timeout=1)
+
+    assert not thread.is_alive()
+
+
+def test_start_after_stop_during_a_check():
+    """Starting again while the stopped worker is still checking runs a new worker."""
+    monitor = ConnectivityMonitor(interval_ms=10)
+    checking = threading.Event()
+    release = threading.Event()
+    checks = []
+
+    def check_internet_conn():
+        checks.append(threading.current_thread())
+        checking.set()
+        release.wait(timeout=1)
+        return True
+
+    with patch.object(ConnectivityMonitor, 'check_internet_conn', side_effect=check_internet_conn):
+        monitor.start()
+        stopped_thread = monitor._thread
+        assert checking.wait(timeout=1)
+
+        monitor.stop()
+        monitor.start()
+        checking.clear()
+        release.set()
+        stopped_thread.join(timeout=1)
+
+        assert not stopped_thread.is_alive()
+        assert monitor._thread is not stopped_thread
+        assert checking.wait(timeout=1)
+        assert checks[-1] is monitor._thread
+
+        monitor.stop()
+        monitor._thread.join(timeout=1)
+
+    assert not monitor._thread.is_alive()
+
+
+def test_get_instance_singleton():
+    """get_instance always returns the same monitor."""
+    assert ConnectivityMonitor.get_instance() is ConnectivityMonitor.get_instance()
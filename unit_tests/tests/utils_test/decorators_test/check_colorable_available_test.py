@@ -10,6 +10,7 @@ from requests.exceptions import HTTPError
 
 from src.utils.decorators.check_colorable_available import check_colorable_available
 from src.utils.decorators.check_colorable_available import create_utxos
+from src.utils.endpoints import CREATE_UTXO_ENDPOINT
 from src.utils.error_message import ERROR_CREATE_UTXO_FEE_RATE_ISSUE
 from src.utils.error_message import ERROR_MESSAGE_TO_CHANGE_FEE_RATE
 from src.utils.handle_exception import CommonException
@@ -29,7 +30,9 @@ def test_create_utxos_success(mock_get_cache, mock_post):
     create_utxos()
 
     mock_post.assert_called_once()
-    mock_cache.invalidate_cache.assert_called_once()
+    mock_cache.invalidate_for_endpoint.assert_called_once_with(
+        CREATE_UTXO_ENDPOINT,
+    )
 
 
 @patch.object(Request, 'post')
@@ -7,80 +7,23 @@ from unittest.mock import patch
 
 import pytest
 from requests.exceptions import ConnectionError as RequestsConnectionError
-from requests.exceptions import HTTPError
 
+from src.model.enums.enums_model import NodeLockState
 from src.utils.custom_exception import CommonException
 from src.utils.decorators.lock_required import call_lock
-from src.utils.decorators.lock_required import is_node_locked
 from src.utils.decorators.lock_required import lock_required
 from src.utils.endpoints import LOCK_ENDPOINT
-from src.utils.endpoints import NODE_INFO_ENDPOINT
-from src.utils.error_message import ERROR_NODE_IS_LOCKED_CALL_UNLOCK
+from src.utils.error_message import ERROR_NODE_IS_UNLOCKED_CALL_LOCK
+from src.utils.node_state import NodeStateTracker
 from src.utils.request import Request
 
-# Test is_node_locked function
 
-
-@patch.object(Request, 'get')
-@patch('src.utils.logging.logger')
-def test_is_node_locked_not_locked(mock_logger, mock_get):
-    """Test the node is not locked."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_get.return_value = mock_response
-
-    result = is_node_locked()
-
-    assert result is False
-
-    mock_get.assert_called_once_with(NODE_INFO_ENDPOINT)
-
-
-@patch.object(Request, 'get')
-@patch('src.utils.logging.logger')
-def test_is_node_locked_locked(mock_logger, mock_get):
-    """Test the node is locked."""
-    mock_response = MagicMock()
-    mock_response.status_code = 403
-    mock_response.json.return_value = {
-        'error': ERROR_NODE_IS_LOCKED_CALL_UNLOCK, 'code': 403,
-    }
-    mock_get.side_effect = HTTPError(response=mock_response)
-
-    expected_result = is_node_locked()
-
-    assert expected_result is True
-    mock_get.assert_called_once_with(NODE_INFO_ENDPOINT)
-
-
-@patch.object(Request, 'get')
-@patch('src.utils.logging.logger')
-def test_is_node_locked_http_error(mock_logger, mock_get):
-    """Test is_node_locked with an HTTP error."""
-    test_response = MagicMock()
-    test_response.status_code = 500
-    test_response.json.return_value = {'error': 'Unhandled error'}
-    mock_get.side_effect = HTTPError(response=test_response)
-
-    with pytest.raises(CommonException) as exc_info:
-        is_node_locked()
-
-    assert str(exc_info.value) == 'Unhandled error'
-
-
-@patch.object(Request, 'get')
-def test_is_node_locked_value_error(mock_get):
-    """Test is_node_locked handling of ValueError during JSON parsing."""
-    test_response = MagicMock()
-    test_response.status_code = 403
-    test_response.json.side_effect = ValueError('Invalid JSON')
-    mock_get.side_effect = HTTPError(response=test_response)
-
-    result = is_node_locked()
-
-    assert result is False
-
-# Test call_lock function
+@pytest.fixture(autouse=True)
+def reset_node_state():
+    """Forget the remembered node lock state between tests."""
+    NodeStateTracker.get_instance().reset()
+    yield
+    NodeStateTracker.get_instance().reset()
 
 
 @patch.object(Request, 'post')
@@ -103,7 +46,7 @@ def mock_method():
 
 
 @patch.object(Request, 'post')
-@patch('src.utils.decorators.lock_required.is_node_locked', return_value=False)
+@patch('src.utils.node_state.is_node_locked', return_value=False)
 def test_lock_required_decorator(mock_is_node_locked, mock_post):
     """Test lock_required decorator."""
     @lock_required
@@ -120,7 +63,7 @@ def test_lock_required_decorator(mock_is_node_locked, mock_post):
 
 
 @patch.object(Request, 'post')
-@patch('src.utils.decorators.lock_required.is_node_locked', return_value=True)
+@patch('src.utils.node_state.is_node_locked', return_value=True)
 def test_lock_required_decorator_when_locked(mock_is_node_locked, mock_post):
     """Test lock_required decorator when node is locked."""
     @lock_required
@@ -135,30 +78,6 @@ def test_lock_required_decorator_when_locked(mock_is_node_locked, mock_post):
     mock_is_node_locked.assert_called_once()
 
 
-@patch.object(Request, 'get')
-def test_is_node_locked_general_exception(mock_get):
-    """Test is_node_locked to ensure the general Exception block is hit."""
-    mock_get.side_effect = Exception('General exception')
-
-    with pytest.raises(CommonException) as exc:
-        is_node_locked()
-
-    assert str(
-        exc.value,
-    ) == 'Decorator(lock_required): Error while checking if node is locked'
-
-
-@patch.object(Request, 'post')
-def test_is_node_locked_node_connection_error(mock_post):
-    """Test unlock node with a connection error."""
-    mock_post.side_effect = RequestsConnectionError()
-
-    with pytest.raises(CommonException) as exc_info:
-        is_node_locked()
-
-    assert str(exc_info.value) == 'Unable to connect to node'
-
-
 @patch.object(Request, 'post')
 def test_call_lock_connection_error(mock_post):
     """Test unlock node with a connection error."""
@@ -186,3 +105,43 @@ def test_call_lock_general_exception(mock_logger, mock_post):
         exc_info.value,
     ) == 'Decorator(call_lock): Error while calling lock API'
     mock_post.assert_called_once_with(LOCK_ENDPOINT)
+
+
+@patch('src.utils.node_state.is_node_locked')
+def test_lock_required_uses_cached_state(mock_is_node_locked):
+    """Test lock_required does not probe the node when the locked state is known."""
+    NodeStateTracker.get_instance().set_state(
+        Request.load_base_url(), NodeLockState.LOCKED,
+    )
+
+    @lock_required
+    def decorated_method():
+        return 'success'
+
+    with patch.object(Request, 'post') as mock_post:
+        assert decorated_method() == 'success'
+        mock_post.assert_not_called()
+    mock_is_node_locked.assert_not_called()
+
+
+@patch('src.utils.node_state.is_node_locked')
+def test_lock_required_retries_once_on_unlocked_error(mock_is_node_locked):
+    """Test lock_required locks the node and retries once when the call fails because the node is unlocked."""
+    NodeStateTracker.get_instance().set_state(
+        Request.load_base_url(), NodeLockState.LOCKED,
+    )
+    mock_method = MagicMock(
+        side_effect=[
+            CommonException(ERROR_NODE_IS_UNLOCKED_CALL_LOCK),
+            'success',
+        ],
+    )
+    mock_method.__name__ = 'mock_method'
+
+    with patch.object(Request, 'post') as mock_post:
+        mock_post.return_value = MagicMock(status_code=200)
+        result = lock_required(mock_method)()
+        mock_post.assert_called_once_with(LOCK_ENDPOINT)
+
+    assert result == 'success'
+    assert mock_method.call_count == 2
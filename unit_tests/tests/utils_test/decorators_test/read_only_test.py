@@ -0,0 +1,44 @@
+"""Unit tests for the read_only decorator."""
+# pylint: disable=redefined-outer-name,unused-argument,protected-access
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.cache import Cache
+from src.utils.decorators.read_only import read_only
+
+
+@pytest.fixture
+def cache():
+    """Cache whose SQLite connection is mocked."""
+    with patch.object(Cache, '_connect_db', return_value=MagicMock()):
+        yield Cache(db_name='test.db', file_path=':memory:')
+
+
+def test_read_only_refuses_invalidation(cache):
+    """A read-only method returns its result without invalidating the cache."""
+    @read_only
+    def list_assets():
+        cache.invalidate_cache()
+        return ['asset']
+
+    with patch.object(cache, '_memory_invalidate') as mock_memory_invalidate:
+        assert list_assets() == ['asset']
+        mock_memory_invalidate.assert_not_called()
+    assert cache.get_stats()['refused_invalidations'] == 1
+
+
+def test_read_only_scope_ends_on_exception(cache):
+    """The scope ends when the read-only method raises."""
+    @read_only
+    def failing_read():
+        raise ValueError('failed')
+
+    with pytest.raises(ValueError):
+        failing_read()
+
+    assert not cache.refuse_in_read_only_scope('all entries')
+    assert cache.get_stats()['refused_invalidations'] == 0
@@ -13,19 +13,27 @@ from requests.exceptions import HTTPError
 from src.data.repository.setting_repository import SettingRepository
 from src.model.common_operation_model import UnlockRequestModel
 from src.model.enums.enums_model import NetworkEnumModel
-from src.utils.decorators.unlock_required import is_node_locked
+from src.model.enums.enums_model import NodeLockState
 from src.utils.decorators.unlock_required import unlock_node
 from src.utils.decorators.unlock_required import unlock_required
-from src.utils.endpoints import NODE_INFO_ENDPOINT
 from src.utils.endpoints import UNLOCK_ENDPOINT
 from src.utils.error_message import ERROR_NODE_IS_LOCKED_CALL_UNLOCK
 from src.utils.error_message import ERROR_NODE_WALLET_NOT_INITIALIZED
 from src.utils.error_message import ERROR_PASSWORD_INCORRECT
 from src.utils.handle_exception import CommonException
+from src.utils.node_state import NodeStateTracker
 from src.utils.page_navigation_events import PageNavigationEventManager
 from src.utils.request import Request
 
 
+@pytest.fixture(autouse=True)
+def reset_node_state():
+    """Forget the remembered node lock state between tests."""
+    NodeStateTracker.get_instance().reset()
+    yield
+    NodeStateTracker.get_instance().reset()
+
+
 @pytest.fixture
 def test_response():
     """Fixture to create a generic mock response object."""
@@ -201,7 +209,7 @@ def test_unlock_node_connection_error(
         assert str(exc_info.value) == 'Unable to connect to node'
 
 
-@patch('src.utils.decorators.unlock_required.is_node_locked', return_value=True)
+@patch('src.utils.node_state.is_node_locked', return_value=True)
 @patch('src.utils.decorators.unlock_required.unlock_node')
 def test_unlock_required_decorator(mock_unlock_node, mock_is_node_locked):
     """Test unlock_required decorator."""
@@ -216,60 +224,6 @@ def test_unlock_required_decorator(mock_unlock_node, mock_is_node_locked):
     mock_unlock_node.assert_called_once()
 
 
-@patch.object(Request, 'get')
-def test_is_node_locked_not_locked(mock_get, test_response):
-    """Test the node is not locked."""
-    test_response.status_code = 200
-    mock_get.return_value = test_response
-
-    result = is_node_locked()
-
-    assert result is False
-    mock_get.assert_called_once_with(NODE_INFO_ENDPOINT)
-
-
-@patch.object(Request, 'get')
-def test_is_node_locked_locked(mock_get, test_response):
-    """Test the node is locked."""
-    test_response.status_code = 403
-    test_response.json.return_value = {
-        'error': ERROR_NODE_IS_LOCKED_CALL_UNLOCK, 'code': 403,
-    }
-    mock_get.side_effect = HTTPError(response=test_response)
-
-    result = is_node_locked()
-
-    assert result is True
-    mock_get.assert_called_once_with(NODE_INFO_ENDPOINT)
-
-
-@patch.object(Request, 'get')
-@patch('src.utils.logging.logger')
-def test_is_node_locked_http_error(mock_logger, mock_get, test_response):
-    """Test is_node_locked with an HTTP error."""
-    test_response.status_code = 500
-    test_response.json.return_value = {'error': 'Unhandled error'}
-    mock_get.side_effect = HTTPError(response=test_response)
-
-    with pytest.raises(CommonException) as exc_val:
-        is_node_locked()
-
-    assert str(exc_val.value) == 'Unhandled error'
-
-
-@patch.object(Request, 'get')
-def test_is_node_locked_value_error(mock_get):
-    """Test is_node_locked handling of ValueError during JSON parsing."""
-    mock_response = MagicMock()
-    mock_response.status_code = 403
-    mock_response.json.side_effect = ValueError('Invalid JSON')
-    mock_get.side_effect = HTTPError(response=mock_response)
-
-    result = is_node_locked()
-
-    assert result is False
-
-
 @patch.object(Request, 'post')
 def test_unlock_node_general_exception(mock_post):
     """Test unlock_node to ensure the general Exception block is hit."""
@@ -285,30 +239,6 @@ def test_unlock_node_general_exception(mock_post):
         print(mock_navigate_signal.emit.call_args_list)
 
 
-@patch.object(Request, 'get')
-def test_is_node_locked_general_exception(mock_get):
-    """Test is_node_locked to ensure the general Exception block is hit."""
-    mock_get.side_effect = Exception('General exception')
-
-    with pytest.raises(CommonException) as exc_info:
-        is_node_locked()
-
-    assert str(
-        exc_info.value,
-    ) == 'Decorator(unlock_required): Error while checking if node is locked'
-
-
-@patch.object(Request, 'post')
-def test_is_node_locked_node_connection_error(mock_post):
-    """Test unlock node with a connection error."""
-    mock_post.side_effect = RequestsConnectionError()
-
-    with pytest.raises(CommonException) as exc_info:
-        is_node_locked()
-
-    assert str(exc_info.value) == 'Unable to connect to node'
-
-
 @patch('src.utils.decorators.unlock_required.get_value')
 @patch('src.data.repository.setting_repository.SettingRepository.get_keyring_status')
 @patch('src.utils.decorators.unlock_required.get_bitcoin_config')
@@ -579,3 +509,58 @@ def test_unlock_node_http_error_with_json_error(
         # Verify error was logged
         mock_logger.assert_called_once_with('Custom error message')
         assert str(exc_info.value) == 'Custom error message'
+
+
+@patch('src.utils.node_state.is_node_locked')
+@patch('src.utils.decorators.unlock_required.unlock_node')
+def test_unlock_required_uses_cached_state(mock_unlock_node, mock_is_node_locked):
+    """Test unlock_required does not probe the node when the unlocked state is known."""
+    NodeStateTracker.get_instance().set_state(
+        Request.load_base_url(), NodeLockState.UNLOCKED,
+    )
+
+    @unlock_required
+    def mock_method():
+        return 'success'
+
+    assert mock_method() == 'success'
+    assert mock_method() == 'success'
+    mock_is_node_locked.assert_not_called()
+    mock_unlock_node.assert_not_called()
+
+
+@patch('src.utils.node_state.is_node_locked')
+@patch('src.utils.decorators.unlock_required.unlock_node')
+def test_unlock_required_retries_once_on_locked_error(mock_unlock_node, mock_is_node_locked):
+    """Test unlock_required unlocks the node and retries once when the call fails with a lock error."""
+    NodeStateTracker.get_instance().set_state(
+        Request.load_base_url(), NodeLockState.UNLOCKED,
+    )
+    mock_method = MagicMock(
+        side_effect=[
+            CommonException(ERROR_NODE_IS_LOCKED_CALL_UNLOCK),
+            'success',
+        ],
+    )
+    mock_method.__name__ = 'mock_method'
+
+    result = unlock_required(mock_method)()
+
+    assert result == 'success'
+    assert mock_method.call_count == 2
+    mock_unlock_node.assert_called_once()
+    mock_is_node_locked.assert_not_called()
+
+
+@patch('src.utils.node_state.is_node_locked', return_value=False)
+@patch('src.utils.decorators.unlock_required.unlock_node')
+def test_unlock_required_does_not_retry_other_errors(mock_unlock_node, mock_is_node_locked):
+    """Test unlock_required re-raises errors unrelated to the lock state."""
+    mock_method = MagicMock(side_effect=CommonException('Other error'))
+    mock_method.__name__ = 'mock_method'
+
+    with pytest.raises(CommonException):
+        unlock_required(mock_method)()
+
+    mock_method.assert_called_once()
+    mock_unlock_node.assert_not_called()
@@ -0,0 +1,47 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument
+"""Unit tests for the FeeEstimateCache class."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from src.utils.constant import FAST_TRANSACTION_FEE_BLOCKS
+from src.utils.constant import MEDIUM_TRANSACTION_FEE_BLOCKS
+from src.utils.constant import SLOW_TRANSACTION_FEE_BLOCKS
+from src.utils.fee_estimate_cache import FeeEstimateCache
+
+
+def test_get_unknown_block_target():
+    """A block target never fetched has no fee rate."""
+    assert FeeEstimateCache().get(FAST_TRANSACTION_FEE_BLOCKS) is None
+
+
+def test_fee_rate_becomes_stale():
+    """A fee rate is no longer returned once it is older than max_age."""
+    cache = FeeEstimateCache(max_age=60)
+    with patch('src.utils.fee_estimate_cache.time.monotonic', return_value=100.0):
+        cache.set(FAST_TRANSACTION_FEE_BLOCKS, 12.5)
+    with patch('src.utils.fee_estimate_cache.time.monotonic', return_value=160.0):
+        assert cache.get(FAST_TRANSACTION_FEE_BLOCKS) == 12.5
+    with patch('src.utils.fee_estimate_cache.time.monotonic', return_value=161.0):
+        assert cache.get(FAST_TRANSACTION_FEE_BLOCKS) is None
+
+
+def test_is_fresh_requires_every_target():
+    """The cache is fresh only when all prefetched block targets are known."""
+    cache = FeeEstimateCache()
+    cache.set(FAST_TRANSACTION_FEE_BLOCKS, 10)
+    cache.set(MEDIUM_TRANSACTION_FEE_BLOCKS, 5)
+    assert not cache.is_fresh()
+
+    cache.set(SLOW_TRANSACTION_FEE_BLOCKS, 1)
+    assert cache.is_fresh()
+
+    cache.clear()
+    assert not cache.is_fresh()
+
+
+def test_get_instance_singleton():
+    """get_instance always returns the same cache."""
+    assert FeeEstimateCache.get_instance() is FeeEstimateCache.get_instance()
@@ -0,0 +1,64 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument,protected-access
+"""Unit tests for the GuiThreadWatchdog class."""
+from __future__ import annotations
+
+import threading
+import time
+
+from src.utils.gui_thread_watchdog import GUI_WATCHDOG_ENV
+from src.utils.gui_thread_watchdog import GuiThreadWatchdog
+
+
+def test_disabled_watchdog_reports_nothing(qt_app):
+    """Without being enabled, blocking calls on the GUI thread are not counted."""
+    watchdog = GuiThreadWatchdog()
+
+    watchdog.check_blocking_call('request', '/listassets')
+
+    assert watchdog.stats()['blocking_calls'] == 0
+
+
+def test_only_calls_on_the_gui_thread_are_reported(qt_app):
+    """Calls made on the GUI thread are counted by name; calls made on workers are not."""
+    watchdog = GuiThreadWatchdog()
+    watchdog.enable()
+
+    watchdog.check_blocking_call('request', '/listassets')
+    watchdog.check_blocking_call('request', '/listassets')
+    worker = threading.Thread(
+        target=watchdog.check_blocking_call, args=('keyring', 'mnemonic'),
+    )
+    worker.start()
+    worker.join()
+
+    stats = watchdog.stats()
+    assert stats['blocking_calls'] == 2
+    assert stats['blocking_calls_by_name'] == {'request:/listassets': 2}
+
+
+def test_late_heartbeat_is_recorded_as_stall(qt_app):
+    """A heartbeat delayed beyond the stall threshold is recorded as a stall."""
+    watchdog = GuiThreadWatchdog(heartbeat_ms=50, stall_ms=100)
+
+    watchdog._last_beat = time.perf_counter() - 0.06
+    watchdog._on_heartbeat()
+    watchdog._last_beat = time.perf_counter() - 0.5
+    watchdog._on_heartbeat()
+
+    stats = watchdog.stats()
+    assert stats['stalls'] == 1
+    assert 400 <= stats['max_stall_ms'] < 1000
+
+
+def test_configure_from_env(qt_app, monkeypatch):
+    """The watchdog is enabled when its environment variable is set to 1."""
+    watchdog = GuiThreadWatchdog()
+    monkeypatch.setenv(GUI_WATCHDOG_ENV, '0')
+    watchdog.configure_from_env()
+    assert not watchdog.enabled
+
+    monkeypatch.setenv(GUI_WATCHDOG_ENV, '1')
+    watchdog.configure_from_env()
+    assert watchdog.enabled
@@ -0,0 +1,201 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument
+"""Unit tests for the HistoryStore class."""
+from __future__ import annotations
+
+import sqlite3
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from src.model.btc_model import Transaction
+from src.utils.history_store import HISTORY_KIND_BTC_TRANSACTION
+from src.utils.history_store import HistoryStore
+from src.utils.history_store import sync_history
+
+
+def make_transaction(txid, received=1000):
+    """Create a raw transaction as returned by the node."""
+    return Transaction(
+        transaction_type='User', txid=txid, received=received, sent=0, fee=100,
+    )
+
+
+def format_transaction(transaction):
+    """Formatter setting the display amount."""
+    transaction.amount = f'+{transaction.received}'
+    return transaction
+
+
+def sync(store, transactions, formatter):
+    """Sync wallet-wide transactions keyed by txid."""
+    return store.sync(
+        HISTORY_KIND_BTC_TRANSACTION, '',
+        [(transaction.txid, transaction) for transaction in transactions],
+        formatter,
+    )
+
+
+def test_sync_formats_new_rows(history_store):
+    """New rows are formatted and returned in the given order."""
+    formatter = MagicMock(side_effect=format_transaction)
+    result = sync(
+        history_store, [
+            make_transaction(
+                'b',
+            ), make_transaction('a'),
+        ], formatter,
+    )
+    assert [transaction.txid for transaction in result] == ['b', 'a']
+    assert [transaction.amount for transaction in result] == [
+        '+1000', '+1000',
+    ]
+    assert formatter.call_count == 2
+
+
+def test_sync_only_formats_changed_rows(history_store):
+    """Unchanged rows are read back pre-formatted, changed and new rows are formatted."""
+    sync(
+        history_store, [make_transaction('a'), make_transaction('b')],
+        format_transaction,
+    )
+    formatter = MagicMock(side_effect=format_transaction)
+
+    result = sync(
+        history_store,
+        [
+            make_transaction('a'), make_transaction(
+                'b', received=2000,
+            ), make_transaction('c'),
+        ],
+        formatter,
+    )
+
+    assert [call.args[0].txid for call in formatter.call_args_list] == [
+        'b', 'c',
+    ]
+    assert [transaction.amount for transaction in result] == [
+        '+1000', '+2000', '+1000',
+    ]
+
+
+def test_sync_removes_rows_no_longer_returned(history_store):
+    """Rows missing from the latest fetch are dropped from the store."""
+    sync(
+        history_store, [make_transaction('a'), make_transaction('b')],
+        format_transaction,
+    )
+    sync(history_store, [make_transaction('a')], format_transaction)
+    formatter = MagicMock(side_effect=format_transaction)
+
+    sync(history_store, [make_transaction('b')], formatter)
+
+    formatter.assert_called_once()
+
+
+def test_sync_is_scoped(history_store):
+    """Rows of one scope do not affect another scope."""
+    history_store.sync(
+        HISTORY_KIND_BTC_TRANSACTION, 'asset-1',
+        [('a', make_transaction('a'))], format_transaction,
+    )
+    formatter = MagicMock(side_effect=format_transaction)
+    history_store.sync(
+        HISTORY_KIND_BTC_TRANSACTION, 'asset-2',
+        [('a', make_transaction('a'))], formatter,
+    )
+    formatter.assert_called_once()
+
+
+def test_sync_formatter_error_is_raised(history_store):
+    """A formatter error aborts the sync without storing the row."""
+    with pytest.raises(ValueError):
+        sync(
+            history_store, [make_transaction('a')],
+            MagicMock(side_effect=ValueError('bad row')),
+        )
+    formatter = MagicMock(side_effect=format_transaction)
+    sync(history_store, [make_transaction('a')], formatter)
+    formatter.assert_called_once()
+
+
+def test_sync_stores_json_fields(history_store):
+    """Formatted rows are stored as JSON, not as pickled objects."""
+    sync(history_store, [make_transaction('a')], format_transaction)
+
+    (data,) = history_store.conn.execute('SELECT data FROM history').fetchone()
+
+    assert Transaction.model_validate_json(data).amount == '+1000'
+
+
+def test_sync_formats_again_when_context_changes(history_store):
+    """A timezone change or an upgrade formats every stored row again."""
+    sync(history_store, [make_transaction('a')], format_transaction)
+    formatter = MagicMock(side_effect=format_transaction)
+
+    with patch.object(HistoryStore, 'formatting_context', return_value='other timezone'):
+        sync(history_store, [make_transaction('a')], formatter)
+
+    formatter.assert_called_once()
+
+
+def test_sync_formats_again_unreadable_rows(history_store):
+    """A stored row that no longer validates is formatted again and replaced."""
+    sync(
+        history_store, [make_transaction('a'), make_transaction('b')],
+        format_transaction,
+    )
+    with history_store.conn:
+        history_store.conn.execute(
+            "UPDATE history SET data = ? WHERE row_key = 'a'", (
+                b'\x80\x04pickle',
+            ),
+        )
+        history_store.conn.execute(
+            "UPDATE history SET data = '{\"txid\": 1}' WHERE row_key = 'b'",
+        )
+    formatter = MagicMock(side_effect=format_transaction)
+
+    result = sync(
+        history_store, [
+            make_transaction(
+                'a',
+            ), make_transaction('b'),
+        ], formatter,
+    )
+
+    assert formatter.call_count == 2
+    assert [transaction.amount for transaction in result] == [
+        '+1000', '+1000',
+    ]
+    formatter.reset_mock()
+    sync(
+        history_store, [
+            make_transaction(
+                'a',
+            ), make_transaction('b'),
+        ], formatter,
+    )
+    formatter.assert_not_called()
+
+
+def test_sync_history_falls_back_without_store():
+    """Rows are formatted directly when the store is unavailable."""
+    with patch.object(HistoryStore, 'get_history_store', return_value=None):
+        result = sync_history(
+            HISTORY_KIND_BTC_TRANSACTION, '',
+            [('a', make_transaction('a'))], format_transaction,
+        )
+    assert result[0].amount == '+1000'
+
+
+def test_sync_history_falls_back_on_store_error(history_store):
+    """Rows are formatted directly when the store fails."""
+    with patch.object(history_store, 'sync', side_effect=sqlite3.OperationalError('locked')):
+        result = sync_history(
+            HISTORY_KIND_BTC_TRANSACTION, '',
+            [('a', make_transaction('a'))], format_transaction,
+        )
+    assert result[0].amount == '+1000'
@@ -0,0 +1,104 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument, protected-access
+"""Unit tests for the SessionPool class."""
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.http_session import SessionPool
+
+
+@pytest.fixture
+def session_pool():
+    """Create a small session pool."""
+    return SessionPool(
+        max_sessions=2, pool_connections=1,
+        pool_maxsize=2, max_retries=2, backoff_factor=0.1,
+    )
+
+
+def test_session_is_reused(session_pool):
+    """A released session is handed out again instead of creating a new one."""
+    with session_pool.session() as first:
+        pass
+    with session_pool.session() as second:
+        pass
+    assert first is second
+    assert len(session_pool._sessions) == 1
+
+
+def test_sessions_share_adapter(session_pool):
+    """Concurrent sessions share the same transport adapter."""
+    first = session_pool.acquire()
+    second = session_pool.acquire()
+    assert first is not second
+    assert first.get_adapter('http://127.0.0.1:3001') is session_pool._adapter
+    assert second.get_adapter('https://node.example') is session_pool._adapter
+    session_pool.release(first)
+    session_pool.release(second)
+
+
+def test_acquire_blocks_when_pool_exhausted(session_pool):
+    """Acquiring more than max_sessions blocks until a session is released."""
+    first = session_pool.acquire()
+    second = session_pool.acquire()
+    acquired = threading.Event()
+
+    def worker():
+        session = session_pool.acquire()
+        acquired.set()
+        session_pool.release(session)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not acquired.wait(0.1)
+    session_pool.release(first)
+    assert acquired.wait(1)
+    thread.join()
+    session_pool.release(second)
+
+
+def test_retry_policy(session_pool):
+    """Connection errors are retried for all methods, gateway errors only for idempotent ones."""
+    retry = session_pool._adapter.max_retries
+    assert retry.connect == 2
+    assert retry.read == 0
+    assert retry.backoff_factor == 0.1
+    assert 'POST' not in retry.allowed_methods
+    assert 'GET' in retry.allowed_methods
+    assert retry.raise_on_status is False
+
+
+def test_no_retry_sessions(session_pool):
+    """Sessions acquired without retries fail on the first connection error and are pooled apart."""
+    with session_pool.session(retry=False) as probe:
+        pass
+    with session_pool.session() as session:
+        pass
+    assert probe is not session
+    assert probe.get_adapter(
+        'http://127.0.0.1:3001',
+    ) is session_pool._no_retry_adapter
+    assert session_pool._no_retry_adapter.max_retries.total == 0
+    assert session_pool._no_retry_adapter.max_retries.connect == 0
+    with session_pool.session(retry=False) as second_probe:
+        assert second_probe is probe
+
+
+def test_close_all(session_pool):
+    """close_all closes every created session."""
+    with session_pool.session() as session:
+        pass
+    with patch.object(session, 'close') as mock_close:
+        session_pool.close_all()
+        mock_close.assert_called_once()
+
+
+def test_get_instance_singleton():
+    """get_instance always returns the same pool."""
+    with patch.object(SessionPool, '_instance', None):
+        assert SessionPool.get_instance() is SessionPool.get_instance()
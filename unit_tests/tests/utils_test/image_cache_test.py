@@ -0,0 +1,159 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument,protected-access
+"""Unit tests for the ImageCache class."""
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import wait
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.image_cache import ImageCache
+from src.utils.image_cache import render_identicon_png
+from src.utils.image_cache import render_qr_code_png
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+@pytest.fixture
+def disk_cache(tmp_path):
+    """Create a cache storing its images in a temporary folder."""
+    cache = ImageCache(str(tmp_path / 'images'), max_entries=2)
+    yield cache
+    cache.shutdown()
+
+
+def test_get_or_create_renders_once(disk_cache):
+    """An image is rendered on first use and served from the cache afterwards."""
+    create = MagicMock(return_value=b'png')
+    key = ImageCache.identicon_key('asset_id')
+
+    assert disk_cache.get_or_create(key, create) == b'png'
+    assert disk_cache.get_or_create(key, create) == b'png'
+    create.assert_called_once()
+
+
+def test_keys_depend_on_content():
+    """Keys differ by kind, size and data, and are stable for the same content."""
+    assert ImageCache.identicon_key('a') == ImageCache.identicon_key('a', 40)
+    assert ImageCache.identicon_key('a') != ImageCache.identicon_key('a', 80)
+    assert ImageCache.identicon_key('a') != ImageCache.identicon_key('b')
+    assert ImageCache.identicon_key('a') != ImageCache.qr_code_key('a')
+
+
+def test_memory_eviction_falls_back_to_disk(disk_cache):
+    """Images evicted from memory are read back from disk."""
+    for name in ('a', 'b', 'c'):
+        disk_cache.put(name, name.encode())
+
+    assert list(disk_cache._memory) == ['b', 'c']
+    assert os.path.exists(os.path.join(disk_cache.directory, 'a.png'))
+    assert disk_cache.get('a') == b'a'
+
+
+def test_disk_copy_survives_new_instance(disk_cache):
+    """A new cache on the same folder finds the images stored by a previous one."""
+    disk_cache.put('key', b'data')
+
+    assert ImageCache(disk_cache.directory).get('key') == b'data'
+
+
+def test_memory_only_cache_does_not_write():
+    """A cache without a folder keeps images in memory only."""
+    cache = ImageCache(None)
+    cache.put('key', b'data')
+
+    assert cache.get('key') == b'data'
+    cache.clear()
+    assert cache.get('key') is None
+
+
+def test_unpersisted_images_stay_in_memory(disk_cache):
+    """Images stored without persistence, like QR codes, are never written to disk."""
+    key = ImageCache.qr_code_key('invoice')
+    disk_cache.get_or_create(key, lambda: b'qr', persist=False)
+
+    assert disk_cache.get(key) == b'qr'
+    assert not os.path.exists(os.path.join(disk_cache.directory, f'{key}.png'))
+
+
+def test_prune_disk_deletes_least_recently_used(tmp_path):
+    """Images beyond the disk bound are deleted, least recently used first."""
+    cache = ImageCache(str(tmp_path), max_disk_entries=2)
+    for age, name in enumerate(('old', 'middle', 'new')):
+        cache.put(name, name.encode())
+        file_path = os.path.join(cache.directory, f'{name}.png')
+        os.utime(file_path, (1000 + age, 1000 + age))
+    cache.clear()
+    cache.get('old')
+
+    assert cache.prune_disk() == 1
+    assert sorted(os.listdir(cache.directory)) == ['new.png', 'old.png']
+
+
+def test_create_error_is_raised_and_not_cached(disk_cache):
+    """Render errors reach the caller and nothing is stored."""
+    with pytest.raises(ValueError):
+        disk_cache.get_or_create(
+            'key', MagicMock(side_effect=ValueError('bad data')),
+        )
+    assert disk_cache.get('key') is None
+
+
+def test_prefetch_identicons_renders_missing_in_background(disk_cache):
+    """Prefetch renders each missing identicon once, off the calling thread."""
+    disk_cache.put(ImageCache.identicon_key('cached'), b'cached')
+    with patch(
+        'src.utils.image_cache.render_identicon_png', return_value=b'png',
+    ) as mock_render:
+        futures = disk_cache.prefetch_identicons(['cached', 'new', 'new'])
+        wait(futures)
+
+    assert len(futures) == 1
+    mock_render.assert_called_once_with('new', 40)
+    assert disk_cache.get(ImageCache.identicon_key('new')) == b'png'
+
+
+def test_concurrent_callers_share_a_render(disk_cache):
+    """A caller asking for an image being rendered waits for that render instead of starting another."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_render():
+        started.set()
+        release.wait(5)
+        return b'png'
+    create = MagicMock(side_effect=slow_render)
+    results = []
+    renderer = threading.Thread(
+        target=lambda: results.append(disk_cache.get_or_create('key', create)),
+    )
+    renderer.start()
+    assert started.wait(5)
+    waiter = threading.Thread(
+        target=lambda: results.append(disk_cache.get_or_create('key', create)),
+    )
+    waiter.start()
+    waiter.join(0.1)
+    assert waiter.is_alive()
+    release.set()
+    renderer.join(5)
+    waiter.join(5)
+
+    assert results == [b'png', b'png']
+    create.assert_called_once()
+
+
+def test_render_functions_return_png():
+    """The renderers produce PNG images."""
+    assert render_identicon_png('asset_id').startswith(PNG_SIGNATURE)
+    assert render_qr_code_png('bcrt1qaddress').startswith(PNG_SIGNATURE)
+
+
+def test_get_instance_singleton():
+    """get_instance always returns the same cache."""
+    assert ImageCache.get_instance() is ImageCache.get_instance()
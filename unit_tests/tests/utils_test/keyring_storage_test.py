@@ -9,6 +9,8 @@ import keyring as kr
 import pytest
 
 from src.utils.constant import APP_NAME
+from src.utils.constant import MNEMONIC_KEY
+from src.utils.constant import NATIVE_LOGIN_ENABLED
 from src.utils.keyring_storage import delete_value
 from src.utils.keyring_storage import get_value
 from src.utils.keyring_storage import set_value
@@ -88,3 +90,37 @@ def test_delete_value_exception(mock_keyring):
     kr.delete_password.side_effect = kr.errors.KeyringError('Test Error')
     delete_value('test_key', network='regtest')
     kr.delete_password.assert_called_once_with(APP_NAME, 'test_key_regtest')
+
+
+def test_native_auth_flags_are_cached(mock_keyring, mocker):
+    """Test that native authentication flags are read from the keyring once until they expire."""
+    kr.get_password.return_value = 'true'
+    assert get_value(NATIVE_LOGIN_ENABLED) == 'true'
+    assert get_value(NATIVE_LOGIN_ENABLED) == 'true'
+    kr.get_password.assert_called_once_with(APP_NAME, NATIVE_LOGIN_ENABLED)
+
+    # Writes and deletes update the cached value
+    kr.get_password.return_value = 'false'
+    assert set_value(NATIVE_LOGIN_ENABLED, 'false') is True
+    kr.get_password.reset_mock()
+    assert get_value(NATIVE_LOGIN_ENABLED) == 'false'
+    kr.get_password.assert_not_called()
+    delete_value(NATIVE_LOGIN_ENABLED)
+    kr.get_password.return_value = None
+    assert get_value(NATIVE_LOGIN_ENABLED) is None
+    kr.get_password.assert_called_once_with(APP_NAME, NATIVE_LOGIN_ENABLED)
+
+    # Cached values expire
+    mocker.patch(
+        'src.utils.keyring_storage.time.monotonic', return_value=float('inf'),
+    )
+    get_value(NATIVE_LOGIN_ENABLED)
+    assert kr.get_password.call_count == 2
+
+
+def test_secrets_are_not_cached(mock_keyring):
+    """Test that the mnemonic is read from the keyring every time."""
+    kr.get_password.return_value = 'secret words'
+    get_value(MNEMONIC_KEY, network='regtest')
+    get_value(MNEMONIC_KEY, network='regtest')
+    assert kr.get_password.call_count == 2
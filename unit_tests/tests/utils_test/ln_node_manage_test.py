@@ -4,6 +4,7 @@
 """unit tests for the LnNodeServerManager class."""
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -12,9 +13,14 @@ from PySide6.QtCore import QProcess
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import HTTPError
 
-from src.utils.constant import INTERVAL
 from src.utils.constant import MAX_ATTEMPTS_FOR_CLOSE
+from src.utils.constant import NODE_READY_PROBE_INITIAL_DELAY_MS
+from src.utils.constant import NODE_READY_PROBE_MAX_DELAY_MS
+from src.utils.constant import NODE_READY_PROBE_TIMEOUT
+from src.utils.constant import NODE_READY_TIMEOUT
+from src.utils.endpoints import NODE_INFO_ENDPOINT
 from src.utils.ln_node_manage import LnNodeServerManager
+from src.utils.task_scheduler import TaskScheduler
 
 
 @pytest.fixture
@@ -41,50 +47,99 @@ def instance(mock_process):
     return obj
 
 
-def test_check_node_status_success(ln_node_manager):
+def test_check_node_status_success(qtbot, ln_node_manager):
     """Test check_node_status for successful server status check."""
     with patch('src.utils.request.Request.get') as mock_get:
-        mock_get.return_value = MagicMock()  # Mock the response object
-        # Mock the raise_for_status method
-        mock_get.return_value.raise_for_status = MagicMock()
+        mock_get.return_value = MagicMock(status_code=200)
 
         # Connect a mock slot to the signal
         mock_slot = MagicMock()
         ln_node_manager.process_started.connect(mock_slot)
+        loader_slot = MagicMock()
+        ln_node_manager.main_window_loader.connect(loader_slot)
 
         ln_node_manager.check_node_status()
-        mock_slot.assert_called_once()
+        qtbot.waitUntil(lambda: mock_slot.called, timeout=2000)
+
+    mock_slot.assert_called_once()
+    loader_slot.assert_called_once_with(False)
 
 
-def test_check_node_status_http_error(ln_node_manager):
-    """Test check_node_status for HTTPError."""
+def test_check_node_status_http_error(qtbot, ln_node_manager):
+    """Test check_node_status for HTTPError: the server answered, so it is ready."""
     with patch('src.utils.request.Request.get') as mock_get:
         mock_get.side_effect = HTTPError('HTTP error occurred')
 
         # Connect a mock slot to the signal
         mock_slot = MagicMock()
-        ln_node_manager.process_error.connect(mock_slot)
-
-        ln_node_manager.check_node_status()  # Call the method
+        ln_node_manager.process_started.connect(mock_slot)
+        loader_slot = MagicMock()
+        ln_node_manager.main_window_loader.connect(loader_slot)
 
-        # Manually trigger the signal for testing
-        ln_node_manager.process_error.emit(500, 'HTTP error occurred')
+        ln_node_manager.check_node_status()
+        qtbot.waitUntil(lambda: mock_slot.called, timeout=2000)
 
-        # Assert that the mock slot was called with the expected arguments
-        mock_slot.assert_called_once_with(500, 'HTTP error occurred')
+    mock_slot.assert_called_once()
+    loader_slot.assert_not_called()
 
 
-def test_check_node_status_connection_error(ln_node_manager):
+def test_check_node_status_connection_error(qtbot, ln_node_manager):
     """Test check_node_status for connection error."""
+    ln_node_manager.timer.start = MagicMock()
     with patch('src.utils.request.Request.get') as mock_get:
         mock_get.side_effect = RequestsConnectionError(
             'Connection error occurred',
         )
 
         ln_node_manager.check_node_status()  # Call the method
+        qtbot.waitUntil(lambda: ln_node_manager.attempts == 1, timeout=2000)
+
+    # The next check is scheduled after the doubled delay
+    ln_node_manager.timer.start.assert_called_once_with(
+        NODE_READY_PROBE_INITIAL_DELAY_MS * 2,
+    )
+
+
+def test_check_node_status_probes_off_the_gui_thread(qtbot, ln_node_manager):
+    """The probe runs on a worker thread, once at a time, without connection retries."""
+    probe_threads = []
+
+    def probe(*args, **kwargs):
+        probe_threads.append(threading.current_thread())
+        return MagicMock(status_code=200)
+
+    mock_slot = MagicMock()
+    ln_node_manager.process_started.connect(mock_slot)
+    with patch('src.utils.request.Request.get', side_effect=probe) as mock_get:
+        ln_node_manager.check_node_status()
+        ln_node_manager.check_node_status()
+        qtbot.waitUntil(lambda: mock_slot.called, timeout=2000)
+
+    assert probe_threads and threading.main_thread() not in probe_threads
+    mock_get.assert_called_once_with(
+        NODE_INFO_ENDPOINT, timeout=NODE_READY_PROBE_TIMEOUT, retry=False,
+    )
+    mock_slot.assert_called_once()
+
+
+def test_stop_server_drops_probe_in_flight(qtbot, ln_node_manager):
+    """A probe still running when the server is stopped does not report it as started."""
+    release = threading.Event()
+
+    def probe(*args, **kwargs):
+        release.wait(2)
+        return MagicMock(status_code=200)
+
+    mock_slot = MagicMock()
+    ln_node_manager.process_started.connect(mock_slot)
+    with patch('src.utils.request.Request.get', side_effect=probe):
+        ln_node_manager.check_node_status()
+        ln_node_manager.stop_server_from_close_button()
+        release.set()
+        assert TaskScheduler.get_instance().wait_for_done(2000)
+        qtbot.wait(20)
 
-        # Assert that the attempts counter is incremented
-        assert ln_node_manager.attempts == 1  # Check if attempts incremented
+    mock_slot.assert_not_called()
 
 
 def test_check_process_on_close_button_click_max_attempts(ln_node_manager):
@@ -210,9 +265,11 @@ def test_on_process_started_success(ln_node_manager):
 
     ln_node_manager.on_process_started()
 
-    # Assert that attempts are reset and timer is started
+    # Assert that attempts are reset and the first status check is scheduled
     assert ln_node_manager.attempts == 0
-    ln_node_manager.timer.start.assert_called_once_with(INTERVAL * 1000)
+    ln_node_manager.timer.start.assert_called_once_with(
+        NODE_READY_PROBE_INITIAL_DELAY_MS,
+    )
 
 
 def test_on_process_started_failure(ln_node_manager):
@@ -227,3 +284,83 @@ def test_on_process_started_failure(ln_node_manager):
         mock_signal_handler.emit.assert_called_once_with(
             500, 'Unable to start server',
         )
+
+
+def test_check_node_status_backoff(ln_node_manager):
+    """Each failed status check doubles the delay before the next one, up to the maximum."""
+    ln_node_manager.timer.start = MagicMock()
+    for _ in range(10):
+        ln_node_manager.on_node_status(0)
+
+    delays = [
+        call.args[0]
+        for call in ln_node_manager.timer.start.call_args_list
+    ]
+    assert delays[:3] == [
+        NODE_READY_PROBE_INITIAL_DELAY_MS * 2,
+        NODE_READY_PROBE_INITIAL_DELAY_MS * 4,
+        NODE_READY_PROBE_INITIAL_DELAY_MS * 8,
+    ]
+    assert delays[-1] == NODE_READY_PROBE_MAX_DELAY_MS
+
+
+def test_check_node_status_timeout(ln_node_manager):
+    """The server is reported as failed once it did not answer within the timeout."""
+    ln_node_manager.started_at = 100.0
+    error_slot = MagicMock()
+    ln_node_manager.process_error.connect(error_slot)
+    with patch('src.utils.ln_node_manage.time.monotonic', return_value=100.0 + NODE_READY_TIMEOUT), \
+            patch('src.utils.request.Request.get') as mock_get:
+        ln_node_manager.check_node_status()
+
+    mock_get.assert_not_called()
+    error_slot.assert_called_once_with(500, 'Unable to start server')
+
+
+def test_check_node_status_records_time_to_ready(ln_node_manager):
+    """The time the server took to answer is recorded when it is ready."""
+    ln_node_manager.started_at = 100.0
+    with patch('src.utils.ln_node_manage.time.monotonic', return_value=101.5):
+        ln_node_manager.on_node_status(200)
+
+    assert ln_node_manager.time_to_ready == 1.5
+    assert ln_node_manager.started_at is None
+
+
+def test_probe_node_status():
+    """The probe returns the HTTP status of the answer, or 0 if the node did not answer."""
+    with patch('src.utils.request.Request.get') as mock_get:
+        mock_get.return_value = MagicMock(status_code=200)
+        assert LnNodeServerManager.probe_node_status() == 200
+
+        mock_get.side_effect = HTTPError(response=MagicMock(status_code=403))
+        assert LnNodeServerManager.probe_node_status() == 403
+
+        mock_get.side_effect = RequestsConnectionError('Connection refused')
+        assert LnNodeServerManager.probe_node_status() == 0
+
+
+def test_on_process_output_listening_checks_status_now(instance):
+    """The listening line of the node triggers an immediate status check."""
+    instance.timer = MagicMock()
+    instance.timer.isActive.return_value = True
+    instance.process.readAllStandardOutput.return_value.data.return_value = (
+        b'INFO rgb_lightning_node: Listening on 0.0.0.0:3001\n'
+    )
+
+    instance.on_process_output()
+
+    instance.timer.start.assert_called_once_with(0)
+
+
+def test_on_process_output_other_line(instance):
+    """Other output lines leave the scheduled status check untouched."""
+    instance.timer = MagicMock()
+    instance.timer.isActive.return_value = True
+    instance.process.readAllStandardOutput.return_value.data.return_value = (
+        b'INFO rgb_lightning_node: Starting\n'
+    )
+
+    instance.on_process_output()
+
+    instance.timer.start.assert_not_called()
@@ -67,6 +67,49 @@ def test_get_value_conversion_failure(local_store):
     assert result is None
 
 
+def test_get_value_reads_settings_once(local_store):
+    """Test that a value is read from the settings file once, then from memory."""
+    local_store.settings.value = MagicMock(return_value='123')
+    assert local_store.get_value('test_key') == '123'
+    assert local_store.get_value('test_key', int) == 123
+    local_store.settings.value.assert_called_once_with('test_key')
+
+    local_store.reload()
+    local_store.get_value('test_key')
+    assert local_store.settings.value.call_count == 2
+
+
+def test_set_value_writes_through_and_notifies(local_store):
+    """Test that set_value updates the file and memory, and signals changed values only."""
+    local_store.settings.value = MagicMock(return_value='old_value')
+    local_store.settings.setValue = MagicMock()
+    changed = MagicMock()
+    local_store.signals.value_changed.connect(changed)
+    local_store.get_value('test_key')
+
+    local_store.set_value('test_key', 'new_value')
+    local_store.set_value('test_key', 'new_value')
+
+    assert local_store.get_value('test_key') == 'new_value'
+    assert local_store.settings.setValue.call_count == 2
+    local_store.settings.value.assert_called_once_with('test_key')
+    changed.assert_called_once_with('test_key', 'new_value')
+
+
+def test_remove_key_forgets_value(local_store):
+    """Test that a removed key reads as None and is signalled as removed."""
+    local_store.settings.remove = MagicMock()
+    local_store.settings.setValue = MagicMock()
+    changed = MagicMock()
+    local_store.set_value('group/test_key', 'test_value')
+    local_store.signals.value_changed.connect(changed)
+
+    local_store.remove_key('group')
+
+    assert local_store.get_value('group') is None
+    changed.assert_called_once_with('group/test_key', None)
+
+
 def test_remove_key(local_store):
     """Test that remove_key removes the key from settings."""
     local_store.settings.remove = MagicMock()
@@ -0,0 +1,102 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument
+"""Unit tests for the MetricsRegistry class."""
+from __future__ import annotations
+
+import json
+
+from src.utils.metrics import MetricsRegistry
+from src.utils.metrics import percentile
+
+
+def test_percentile():
+    """Percentiles use the nearest rank of the sorted samples."""
+    samples = [float(value) for value in range(100, 0, -1)]
+
+    assert percentile(samples, 0.50) == 50.0
+    assert percentile(samples, 0.95) == 95.0
+    assert percentile(samples, 0.99) == 99.0
+    assert percentile([7.0], 0.99) == 7.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_record_request_aggregates_per_endpoint():
+    """Calls, errors, payload sizes, latencies and histogram are kept per endpoint."""
+    registry = MetricsRegistry()
+    registry.record_request(
+        'POST', '/listassets', 0.005,
+        request_bytes=20, response_bytes=300,
+    )
+    registry.record_request(
+        'POST', '/listassets', 0.2,
+        ok=False, response_bytes=40,
+    )
+    registry.record_request('GET', '/nodeinfo', 7.0)
+
+    endpoints = registry.snapshot()['endpoints']
+    list_assets = endpoints['/listassets']
+    assert list_assets['calls'] == 2
+    assert list_assets['errors'] == 1
+    assert list_assets['request_bytes'] == 20
+    assert list_assets['response_bytes'] == 340
+    assert list_assets['methods'] == ['POST']
+    assert list_assets['latency']['p50_ms'] == 5.0
+    assert list_assets['latency']['max_ms'] == 200.0
+    assert list_assets['histogram_ms']['<=10'] == 1
+    assert list_assets['histogram_ms']['<=250'] == 1
+    assert endpoints['/nodeinfo']['histogram_ms']['>5000'] == 1
+
+
+def test_percentiles_use_recent_samples():
+    """Only the most recent samples are kept for percentiles, while counts cover all calls."""
+    registry = MetricsRegistry(max_samples=2)
+    for duration_s in (1.0, 0.001, 0.002):
+        registry.record_request('GET', '/listchannels', duration_s)
+
+    metrics = registry.snapshot()['endpoints']['/listchannels']
+    assert metrics['calls'] == 3
+    assert metrics['latency']['p99_ms'] == 2.0
+    assert metrics['latency']['max_ms'] == 1000.0
+
+
+def test_requests_are_attributed_to_current_page():
+    """Requests are counted for the page shown when they were made, busiest page first."""
+    registry = MetricsRegistry()
+    registry.record_request('GET', '/nodeinfo', 0.01)
+    registry.set_current_page('FungibleAssetWidget')
+    registry.record_request('POST', '/listassets', 0.01)
+    registry.record_request('POST', '/listassets', 0.01)
+    registry.record_request('POST', '/btcbalance', 0.01)
+
+    pages = registry.snapshot()['pages']
+    assert list(pages) == ['FungibleAssetWidget', 'unknown']
+    assert pages['FungibleAssetWidget'] == {'/listassets': 2, '/btcbalance': 1}
+
+
+def test_queue_waits_and_sources():
+    """Queue waits are summarised and failing sources are left out of the snapshot."""
+    registry = MetricsRegistry()
+    registry.record_queue_wait('thread_manager', 0.004)
+    registry.register_source('cache', lambda: {'misses': 3})
+    registry.register_source('broken', lambda: 1 / 0)
+
+    snapshot = registry.snapshot()
+    assert snapshot['queue_waits']['thread_manager']['count'] == 1
+    assert snapshot['queue_waits']['thread_manager']['p50_ms'] == 4.0
+    assert snapshot['components'] == {'cache': {'misses': 3}}
+
+
+def test_export_json_and_reset(tmp_path):
+    """The snapshot is exported as JSON, and reset forgets the recorded requests."""
+    registry = MetricsRegistry()
+    registry.record_request('GET', '/nodeinfo', 0.01)
+    path = tmp_path / 'metrics.json'
+
+    registry.export_json(str(path))
+    registry.reset()
+
+    assert json.loads(
+        path.read_text(encoding='utf-8'),
+    )['endpoints']['/nodeinfo']['calls'] == 1
+    assert not registry.snapshot()['endpoints']
@@ -0,0 +1,207 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument
+"""Unit tests for the NodeStateTracker class."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import HTTPError
+
+from src.model.enums.enums_model import NodeLockState
+from src.utils.custom_exception import CommonException
+from src.utils.endpoints import LIST_ASSETS_ENDPOINT
+from src.utils.endpoints import LOCK_ENDPOINT
+from src.utils.endpoints import NODE_INFO_ENDPOINT
+from src.utils.endpoints import SHUTDOWN_ENDPOINT
+from src.utils.endpoints import UNLOCK_ENDPOINT
+from src.utils.error_message import ERROR_NODE_IS_LOCKED_CALL_UNLOCK
+from src.utils.error_message import ERROR_NODE_IS_UNLOCKED_CALL_LOCK
+from src.utils.node_state import is_node_locked
+from src.utils.node_state import is_node_locked_cached
+from src.utils.node_state import NodeStateTracker
+from src.utils.request import Request
+
+NODE_URL = 'http://127.0.0.1:3001'
+
+
+@pytest.fixture
+def tracker():
+    """Create a fresh tracker."""
+    return NodeStateTracker(max_age=60)
+
+
+def make_response(status_code, error=None):
+    """Create a mock node response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = {'error': error, 'code': status_code}
+    return response
+
+
+def test_initial_state_unknown(tracker):
+    """A new tracker knows nothing about the node."""
+    assert tracker.get_state(NODE_URL) == NodeLockState.UNKNOWN
+
+
+def test_set_state_is_per_node(tracker):
+    """The remembered state only applies to the node it was learned from."""
+    tracker.set_state(NODE_URL, NodeLockState.UNLOCKED)
+    assert tracker.get_state(NODE_URL) == NodeLockState.UNLOCKED
+    assert tracker.get_state('http://remote:3001') == NodeLockState.UNKNOWN
+
+
+def test_state_becomes_stale(tracker):
+    """The state is unknown again once it is older than max_age."""
+    with patch('src.utils.node_state.time.monotonic', return_value=100.0):
+        tracker.set_state(NODE_URL, NodeLockState.LOCKED)
+    with patch('src.utils.node_state.time.monotonic', return_value=150.0):
+        assert tracker.get_state(NODE_URL) == NodeLockState.LOCKED
+    with patch('src.utils.node_state.time.monotonic', return_value=161.0):
+        assert tracker.get_state(NODE_URL) == NodeLockState.UNKNOWN
+
+
+def test_observe_unlock_and_lock(tracker):
+    """Successful unlock and lock responses update the state."""
+    tracker.observe_response(NODE_URL, UNLOCK_ENDPOINT, make_response(200))
+    assert tracker.get_state(NODE_URL) == NodeLockState.UNLOCKED
+    tracker.observe_response(NODE_URL, LOCK_ENDPOINT, make_response(200))
+    assert tracker.get_state(NODE_URL) == NodeLockState.LOCKED
+
+
+def test_observe_shutdown_resets(tracker):
+    """A successful shutdown forgets the state."""
+    tracker.set_state(NODE_URL, NodeLockState.UNLOCKED)
+    tracker.observe_response(NODE_URL, SHUTDOWN_ENDPOINT, make_response(200))
+    assert tracker.get_state(NODE_URL) == NodeLockState.UNKNOWN
+
+
+def test_observe_lock_errors(tracker):
+    """403 lock errors from any endpoint update the state."""
+    tracker.set_state(NODE_URL, NodeLockState.UNLOCKED)
+    tracker.observe_response(
+        NODE_URL, LIST_ASSETS_ENDPOINT, make_response(
+            403, ERROR_NODE_IS_LOCKED_CALL_UNLOCK,
+        ),
+    )
+    assert tracker.get_state(NODE_URL) == NodeLockState.LOCKED
+    tracker.observe_response(
+        NODE_URL, LIST_ASSETS_ENDPOINT, make_response(
+            403, ERROR_NODE_IS_UNLOCKED_CALL_LOCK,
+        ),
+    )
+    assert tracker.get_state(NODE_URL) == NodeLockState.UNLOCKED
+
+
+def test_observe_ignores_unrelated_responses(tracker):
+    """Other responses leave the state untouched."""
+    tracker.set_state(NODE_URL, NodeLockState.UNLOCKED)
+    tracker.observe_response(
+        NODE_URL, LIST_ASSETS_ENDPOINT, make_response(200),
+    )
+    tracker.observe_response(
+        NODE_URL, LIST_ASSETS_ENDPOINT, make_response(403, 'Other error'),
+    )
+    invalid_json = make_response(403)
+    invalid_json.json.side_effect = ValueError('Invalid JSON')
+    tracker.observe_response(NODE_URL, LIST_ASSETS_ENDPOINT, invalid_json)
+    assert tracker.get_state(NODE_URL) == NodeLockState.UNLOCKED
+
+
+def test_get_instance_singleton():
+    """get_instance always returns the same tracker."""
+    assert NodeStateTracker.get_instance() is NodeStateTracker.get_instance()
+
+
+@pytest.fixture
+def reset_node_state():
+    """Forget the remembered node lock state before and after the test."""
+    NodeStateTracker.get_instance().reset()
+    yield
+    NodeStateTracker.get_instance().reset()
+
+
+@patch.object(Request, 'get')
+def test_is_node_locked_not_locked(mock_get, reset_node_state):
+    """The probe reports an unlocked node and remembers it."""
+    mock_get.return_value = make_response(200)
+
+    assert is_node_locked() is False
+    mock_get.assert_called_once_with(NODE_INFO_ENDPOINT, retry=False)
+    assert NodeStateTracker.get_instance().get_state(
+        Request.load_base_url(),
+    ) == NodeLockState.UNLOCKED
+
+
+@patch.object(Request, 'get')
+def test_is_node_locked_locked(mock_get, reset_node_state):
+    """The probe reports a locked node from its 403 error."""
+    mock_get.side_effect = HTTPError(
+        response=make_response(403, ERROR_NODE_IS_LOCKED_CALL_UNLOCK),
+    )
+
+    assert is_node_locked() is True
+    mock_get.assert_called_once_with(NODE_INFO_ENDPOINT, retry=False)
+
+
+@patch.object(Request, 'get')
+def test_is_node_locked_http_error(mock_get, reset_node_state):
+    """Other HTTP errors are raised with the node's message."""
+    mock_get.side_effect = HTTPError(
+        response=make_response(500, 'Unhandled error'),
+    )
+
+    with pytest.raises(CommonException) as exc_info:
+        is_node_locked()
+
+    assert str(exc_info.value) == 'Unhandled error'
+
+
+@patch.object(Request, 'get')
+def test_is_node_locked_value_error(mock_get, reset_node_state):
+    """A 403 error without a JSON body is not taken as locked."""
+    response = make_response(403)
+    response.json.side_effect = ValueError('Invalid JSON')
+    mock_get.side_effect = HTTPError(response=response)
+
+    assert is_node_locked() is False
+
+
+@patch.object(Request, 'get')
+def test_is_node_locked_connection_error(mock_get, reset_node_state):
+    """A refused connection is reported as an unreachable node."""
+    mock_get.side_effect = RequestsConnectionError()
+
+    with pytest.raises(CommonException) as exc_info:
+        is_node_locked()
+
+    assert str(exc_info.value) == 'Unable to connect to node'
+
+
+@patch.object(Request, 'get')
+def test_is_node_locked_general_exception(mock_get, reset_node_state):
+    """Unexpected errors are wrapped in a CommonException."""
+    mock_get.side_effect = Exception('General exception')
+
+    with pytest.raises(CommonException) as exc_info:
+        is_node_locked()
+
+    assert str(
+        exc_info.value,
+    ) == 'is_node_locked: Error while checking if node is locked'
+
+
+@patch('src.utils.node_state.is_node_locked', return_value=True)
+def test_is_node_locked_cached(mock_is_node_locked, reset_node_state):
+    """The node is only probed while its lock state is unknown."""
+    assert is_node_locked_cached() is True
+    mock_is_node_locked.assert_called_once()
+
+    NodeStateTracker.get_instance().set_state(
+        Request.load_base_url(), NodeLockState.UNLOCKED,
+    )
+    assert is_node_locked_cached() is False
+    mock_is_node_locked.assert_called_once()
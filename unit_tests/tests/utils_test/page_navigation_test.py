@@ -4,6 +4,8 @@
 """Unit tests for the PageNavigation class."""
 from __future__ import annotations
 
+import subprocess
+import sys
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -13,6 +15,7 @@ from src.model.rgb_model import RgbAssetPageLoadModel
 from src.model.selection_page_model import SelectionPageModel
 from src.model.success_model import SuccessPageModel
 from src.model.transaction_detail_page_model import TransactionDetailPageModel
+from src.utils.page_navigation import LazyPage
 from src.utils.page_navigation import PageNavigation
 from src.utils.page_navigation_events import PageNavigationEventManager
 from src.views.main_window import MainWindow
@@ -313,3 +316,143 @@ def test_error_report_dialog_box(page_navigation):
 
         # Verify the dialog was shown
         mock_dialog_instance.exec.assert_called_once()
+
+
+def test_cacheable_page_is_reused_and_refreshed(page_navigation, mock_ui):
+    """Navigating back to a cacheable page reuses its widget and refreshes it."""
+    page_navigation.bitcoin_page()
+    first_widget = page_navigation.current_stack['widget']
+    page_navigation.help_page()
+    page_navigation.bitcoin_page()
+
+    assert page_navigation.current_stack['widget'] is first_widget
+    page_navigation.pages['Bitcoin'].assert_called_once_with(
+        mock_ui.view_model,
+    )
+    first_widget.refresh_page.assert_called_once()
+
+
+def test_non_cacheable_page_is_rebuilt(page_navigation):
+    """Pages outside the cache are created on every navigation."""
+    page_navigation.send_bitcoin_page()
+    page_navigation.send_bitcoin_page()
+
+    assert page_navigation.pages['SendBitcoin'].call_count == 2
+    assert 'SendBitcoin' not in page_navigation.page_cache
+
+
+def test_page_cache_evicts_least_recently_shown(mock_ui, mock_event_manager):
+    """The least recently shown page is removed once the cache is full."""
+    navigation = PageNavigation(mock_ui, max_cached_pages=2)
+    for page_name in navigation.pages:
+        navigation.pages[page_name] = MagicMock(
+            side_effect=lambda *_: MagicMock(),
+        )
+
+    navigation.bitcoin_page()
+    bitcoin_widget = navigation.current_stack['widget']
+    navigation.about_page()
+    navigation.help_page()
+
+    assert list(navigation.page_cache) == ['AboutWidget', 'HelpWidget']
+    mock_ui.stacked_widget.removeWidget.assert_called_once_with(
+        bitcoin_widget,
+    )
+    bitcoin_widget.deleteLater.assert_called_once()
+
+
+def test_session_boundary_page_clears_cache(page_navigation, mock_ui):
+    """Starting a new session drops the cached pages."""
+    page_navigation.bitcoin_page()
+    bitcoin_widget = page_navigation.current_stack['widget']
+    page_navigation.enter_wallet_password_page()
+
+    assert not page_navigation.page_cache
+    bitcoin_widget.deleteLater.assert_called_once()
+
+
+def test_show_current_page_adds_widget_once(page_navigation, mock_ui):
+    """The page widget is only added to the stacked widget when not already in it."""
+    mock_ui.stacked_widget.indexOf.return_value = -1
+    page_navigation.bitcoin_page()
+    mock_ui.stacked_widget.addWidget.assert_called_once()
+
+    mock_ui.stacked_widget.indexOf.return_value = 0
+    page_navigation.bitcoin_page()
+    mock_ui.stacked_widget.addWidget.assert_called_once()
+
+
+def test_lazy_page_imports_module_on_first_use():
+    """A lazy page imports its module once, when the page is first created."""
+    lazy_page = LazyPage('src.views.ui_about', 'AboutWidget')
+    page_class = MagicMock(return_value='widget')
+    module = MagicMock(AboutWidget=page_class)
+
+    with patch('src.utils.page_navigation.importlib.import_module', return_value=module) as mock_import:
+        assert not lazy_page.is_loaded
+        assert lazy_page('view_model') == 'widget'
+        assert lazy_page('view_model') == 'widget'
+
+    mock_import.assert_called_once_with('src.views.ui_about')
+    assert lazy_page.is_loaded
+    page_class.assert_called_with('view_model')
+
+
+def test_pages_are_lazy(mock_ui, mock_event_manager):
+    """Every page is a lazy factory of an existing page widget class."""
+    navigation = PageNavigation(mock_ui)
+
+    for page in navigation.pages.values():
+        assert isinstance(page, LazyPage)
+    assert navigation.pages['Bitcoin'].load().__name__ == 'BtcWidget'
+
+
+def test_page_navigation_import_does_not_import_pages():
+    """Importing the navigation leaves the page modules to be imported on demand."""
+    code = (
+        'import sys; import src.utils.page_navigation; '
+        "print(sorted(m for m in ('src.views.ui_swap', 'src.views.ui_settings', "
+        "'src.views.ui_create_channel') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True,
+        check=True, timeout=120,
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == '[]'
+
+
+def test_warm_up_pages_imports_each_module_once(page_navigation):
+    """Warm-up loads every page not loaded yet, one per timer step."""
+    pages = [MagicMock(spec=LazyPage, is_loaded=False) for _ in range(2)]
+    loaded_page = MagicMock(spec=LazyPage, is_loaded=True)
+    page_navigation.pages = {
+        'First': pages[0], 'Alias': pages[0], 'Second': pages[1], 'Loaded': loaded_page,
+    }
+
+    with patch('src.utils.page_navigation.QTimer.singleShot') as mock_single_shot:
+        page_navigation.warm_up_pages(start_delay_ms=0)
+        while mock_single_shot.call_args_list:
+            _, callback = mock_single_shot.call_args_list.pop(0).args
+            callback()
+
+    for page in pages:
+        page.load.assert_called_once()
+    loaded_page.load.assert_not_called()
+    assert page_navigation.warm_up_queue is None
+
+
+def test_navigation_cancels_tasks_of_previous_page(page_navigation, page_scope, metrics_registry):
+    """Showing a page cancels the page-scoped tasks of the previous one before the new page loads."""
+    page_navigation.fungibles_asset_page()
+    fungible_token = page_scope.token()
+
+    params = MagicMock(spec=RgbAssetPageLoadModel)
+    page_navigation.rgb25_detail_page(params)
+
+    assert fungible_token.is_cancelled
+    assert page_scope.page_name == 'RGB25Detail'
+    assert metrics_registry.current_page == 'RGB25Detail'
+    page_navigation.pages['RGB25Detail'].assert_called_once_with(
+        page_navigation._ui.view_model, params,
+    )
@@ -0,0 +1,30 @@
+"""Unit tests for the PageScope class."""
+from __future__ import annotations
+
+from src.utils.page_scope import PageScope
+
+
+def test_enter_cancels_tokens_of_previous_page():
+    """Entering a page cancels the tokens handed out for the previous one only."""
+    scope = PageScope()
+    scope.enter('FungibleAssetWidget')
+    old_token = scope.token()
+
+    scope.enter('Bitcoin')
+    new_token = scope.token()
+
+    assert old_token.is_cancelled
+    assert not new_token.is_cancelled
+    assert scope.page_name == 'Bitcoin'
+    assert scope.cancelled_tasks == 1
+
+
+def test_enter_ignores_tokens_already_cancelled():
+    """Tokens cancelled by their owner are not counted again."""
+    scope = PageScope()
+    token = scope.token()
+    token.cancel()
+
+    scope.enter('Bitcoin')
+
+    assert scope.cancelled_tasks == 0
@@ -4,6 +4,8 @@
 """Unit tests for the Request class."""
 from __future__ import annotations
 
+import threading
+import time
 from datetime import timedelta
 from unittest.mock import call
 from unittest.mock import MagicMock
@@ -14,7 +16,11 @@ import requests
 
 from src.utils.constant import BACKED_URL_LIGHTNING_NETWORK
 from src.utils.constant import REQUEST_TIMEOUT
+from src.utils.custom_exception import RequestCancelledError
 from src.utils.request import Request
+from src.utils.single_flight import SingleFlight
+from src.utils.task_scheduler import bind_token
+from src.utils.task_scheduler import CancellationToken
 
 
 @pytest.fixture
@@ -30,11 +36,12 @@ def mock_response():
 
 
 @pytest.fixture(autouse=True)
-def mock_requests():
-    """Mock all requests methods."""
-    with patch('src.utils.request.requests') as mock_req:
-        mock_req.Response = MagicMock(spec=requests.Response)
-        yield mock_req
+def mock_session():
+    """Mock the pooled session used to send requests."""
+    with patch('src.utils.request.SessionPool.get_instance') as mock_get_instance:
+        session = MagicMock(spec=requests.Session)
+        mock_get_instance.return_value.session.return_value.__enter__.return_value = session
+        yield session
 
 
 def test_load_base_url_with_local_store():
@@ -69,9 +76,9 @@ def test_merge_headers_without_extra():
 
 
 @patch('src.utils.request.logger')
-def test_get_request(mock_logger, mock_requests, mock_response):
+def test_get_request(mock_logger, mock_session, mock_response):
     """Test GET request functionality."""
-    mock_requests.get.return_value = mock_response
+    mock_session.request.return_value = mock_response
 
     # Mock the base URL to ensure consistent testing
     with patch('src.utils.request.Request.load_base_url', return_value='http://127.0.0.1:3001'):
@@ -85,8 +92,8 @@ def test_get_request(mock_logger, mock_requests, mock_response):
         )
 
         # Verify the request was made correctly
-        mock_requests.get.assert_called_once_with(
-            'http://127.0.0.1:3001/test',
+        mock_session.request.assert_called_once_with(
+            'GET', 'http://127.0.0.1:3001/test',
             headers={
                 'Content-Type': 'application/json',
                 'Authorization': 'Bearer token',
@@ -108,10 +115,22 @@ def test_get_request(mock_logger, mock_requests, mock_response):
         assert response == mock_response
 
 
+def test_get_request_without_retry(mock_session, mock_response):
+    """Test that probes borrow a session which does not retry failed connections."""
+    mock_session.request.return_value = mock_response
+
+    with patch('src.utils.request.Request.load_base_url', return_value='http://127.0.0.1:3001'), \
+            patch('src.utils.request.SessionPool.get_instance') as mock_get_instance:
+        mock_get_instance.return_value.session.return_value.__enter__.return_value = mock_session
+        Request.get(endpoint='/nodeinfo', retry=False)
+
+    mock_get_instance.return_value.session.assert_called_once_with(False)
+
+
 @patch('src.utils.request.logger')
-def test_post_request(mock_logger, mock_requests, mock_response):
+def test_post_request(mock_logger, mock_session, mock_response):
     """Test POST request functionality."""
-    mock_requests.post.return_value = mock_response
+    mock_session.request.return_value = mock_response
 
     # Mock the base URL to ensure consistent testing
     with patch('src.utils.request.Request.load_base_url', return_value='http://127.0.0.1:3001'):
@@ -125,8 +144,8 @@ def test_post_request(mock_logger, mock_requests, mock_response):
         )
 
         # Verify the request was made correctly
-        mock_requests.post.assert_called_once_with(
-            'http://127.0.0.1:3001/test',
+        mock_session.request.assert_called_once_with(
+            'POST', 'http://127.0.0.1:3001/test',
             json={'key': 'value'},
             headers={
                 'Content-Type': 'application/json',
@@ -149,9 +168,9 @@ def test_post_request(mock_logger, mock_requests, mock_response):
 
 
 @patch('src.utils.request.logger')
-def test_post_request_with_files(mock_logger, mock_requests, mock_response):
+def test_post_request_with_files(mock_logger, mock_session, mock_response):
     """Test POST request with file upload."""
-    mock_requests.post.return_value = mock_response
+    mock_session.request.return_value = mock_response
     test_files = {'file': ('test.txt', 'test content')}
 
     # Mock the base URL to ensure consistent testing
@@ -162,8 +181,8 @@ def test_post_request_with_files(mock_logger, mock_requests, mock_response):
         )
 
         # Verify the request was made correctly
-        mock_requests.post.assert_called_once_with(
-            'http://127.0.0.1:3001/upload',
+        mock_session.request.assert_called_once_with(
+            'POST', 'http://127.0.0.1:3001/upload',
             files=test_files,
             timeout=REQUEST_TIMEOUT,
         )
@@ -172,9 +191,9 @@ def test_post_request_with_files(mock_logger, mock_requests, mock_response):
 
 
 @patch('src.utils.request.logger')
-def test_put_request(mock_logger, mock_requests, mock_response):
+def test_put_request(mock_logger, mock_session, mock_response):
     """Test PUT request functionality."""
-    mock_requests.put.return_value = mock_response
+    mock_session.request.return_value = mock_response
 
     # Mock the base URL to ensure consistent testing
     with patch('src.utils.request.Request.load_base_url', return_value='http://127.0.0.1:3001'):
@@ -187,8 +206,8 @@ def test_put_request(mock_logger, mock_requests, mock_response):
         )
 
         # Verify the request was made correctly
-        mock_requests.put.assert_called_once_with(
-            'http://127.0.0.1:3001/test',
+        mock_session.request.assert_called_once_with(
+            'PUT', 'http://127.0.0.1:3001/test',
             json={'key': 'value'},
             headers={
                 'Content-Type': 'application/json',
@@ -211,9 +230,9 @@ def test_put_request(mock_logger, mock_requests, mock_response):
 
 
 @patch('src.utils.request.logger')
-def test_delete_request(mock_logger, mock_requests, mock_response):
+def test_delete_request(mock_logger, mock_session, mock_response):
     """Test DELETE request functionality."""
-    mock_requests.delete.return_value = mock_response
+    mock_session.request.return_value = mock_response
 
     # Mock the base URL to ensure consistent testing
     with patch('src.utils.request.Request.load_base_url', return_value='http://127.0.0.1:3001'):
@@ -225,8 +244,8 @@ def test_delete_request(mock_logger, mock_requests, mock_response):
         )
 
         # Verify the request was made correctly
-        mock_requests.delete.assert_called_once_with(
-            'http://127.0.0.1:3001/test',
+        mock_session.request.assert_called_once_with(
+            'DELETE', 'http://127.0.0.1:3001/test',
             headers={
                 'Content-Type': 'application/json',
                 'Authorization': 'Bearer token',
@@ -250,19 +269,131 @@ def test_delete_request(mock_logger, mock_requests, mock_response):
         assert response == mock_response
 
 
-def test_request_with_default_params(mock_requests, mock_response):
+def test_request_with_default_params(mock_session, mock_response):
     """Test requests with default parameters."""
-    mock_requests.get.return_value = mock_response
+    mock_session.request.return_value = mock_response
 
     # Mock the base URL to ensure consistent testing
     with patch('src.utils.request.Request.load_base_url', return_value='http://127.0.0.1:3001'):
         Request.get('/test')
 
         # Verify defaults were used
-        mock_requests.get.assert_called_once_with(
-            'http://127.0.0.1:3001/test',
+        mock_session.request.assert_called_once_with(
+            'GET', 'http://127.0.0.1:3001/test',
             headers={'Content-Type': 'application/json'},
             params={},
             timeout=None,
             json=None,
         )
+
+
+def test_request_metrics_recorded(mock_session, mock_response, metrics_registry):
+    """Every request is recorded in the metrics registry under its endpoint."""
+    mock_response.ok = True
+    mock_response.content = b'{"status": true}'
+    mock_session.request.return_value = mock_response
+
+    with patch('src.utils.request.Request.load_base_url', return_value='http://127.0.0.1:3001'):
+        Request.post('/unlock', body={'password': 'x'})
+
+    metrics = metrics_registry.snapshot()['endpoints']['/unlock']
+    assert metrics['calls'] == 1
+    assert metrics['errors'] == 0
+    assert metrics['methods'] == ['POST']
+    assert metrics['response_bytes'] == len(b'{"status": true}')
+
+
+def test_request_metrics_recorded_on_failure(mock_session, metrics_registry):
+    """Requests that raise are recorded as errors before the exception propagates."""
+    mock_session.request.side_effect = requests.ConnectionError('refused')
+
+    with patch('src.utils.request.Request.load_base_url', return_value='http://127.0.0.1:3001'):
+        with pytest.raises(requests.ConnectionError):
+            Request.get('/nodeinfo')
+
+    metrics = metrics_registry.snapshot()['endpoints']['/nodeinfo']
+    assert metrics['calls'] == 1
+    assert metrics['errors'] == 1
+
+
+def send_concurrently(send, release: threading.Event, started: threading.Event, callers: int = 2):
+    """Start `send` in several threads while the first request is held in flight."""
+    threads = [threading.Thread(target=send) for _ in range(callers)]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    return threads
+
+
+def test_concurrent_read_requests_are_coalesced(mock_session, mock_response, metrics_registry):
+    """Identical concurrent calls to a read-only endpoint share one request."""
+    started = threading.Event()
+    release = threading.Event()
+    single_flight = SingleFlight()
+
+    def request(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return mock_response
+    mock_session.request.side_effect = request
+    responses = []
+
+    with patch('src.utils.request.Request.load_base_url', return_value='http://127.0.0.1:3001'), \
+            patch('src.utils.request.SingleFlight.get_instance', return_value=single_flight):
+        threads = send_concurrently(
+            lambda: responses.append(
+                Request.post('/listassets', body={'filter_asset_schemas': []}),
+            ),
+            release, started,
+        )
+        key = next(iter(single_flight._calls))
+        while single_flight._calls[key].followers < 1:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+    assert mock_session.request.call_count == 1
+    assert responses == [mock_response, mock_response]
+    assert metrics_registry.snapshot(
+    )['endpoints']['/listassets']['coalesced'] == 1
+
+
+def test_concurrent_mutating_requests_are_not_coalesced(mock_session, mock_response):
+    """Identical concurrent calls to a mutating endpoint are all sent."""
+    started = threading.Event()
+    release = threading.Event()
+    in_flight = []
+
+    def request(*args, **kwargs):
+        in_flight.append(1)
+        if len(in_flight) == 2:
+            release.set()
+        started.set()
+        release.wait(5)
+        return mock_response
+    mock_session.request.side_effect = request
+
+    with patch('src.utils.request.Request.load_base_url', return_value='http://127.0.0.1:3001'):
+        threads = send_concurrently(
+            lambda: Request.post('/sendasset', body={'asset_id': 'rgb:1'}),
+            release, started,
+        )
+        for thread in threads:
+            thread.join(5)
+
+    assert mock_session.request.call_count == 2
+
+
+def test_request_of_cancelled_task_is_not_sent(mock_session):
+    """Requests made by a task after it was cancelled raise instead of reaching the node."""
+    token = CancellationToken()
+    token.cancel()
+
+    with patch('src.utils.request.Request.load_base_url', return_value='http://127.0.0.1:3001'), \
+            bind_token(token):
+        with pytest.raises(RequestCancelledError):
+            Request.post('/listassets', body={'filter_asset_schemas': []})
+
+    mock_session.request.assert_not_called()
@@ -0,0 +1,92 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument
+"""Unit tests for the ServiceExecutor class."""
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.service_executor import ServiceExecutor
+from src.utils.task_scheduler import bind_token
+from src.utils.task_scheduler import CancellationToken
+from src.utils.task_scheduler import current_token
+
+
+@pytest.fixture
+def service_executor():
+    """Create an executor with two workers."""
+    executor = ServiceExecutor(max_workers=2)
+    yield executor
+    executor.shutdown()
+
+
+def test_run_parallel_returns_results_by_name(service_executor):
+    """Each result is returned under the name of its call."""
+    results = service_executor.run_parallel({
+        'first': lambda: 1,
+        'second': lambda: 'two',
+    })
+    assert results == {'first': 1, 'second': 'two'}
+
+
+def test_run_parallel_runs_calls_concurrently(service_executor):
+    """Both calls are in flight at the same time."""
+    barrier = threading.Barrier(2, timeout=1)
+
+    def call():
+        barrier.wait()
+        return True
+
+    results = service_executor.run_parallel({'first': call, 'second': call})
+    assert results == {'first': True, 'second': True}
+
+
+def test_run_parallel_raises_first_declared_error(service_executor):
+    """The error of the first failing call in declaration order is raised after all calls finish."""
+    finished = threading.Event()
+
+    def slow_success():
+        finished.set()
+        return True
+
+    def fail(message):
+        raise ValueError(message)
+
+    with pytest.raises(ValueError, match='first'):
+        service_executor.run_parallel({
+            'first': lambda: fail('first'),
+            'success': slow_success,
+            'second': lambda: fail('second'),
+        })
+    assert finished.is_set()
+
+
+def test_run_parallel_nested_runs_inline(service_executor):
+    """Calls made from an executor thread do not wait on the pool."""
+    def outer():
+        return service_executor.run_parallel({
+            'inner': threading.current_thread,
+        })['inner']
+
+    results = service_executor.run_parallel({'a': outer, 'b': outer})
+    assert results['a'].name.startswith('service-executor')
+
+
+def test_get_instance_singleton():
+    """get_instance always returns the same executor."""
+    with patch.object(ServiceExecutor, '_instance', None):
+        assert ServiceExecutor.get_instance() is ServiceExecutor.get_instance()
+
+
+def test_run_parallel_calls_share_the_token_of_the_task(service_executor):
+    """Calls run with the cancellation token of the calling task."""
+    token = CancellationToken()
+    with bind_token(token):
+        results = service_executor.run_parallel({
+            'first': current_token, 'second': current_token,
+        })
+    assert results == {'first': token, 'second': token}
+    assert current_token() is None
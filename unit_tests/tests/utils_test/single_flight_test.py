@@ -0,0 +1,124 @@
+# pylint: disable=protected-access
+"""Unit tests for the SingleFlight class."""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.utils.single_flight import SingleFlight
+
+
+def wait_for_followers(single_flight: SingleFlight, key: str, followers: int):
+    """Wait until the given number of callers wait for the call in flight."""
+    deadline = time.monotonic() + 5
+    while single_flight._calls[key].followers < followers:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def run_concurrently(single_flight: SingleFlight, key: str, func, callers: int = 3):
+    """Call `do` from several threads while the first call is held in flight."""
+    outcomes: list = []
+
+    def call():
+        try:
+            outcomes.append(single_flight.do(key, func))
+        except ValueError as exc:
+            outcomes.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(callers)]
+    threads[0].start()
+    return threads, outcomes
+
+
+def test_make_key_ignores_payload_order_and_timeout():
+    """Keys depend on the method, URL and payload, not on dict order or timeout."""
+    key = SingleFlight.make_key(
+        'POST', 'http://node/listassets', json={'a': 1, 'b': [2]}, timeout=5,
+    )
+    assert key == SingleFlight.make_key(
+        'POST', 'http://node/listassets', json={'b': [2], 'a': 1},
+    )
+    assert key != SingleFlight.make_key(
+        'POST', 'http://node/listassets', json={'a': 2, 'b': [2]},
+    )
+    assert key != SingleFlight.make_key(
+        'GET', 'http://node/listassets', json={'a': 1, 'b': [2]},
+    )
+
+
+def test_concurrent_calls_share_one_result():
+    """Callers arriving while a call is in flight get its result without calling."""
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 'assets'
+
+    threads, outcomes = run_concurrently(single_flight, 'key', func)
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    wait_for_followers(single_flight, 'key', 2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(outcomes) == [
+        ('assets', False),
+        ('assets', True), ('assets', True),
+    ]
+    assert single_flight.in_flight() == 0
+
+
+def test_concurrent_calls_share_the_exception():
+    """Every caller waiting for a failed call receives its exception."""
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    error = ValueError('node unreachable')
+
+    def func():
+        started.set()
+        release.wait(5)
+        raise error
+
+    threads, outcomes = run_concurrently(single_flight, 'key', func, callers=2)
+    assert started.wait(5)
+    threads[1].start()
+    wait_for_followers(single_flight, 'key', 1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert outcomes == [error, error]
+    assert single_flight.in_flight() == 0
+
+
+def test_sequential_calls_are_not_cached():
+    """Once a call completes, the next call with the same key runs again."""
+    single_flight = SingleFlight()
+    results = iter(['first', 'second'])
+
+    assert single_flight.do('key', lambda: next(results)) == ('first', False)
+    assert single_flight.do('key', lambda: next(results)) == ('second', False)
+
+
+def test_failed_call_is_not_kept():
+    """A call that raised does not prevent the next call with the same key."""
+    single_flight = SingleFlight()
+
+    def fail():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        single_flight.do('key', fail)
+    assert single_flight.do('key', lambda: 'ok') == ('ok', False)
@@ -0,0 +1,142 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument,protected-access
+"""Unit tests for the StartupTracer class."""
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QWidget
+
+from src.utils.startup_trace import _FirstPaintWatcher
+from src.utils.startup_trace import STARTUP_TRACE_DEFAULT_PAGE
+from src.utils.startup_trace import STARTUP_TRACE_ENV
+from src.utils.startup_trace import STARTUP_TRACE_EXIT_ENV
+from src.utils.startup_trace import STARTUP_TRACE_PAGE_ENV
+from src.utils.startup_trace import StartupTracer
+
+
+def test_disabled_tracer_records_nothing(tmp_path):
+    """Without an output path, phases are not recorded and no file is written."""
+    tracer = StartupTracer()
+
+    with tracer.phase('imports'):
+        pass
+    tracer.begin('node_start')
+    tracer.end('node_start')
+    tracer.mark('ready')
+    tracer.finish()
+
+    assert not tracer.enabled
+    assert not tracer.events
+    assert not list(tmp_path.iterdir())
+
+
+def test_phases_are_recorded_as_complete_events(tmp_path):
+    """Phases, spans and marks are recorded in the Chrome trace event format."""
+    tracer = StartupTracer()
+    tracer.enable(str(tmp_path / 'trace.json'))
+
+    with tracer.phase('create_qapplication'):
+        pass
+    tracer.begin('node_start')
+    tracer.end('node_start')
+    tracer.end('never_started')
+    tracer.mark('ready')
+
+    names = [event['name'] for event in tracer.events]
+    assert names == ['create_qapplication', 'node_start', 'ready']
+    assert tracer.events[0]['ph'] == 'X'
+    assert tracer.events[0]['dur'] >= 0
+    assert tracer.events[2]['ph'] == 'i'
+    assert set(tracer.phase_durations()) == {
+        'create_qapplication', 'node_start',
+    }
+
+
+def test_finish_writes_trace_and_exits(tmp_path, qt_app):
+    """Finishing writes the JSON trace once and quits the application when asked to."""
+    trace_path = tmp_path / 'trace.json'
+    tracer = StartupTracer()
+    tracer.enable(str(trace_path), exit_when_done=True)
+    tracer.record('imports', tracer.origin, tracer.origin + 0.25)
+
+    with patch.object(QCoreApplication, 'instance') as mock_instance:
+        tracer.finish()
+        tracer.finish()
+
+    mock_instance.return_value.exit.assert_called_once_with(0)
+    trace = json.loads(trace_path.read_text(encoding='utf-8'))
+    assert trace['otherData']['phases_ms'] == {'imports': 250.0}
+    assert trace['traceEvents'][0]['dur'] == 250000
+    assert tracer.is_finished
+    assert not tracer.enabled
+
+
+def test_configure_from_env(tmp_path, monkeypatch):
+    """The environment variables enable tracing with their page and exit settings."""
+    monkeypatch.setenv(STARTUP_TRACE_ENV, str(tmp_path / 'trace.json'))
+    monkeypatch.setenv(STARTUP_TRACE_PAGE_ENV, 'TermCondition')
+    monkeypatch.setenv(STARTUP_TRACE_EXIT_ENV, '1')
+    tracer = StartupTracer()
+
+    tracer.configure_from_env()
+
+    assert tracer.enabled
+    assert tracer.target_page == 'TermCondition'
+    assert tracer.exit_when_done
+
+
+def test_configure_from_env_without_variable(monkeypatch):
+    """Tracing stays disabled when the environment variable is not set."""
+    monkeypatch.delenv(STARTUP_TRACE_ENV, raising=False)
+    tracer = StartupTracer()
+
+    tracer.configure_from_env()
+
+    assert not tracer.enabled
+    assert tracer.target_page == STARTUP_TRACE_DEFAULT_PAGE
+
+
+def test_first_paint_of_target_page_finishes_trace(tmp_path):
+    """The first paint of the target page is recorded and ends the trace."""
+    tracer = StartupTracer()
+    tracer.enable(
+        str(tmp_path / 'trace.json'),
+        target_page='FungibleAssetWidget',
+    )
+
+    tracer.on_first_paint('TermCondition')
+    assert not tracer.is_finished
+
+    tracer.on_first_paint('FungibleAssetWidget')
+    assert tracer.is_finished
+    assert set(tracer.phase_durations()) == {
+        'first_paint:TermCondition', 'first_paint:FungibleAssetWidget',
+    }
+
+
+def test_watch_first_paint_installs_one_watcher_per_page(tmp_path, qt_app):
+    """Each page is watched once, and the watcher reports its first paint only."""
+    tracer = StartupTracer()
+    tracer.enable(str(tmp_path / 'trace.json'))
+    widget = QWidget()
+    widget.installEventFilter = MagicMock()
+
+    tracer.watch_first_paint(widget, 'TermCondition')
+    tracer.watch_first_paint(widget, 'TermCondition')
+
+    widget.installEventFilter.assert_called_once()
+    watcher = widget.installEventFilter.call_args.args[0]
+    assert isinstance(watcher, _FirstPaintWatcher)
+
+    watched = MagicMock()
+    with patch('src.utils.startup_trace.QTimer.singleShot') as mock_single_shot:
+        assert watcher.eventFilter(watched, QEvent(QEvent.Type.Paint)) is False
+        mock_single_shot.call_args.args[1]()
+    watched.removeEventFilter.assert_called_once_with(watcher)
+    assert 'first_paint:TermCondition' in tracer.phase_durations()
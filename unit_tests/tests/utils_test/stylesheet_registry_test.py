@@ -0,0 +1,74 @@
+# Disable the redefined-outer-name warning as
+# it's normal to pass mocked object in tests function
+# pylint: disable=redefined-outer-name,unused-argument
+"""Unit tests for the StylesheetRegistry class."""
+from __future__ import annotations
+
+import os
+from unittest.mock import mock_open
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.helpers import get_stylesheet_folder
+from src.utils.helpers import load_stylesheet
+from src.utils.helpers import preload_stylesheets
+from src.utils.stylesheet_registry import StylesheetRegistry
+
+
+def test_get_reads_file_once(tmp_path):
+    """A stylesheet is read from disk on first use and served from memory afterwards."""
+    qss_file = tmp_path / 'style.qss'
+    qss_file.write_text('QWidget { color: #fff; }', encoding='utf-8')
+    registry = StylesheetRegistry()
+
+    assert registry.get(str(qss_file)) == 'QWidget { color: #fff; }'
+    with patch('builtins.open', mock_open(read_data='changed')) as mocked_open:
+        assert registry.get(str(qss_file)) == 'QWidget { color: #fff; }'
+    mocked_open.assert_not_called()
+
+
+def test_get_missing_file_raises_and_is_not_cached(tmp_path):
+    """Missing files raise FileNotFoundError every time they are requested."""
+    registry = StylesheetRegistry()
+
+    with pytest.raises(FileNotFoundError):
+        registry.get(str(tmp_path / 'missing.qss'))
+    assert len(registry) == 0
+
+
+def test_preload_reads_only_stylesheets(tmp_path):
+    """Preloading a folder reads its .qss files and skips other files."""
+    (tmp_path / 'a.qss').write_text('a', encoding='utf-8')
+    (tmp_path / 'b.qss').write_text('b', encoding='utf-8')
+    (tmp_path / 'notes.txt').write_text('c', encoding='utf-8')
+    registry = StylesheetRegistry()
+
+    assert registry.preload(str(tmp_path)) == 2
+    assert registry.get(os.path.join(str(tmp_path), 'a.qss')) == 'a'
+
+
+def test_preload_missing_folder(tmp_path):
+    """Preloading a missing folder logs the error and keeps the registry usable."""
+    registry = StylesheetRegistry()
+
+    assert registry.preload(str(tmp_path / 'missing')) == 0
+
+
+def test_load_stylesheet_uses_preloaded_stylesheets(stylesheet_registry):
+    """After the application stylesheets are preloaded, load_stylesheet does not read files."""
+    count = preload_stylesheets()
+    qss_count = len([
+        name for name in os.listdir(get_stylesheet_folder()) if name.endswith('.qss')
+    ])
+    assert count == qss_count
+
+    with patch('builtins.open') as mocked_open:
+        assert load_stylesheet('views/qss/q_label.qss')
+        assert load_stylesheet()
+    mocked_open.assert_not_called()
+
+
+def test_get_instance_singleton():
+    """get_instance always returns the same registry."""
+    assert StylesheetRegistry.get_instance() is StylesheetRegistry.get_instance()
@@ -0,0 +1,117 @@
+# pylint: disable=redefined-outer-name
+"""Unit tests for the TaskScheduler class."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.utils.task_scheduler import CancellationToken
+from src.utils.task_scheduler import TaskPriority
+from src.utils.task_scheduler import TaskScheduler
+
+
+@pytest.fixture
+def scheduler():
+    """A scheduler with a single worker, so that queued tasks run one at a time."""
+    scheduler = TaskScheduler(max_workers=1, group_limit=1)
+    yield scheduler
+    scheduler.wait_for_done(5000)
+
+
+def block_worker(scheduler: TaskScheduler) -> threading.Event:
+    """Occupy the worker of the scheduler until the returned event is set."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocker():
+        started.set()
+        release.wait(5)
+    scheduler.submit(blocker)
+    assert started.wait(5)
+    return release
+
+
+def test_tasks_run_by_priority(scheduler):
+    """Queued tasks of the visible page run before background refreshes and prefetches."""
+    release = block_worker(scheduler)
+    order = []
+    scheduler.submit(lambda: order.append('prefetch'), TaskPriority.PREFETCH)
+    scheduler.submit(
+        lambda: order.append(
+            'background',
+        ), TaskPriority.BACKGROUND,
+    )
+    scheduler.submit(lambda: order.append('visible 1'))
+    scheduler.submit(lambda: order.append('visible 2'))
+
+    assert scheduler.stats()['queued_visible'] == 2
+    release.set()
+    assert scheduler.wait_for_done(5000)
+    assert order == ['visible 1', 'visible 2', 'background', 'prefetch']
+
+
+def test_cancelled_task_is_dropped(scheduler):
+    """A task cancelled before it started never runs, but its submitter is told."""
+    release = block_worker(scheduler)
+    ran = []
+    dropped = []
+    token = scheduler.submit(
+        lambda: ran.append(1), on_cancel=lambda: dropped.append(1),
+    )
+    token.cancel()
+    release.set()
+
+    assert scheduler.wait_for_done(5000)
+    assert not ran
+    assert dropped == [1]
+    assert scheduler.stats()['cancelled'] == 1
+
+
+def test_group_limit_defers_tasks_of_a_busy_group():
+    """Tasks of a group at its limit wait while tasks of other groups run."""
+    scheduler = TaskScheduler(max_workers=2, group_limit=1)
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def slow():
+        started.set()
+        release.wait(5)
+        order.append('first assets')
+    scheduler.submit(slow, group='assets')
+    assert started.wait(5)
+    scheduler.submit(lambda: order.append('second assets'), group='assets')
+    scheduler.submit(lambda: order.append('channels'), group='channels')
+
+    assert scheduler.wait_for_done(200) is False
+    assert order == ['channels']
+    release.set()
+    assert scheduler.wait_for_done(5000)
+    assert order == ['channels', 'first assets', 'second assets']
+
+
+def test_failing_task_frees_its_worker(scheduler):
+    """A task raising an exception does not prevent the next one from running."""
+    ran = []
+
+    def fail():
+        raise RuntimeError('boom')
+    scheduler.submit(fail)
+    scheduler.submit(lambda: ran.append(1))
+
+    assert scheduler.wait_for_done(5000)
+    assert ran == [1]
+
+
+def test_queue_wait_recorded_per_priority(scheduler, metrics_registry):
+    """The wait of every started task is recorded under its priority class."""
+    token = CancellationToken()
+    assert scheduler.submit(
+        lambda: None, TaskPriority.BACKGROUND, token=token,
+    ) is token
+    assert scheduler.wait_for_done(5000)
+
+    queue_waits = metrics_registry.snapshot()['queue_waits']
+    assert queue_waits['scheduler:background']['count'] == 1
+    assert scheduler.stats()['submitted'] == 1
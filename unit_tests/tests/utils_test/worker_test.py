@@ -9,6 +9,9 @@ from unittest.mock import patch
 import pytest
 
 from src.utils.custom_exception import CommonException
+from src.utils.task_scheduler import CancellationToken
+from src.utils.task_scheduler import TaskPriority
+from src.utils.task_scheduler import TaskScheduler
 from src.utils.worker import ThreadManager
 from src.utils.worker import WorkerWithCache
 from src.utils.worker import WorkerWithoutCache
@@ -182,6 +185,7 @@ def mock_signals():
         result = MagicMock()
         error = MagicMock()
         finished = MagicMock()
+        cancelled = MagicMock()
     return MockSignals()
 
 
@@ -289,3 +293,110 @@ def test_worker_finally(mock_signals):
 
     worker.run()
     mock_signals.finished.emit.assert_called_once()
+
+
+def test_run_in_thread_submits_to_scheduler(thread_manager, task_scheduler):
+    """Calls are queued in the shared scheduler, grouped by function, with the requested priority."""
+    with patch.object(task_scheduler, 'submit', wraps=task_scheduler.submit) as mock_submit:
+        token = thread_manager.run_in_thread(
+            sample_function, {'priority': TaskPriority.BACKGROUND},
+        )
+
+    mock_submit.assert_called_once_with(
+        thread_manager.worker.run,
+        priority=TaskPriority.BACKGROUND,
+        group=f'{__name__}.sample_function',
+        token=token,
+        on_cancel=thread_manager.worker.drop,
+    )
+    assert isinstance(token, CancellationToken)
+    assert task_scheduler.wait_for_done(5000)
+
+
+def test_page_scoped_call_is_cancelled_on_navigation(thread_manager, page_scope):
+    """Page-scoped calls are cancelled when the scope of another page is entered."""
+    scoped = thread_manager.run_in_thread(
+        sample_function, {'page_scoped': True},
+    )
+    unscoped = thread_manager.run_in_thread(sample_function)
+
+    page_scope.enter('Bitcoin')
+
+    assert scoped.is_cancelled
+    assert not unscoped.is_cancelled
+
+
+def test_page_scoped_call_dropped_before_start_calls_cancel_callback(thread_manager, page_scope, qtbot, monkeypatch):
+    """A page-scoped call dropped while queued still reports its cancellation and completion."""
+    # Without a free worker, the call stays queued until a worker is added
+    scheduler = TaskScheduler(max_workers=0)
+    monkeypatch.setattr(TaskScheduler, '_instance', scheduler)
+    callback = MagicMock()
+    cancel_callback = MagicMock()
+    thread_manager.run_in_thread(
+        sample_function, {
+            'callback': callback,
+            'cancel_callback': cancel_callback,
+            'page_scoped': True,
+        },
+    )
+    finished = MagicMock()
+    thread_manager.worker.finished.connect(finished)
+
+    page_scope.enter('Bitcoin')
+    scheduler.max_workers = 1
+    scheduler._dispatch()
+
+    assert scheduler.wait_for_done(5000)
+    qtbot.waitUntil(lambda: cancel_callback.called, timeout=2000)
+    cancel_callback.assert_called_once()
+    callback.assert_not_called()
+    finished.assert_called_once()
+
+
+def test_cancelled_worker_drops_result():
+    """A worker cancelled while it runs emits neither its result nor its error, only `cancelled`."""
+    token = CancellationToken()
+
+    def cancelled_during_call():
+        token.cancel()
+        return 'Stale'
+    worker = WorkerWithoutCache(cancelled_during_call, token=token)
+    worker.result = MagicMock()
+    worker.error = MagicMock()
+    worker.finished = MagicMock()
+    worker.cancelled = MagicMock()
+
+    worker.run()
+
+    worker.result.emit.assert_not_called()
+    worker.error.emit.assert_not_called()
+    worker.cancelled.emit.assert_called_once()
+    worker.finished.emit.assert_called_once()
+
+
+def test_cancelled_worker_with_cache_still_caches_result(mock_signals):
+    """Fresh data of a cancelled worker updates the cache but is not emitted."""
+    token = CancellationToken()
+    mock_cache = MagicMock()
+    mock_cache.fetch_cache.return_value = (None, False)
+
+    def cancelled_during_call():
+        token.cancel()
+        return 'fresh_data'
+    with patch('src.utils.cache.Cache.get_cache_session', return_value=mock_cache):
+        worker = WorkerWithCache(
+            func=cancelled_during_call, key='test_key', use_cache=True, token=token,
+        )
+        worker.progress = mock_signals.progress
+        worker.result = mock_signals.result
+        worker.error = mock_signals.error
+        worker.finished = mock_signals.finished
+        worker.cancelled = mock_signals.cancelled
+
+        worker.run()
+
+    mock_signals.result.emit.assert_not_called()
+    mock_cache.on_success.assert_called_once_with('test_key', 'fresh_data')
+    mock_signals.cancelled.emit.assert_called_once()
+    mock_signals.finished.emit.assert_called_once()
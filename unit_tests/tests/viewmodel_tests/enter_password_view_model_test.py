@@ -279,9 +279,10 @@ def test_on_success_with_generic_exception(enter_wallet_password_view_model, moc
 
 
 # Mock MessageBox
+@patch('src.viewmodels.enter_password_view_model.QApplication')
 @patch('src.viewmodels.enter_password_view_model.MessageBox', autospec=True)
 def test_on_error_network_mismatch(
-    mock_message_box, enter_wallet_password_view_model, mocker,
+    mock_message_box, mock_application, enter_wallet_password_view_model, mocker,
 ):
     """Test on_error method when network mismatch error occurs"""
     # Arrange
@@ -306,6 +307,7 @@ def test_on_error_network_mismatch(
         mock_message_box.assert_called_once_with(
             'critical', ERROR_NETWORK_MISMATCH,
         )
+        mock_application.instance.return_value.exit.assert_called_once()
 
 
 def test_on_error_other_error(enter_wallet_password_view_model):
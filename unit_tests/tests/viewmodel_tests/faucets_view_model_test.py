@@ -76,10 +76,23 @@ def test_get_faucet_list_starts_loading(qtbot: QtBot):
                 'args': [],
                 'callback': view_model.on_success_get_faucet_list,
                 'error_callback': view_model.on_error,
+                'cancel_callback': view_model.on_cancel,
+                'page_scoped': True,
             },
         )
 
 
+def test_on_cancel_stops_loading():
+    """**on_cancel_stops_loading**: Verifies that leaving the faucets page while the list loads stops the loader."""
+    view_model = FaucetsViewModel(page_navigation=MagicMock())
+    stop_loading = MagicMock()
+    view_model.stop_loading.connect(stop_loading)
+
+    view_model.on_cancel()
+
+    stop_loading.assert_called_once()
+
+
 def test_on_error_shows_toast():
     '''**on_error_shows_toast**: Verifies that the `on_error` method shows a toast notification with the correct error message.'''
     view_model = FaucetsViewModel(page_navigation=MagicMock())
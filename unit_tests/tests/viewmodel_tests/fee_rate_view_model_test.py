@@ -10,10 +10,13 @@ from unittest.mock import patch
 
 import pytest
 
+from src.data.service.fee_estimate_service import FeeEstimateService
 from src.model.btc_model import EstimateFeeResponse
 from src.utils.common_utils import TRANSACTION_SPEEDS
+from src.utils.constant import FEE_ESTIMATE_IDLE_TIMEOUT
 from src.utils.error_message import ERROR_SOMETHING_WENT_WRONG
 from src.utils.info_message import INFO_CUSTOM_FEE_RATE
+from src.utils.task_scheduler import TaskPriority
 from src.viewmodels.fee_rate_view_model import EstimateFeeViewModel
 
 
@@ -157,3 +160,50 @@ def test_get_fee_rate_generic_exception(fee_rate_view_model, mocker):
     mock_toast_manager.assert_called_once_with(
         description=f"An unexpected error occurred: {error_message}",
     )
+
+
+def test_get_fee_rate_uses_cached_estimate(fee_rate_view_model, fee_estimate_cache):
+    """A cached estimate is emitted immediately, without loading or a node call."""
+    fee_estimate_cache.set(TRANSACTION_SPEEDS['fast_checkBox'], 25.0)
+    mock_loading_status = Mock()
+    mock_fee_estimation_success = Mock()
+    fee_rate_view_model.loading_status.connect(mock_loading_status)
+    fee_rate_view_model.fee_estimation_success.connect(
+        mock_fee_estimation_success,
+    )
+
+    with patch.object(fee_rate_view_model, 'run_in_thread') as mock_run_in_thread:
+        fee_rate_view_model.get_fee_rate('fast_checkBox')
+
+    mock_fee_estimation_success.assert_called_once_with(25.0)
+    mock_loading_status.assert_not_called()
+    mock_run_in_thread.assert_not_called()
+
+
+def test_prefetch_fee_rates(fee_rate_view_model, fee_estimate_cache):
+    """Prefetching starts the refresh schedule and fetches only stale estimates."""
+    with patch.object(fee_rate_view_model, 'run_in_thread') as mock_run_in_thread:
+        fee_rate_view_model.prefetch_fee_rates()
+        assert fee_rate_view_model.refresh_timer.isActive()
+        mock_run_in_thread.assert_called_once_with(
+            FeeEstimateService.refresh_fee_estimates,
+            {'priority': TaskPriority.PREFETCH},
+        )
+
+        for blocks in TRANSACTION_SPEEDS.values():
+            fee_estimate_cache.set(blocks, 1.0)
+        fee_rate_view_model.prefetch_fee_rates()
+        mock_run_in_thread.assert_called_once()
+    fee_rate_view_model.refresh_timer.stop()
+
+
+def test_refresh_stops_when_idle(fee_rate_view_model):
+    """The scheduled refresh stops once no page used the estimates for a while."""
+    fee_rate_view_model.refresh_timer.start()
+    fee_rate_view_model.last_used_at = 0.0
+    with patch.object(fee_rate_view_model, 'run_in_thread') as mock_run_in_thread, \
+            patch('src.viewmodels.fee_rate_view_model.time.monotonic', return_value=FEE_ESTIMATE_IDLE_TIMEOUT + 1.0):
+        fee_rate_view_model.on_refresh_timeout()
+
+    mock_run_in_thread.assert_not_called()
+    assert not fee_rate_view_model.refresh_timer.isActive()
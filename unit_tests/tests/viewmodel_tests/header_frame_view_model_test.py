@@ -2,107 +2,35 @@
 # pylint: disable=redefined-outer-name,unused-argument
 from __future__ import annotations
 
-from src.utils.constant import PING_DNS_SERVER_CALL_INTERVAL
 from src.viewmodels.header_frame_view_model import HeaderFrameViewModel
-from src.viewmodels.header_frame_view_model import NetworkCheckerThread
 
 
-def test_network_checker_thread_success(mocker, qtbot):
-    """Test that NetworkCheckerThread emits True when network is available."""
-    network_checker = NetworkCheckerThread()
-
-    mocker.patch.object(
-        network_checker, 'check_internet_conn', return_value=True,
-    )
-
-    def signal_received(value):
-        assert value is True
-
-    network_checker.network_status_signal.connect(signal_received)
-
-    network_checker.start()
-    qtbot.waitSignal(network_checker.finished, timeout=1000)
-
-
-def test_network_checker_thread_failure(mocker, qtbot):
-    """Test that NetworkCheckerThread emits False when network is unavailable."""
-    network_checker = NetworkCheckerThread()
-
-    mocker.patch.object(
-        network_checker, 'check_internet_conn', return_value=False,
-    )
-
-    def signal_received(value):
-        assert value is False
-
-    network_checker.network_status_signal.connect(signal_received)
-
-    network_checker.start()
-    qtbot.waitSignal(network_checker.finished, timeout=1000)
-
-
-def test_check_internet_conn_success(mocker):
-    """Test check_internet_conn returns True when socket connection succeeds."""
-    network_checker = NetworkCheckerThread()
-
-    mocker.patch('socket.create_connection', return_value=True)
-
-    assert network_checker.check_internet_conn() is True
-
-
-def test_check_internet_conn_failure(mocker):
-    """Test check_internet_conn returns False when socket connection fails."""
-    network_checker = NetworkCheckerThread()
-
-    mocker.patch('socket.create_connection', side_effect=OSError)
-
-    assert network_checker.check_internet_conn() is False
-
-
-def test_header_frame_view_model_init(mocker):
-    """Test that HeaderFrameViewModel initializes correctly with a running timer."""
-    mock_timer = mocker.patch(
-        'src.viewmodels.header_frame_view_model.QTimer',
-    )
+def test_header_frame_view_model_init(mocker, connectivity_monitor):
+    """Test that HeaderFrameViewModel starts the shared connectivity monitor."""
+    mock_start = mocker.patch.object(connectivity_monitor, 'start')
 
     view_model = HeaderFrameViewModel()
 
-    # Ensure QTimer was instantiated
-    mock_timer.assert_called_once()
-
-    # Retrieve the mocked QTimer instance
-    mock_timer_instance = mock_timer.return_value
-
-    # Ensure timer settings and start behavior are correct
-    mock_timer_instance.setInterval.assert_called_once_with(
-        PING_DNS_SERVER_CALL_INTERVAL,
-    )
-    mock_timer_instance.timeout.connect.assert_called_once_with(
-        view_model.start_network_check,
-    )
-    mock_timer_instance.start.assert_called_once()
+    assert view_model.connectivity_monitor is connectivity_monitor
+    mock_start.assert_called_once()
 
 
-def test_header_frame_view_model_network_check(mocker):
-    """Test that start_network_check creates a NetworkCheckerThread and starts it."""
-    view_model = HeaderFrameViewModel()
-
-    mock_thread = mocker.patch(
-        'src.viewmodels.header_frame_view_model.NetworkCheckerThread',
-    )
-    mock_instance = mock_thread.return_value
+def test_header_frame_view_model_shares_monitor(mocker, connectivity_monitor):
+    """Test that every HeaderFrameViewModel relays the status published by the monitor."""
+    mocker.patch.object(connectivity_monitor, 'start')
+    view_models = [HeaderFrameViewModel(), HeaderFrameViewModel()]
+    received_signals = []
+    for view_model in view_models:
+        view_model.network_status_signal.connect(received_signals.append)
 
-    view_model.start_network_check()
+    connectivity_monitor.network_status_signal.emit(False)
 
-    mock_thread.assert_called_once()
-    mock_instance.network_status_signal.connect.assert_called_once_with(
-        view_model.handle_network_status,
-    )
-    mock_instance.start.assert_called_once()
+    assert received_signals == [False, False]
 
 
-def test_header_frame_view_model_handle_network_status():
+def test_header_frame_view_model_handle_network_status(mocker, connectivity_monitor):
     """Test that handle_network_status emits the correct signal."""
+    mocker.patch.object(connectivity_monitor, 'start')
     view_model = HeaderFrameViewModel()
     received_signals = []
 
@@ -117,12 +45,13 @@ def test_header_frame_view_model_handle_network_status():
     assert received_signals == [True, False]
 
 
-def test_header_frame_view_model_stop_network_checker(mocker):
-    """Test that stop_network_checker stops the timer."""
+def test_header_frame_view_model_stop_network_checker(mocker, connectivity_monitor):
+    """Test that stop_network_checker stops the connectivity monitor."""
+    mocker.patch.object(connectivity_monitor, 'start')
     view_model = HeaderFrameViewModel()
 
-    mock_timer = mocker.patch.object(view_model.timer, 'stop')
+    mock_stop = mocker.patch.object(connectivity_monitor, 'stop')
 
     view_model.stop_network_checker()
 
-    mock_timer.assert_called_once()
+    mock_stop.assert_called_once()
@@ -16,6 +16,7 @@ from src.model.invoices_model import LnInvoiceResponseModel
 from src.model.payments_model import CombinedDecodedModel
 from src.model.payments_model import KeysendResponseModel
 from src.model.payments_model import ListPaymentResponseModel
+from src.utils.common_utils import render_qr_code
 from src.utils.custom_exception import CommonException
 from src.utils.error_message import ERROR_SOMETHING_WENT_WRONG
 from src.viewmodels.ln_offchain_view_model import LnOffChainViewModel
@@ -54,6 +55,10 @@ def test_on_success_get_invoice(ln_offchain_view_model):
         encoded_invoice = LnInvoiceResponseModel(invoice='encoded_invoice')
         ln_offchain_view_model.invoice_get_event = Mock()
         ln_offchain_view_model.on_success_get_invoice(encoded_invoice)
+        # The invoice is shown once the worker rendering its QR code is done
+        ln_offchain_view_model.invoice_get_event.emit.assert_not_called()
+        assert ln_offchain_view_model.worker.func is render_qr_code
+        ln_offchain_view_model.worker.result.emit(b'png')
         ln_offchain_view_model.invoice_get_event.emit.assert_called_once_with(
             'encoded_invoice',
         )
@@ -205,3 +210,9 @@ def test_list_ln_payment_loading(ln_offchain_view_model, mocker):
 
     # Assert that loading is set to true
     ln_offchain_view_model.is_loading.emit.assert_called_once_with(True)
+
+    # Leaving the page before the list is loaded stops the loading
+    options = ln_offchain_view_model.run_in_thread.call_args[0][1]
+    assert options['page_scoped']
+    options['cancel_callback']()
+    ln_offchain_view_model.is_loading.emit.assert_called_with(False)
@@ -10,6 +10,7 @@ from unittest.mock import patch
 import pytest
 
 from src.model.btc_model import AddressResponseModel
+from src.utils.common_utils import render_qr_code
 from src.utils.custom_exception import CommonException
 from src.viewmodels.receive_bitcoin_view_model import ReceiveBitcoinViewModel
 
@@ -37,6 +38,10 @@ def test_get_bitcoin_address_success(mock_get_address, receive_bitcoin_view_mode
     mock_get_address.return_value = mock_address_response
     receive_bitcoin_view_model.get_bitcoin_address()
     receive_bitcoin_view_model.worker.result.emit(mock_address_response)
+    # The address is shown once the worker rendering its QR code is done
+    mock_address_signal.assert_not_called()
+    assert receive_bitcoin_view_model.worker.func is render_qr_code
+    receive_bitcoin_view_model.worker.result.emit(b'png')
     mock_address_signal.assert_called_once_with(mock_address_response.address)
 
 
@@ -66,4 +71,8 @@ def test_get_bitcoin_address_with_hard_refresh(mock_get_address, receive_bitcoin
     mock_get_address.return_value = mock_address_response
     receive_bitcoin_view_model.get_bitcoin_address(is_hard_refresh=True)
     receive_bitcoin_view_model.worker.result.emit(mock_address_response)
+    # The address is shown once the worker rendering its QR code is done
+    mock_address_signal.assert_not_called()
+    assert receive_bitcoin_view_model.worker.func is render_qr_code
+    receive_bitcoin_view_model.worker.result.emit(b'png')
     mock_address_signal.assert_called_once_with(mock_address_response.address)
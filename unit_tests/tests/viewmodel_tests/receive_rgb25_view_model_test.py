@@ -10,6 +10,7 @@ from unittest.mock import patch
 import pytest
 
 from src.model.rgb_model import RgbInvoiceDataResponseModel
+from src.utils.common_utils import render_qr_code
 from src.utils.custom_exception import CommonException
 from src.viewmodels.receive_rgb25_view_model import ReceiveRGB25ViewModel
 
@@ -46,6 +47,10 @@ def test_get_rgb_invoice_success(mock_rgb_invoice, receive_rgb25_view_model):
     # Call get_rgb_invoice with a minimum confirmation argument
     receive_rgb25_view_model.get_rgb_invoice(minimum_confirmations=1)
     receive_rgb25_view_model.worker.result.emit(mock_invoice_response)
+    # The invoice is shown once the worker rendering its QR code is done
+    mock_address_signal.assert_not_called()
+    assert receive_rgb25_view_model.worker.func is render_qr_code
+    receive_rgb25_view_model.worker.result.emit(b'png')
 
     mock_address_signal.assert_called_once_with(mock_invoice_response.invoice)
     mock_loading_signal.assert_called_once_with(False)
@@ -53,6 +53,7 @@ def test_on_success_restore_successful(restore_view_model, mocker):
         'src.data.repository.setting_repository.SettingRepository.set_keyring_status',
     )
     mocker.patch('src.utils.keyring_storage.set_value', return_value=True)
+    mocker.patch('src.viewmodels.restore_view_model.KeyringErrorDialog')
     test_network_enum = Enum(
         'TestNetworkEnum', {'TEST_NETWORK': 'test_network'},
     )
@@ -11,9 +11,12 @@ from unittest.mock import patch
 
 import pytest
 
+from src.data.repository.rgb_repository import RgbRepository
 from src.model.enums.enums_model import AssetType
 from src.model.enums.enums_model import TransferStatusEnumModel
 from src.model.rgb_model import AssetBalanceResponseModel
+from src.model.rgb_model import DecodeRgbInvoiceRequestModel
+from src.model.rgb_model import DecodeRgbInvoiceResponseModel
 from src.model.rgb_model import FailTransferResponseModel
 from src.model.rgb_model import ListTransferAssetWithBalanceResponseModel
 from src.model.rgb_model import SendAssetResponseModel
@@ -22,10 +25,12 @@ from src.utils.custom_exception import CommonException
 from src.utils.error_message import ERROR_AUTHENTICATION_CANCELLED
 from src.utils.error_message import ERROR_FAIL_TRANSFER
 from src.utils.error_message import ERROR_SOMETHING_WENT_WRONG
+from src.utils.error_message import ERROR_UNEXPECTED
 from src.utils.info_message import INFO_ASSET_SENT
 from src.utils.info_message import INFO_FAIL_TRANSFER_SUCCESSFULLY
 from src.utils.info_message import INFO_REFRESH_SUCCESSFULLY
 from src.utils.page_navigation import PageNavigation
+from src.utils.task_scheduler import CancellationToken
 from src.viewmodels.rgb_25_view_model import RGB25ViewModel
 
 
@@ -109,6 +114,25 @@ def test_get_rgb25_asset_detail_success(mock_get_asset_transactions, rgb25_view_
     assert rgb25_view_model.asset_type == asset_type
 
 
+@patch('src.utils.worker.ThreadManager.run_in_thread', autospec=True)
+def test_cancelled_asset_detail_stops_loading(mock_run_in_thread, rgb25_view_model):
+    """A cancelled transactions request stops the loader, unless a newer request is loading."""
+    mock_run_in_thread.side_effect = lambda *_: CancellationToken()
+    is_loading = Mock()
+    rgb25_view_model.is_loading.connect(is_loading)
+
+    rgb25_view_model.get_rgb25_asset_detail('id_1', 'name', 'path', 'type')
+    rgb25_view_model.get_rgb25_asset_detail('id_2', 'name', 'path', 'type')
+    first_options = mock_run_in_thread.call_args_list[0][0][2]
+    second_options = mock_run_in_thread.call_args_list[1][0][2]
+
+    first_options['cancel_callback']()
+    is_loading.assert_not_called()
+
+    second_options['cancel_callback']()
+    is_loading.assert_called_once_with(False)
+
+
 @patch('src.utils.worker.ThreadManager.run_in_thread', autospec=True)
 def test_on_send_click(mock_run_in_thread, rgb25_view_model):
     """Test the on_send_click method of RGB25ViewModel without executing the actual method."""
@@ -139,6 +163,36 @@ def test_on_send_click(mock_run_in_thread, rgb25_view_model):
     assert rgb25_view_model.min_confirmation == min_confirmation
 
 
+@patch('src.viewmodels.rgb_25_view_model.ToastManager')
+@patch('src.utils.worker.ThreadManager.run_in_thread', autospec=True)
+def test_on_send_invoice_click(mock_run_in_thread, mock_toast_manager, rgb25_view_model):
+    """Test that on_send_invoice_click decodes the invoice in a thread before sending."""
+    rgb25_view_model.on_send_click = MagicMock()
+
+    rgb25_view_model.on_send_invoice_click('test_invoice', 100, 1.0, 1)
+
+    _, func, options = mock_run_in_thread.call_args[0]
+    assert func is RgbRepository.decode_invoice
+    assert options['args'] == [
+        DecodeRgbInvoiceRequestModel(invoice='test_invoice'),
+    ]
+
+    # A decoded invoice is sent to its recipient
+    decoded_invoice = MagicMock(spec=DecodeRgbInvoiceResponseModel)
+    decoded_invoice.recipient_id = 'test_recipient_id'
+    decoded_invoice.transport_endpoints = ['test_endpoint']
+    options['callback'](decoded_invoice)
+    rgb25_view_model.on_send_click.assert_called_once_with(
+        100, 'test_recipient_id', ['test_endpoint'], 1.0, 1,
+    )
+
+    # An invoice which cannot be decoded is reported
+    options['error_callback'](CommonException('Invalid invoice'))
+    mock_toast_manager.error.assert_called_once_with(
+        description=ERROR_UNEXPECTED.format('Invalid invoice'),
+    )
+
+
 @patch('src.data.repository.rgb_repository.RgbRepository.fail_transfer')
 @patch('src.views.components.toast.ToastManager.success')
 @patch('src.views.components.toast.ToastManager.error')
@@ -243,7 +243,7 @@ def test_set_wallet_password_passwords_do_not_match(set_wallet_password_view_mod
 @patch('src.data.repository.setting_repository.SettingRepository')
 @patch('src.utils.keyring_storage.set_value')
 @patch('src.views.components.toast.ToastManager')
-@patch('src.views.components.keyring_error_dialog.KeyringErrorDialog')
+@patch('src.viewmodels.set_wallet_password_view_model.KeyringErrorDialog')
 def test_on_success(mock_keyring_error_dialog, mock_toast_manager, mock_set_value, mock_setting_repository, set_wallet_password_view_model, mock_keyring_and_storage):
     """Test the on_success method."""
 
@@ -272,7 +272,7 @@ def test_on_success(mock_keyring_error_dialog, mock_toast_manager, mock_set_valu
 @patch('src.data.repository.setting_repository.SettingRepository')
 @patch('src.utils.keyring_storage.set_value')
 @patch('src.views.components.toast.ToastManager')
-@patch('src.views.components.keyring_error_dialog.KeyringErrorDialog')
+@patch('src.viewmodels.set_wallet_password_view_model.KeyringErrorDialog')
 def test_on_success_keyring_error(mock_keyring_error_dialog, mock_toast_manager, mock_set_value, mock_setting_repository, set_wallet_password_view_model):
     """Test the on_success method with keyring storage error."""
 
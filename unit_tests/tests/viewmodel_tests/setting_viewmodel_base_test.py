@@ -265,12 +265,32 @@ def test_enable_hide_asset_false(mock_toast_manager, mock_setting_repository, se
     )
 
 
+def test_on_page_load(setting_view_model):
+    """Test that on_page_load reads the settings in a worker thread."""
+    setting_view_model.run_in_thread = Mock()
+
+    setting_view_model.on_page_load()
+
+    setting_view_model.run_in_thread.assert_called_once_with(
+        setting_view_model._load_page_settings,
+        {
+            'callback': setting_view_model.on_success_of_page_load,
+            'error_callback': setting_view_model.on_error_of_page_load,
+        },
+    )
+
+    setting_view_model.on_page_load_event = Mock()
+    settings = MagicMock(spec=SettingPageLoadModel)
+    setting_view_model.on_success_of_page_load(settings)
+    setting_view_model.on_page_load_event.emit.assert_called_once_with(
+        settings,
+    )
+
+
 @patch('src.viewmodels.setting_view_model.SettingRepository')
 @patch('src.viewmodels.setting_view_model.SettingCardRepository')
-@patch('src.viewmodels.setting_view_model.ToastManager')
-def test_on_page_load(mock_toast_manager, mock_setting_card_repository, mock_setting_repository, setting_view_model):
-    """Test the on_page_load method."""
-    setting_view_model.on_page_load_event = Mock()
+def test_load_page_settings(mock_setting_card_repository, mock_setting_repository):
+    """Test the _load_page_settings method."""
 
     mock_setting_repository.get_native_authentication_status.return_value = NativeAuthenticationStatus(
         is_enabled=True,
@@ -313,8 +333,6 @@ def test_on_page_load(mock_toast_manager, mock_setting_card_repository, mock_set
         min_confirmation=6,
     )
 
-    setting_view_model.on_page_load()
-
     expected_model = SettingPageLoadModel(
         status_of_native_auth=NativeAuthenticationStatus(is_enabled=True),
         status_of_native_logging_auth=IsNativeLoginIntoAppEnabled(
@@ -346,22 +364,7 @@ def test_on_page_load(mock_toast_manager, mock_setting_card_repository, mock_set
             min_confirmation=6,
         ),
     )
-    setting_view_model.on_page_load_event.emit.assert_called_once_with(
-        expected_model,
-    )
-
-    # Test exception handling
-    mock_setting_repository.get_native_authentication_status.side_effect = CommonException(
-        'Error',
-    )
-    setting_view_model.on_page_load()
-    mock_toast_manager.error.assert_called_with(description='Error')
-
-    mock_setting_repository.get_native_authentication_status.side_effect = Exception
-    setting_view_model.on_page_load()
-    mock_toast_manager.error.assert_called_with(
-        description=ERROR_SOMETHING_WENT_WRONG,
-    )
+    assert SettingViewModel._load_page_settings() == expected_model
 
 
 @patch('src.viewmodels.setting_view_model.ToastManager')
@@ -633,29 +636,23 @@ def test_on_error_native_auth_generic_exception(mock_toast_manager, setting_view
     )
 
 
-@patch('src.viewmodels.setting_view_model.SettingRepository')
 @patch('src.viewmodels.setting_view_model.ToastManager')
-def test_on_page_load_common_exception(mock_toast_manager, mock_setting_repository, setting_view_model):
-    """Test on_page_load when CommonException occurs."""
+def test_on_error_of_page_load_common_exception(mock_toast_manager, setting_view_model):
+    """Test on_error_of_page_load when CommonException occurs."""
     setting_view_model._page_navigation = Mock()
-    mock_setting_repository.get_native_authentication_status.side_effect = CommonException(
-        'Test error',
-    )
 
-    setting_view_model.on_page_load()
+    setting_view_model.on_error_of_page_load(CommonException('Test error'))
 
     mock_toast_manager.error.assert_called_once_with(description='Test error')
     setting_view_model._page_navigation.fungibles_asset_page.assert_called_once()
 
 
-@patch('src.viewmodels.setting_view_model.SettingRepository')
 @patch('src.viewmodels.setting_view_model.ToastManager')
-def test_on_page_load_generic_exception(mock_toast_manager, mock_setting_repository, setting_view_model):
-    """Test on_page_load when generic Exception occurs."""
+def test_on_error_of_page_load_generic_exception(mock_toast_manager, setting_view_model):
+    """Test on_error_of_page_load when generic Exception occurs."""
     setting_view_model._page_navigation = Mock()
-    mock_setting_repository.get_native_authentication_status.side_effect = Exception()
 
-    setting_view_model.on_page_load()
+    setting_view_model.on_error_of_page_load(Exception())
 
     mock_toast_manager.error.assert_called_once_with(
         description=ERROR_SOMETHING_WENT_WRONG,